@@ -4,8 +4,18 @@ from app.config import settings
 from app.services.azure_translator import AzureTranslator
 from app.services.openrouter_service import OpenRouterService
 from app.services.translation_processor import TranslationProcessor
+from app.services.llm_router import LLMRouter
+from app.services.llm_dispatcher import LLMDispatcher
 from app.services.image_translator import ImageTranslator
+from app.services.image_render_pool import ImageRenderPool
 from app.services.document_processor import DocumentProcessor
+from app.services.editor_sessions import EditorSessionManager
+from app.utils.circuit_breaker import CircuitBreakerRegistry
+from app.utils.ocr_cache import OCRCache
+from app.utils.shared_cache import SharedCache
+from app.utils.storage_manager import StorageManager
+from app.utils.translation_memory import TranslationMemory
+from app.utils.upload_store import UploadStore
 
 
 @lru_cache()
@@ -14,7 +24,16 @@ def get_azure_translator() -> AzureTranslator:
     return AzureTranslator(
         subscription_key=settings.AZURE_TRANSLATOR_KEY,
         endpoint=settings.AZURE_TRANSLATOR_ENDPOINT,
-        region=settings.AZURE_TRANSLATOR_REGION
+        region=settings.AZURE_TRANSLATOR_REGION,
+        max_elements_per_request=settings.AZURE_MAX_ELEMENTS_PER_REQUEST,
+        max_chars_per_request=settings.AZURE_MAX_CHARS_PER_REQUEST,
+        max_concurrent_requests=settings.AZURE_MAX_CONCURRENT_REQUESTS,
+        retry_attempts=settings.TRANSLATION_RETRY_ATTEMPTS,
+        retry_delay=settings.TRANSLATION_RETRY_DELAY,
+        hedge_budget=settings.AZURE_HEDGE_BUDGET,
+        request_timeout=settings.AZURE_REQUEST_TIMEOUT,
+        hedge_max_chars=settings.AZURE_HEDGE_MAX_CHARS,
+        breaker=get_circuit_breakers().get('azure_translator')
     )
 
 
@@ -25,7 +44,9 @@ def get_openrouter_service() -> OpenRouterService:
         return None
     return OpenRouterService(
         api_key=settings.OPENROUTER_API_KEY,
-        api_url=settings.OPENROUTER_API_URL
+        api_url=settings.OPENROUTER_API_URL,
+        max_tokens_cap=settings.OPENROUTER_MAX_TOKENS,
+        timeout=settings.OPENROUTER_TIMEOUT
     )
 
 
@@ -36,7 +57,64 @@ def get_translation_processor() -> TranslationProcessor:
         azure_translator=get_azure_translator(),
         openrouter_service=get_openrouter_service(),
         use_llm_enhancement=settings.USE_LLM_ENHANCEMENT,
-        default_llm_model=settings.DEFAULT_LLM_MODEL
+        default_llm_model=settings.DEFAULT_LLM_MODEL,
+        llm_router=get_llm_router(),
+        llm_dispatcher=get_llm_dispatcher(),
+        llm_fallback_models=settings.LLM_FALLBACK_MODELS,
+        breakers=get_circuit_breakers(),
+        translation_memory=get_translation_memory()
+    )
+
+
+@lru_cache()
+def get_translation_memory() -> TranslationMemory:
+    """Get the translation memory shared by all workers (None when disabled)."""
+    if not settings.TRANSLATION_MEMORY_ENABLED:
+        return None
+    return TranslationMemory(
+        path=settings.STATE_FOLDER / "translation_memory.sqlite3",
+        max_machine_entries=settings.TRANSLATION_MEMORY_MACHINE_ENTRIES
+    )
+
+
+@lru_cache()
+def get_llm_router() -> LLMRouter:
+    """Get the per-segment Azure/LLM routing policy."""
+    return LLMRouter(
+        threshold=settings.LLM_ROUTING_THRESHOLD,
+        glossary_terms=settings.LLM_GLOSSARY_TERMS,
+        llm_seconds_per_call=settings.LLM_SECONDS_PER_CALL,
+        llm_cost_per_million_tokens=settings.LLM_COST_PER_MILLION_TOKENS
+    )
+
+
+@lru_cache()
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Get the process-wide circuit breakers for translation backends."""
+    return CircuitBreakerRegistry(
+        failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout=settings.CIRCUIT_BREAKER_RECOVERY_SECONDS
+    )
+
+
+@lru_cache()
+def get_llm_dispatcher() -> LLMDispatcher:
+    """Get the process-wide LLM dispatcher enforcing per-model limits."""
+    return LLMDispatcher(
+        model_limits=settings.AVAILABLE_LLM_MODELS,
+        default_max_concurrency=settings.LLM_DEFAULT_MAX_CONCURRENCY,
+        default_tokens_per_minute=settings.LLM_DEFAULT_TOKENS_PER_MINUTE
+    )
+
+
+@lru_cache()
+def get_image_render_pool() -> ImageRenderPool:
+    """Get Image Render Pool instance (None when rendering in-thread)."""
+    if settings.IMAGE_RENDER_WORKERS <= 0:
+        return None
+    return ImageRenderPool(
+        max_workers=settings.IMAGE_RENDER_WORKERS,
+        max_pending=settings.IMAGE_RENDER_MAX_PENDING or None
     )
 
 
@@ -47,7 +125,12 @@ def get_image_translator() -> ImageTranslator:
         return None
     return ImageTranslator(
         vision_endpoint=settings.AZURE_VISION_ENDPOINT,
-        vision_key=settings.AZURE_VISION_KEY
+        vision_key=settings.AZURE_VISION_KEY,
+        poll_interval=settings.OCR_POLL_INTERVAL,
+        encode_profile=settings.IMAGE_ENCODE_PROFILE,
+        render_pool=get_image_render_pool(),
+        ocr_cache=get_ocr_cache(),
+        ocr_model_version=settings.OCR_MODEL_VERSION
     )
 
 
@@ -57,5 +140,64 @@ def get_document_processor() -> DocumentProcessor:
     image_translator = get_image_translator() if settings.TRANSLATE_IMAGES else None
     return DocumentProcessor(
         translation_processor=get_translation_processor(),
-        image_translator=image_translator
-    )
\ No newline at end of file
+        image_translator=image_translator,
+        max_output_workers=settings.DOCUMENT_OUTPUT_WORKERS,
+        engine=settings.DOCUMENT_ENGINE,
+        include_masters_and_notes=settings.TRANSLATE_MASTERS_AND_NOTES,
+        deck_context=settings.LLM_DECK_CONTEXT,
+        llm_style_notes=settings.LLM_STYLE_NOTES or None,
+        extraction_cache_size=settings.EXTRACTION_CACHE_SIZE
+    )
+
+
+@lru_cache()
+def get_upload_store() -> UploadStore:
+    """Get the content-addressed store of uploaded documents."""
+    return UploadStore(settings.UPLOAD_FOLDER)
+
+
+@lru_cache()
+def get_shared_cache() -> SharedCache:
+    """Get the cache shared by all worker processes."""
+    return SharedCache(
+        path=settings.STATE_FOLDER / "cache.sqlite3",
+        max_entries=settings.SHARED_CACHE_MAX_ENTRIES
+    )
+
+
+@lru_cache()
+def get_ocr_cache() -> OCRCache:
+    """Get the OCR result cache (memory, plus disk shared by all workers)."""
+    disk = None
+    if settings.OCR_CACHE_MAX_ENTRIES > 0:
+        disk = SharedCache(
+            path=settings.STATE_FOLDER / "ocr.sqlite3",
+            max_entries=settings.OCR_CACHE_MAX_ENTRIES
+        )
+    return OCRCache(disk=disk, memory_entries=settings.OCR_CACHE_MEMORY_ENTRIES)
+
+
+@lru_cache()
+def get_storage_manager() -> StorageManager:
+    """Get the disk budget manager for uploads and outputs."""
+    return StorageManager(
+        roots={'uploads': settings.UPLOAD_FOLDER, 'outputs': settings.OUTPUT_FOLDER},
+        db_path=settings.STATE_FOLDER / "storage.sqlite3",
+        max_bytes=settings.STORAGE_MAX_MB * 1024 * 1024,
+        ttl_seconds=settings.STORAGE_TTL_HOURS * 3600,
+        min_free_bytes=settings.STORAGE_MIN_FREE_MB * 1024 * 1024
+    )
+
+
+@lru_cache()
+def get_editor_sessions() -> EditorSessionManager:
+    """Get this worker's in-memory editor sessions."""
+    return EditorSessionManager(
+        lock_folder=settings.lock_folder(),
+        storage=get_storage_manager(),
+        memory_budget=settings.EDITOR_SESSION_MEMORY_MB * 1024 * 1024,
+        idle_seconds=settings.EDITOR_SESSION_IDLE_SECONDS,
+        save_delay=settings.EDITOR_SAVE_DELAY,
+        max_save_delay=settings.EDITOR_SAVE_MAX_DELAY,
+        pin_seconds=settings.EDITOR_PIN_MINUTES * 60
+    )
@@ -0,0 +1,86 @@
+"""Operational admin API routes."""
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from typing import Optional
+import hmac
+import logging
+
+from app.config import settings
+from app.api.dependencies import get_circuit_breakers, get_storage_manager
+from app.utils.circuit_breaker import CircuitBreakerRegistry
+from app.utils.storage_manager import StorageManager
+
+logger = logging.getLogger(__name__)
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Check the X-Admin-Token header; admin routes are closed while ADMIN_TOKEN is unset."""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin API is disabled, set ADMIN_TOKEN to enable it")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token.encode(), settings.ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/circuit-breakers")
+async def get_circuit_breakers_state(
+    breakers: CircuitBreakerRegistry = Depends(get_circuit_breakers)
+):
+    """
+    Get the circuit breaker state of every translation backend used so far.
+
+    Breakers are per worker process; with several workers each request
+    reports the worker that served it.
+    """
+    return {"breakers": breakers.snapshot()}
+
+
+@router.post("/circuit-breakers/{name:path}/reset")
+async def reset_circuit_breaker(
+    name: str,
+    breakers: CircuitBreakerRegistry = Depends(get_circuit_breakers)
+):
+    """
+    Close a circuit breaker, e.g. after the backend has recovered.
+    """
+    if name not in breakers:
+        raise HTTPException(status_code=404, detail=f"Unknown circuit breaker: {name}")
+    breaker = breakers.get(name)
+    breaker.reset()
+    logger.info(f"Circuit breaker '{name}' reset by admin")
+    return breaker.snapshot()
+
+
+@router.get("/storage")
+def get_storage_usage(
+    storage: StorageManager = Depends(get_storage_manager)
+):
+    """
+    Get disk usage of uploads and outputs against the storage budget.
+    """
+    return storage.usage()
+
+
+@router.post("/storage/sweep")
+def sweep_storage(
+    storage: StorageManager = Depends(get_storage_manager)
+):
+    """
+    Run a storage sweep now instead of waiting for the background one.
+    """
+    report = storage.sweep()
+    if report is None:
+        raise HTTPException(status_code=409, detail="A sweep is already running")
+    return report
+
+
+@router.get("/startup")
+async def get_startup_profile(request: Request):
+    """
+    Get how long this worker took to import the application and warm each service.
+    """
+    profile = getattr(request.app.state, "startup_profile", None)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Startup profile not recorded")
+    return profile.report()
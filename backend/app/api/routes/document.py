@@ -1,19 +1,31 @@
 """Document upload and translation API routes."""
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form
 from fastapi.responses import FileResponse
+from contextlib import ExitStack
 from pathlib import Path
+import io
 import logging
 import shutil
-from typing import Optional
+import time
+import zipfile
+from typing import Iterator, List, Optional, Tuple
 
 from app.config import settings
 from app.services.document_processor import DocumentProcessor
+from app.services.editor_sessions import EditorSessionManager
 from app.services.translation_processor import TranslationProcessor
-from app.api.dependencies import get_translation_processor, get_document_processor
+from app.api.dependencies import (
+    get_translation_processor,
+    get_document_processor,
+    get_upload_store,
+    get_storage_manager,
+    get_editor_sessions
+)
 from app.models.document import (
     DocumentUploadResponse,
     DocumentTranslationRequest,
-    DocumentTranslationResponse
+    DocumentTranslationResponse,
+    MultiDocumentTranslationResponse
 )
 from app.utils.file_handler import (
     is_supported_file_type,
@@ -21,6 +33,10 @@ from app.utils.file_handler import (
     ensure_directory_exists,
     generate_unique_filename
 )
+from app.utils.file_lock import document_locks
+from app.utils.ndjson import ndjson_response
+from app.utils.storage_manager import StorageManager
+from app.utils.upload_store import UploadStore, content_id
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -29,6 +45,71 @@ router = APIRouter()
 settings.ensure_directories()
 
 
+def _document_locks(*names: str):
+    """Lock the given upload/output names against jobs in other workers."""
+    return document_locks(settings.lock_folder(), names, timeout=settings.DOCUMENT_LOCK_TIMEOUT)
+
+
+def _translation_response(
+    filename: str,
+    output_filename: str,
+    target_language: str,
+    result: dict,
+    use_llm: bool,
+    llm_model: Optional[str]
+) -> DocumentTranslationResponse:
+    """Build the API response for one language from DocumentProcessor statistics."""
+    return DocumentTranslationResponse(
+        success=result.get('success', False),
+        filename=filename,
+        output_filename=output_filename,
+        slides_translated=result.get('slides_processed', 0),
+        text_frames_translated=result.get('text_frames_translated', 0),
+        notes_translated=result.get('notes_translated', 0),
+        shared_frames_translated=result.get('shared_frames_translated', 0),
+        shared_frames_inherited=result.get('shared_frames_inherited', 0),
+        segments_total=result.get('segments_total', 0),
+        segments_unique=result.get('segments_unique', 0),
+        llm_segments=result.get('llm_segments', 0),
+        azure_segments=result.get('azure_segments', 0),
+        llm_seconds_saved=result.get('llm_seconds_saved', 0.0),
+        llm_cost_saved=result.get('llm_cost_saved', 0.0),
+        llm_prompt_tokens=result.get('llm_prompt_tokens', 0),
+        llm_completion_tokens=result.get('llm_completion_tokens', 0),
+        llm_cached_tokens=result.get('llm_cached_tokens', 0),
+        llm_cache_savings=result.get('llm_cache_savings', 0.0),
+        target_language=target_language,
+        use_llm=use_llm,
+        llm_model=llm_model,
+        error=result.get('error')
+    )
+
+
+def _target_languages(values: List[str]) -> List[str]:
+    """Target languages from repeated form fields and/or comma-separated values."""
+    languages = list(dict.fromkeys(
+        language.strip()
+        for value in values
+        for language in value.split(',')
+        if language.strip()
+    ))
+    if not languages:
+        raise HTTPException(status_code=400, detail="At least one target language is required")
+    if len(languages) > settings.MAX_TARGET_LANGUAGES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.MAX_TARGET_LANGUAGES} target languages are supported per request"
+        )
+    return languages
+
+
+def _busy(filename: str) -> HTTPException:
+    return HTTPException(
+        status_code=409,
+        detail=f"Another job is still processing {filename}, please retry later"
+    )
+
+
 @router.get("/models")
 async def get_available_models():
     """
@@ -38,18 +119,28 @@ async def get_available_models():
         Dictionary with available models
     """
     return {
-        "models": settings.AVAILABLE_LLM_MODELS,
+        "models": {name: model["label"] for name, model in settings.AVAILABLE_LLM_MODELS.items()},
         "default": settings.DEFAULT_LLM_MODEL
     }
 
 
 @router.post("/upload", response_model=DocumentUploadResponse)
-async def upload_document(file: UploadFile = File(...)):
+def upload_document(
+    file: UploadFile = File(...),
+    uploads: UploadStore = Depends(get_upload_store),
+    storage: StorageManager = Depends(get_storage_manager)
+):
     """
     Upload a PPTX document for translation.
     
+    The file is stored under its content hash, returned as ``document_id``
+    for /translate-by-id; uploading identical content again stores nothing
+    new, and different files with the same name never overwrite each other.
+    
     Args:
         file: PPTX file to upload
+        uploads: Content-addressed upload store
+        storage: Disk budget manager
         
     Returns:
         Upload confirmation with file details
@@ -62,31 +153,29 @@ async def upload_document(file: UploadFile = File(...)):
                 detail="Only PPTX files are supported"
             )
         
-        # Check file size
-        file_path = settings.UPLOAD_FOLDER / file.filename
+        content = file.file.read()
         
-        # Save file
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            
-            # Check size
-            if len(content) > settings.MAX_UPLOAD_SIZE:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB"
-                )
-            
-            buffer.write(content)
+        # Check size
+        if len(content) > settings.MAX_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB"
+            )
         
+        # Stored files are immutable, so no job reading one needs a lock
+        storage.make_room(len(content))
+        document_id = uploads.put(content, file.filename)
+        file_path = uploads.path(document_id)
         file_size = get_file_size(str(file_path))
         
-        logger.info(f"File uploaded: {file.filename} ({file_size} bytes)")
+        logger.info(f"File uploaded: {file.filename} ({file_size} bytes) as {document_id}")
         
         return DocumentUploadResponse(
             success=True,
             filename=file.filename,
             file_path=str(file_path),
-            file_size=file_size
+            file_size=file_size,
+            document_id=document_id
         )
     
     except HTTPException:
@@ -96,19 +185,131 @@ async def upload_document(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
+def _translate_stored(
+    doc_processor: DocumentProcessor,
+    storage: StorageManager,
+    document_id: str,
+    input_path: Path,
+    filename: str,
+    target_language: str,
+    source_language: Optional[str],
+    use_llm: bool,
+    llm_model: Optional[str],
+    preserve_formatting: bool
+) -> DocumentTranslationResponse:
+    """Translate a stored upload into one language, naming the output after filename."""
+    output_filename = generate_unique_filename(filename, target_language, document_id)
+    output_path = settings.OUTPUT_FOLDER / output_filename
+    
+    # Translated decks are about as large as their input
+    storage.make_room(get_file_size(str(input_path)))
+    
+    try:
+        # The output is owned by this job until it finishes, in any worker,
+        # and neither file is evicted meanwhile
+        with _document_locks(output_filename), storage.pinned(input_path, output_path):
+            result = doc_processor.process_pptx(
+                input_path=input_path,
+                output_path=output_path,
+                target_language=target_language,
+                source_language=source_language,
+                use_llm=use_llm,
+                llm_model=llm_model,
+                preserve_formatting=preserve_formatting,
+                document_id=document_id
+            )
+    except TimeoutError:
+        raise _busy(output_filename)
+    
+    if not result.get('success'):
+        raise HTTPException(
+            status_code=500,
+            detail=result.get('error', 'Translation failed')
+        )
+    
+    logger.info(f"Document translated: {filename} -> {output_filename}")
+    
+    return _translation_response(filename, output_filename, target_language, result, use_llm, llm_model)
+
+
+@router.post("/translate-by-id", response_model=DocumentTranslationResponse)
+def translate_document_by_id(
+    request: DocumentTranslationRequest,
+    doc_processor: DocumentProcessor = Depends(get_document_processor),
+    uploads: UploadStore = Depends(get_upload_store),
+    storage: StorageManager = Depends(get_storage_manager)
+):
+    """
+    Translate a document previously sent to /upload, by its document id.
+    
+    Nothing is uploaded again, and repeated translations of the same
+    document (other languages, with or without LLM) reuse its parsed text
+    and OCR results while they are cached.
+    
+    Args:
+        request: Document id and translation options
+        doc_processor: Document processor instance (includes image translation)
+        uploads: Content-addressed upload store
+        storage: Disk budget manager
+        
+    Returns:
+        Translation result with output file details
+    """
+    try:
+        try:
+            input_path = uploads.path(request.document_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        # Pin before looking the upload up, so a sweep either ran before
+        # (and the upload is gone) or keeps it until the job is done
+        with storage.pinned(input_path):
+            upload = uploads.get(request.document_id)
+            if upload is None:
+                raise HTTPException(status_code=404, detail="Document not found, please upload it again")
+            
+            filename = Path(request.filename or upload['filename']).name
+            if not filename.endswith('.pptx'):
+                filename = f"{Path(filename).stem}.pptx"
+            
+            return _translate_stored(
+                doc_processor,
+                storage,
+                request.document_id,
+                input_path,
+                filename,
+                request.target_language,
+                request.source_language,
+                request.use_llm,
+                request.llm_model,
+                request.preserve_formatting
+            )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Translation error: {e}")
+        raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
+
+
 @router.post("/translate", response_model=DocumentTranslationResponse)
-async def translate_document(
+def translate_document(
     file: UploadFile = File(...),
     target_language: str = Form(...),
     source_language: Optional[str] = Form(None),
     use_llm: bool = Form(False),
     llm_model: Optional[str] = Form(None),
     preserve_formatting: bool = Form(True),
-    doc_processor: DocumentProcessor = Depends(get_document_processor)
+    doc_processor: DocumentProcessor = Depends(get_document_processor),
+    uploads: UploadStore = Depends(get_upload_store),
+    storage: StorageManager = Depends(get_storage_manager)
 ):
     """
     Translate a PPTX document (upload and translate in one step).
     
+    Prefer /upload followed by /translate-by-id when translating a deck
+    more than once, so it is sent (and parsed) only once.
+    
     Args:
         file: PPTX file to translate
         target_language: Target language code
@@ -117,6 +318,8 @@ async def translate_document(
         llm_model: LLM model to use (optional, defaults to Claude 3.5 Sonnet)
         preserve_formatting: Whether to preserve formatting
         doc_processor: Document processor instance (includes image translation)
+        uploads: Content-addressed upload store
+        storage: Disk budget manager
         
     Returns:
         Translation result with output file details
@@ -129,70 +332,344 @@ async def translate_document(
                 detail="Only PPTX files are supported"
             )
         
-        # Save uploaded file
-        input_path = settings.UPLOAD_FOLDER / file.filename
-        with open(input_path, "wb") as buffer:
-            content = await file.read()
-            
-            # Check size
-            if len(content) > settings.MAX_UPLOAD_SIZE:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB"
-                )
+        content = file.file.read()
+        
+        # Check size
+        if len(content) > settings.MAX_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB"
+            )
+        
+        document_id = content_id(content)
+        input_path = uploads.path(document_id)
+        storage.make_room(len(content))
+        
+        with storage.pinned(input_path):
+            uploads.put(content, file.filename)
+            logger.info(f"File uploaded for translation: {file.filename}")
             
-            buffer.write(content)
-        
-        logger.info(f"File uploaded for translation: {file.filename}")
-        
-        # Generate output filename
-        output_filename = generate_unique_filename(file.filename, target_language)
-        output_path = settings.OUTPUT_FOLDER / output_filename
-        
-        # Process document (now includes image translation)
-        result = doc_processor.process_pptx(
-            input_path=input_path,
-            output_path=output_path,
-            target_language=target_language,
-            source_language=source_language,
-            use_llm=use_llm,
-            llm_model=llm_model,
-            preserve_formatting=preserve_formatting
-        )
+            return _translate_stored(
+                doc_processor,
+                storage,
+                document_id,
+                input_path,
+                file.filename,
+                target_language,
+                source_language,
+                use_llm,
+                llm_model,
+                preserve_formatting
+            )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Translation error: {e}")
+        raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
+
+
+@router.post("/translate-multi", response_model=MultiDocumentTranslationResponse)
+def translate_document_multi(
+    file: UploadFile = File(...),
+    target_languages: List[str] = Form(...),
+    source_language: Optional[str] = Form(None),
+    use_llm: bool = Form(False),
+    llm_model: Optional[str] = Form(None),
+    preserve_formatting: bool = Form(True),
+    doc_processor: DocumentProcessor = Depends(get_document_processor),
+    uploads: UploadStore = Depends(get_upload_store),
+    storage: StorageManager = Depends(get_storage_manager)
+):
+    """
+    Translate a PPTX document into several target languages in one pass.
+    
+    The document is parsed and its images are OCR'd once, segments are
+    translated into every language in shared batches, and one output file
+    is written per language.
+    
+    Args:
+        file: PPTX file to translate
+        target_languages: Target language codes (repeated field or comma-separated)
+        source_language: Source language code (optional)
+        use_llm: Whether to use LLM enhancement
+        llm_model: LLM model to use (optional, defaults to Claude 3.5 Sonnet)
+        preserve_formatting: Whether to preserve formatting
+        doc_processor: Document processor instance (includes image translation)
+        uploads: Content-addressed upload store
+        storage: Disk budget manager
+        
+    Returns:
+        Per-language translation results with output file details
+    """
+    try:
+        # Validate file extension
+        if not file.filename.endswith('.pptx'):
+            raise HTTPException(
+                status_code=400,
+                detail="Only PPTX files are supported"
+            )
+        
+        # Accept both repeated form fields and a single comma-separated value
+        languages = _target_languages(target_languages)
+        
+        content = file.file.read()
         
-        if not result.get('success'):
+        # Check size
+        if len(content) > settings.MAX_UPLOAD_SIZE:
             raise HTTPException(
-                status_code=500,
-                detail=result.get('error', 'Translation failed')
+                status_code=400,
+                detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB"
             )
         
-        logger.info(f"Document translated: {file.filename} -> {output_filename}")
+        document_id = content_id(content)
+        input_path = uploads.path(document_id)
+        output_paths = {
+            language: settings.OUTPUT_FOLDER / generate_unique_filename(file.filename, language, document_id)
+            for language in languages
+        }
         
-        return DocumentTranslationResponse(
-            success=True,
+        # The upload plus one translated deck of about its size per language
+        storage.make_room(len(content) * (1 + len(languages)))
+        
+        # Outputs are owned by this job until it finishes, in any worker,
+        # and neither the upload nor the outputs are evicted meanwhile
+        with _document_locks(*(path.name for path in output_paths.values())), \
+                storage.pinned(input_path, *output_paths.values()):
+            uploads.put(content, file.filename)
+            logger.info(f"File uploaded for translation into {len(languages)} languages: {file.filename}")
+            
+            results = doc_processor.process_pptx_multi(
+                input_path=input_path,
+                output_paths=output_paths,
+                source_language=source_language,
+                use_llm=use_llm,
+                llm_model=llm_model,
+                preserve_formatting=preserve_formatting,
+                document_id=document_id
+            )
+        
+        translations = [
+            _translation_response(
+                file.filename,
+                output_paths[language].name,
+                language,
+                results[language],
+                use_llm,
+                llm_model
+            )
+            for language in languages
+        ]
+        
+        logger.info(f"Document translated: {file.filename} -> {', '.join(p.name for p in output_paths.values())}")
+        
+        return MultiDocumentTranslationResponse(
+            success=all(t.success for t in translations),
             filename=file.filename,
-            output_filename=output_filename,
-            slides_translated=result.get('slides_processed', 0),
-            text_frames_translated=result.get('text_frames_translated', 0),
-            target_language=target_language,
-            use_llm=use_llm,
-            llm_model=llm_model
+            target_languages=languages,
+            translations=translations
         )
     
     except HTTPException:
         raise
+    except TimeoutError:
+        raise _busy(file.filename)
     except Exception as e:
         logger.error(f"Translation error: {e}")
         raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
 
 
+def _bulk_members(filename: str, content: bytes) -> Iterator[Tuple[str, bytes]]:
+    """The PPTX files of an upload: itself, or the decks inside a zip archive."""
+    if filename.endswith('.pptx'):
+        yield filename, content
+        return
+    if not filename.endswith('.zip'):
+        raise HTTPException(status_code=400, detail="Only PPTX files or zip archives of them are supported")
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(content))
+    except zipfile.BadZipFile:
+        raise HTTPException(status_code=400, detail=f"{filename} is not a valid zip archive")
+    with archive:
+        for member in archive.infolist():
+            name = Path(member.filename).name
+            if member.is_dir() or member.filename.startswith('__MACOSX/') or name.startswith('.'):
+                continue
+            if not name.endswith('.pptx'):
+                continue
+            if member.file_size > settings.MAX_UPLOAD_SIZE:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{name} in {filename} exceeds the maximum size of {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB"
+                )
+            yield name, archive.read(member)
+
+
+@router.post("/translate-bulk")
+def translate_documents_bulk(
+    files: List[UploadFile] = File(...),
+    target_languages: List[str] = Form(...),
+    source_language: Optional[str] = Form(None),
+    use_llm: bool = Form(False),
+    llm_model: Optional[str] = Form(None),
+    preserve_formatting: bool = Form(True),
+    doc_processor: DocumentProcessor = Depends(get_document_processor),
+    uploads: UploadStore = Depends(get_upload_store),
+    storage: StorageManager = Depends(get_storage_manager)
+):
+    """
+    Translate many PPTX files, or zip archives of them, as one set.
+    
+    Segments shared between the decks (boilerplate) are translated once for
+    the whole set, and each document's outputs are written as soon as its
+    own segments are translated, so early decks are downloadable while
+    later ones are still being processed.
+    
+    Args:
+        files: PPTX files and/or zip archives of PPTX files
+        target_languages: Target language codes (repeated field or comma-separated)
+        source_language: Source language code (optional)
+        use_llm: Whether to use LLM enhancement
+        llm_model: LLM model to use (optional, defaults to Claude 3.5 Sonnet)
+        preserve_formatting: Whether to preserve formatting
+        doc_processor: Document processor instance (includes image translation)
+        uploads: Content-addressed upload store
+        storage: Disk budget manager
+        
+    Returns:
+        Newline-delimited JSON: an ``accepted`` line listing the documents,
+        one ``document`` line per completed document (completion order;
+        MultiDocumentTranslationResponse fields plus ``index`` and
+        ``document_id``), then a ``done`` line with totals for the set
+    """
+    languages = _target_languages(target_languages)
+    
+    documents = []
+    output_names = set()
+    for file in files:
+        content = file.file.read()
+        if len(content) > settings.MAX_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB"
+            )
+        for name, deck in _bulk_members(file.filename, content):
+            if len(documents) >= settings.BULK_MAX_DOCUMENTS:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"At most {settings.BULK_MAX_DOCUMENTS} documents are supported per request"
+                )
+            storage.make_room(len(deck) * (1 + len(languages)))
+            document_id = uploads.put(deck, name)
+            
+            # Outputs carry the document id; identical decks with the same name
+            # (e.g. copies in different zip folders) still get distinct outputs
+            filename, copy = name, 1
+            while any(generate_unique_filename(filename, language, document_id) in output_names for language in languages):
+                filename = f"{Path(name).stem} ({copy}).pptx"
+                copy += 1
+            output_paths = {
+                language: settings.OUTPUT_FOLDER / generate_unique_filename(filename, language, document_id)
+                for language in languages
+            }
+            output_names.update(path.name for path in output_paths.values())
+            documents.append({
+                'filename': filename,
+                'document_id': document_id,
+                'input_path': uploads.path(document_id),
+                'output_paths': output_paths
+            })
+    if not documents:
+        raise HTTPException(status_code=400, detail="No PPTX files found in the upload")
+    
+    logger.info(f"Bulk translation of {len(documents)} documents into {', '.join(languages)}")
+    
+    def events():
+        yield {
+            'event': 'accepted',
+            'target_languages': languages,
+            'documents': [
+                {'index': index, 'filename': document['filename'], 'document_id': document['document_id']}
+                for index, document in enumerate(documents)
+            ]
+        }
+        start = time.perf_counter()
+        succeeded = segments_total = segments_unique = 0
+        try:
+            # Taken once the stream runs, so an abandoned response holds nothing
+            with ExitStack() as held:
+                held.enter_context(_document_locks(*output_names))
+                held.enter_context(storage.pinned(
+                    *(document['input_path'] for document in documents),
+                    *(path for document in documents for path in document['output_paths'].values())
+                ))
+                for index, results in doc_processor.process_pptx_bulk(
+                    documents,
+                    target_languages=languages,
+                    source_language=source_language,
+                    use_llm=use_llm,
+                    llm_model=llm_model,
+                    preserve_formatting=preserve_formatting
+                ):
+                    document = documents[index]
+                    translations = [
+                        _translation_response(
+                            document['filename'],
+                            document['output_paths'][language].name,
+                            language,
+                            results[language],
+                            use_llm,
+                            llm_model
+                        )
+                        for language in languages
+                    ]
+                    response = MultiDocumentTranslationResponse(
+                        success=all(t.success for t in translations),
+                        filename=document['filename'],
+                        target_languages=languages,
+                        translations=translations,
+                        error=next((t.error for t in translations if t.error), None)
+                    )
+                    first = results[languages[0]]
+                    succeeded += response.success
+                    segments_total += first.get('segments_total', 0)
+                    segments_unique += first.get('segments_new', 0)
+                    yield {
+                        'event': 'document',
+                        'index': index,
+                        'document_id': document['document_id'],
+                        **response.model_dump()
+                    }
+        except TimeoutError:
+            yield {'event': 'error', 'error': _busy("these documents").detail}
+            return
+        
+        logger.info(f"Bulk translation done: {succeeded}/{len(documents)} documents")
+        yield {
+            'event': 'done',
+            'documents': len(documents),
+            'succeeded': succeeded,
+            'segments_total': segments_total,
+            'segments_unique': segments_unique,
+            'seconds': round(time.perf_counter() - start, 3)
+        }
+    
+    return ndjson_response(events())
+
+
 @router.get("/download/{filename}")
-async def download_document(filename: str):
+def download_document(
+    filename: str,
+    storage: StorageManager = Depends(get_storage_manager),
+    sessions: EditorSessionManager = Depends(get_editor_sessions)
+):
     """
     Download a translated document.
     
     Args:
         filename: Name of the translated file
+        storage: Disk budget manager (records the access)
+        sessions: Editor sessions (edits not saved yet are written first)
         
     Returns:
         File download response
@@ -203,6 +680,9 @@ async def download_document(filename: str):
         if not file_path.exists():
             raise HTTPException(status_code=404, detail="File not found")
         
+        sessions.flush(file_path)
+        storage.touch(file_path)
+        
         return FileResponse(
             path=str(file_path),
             filename=filename,
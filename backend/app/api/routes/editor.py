@@ -1,18 +1,82 @@
 """Editor API routes for managing translation edits."""
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from typing import List
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+import json
 import logging
 
+from app.services.editor_sessions import EditorSessionManager
+from app.services.slide_preview import (
+    build_slide_package,
+    edits_digest,
+    placeholder_png,
+    render_slide_png,
+    slide_edits
+)
 from app.services.translation_processor import TranslationProcessor
-from app.api.dependencies import get_translation_processor
+from app.api.dependencies import (
+    get_translation_processor,
+    get_shared_cache,
+    get_storage_manager,
+    get_translation_memory,
+    get_editor_sessions
+)
+from app.utils.metrics import record_cache
+from app.utils.sse import sse_response
+from app.utils.translation_memory import TranslationMemory
 from app.models.translation import ImproveTranslationRequest, ImproveTranslationResponse
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+# Editor payloads (document content) are large; orjson renders them much faster
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# Cache for slide images to avoid regenerating
-_slide_image_cache = {}
+# Slide images are cached in the shared cache (visible to every worker) under this namespace
+_SLIDE_PREVIEW_CACHE = 'slide_preview'
+
+# Text frame fields selectable with ?fields= on /document-content (id is always included)
+_FRAME_FIELDS = ('id', 'text', 'original_text', 'shape_index')
+
+
+def _keep_open(file_path):
+    """Pin a document while it is being edited, so storage sweeps leave it alone."""
+    from app.config import settings
+    get_storage_manager().lease(file_path, settings.EDITOR_PIN_MINUTES * 60)
+
+
+def _original_texts(file_path: Path) -> Dict[str, str]:
+    """
+    Source texts of a translated deck by frame id, from its ``.original.json`` sidecar.
+    
+    The parsed sidecar is cached until the file changes, so paging through
+    a large deck does not re-read it per page. The dict is shared: do not
+    modify it.
+    """
+    original_texts_path = file_path.with_suffix('.original.json')
+    try:
+        stat = original_texts_path.stat()
+    except FileNotFoundError:
+        return {}
+    return _load_original_texts(str(original_texts_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=16)
+def _load_original_texts(path: str, mtime_ns: int, size: int) -> Dict[str, str]:
+    with open(path, 'r', encoding='utf-8') as f:
+        original_texts = json.load(f)
+    logger.info(f"Loaded {len(original_texts)} original texts from {Path(path).name}")
+    return original_texts
+
+
+def _target_language_of(filename: str, requested: Optional[str]) -> Optional[str]:
+    """Target language of a translated deck: as requested, else from its ``<name>_<lang>.pptx`` name."""
+    from app.config import settings
+    if requested:
+        return requested
+    suffix = Path(filename).stem.rpartition('_')[2]
+    return suffix if suffix in settings.SUPPORTED_LANGUAGES else None
 
 
 class SlideContent(BaseModel):
@@ -27,6 +91,7 @@ class DocumentContentResponse(BaseModel):
     filename: str = Field(..., description="Document filename")
     total_slides: int = Field(..., description="Total number of slides")
     slides: List[SlideContent] = Field(..., description="Slide contents")
+    next_cursor: str | None = Field(None, description="Cursor of the next page, if slides remain")
     error: str | None = Field(None, description="Error message if failed")
 
 
@@ -36,6 +101,7 @@ class TranslationEdit(BaseModel):
     current_translation: str = Field(..., description="Current translation")
     edited_translation: str = Field(..., description="User's edited translation")
     target_language: str = Field(..., description="Target language code")
+    source_language: Optional[str] = Field(None, description="Source language code (optional)")
 
 
 class BulkEditRequest(BaseModel):
@@ -48,18 +114,23 @@ class BulkEditResponse(BaseModel):
     success: bool = Field(..., description="Whether operation succeeded")
     edited_count: int = Field(..., description="Number of translations edited")
     edits: List[TranslationEdit] = Field(..., description="Edited translations")
+    remembered: int = Field(0, description="Edits stored in the translation memory")
 
 
 @router.post("/save-edits", response_model=BulkEditResponse)
-async def save_translation_edits(request: BulkEditRequest):
+def save_translation_edits(
+    request: BulkEditRequest,
+    memory: Optional[TranslationMemory] = Depends(get_translation_memory)
+):
     """
     Save user's manual edits to translations.
     
-    This endpoint stores the user's edited translations.
-    In a production system, these would be saved to a database.
+    Edits are stored in the translation memory as human translations, so
+    later translations of the same text use them instead of Azure or the LLM.
     
     Args:
         request: Bulk edit request with list of edits
+        memory: Translation memory (None when disabled)
         
     Returns:
         Confirmation of saved edits
@@ -68,14 +139,22 @@ async def save_translation_edits(request: BulkEditRequest):
         if not request.edits:
             raise HTTPException(status_code=400, detail="No edits provided")
         
-        # In a real application, you would save these to a database
-        # For now, we just return them as confirmation
         logger.info(f"Saving {len(request.edits)} translation edits")
         
+        remembered = 0
+        if memory is not None:
+            pairs = {}
+            for edit in request.edits:
+                key = (edit.target_language, edit.source_language)
+                pairs.setdefault(key, []).append((edit.original_text, edit.edited_translation))
+            for (target_language, source_language), entries in pairs.items():
+                remembered += memory.add(entries, target_language, source_language)
+        
         return BulkEditResponse(
             success=True,
             edited_count=len(request.edits),
-            edits=request.edits
+            edits=request.edits,
+            remembered=remembered
         )
     
     except HTTPException:
@@ -86,7 +165,7 @@ async def save_translation_edits(request: BulkEditRequest):
 
 
 @router.get("/slide-preview/{filename}/{slide_number}")
-async def get_slide_preview(filename: str, slide_number: int):
+def get_slide_preview(filename: str, slide_number: int):
     """
     Generate a placeholder preview image (Aspose.Slides disabled due to ICU issues).
     
@@ -98,24 +177,24 @@ async def get_slide_preview(filename: str, slide_number: int):
         Placeholder image
     """
     from app.config import settings
-    from pathlib import Path
-    import io
     from fastapi.responses import Response
-    from PIL import Image, ImageDraw
     
     try:
         file_path = settings.OUTPUT_FOLDER / filename
         if not file_path.exists():
             raise HTTPException(status_code=404, detail="Document not found")
+        _keep_open(file_path)
         
         # Check cache first
         file_mtime = file_path.stat().st_mtime
         cache_key = f"{filename}_{slide_number}_{file_mtime}"
         
-        if cache_key in _slide_image_cache:
+        cached = get_shared_cache().get(_SLIDE_PREVIEW_CACHE, cache_key)
+        record_cache('slide_preview', cached is not None)
+        if cached is not None:
             logger.debug(f"Serving cached placeholder for {cache_key}")
             return Response(
-                content=_slide_image_cache[cache_key],
+                content=cached,
                 media_type="image/png",
                 headers={
                     "Cache-Control": "public, max-age=86400",
@@ -123,40 +202,10 @@ async def get_slide_preview(filename: str, slide_number: int):
                 }
             )
         
-        # Create placeholder image
-        img = Image.new('RGB', (960, 720), color='#f8f9fa')
-        draw = ImageDraw.Draw(img)
-        
-        # Draw slide number and message
-        text_lines = [
-            f"Slide {slide_number + 1}",
-            "",
-            "Preview not available",
-            "",
-            "(Download file to see presentation)"
-        ]
-        
-        y_position = 280
-        for line in text_lines:
-            bbox = draw.textbbox((0, 0), line)
-            text_width = bbox[2] - bbox[0]
-            x_position = (960 - text_width) // 2
-            draw.text((x_position, y_position), line, fill='#666666')
-            y_position += 40
-        
-        # Draw border
-        draw.rectangle([(0, 0), (959, 719)], outline='#dee2e6', width=3)
-        
-        # Save to bytes
-        img_buffer = io.BytesIO()
-        img.save(img_buffer, format='PNG')
-        img_bytes = img_buffer.getvalue()
+        img_bytes = placeholder_png(slide_number)
         
         # Cache the placeholder
-        _slide_image_cache[cache_key] = img_bytes
-        if len(_slide_image_cache) > 20:
-            oldest_key = next(iter(_slide_image_cache))
-            del _slide_image_cache[oldest_key]
+        get_shared_cache().set(_SLIDE_PREVIEW_CACHE, cache_key, img_bytes)
         
         return Response(
             content=img_bytes,
@@ -175,65 +224,104 @@ async def get_slide_preview(filename: str, slide_number: int):
 
 
 @router.get("/document-content/{filename}", response_model=DocumentContentResponse)
-async def get_document_content(filename: str):
+def get_document_content(
+    filename: str,
+    start: int = Query(1, ge=1, description="First slide (1-indexed)"),
+    end: Optional[int] = Query(None, ge=1, description="Last slide (inclusive)"),
+    limit: Optional[int] = Query(None, ge=1, description="Slides per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (overrides start)"),
+    fields: Optional[str] = Query(None, description=f"Comma-separated text frame fields among {', '.join(_FRAME_FIELDS)}"),
+    sessions: EditorSessionManager = Depends(get_editor_sessions)
+):
     """
-    Extract all text content from a translated document for editing.
+    Extract text content from a translated document for editing.
+    
+    Without paging parameters every slide is returned. Large decks can be
+    fetched a slide range at a time (``start``/``end``) or page by page
+    (``limit``, then ``cursor=next_cursor`` until it is null); ``fields``
+    trims each text frame to the fields the client needs.
     
     Args:
         filename: Name of the translated document file
+        start: First slide of the range (1-indexed)
+        end: Last slide of the range (inclusive)
+        limit: Maximum slides covered by this page
+        cursor: Opaque cursor returned by the previous page
+        fields: Text frame fields to return
+        sessions: Editor sessions (the deck is parsed once and kept in memory)
         
     Returns:
-        Document content with all slides and text frames (including original text)
+        Document content with the requested slides and text frames (including original text)
     """
     from app.config import settings
-    from pptx import Presentation
-    from pathlib import Path
-    import json
     
     try:
         file_path = settings.OUTPUT_FOLDER / filename
         if not file_path.exists():
             raise HTTPException(status_code=404, detail="Document not found")
         
-        # Load original texts from JSON file if it exists
-        original_texts_path = file_path.with_suffix('.original.json')
+        if cursor is not None:
+            try:
+                start = int(cursor)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            # Slides are 1-indexed; python-pptx would accept negative indices
+            if start < 1:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        selected = set(_FRAME_FIELDS)
+        if fields:
+            selected = {field.strip() for field in fields.split(',') if field.strip()} | {'id'}
+            unknown = selected - set(_FRAME_FIELDS)
+            if unknown:
+                raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+        
+        # Original texts from the JSON sidecar, if it exists and they are requested
         original_texts = {}
-        if original_texts_path.exists():
+        if 'original_text' in selected:
             try:
-                with open(original_texts_path, 'r', encoding='utf-8') as f:
-                    original_texts = json.load(f)
-                logger.info(f"Loaded {len(original_texts)} original texts from {original_texts_path.name}")
+                original_texts = _original_texts(file_path)
             except Exception as e:
                 logger.warning(f"Could not load original texts: {e}")
         
-        prs = Presentation(file_path)
-        slides_content = []
-        
-        for slide_idx, slide in enumerate(prs.slides):
-            text_frames = []
+        with sessions.open(file_path) as session:
+            prs = session.presentation
+            total_slides = len(prs.slides)
+            last = min(total_slides, end or total_slides)
+            if limit:
+                last = min(last, start + limit - 1)
+            slides_content = []
             
-            for shape_idx, shape in enumerate(slide.shapes):
-                if shape.has_text_frame:
-                    frame_id = f'slide_{slide_idx}_shape_{shape_idx}'
-                    text_frames.append({
-                        'id': frame_id,
-                        'text': shape.text_frame.text,
-                        'original_text': original_texts.get(frame_id, ''),  # Add original text
-                        'shape_index': shape_idx
+            # Only the requested slides are walked; slides are 1-indexed here
+            for slide_number in range(start, last + 1):
+                slide_idx = slide_number - 1
+                text_frames = []
+                
+                for shape_idx, shape in enumerate(prs.slides[slide_idx].shapes):
+                    if shape.has_text_frame:
+                        frame_id = f'slide_{slide_idx}_shape_{shape_idx}'
+                        frame = {
+                            'id': frame_id,
+                            'text': shape.text_frame.text,
+                            'original_text': original_texts.get(frame_id, ''),  # Add original text
+                            'shape_index': shape_idx
+                        }
+                        text_frames.append({key: value for key, value in frame.items() if key in selected})
+                
+                if text_frames:  # Only include slides with text
+                    slides_content.append({
+                        'slide_number': slide_number,
+                        'text_frames': text_frames
                     })
-            
-            if text_frames:  # Only include slides with text
-                slides_content.append(SlideContent(
-                    slide_number=slide_idx + 1,
-                    text_frames=text_frames
-                ))
         
-        return DocumentContentResponse(
-            success=True,
-            filename=filename,
-            total_slides=len(prs.slides),
-            slides=slides_content
-        )
+        # Plain dicts rendered by orjson directly: no per-frame model validation
+        return ORJSONResponse({
+            'success': True,
+            'filename': filename,
+            'total_slides': total_slides,
+            'slides': slides_content,
+            'next_cursor': str(last + 1) if last < min(total_slides, end or total_slides) else None,
+            'error': None
+        })
         
     except HTTPException:
         raise
@@ -246,149 +334,149 @@ class UpdateContentRequest(BaseModel):
     """Request model for updating document content."""
     filename: str = Field(..., description="Document filename to update")
     edits: List[dict] = Field(..., description="List of text edits with id and new text")
+    target_language: Optional[str] = Field(None, description="Target language code (default: from the filename)")
+    source_language: Optional[str] = Field(None, description="Source language code (optional)")
 
 
 @router.post("/preview-with-edits")
-async def preview_slide_with_edits(request: UpdateContentRequest, slide_number: int):
+def preview_slide_with_edits(
+    request: UpdateContentRequest,
+    slide_number: int,
+    sessions: EditorSessionManager = Depends(get_editor_sessions)
+):
     """
     Generate a preview of a slide with temporary edits applied (without saving).
     
+    Only the previewed slide is copied and edited, in memory, from the deck
+    held by the editor session. Images are cached by document version,
+    slide and the slide's edits, so previewing the same state again is free.
+    
     Args:
         request: Edits to apply temporarily
-        slide_number: Slide number to preview
+        slide_number: Slide number to preview (0-indexed)
+        sessions: Editor sessions holding parsed decks
         
     Returns:
         Image of the slide with edits applied
     """
     from app.config import settings
-    from pathlib import Path
-    import io
-    from fastapi.responses import StreamingResponse
-    import aspose.slides as slides
-    from pptx import Presentation
-    import tempfile
+    from fastapi.responses import Response
     
     try:
         file_path = settings.OUTPUT_FOLDER / request.filename
         if not file_path.exists():
             raise HTTPException(status_code=404, detail="Document not found")
         
-        # Create a temporary copy
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pptx') as tmp:
-            tmp_path = Path(tmp.name)
-        
-        # Load and modify
-        prs = Presentation(file_path)
-        edits_map = {edit['id']: edit['text'] for edit in request.edits}
+        shape_edits = slide_edits({edit['id']: edit['text'] for edit in request.edits}, slide_number)
+        cache = get_shared_cache()
         
-        for slide_idx, slide in enumerate(prs.slides):
-            for shape_idx, shape in enumerate(slide.shapes):
-                if shape.has_text_frame:
-                    frame_id = f'slide_{slide_idx}_shape_{shape_idx}'
-                    if frame_id in edits_map:
-                        text_frame = shape.text_frame
-                        text_frame.clear()
-                        p = text_frame.paragraphs[0] if text_frame.paragraphs else text_frame.add_paragraph()
-                        p.text = edits_map[frame_id]
-        
-        prs.save(tmp_path)
-        
-        # Generate image from temp file
-        with slides.Presentation(str(tmp_path)) as prs_slides:
-            if slide_number < 0 or slide_number >= len(prs_slides.slides):
+        with sessions.open(file_path) as session:
+            if slide_number < 0 or slide_number >= len(session.presentation.slides):
                 raise HTTPException(status_code=400, detail="Invalid slide number")
             
-            slide = prs_slides.slides[slide_number]
-            scale = 2.0
-            with slide.get_image(scale, scale) as img:
-                img_buffer = io.BytesIO()
-                img.save(img_buffer, slides.ImageFormat.PNG)
-                img_buffer.seek(0)
-                
-                # Clean up temp file
-                tmp_path.unlink()
-                
-                return StreamingResponse(
-                    img_buffer,
-                    media_type="image/png",
-                    headers={"Cache-Control": "no-cache"}
-                )
+            # The version covers the saved file and the session's unsaved edits
+            cache_key = f"{request.filename}_{session.version}_{slide_number}_{edits_digest(shape_edits)}"
+            image = cache.get(_SLIDE_PREVIEW_CACHE, cache_key)
+            record_cache('slide_preview', image is not None)
+            if image is None:
+                package = build_slide_package(session.presentation, slide_number, shape_edits)
+        
+        if image is None:
+            image = render_slide_png(package)
+            if image is None:
+                # Not cached, so the slide is rendered once a renderer is available
+                image = placeholder_png(slide_number)
+            else:
+                cache.set(_SLIDE_PREVIEW_CACHE, cache_key, image)
+        
+        return Response(
+            content=image,
+            media_type="image/png",
+            headers={"Cache-Control": "no-cache"}
+        )
         
     except HTTPException:
         raise
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Document not found")
     except Exception as e:
         logger.error(f"Error generating preview: {e}")
-        if tmp_path.exists():
-            tmp_path.unlink()
         raise HTTPException(status_code=500, detail=f"Failed to generate preview: {str(e)}")
 
 
 @router.post("/update-content")
-async def update_document_content(request: UpdateContentRequest):
+def update_document_content(
+    request: UpdateContentRequest,
+    memory: Optional[TranslationMemory] = Depends(get_translation_memory),
+    sessions: EditorSessionManager = Depends(get_editor_sessions)
+):
     """
     Apply user's edits back to the document.
     
+    Edits are applied to the deck held in memory by the editor session and
+    written to disk shortly after the last one (see ``EDITOR_SAVE_DELAY``),
+    so a burst of edits costs one save. Each edited frame with a known
+    original text is also stored in the translation memory as a human
+    translation.
+    
     Args:
         request: Update request with filename and list of edits
+        memory: Translation memory (None when disabled)
+        sessions: Editor sessions holding parsed decks
         
     Returns:
         Success response with updated filename
     """
     from app.config import settings
-    from pptx import Presentation
-    from pathlib import Path
     
     try:
         file_path = settings.OUTPUT_FOLDER / request.filename
         if not file_path.exists():
             raise HTTPException(status_code=404, detail="Document not found")
         
-        prs = Presentation(file_path)
-        
         # Create a mapping of edits by id
         edits_map = {edit['id']: edit['text'] for edit in request.edits}
         
-        # Apply edits
-        for slide_idx, slide in enumerate(prs.slides):
-            for shape_idx, shape in enumerate(slide.shapes):
-                if shape.has_text_frame:
-                    frame_id = f'slide_{slide_idx}_shape_{shape_idx}'
-                    if frame_id in edits_map:
-                        new_text = edits_map[frame_id]
-                        # Clear all existing paragraphs and create new ones
-                        text_frame = shape.text_frame
-                        text_frame.clear()
-                        # Add the new text
-                        p = text_frame.paragraphs[0] if text_frame.paragraphs else text_frame.add_paragraph()
-                        p.text = new_text
-        
-        # Save the updated presentation
-        prs.save(file_path)
-        
-        # Clear cache for this file
-        global _slide_image_cache
-        file_mtime = file_path.stat().st_mtime
-        keys_to_delete = [k for k in _slide_image_cache.keys() if k.startswith(f"{request.filename}_")]
-        for key in keys_to_delete:
-            del _slide_image_cache[key]
+        # The save itself takes the document lock, so a translation job or an
+        # editor in another worker never interleaves with it
+        sessions.apply_edits(file_path, edits_map)
+        
+        # Clear cached previews of this file in every worker
+        get_shared_cache().delete_prefix(_SLIDE_PREVIEW_CACHE, f"{request.filename}_")
         
         logger.info(f"Document updated with {len(request.edits)} edits: {request.filename}")
         
+        remembered = 0
+        target_language = _target_language_of(request.filename, request.target_language)
+        if memory is not None and target_language:
+            try:
+                original_texts = _original_texts(file_path)
+                remembered = memory.add(
+                    [(original_texts[frame_id], text) for frame_id, text in edits_map.items() if frame_id in original_texts],
+                    target_language,
+                    request.source_language
+                )
+            except Exception as e:
+                logger.warning(f"Could not store edits in the translation memory: {e}")
+        
         return {
             "success": True,
             "filename": request.filename,
-            "edits_applied": len(request.edits)
+            "edits_applied": len(request.edits),
+            "remembered": remembered
         }
         
     except HTTPException:
         raise
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Document not found")
     except Exception as e:
         logger.error(f"Error updating document: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to update document: {str(e)}")
 
 
 @router.post("/suggest-improvement", response_model=ImproveTranslationResponse)
-async def suggest_translation_improvement(
+def suggest_translation_improvement(
     request: ImproveTranslationRequest,
     processor: TranslationProcessor = Depends(get_translation_processor)
 ):
@@ -416,4 +504,31 @@ async def suggest_translation_improvement(
     
     except Exception as e:
         logger.error(f"Error suggesting improvement: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to suggest improvement: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to suggest improvement: {str(e)}")
+
+
+@router.post("/suggest-improvement/stream")
+async def suggest_translation_improvement_stream(
+    request: ImproveTranslationRequest,
+    processor: TranslationProcessor = Depends(get_translation_processor)
+):
+    """
+    Stream AI suggestions for improving a translation as server-sent events.
+    
+    The editor can show tokens as they arrive: ``delta`` events carry
+    ``{"text": ...}`` and a final ``done`` event carries the same payload as
+    ``/suggest-improvement``.
+    
+    Args:
+        request: Improvement request with original and current translation
+        processor: Translation processor instance
+        
+    Returns:
+        Server-sent event stream
+    """
+    return sse_response(processor.stream_improve_translation(
+        original_text=request.original_text,
+        current_translation=request.current_translation,
+        target_language=request.target_language,
+        feedback=request.feedback
+    ))
@@ -1,10 +1,14 @@
 """Translation API routes."""
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from typing import List
 import logging
 
 from app.services.translation_processor import TranslationProcessor
 from app.api.dependencies import get_translation_processor
+from app.config import settings
+from app.utils.ndjson import ndjson_response
+from app.utils.sse import sse_response
 from app.models.translation import (
     TranslationRequest,
     TranslationResponse,
@@ -15,11 +19,11 @@ from app.models.translation import (
 )
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post("/translate", response_model=TranslationResponse)
-async def translate_text(
+def translate_text(
     request: TranslationRequest,
     processor: TranslationProcessor = Depends(get_translation_processor)
 ):
@@ -42,8 +46,28 @@ async def translate_text(
         raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
 
 
+@router.post("/translate/stream")
+async def translate_text_stream(
+    request: TranslationRequest,
+    processor: TranslationProcessor = Depends(get_translation_processor)
+):
+    """
+    Translate text, streaming LLM output as server-sent events.
+    
+    Emits ``delta`` events with ``{"text": ...}`` while the LLM generates,
+    then a single ``done`` event with the same payload as ``/translate``.
+    """
+    return sse_response(processor.stream_translate_text(
+        text=request.text,
+        target_language=request.target_language,
+        source_language=request.source_language,
+        context=request.context,
+        force_llm=request.use_llm
+    ))
+
+
 @router.post("/batch-translate", response_model=BatchTranslationResponse)
-async def batch_translate_texts(
+def batch_translate_texts(
     request: BatchTranslationRequest,
     processor: TranslationProcessor = Depends(get_translation_processor)
 ):
@@ -70,8 +94,33 @@ async def batch_translate_texts(
         raise HTTPException(status_code=500, detail=f"Batch translation failed: {str(e)}")
 
 
+@router.post("/batch-translate/stream")
+async def batch_translate_texts_stream(
+    request: BatchTranslationRequest,
+    processor: TranslationProcessor = Depends(get_translation_processor)
+):
+    """
+    Translate multiple texts, streaming results as newline-delimited JSON.
+    
+    Each line is a ``/translate``-shaped result plus its ``index``, in input
+    order, sent as soon as it and every earlier result are ready. Duplicate
+    texts are translated once, and texts already in the target language,
+    or without anything to translate, are returned unchanged.
+    """
+    results = processor.stream_batch_translate(
+        texts=request.texts,
+        target_language=request.target_language,
+        source_language=request.source_language,
+        chunk_size=settings.BATCH_STREAM_CHUNK_SIZE
+    )
+    return ndjson_response(
+        {'index': result['index'], **TranslationResponse(**result).model_dump()}
+        for result in results
+    )
+
+
 @router.post("/improve", response_model=ImproveTranslationResponse)
-async def improve_translation(
+def improve_translation(
     request: ImproveTranslationRequest,
     processor: TranslationProcessor = Depends(get_translation_processor)
 ):
@@ -90,4 +139,23 @@ async def improve_translation(
     
     except Exception as e:
         logger.error(f"Translation improvement error: {e}")
-        raise HTTPException(status_code=500, detail=f"Improvement failed: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Improvement failed: {str(e)}")
+
+
+@router.post("/improve/stream")
+async def improve_translation_stream(
+    request: ImproveTranslationRequest,
+    processor: TranslationProcessor = Depends(get_translation_processor)
+):
+    """
+    Improve an existing translation using LLM, streaming tokens as server-sent events.
+    
+    Emits ``delta`` events with ``{"text": ...}``, then a single ``done``
+    event with the same payload as ``/improve``.
+    """
+    return sse_response(processor.stream_improve_translation(
+        original_text=request.original_text,
+        current_translation=request.current_translation,
+        target_language=request.target_language,
+        feedback=request.feedback
+    ))
@@ -12,14 +12,26 @@ class Config:
     AZURE_TRANSLATOR_ENDPOINT: str = os.getenv("AZURE_TRANSLATOR_ENDPOINT", "https://api.cognitive.microsofttranslator.com/")
     AZURE_TRANSLATOR_KEY: str = os.getenv("AZURE_TRANSLATOR_KEY", "")  # REMOVED hardcoded key
     AZURE_TRANSLATOR_REGION: str = os.getenv("AZURE_TRANSLATOR_REGION", "japaneast")
+    AZURE_MAX_ELEMENTS_PER_REQUEST: int = int(os.getenv("AZURE_MAX_ELEMENTS_PER_REQUEST", "1000"))  # Azure /translate array limit
+    AZURE_MAX_CHARS_PER_REQUEST: int = int(os.getenv("AZURE_MAX_CHARS_PER_REQUEST", "50000"))  # Counted once per target language
+    AZURE_MAX_CONCURRENT_REQUESTS: int = int(os.getenv("AZURE_MAX_CONCURRENT_REQUESTS", "4"))  # Chunks dispatched in parallel
+    AZURE_HEDGE_BUDGET: float = float(os.getenv("AZURE_HEDGE_BUDGET", "0.05"))  # Share of requests that may be duplicated after the p95 (0 = off)
+    AZURE_REQUEST_TIMEOUT: float = float(os.getenv("AZURE_REQUEST_TIMEOUT", "30"))  # Deadline per request; adapts to 3x p99 once latencies are known
+    AZURE_HEDGE_MAX_CHARS: int = int(os.getenv("AZURE_HEDGE_MAX_CHARS", "5000"))  # Larger requests are never hedged and are timed separately
     
     # Azure Computer Vision settings (for OCR)
     AZURE_VISION_ENDPOINT: str = os.getenv("AZURE_VISION_ENDPOINT", "")
     AZURE_VISION_KEY: str = os.getenv("AZURE_VISION_KEY", "")
+    OCR_POLL_INTERVAL: float = float(os.getenv("OCR_POLL_INTERVAL", "1.0"))  # Seconds between Read API result polls
+    OCR_MODEL_VERSION: str = os.getenv("OCR_MODEL_VERSION", "latest")  # Read API model version; part of the OCR cache key
+    OCR_CACHE_MEMORY_ENTRIES: int = int(os.getenv("OCR_CACHE_MEMORY_ENTRIES", "256"))  # OCR results kept in each worker's memory
+    OCR_CACHE_MAX_ENTRIES: int = int(os.getenv("OCR_CACHE_MAX_ENTRIES", "5000"))  # OCR results kept on disk, shared by workers (0 = memory only)
     
     # OpenRouter settings
     OPENROUTER_API_URL: str = os.getenv("OPENROUTER_API_URL", "https://openrouter.ai/api/v1/chat/completions")
     OPENROUTER_API_KEY: str = os.getenv("OPENROUTER_API_KEY", "")  # REMOVED hardcoded key
+    OPENROUTER_MAX_TOKENS: int = int(os.getenv("OPENROUTER_MAX_TOKENS", "4096"))  # Cap on the input-derived completion budget
+    OPENROUTER_TIMEOUT: float = float(os.getenv("OPENROUTER_TIMEOUT", "60"))  # Seconds per request (or between streamed chunks)
     
     # Application settings
     APP_NAME: str = "Document Translation App"
@@ -28,23 +40,69 @@ class Config:
     # File upload settings
     UPLOAD_FOLDER: Path = Path("uploads")
     OUTPUT_FOLDER: Path = Path("outputs")
+    STATE_FOLDER: Path = Path(os.getenv("STATE_FOLDER", "state"))  # Caches and locks shared by all workers
     MAX_UPLOAD_SIZE: int = 100 * 1024 * 1024  # 100 MB
+    STORAGE_MAX_MB: int = int(os.getenv("STORAGE_MAX_MB", "10240"))  # Budget for uploads + outputs (0 = unlimited)
+    STORAGE_TTL_HOURS: float = float(os.getenv("STORAGE_TTL_HOURS", "72"))  # Delete documents not accessed for this long (0 = never)
+    STORAGE_MIN_FREE_MB: int = int(os.getenv("STORAGE_MIN_FREE_MB", "1024"))  # Evict LRU documents to keep this much disk free (0 = off)
+    STORAGE_SWEEP_INTERVAL: float = float(os.getenv("STORAGE_SWEEP_INTERVAL", "300"))  # Seconds between background sweeps (0 = off)
+    EDITOR_PIN_MINUTES: float = float(os.getenv("EDITOR_PIN_MINUTES", "30"))  # Documents stay pinned this long after an editor request
+    EDITOR_SESSION_MEMORY_MB: int = int(os.getenv("EDITOR_SESSION_MEMORY_MB", "512"))  # Parsed decks kept in memory per worker for the editor
+    EDITOR_SESSION_IDLE_SECONDS: float = float(os.getenv("EDITOR_SESSION_IDLE_SECONDS", "600"))  # Unused editor sessions are saved and dropped
+    EDITOR_SAVE_DELAY: float = float(os.getenv("EDITOR_SAVE_DELAY", "2.0"))  # Seconds after the last edit before it is written to disk
+    EDITOR_SAVE_MAX_DELAY: float = float(os.getenv("EDITOR_SAVE_MAX_DELAY", "10.0"))  # Edits are written at most this long after the first unsaved one
     ALLOWED_EXTENSIONS: set = {'.pptx'}
     
+    # Worker settings (start.sh --workers N exports WEB_CONCURRENCY)
+    WEB_CONCURRENCY: int = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))  # uvicorn worker processes
+    SHARED_CACHE_MAX_ENTRIES: int = int(os.getenv("SHARED_CACHE_MAX_ENTRIES", "200"))  # Per cache namespace
+    DOCUMENT_LOCK_TIMEOUT: float = float(os.getenv("DOCUMENT_LOCK_TIMEOUT", "0"))  # Seconds to wait for a job on the same document (0 = 409 at once)
+    
     # Translation settings
     SUPPORTED_LANGUAGES: list = ["en", "id", "ja", "fr", "de", "es", "zh", "ko"]
     DEFAULT_LLM_MODEL: str = "anthropic/claude-3.5-sonnet"
     USE_LLM_ENHANCEMENT: bool = os.getenv("USE_LLM_ENHANCEMENT", "true").lower() == "true"
     TRANSLATE_IMAGES: bool = os.getenv("TRANSLATE_IMAGES", "true").lower() == "true"  # Enable/disable image translation
+    IMAGE_RENDER_WORKERS: int = int(os.getenv("IMAGE_RENDER_WORKERS", str(max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY))))  # Render processes per worker (0 renders in-thread)
+    IMAGE_RENDER_MAX_PENDING: int = int(os.getenv("IMAGE_RENDER_MAX_PENDING", "0"))  # Queued renders before callers block (0 = 2x workers)
+    IMAGE_ENCODE_PROFILE: str = os.getenv("IMAGE_ENCODE_PROFILE", "balanced")  # fast | balanced | quality
     TRANSLATION_RETRY_ATTEMPTS: int = int(os.getenv("TRANSLATION_RETRY_ATTEMPTS", "3"))  # Number of retry attempts for failed translations
     TRANSLATION_RETRY_DELAY: float = float(os.getenv("TRANSLATION_RETRY_DELAY", "1.0"))  # Initial retry delay in seconds
+    DOCUMENT_OUTPUT_WORKERS: int = int(os.getenv("DOCUMENT_OUTPUT_WORKERS", "4"))  # Translated files written concurrently
+    DOCUMENT_ENGINE: str = os.getenv("DOCUMENT_ENGINE", "xml")  # xml (zip/XML fast path) | pptx (python-pptx)
+    TRANSLATE_MASTERS_AND_NOTES: bool = os.getenv("TRANSLATE_MASTERS_AND_NOTES", "true").lower() == "true"
+    EXTRACTION_CACHE_SIZE: int = int(os.getenv("EXTRACTION_CACHE_SIZE", "4"))  # Parsed+OCR'd uploads kept per worker for repeat translations (0 = off)
+    TRANSLATION_MEMORY_ENABLED: bool = os.getenv("TRANSLATION_MEMORY_ENABLED", "true").lower() == "true"  # Reuse saved human edits and past translations
+    TRANSLATION_MEMORY_MACHINE_ENTRIES: int = int(os.getenv("TRANSLATION_MEMORY_MACHINE_ENTRIES", "100000"))  # Machine translations kept (0 = human edits only)
+    LLM_ROUTING_THRESHOLD: float = float(os.getenv("LLM_ROUTING_THRESHOLD", "0.3"))  # Segment score needed for LLM translation (0 = every segment)
+    LLM_GLOSSARY_TERMS: list = [term for term in os.getenv("LLM_GLOSSARY_TERMS", "").split(",") if term.strip()]  # Terms always sent to the LLM
+    LLM_DECK_CONTEXT: bool = os.getenv("LLM_DECK_CONTEXT", "true").lower() == "true"  # Shared per-document context as a cached prompt prefix
+    LLM_STYLE_NOTES: str = os.getenv("LLM_STYLE_NOTES", "")  # House style instructions included in the deck context
+    LLM_SECONDS_PER_CALL: float = float(os.getenv("LLM_SECONDS_PER_CALL", "2.0"))  # Initial LLM latency estimate for routing reports
+    LLM_COST_PER_MILLION_TOKENS: float = float(os.getenv("LLM_COST_PER_MILLION_TOKENS", "6.0"))  # Blended price for routing reports
+    MAX_TARGET_LANGUAGES: int = int(os.getenv("MAX_TARGET_LANGUAGES", "10"))  # Target languages per multi-language request
+    COMPRESSION_MINIMUM_SIZE: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))  # Smaller responses are sent uncompressed
+    STARTUP_PREWARM: bool = os.getenv("STARTUP_PREWARM", "true").lower() == "true"  # Build and warm services before a worker takes traffic
+    BATCH_STREAM_CHUNK_SIZE: int = int(os.getenv("BATCH_STREAM_CHUNK_SIZE", "100"))  # Unique texts per request in /batch-translate/stream
+    BULK_MAX_DOCUMENTS: int = int(os.getenv("BULK_MAX_DOCUMENTS", "100"))  # Decks per /translate-bulk request (files + zip contents)
     
     # Available LLM models for translation
+    LLM_DEFAULT_MAX_CONCURRENCY: int = int(os.getenv("LLM_DEFAULT_MAX_CONCURRENCY", "8"))  # In-flight calls per model without its own limit
+    LLM_DEFAULT_TOKENS_PER_MINUTE: int = int(os.getenv("LLM_DEFAULT_TOKENS_PER_MINUTE", "0"))  # TPM per model without its own limit (0 = unlimited)
+    
+    LLM_FALLBACK_MODELS: list = [model.strip() for model in os.getenv("LLM_FALLBACK_MODELS", "").split(",") if model.strip()]  # Tried in order when the chosen model fails; Azure comes last
+    
+    # Circuit breakers per backend/model: consecutive failures to open, seconds before a probe
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_BREAKER_RECOVERY_SECONDS: float = float(os.getenv("CIRCUIT_BREAKER_RECOVERY_SECONDS", "30"))
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")  # Required as X-Admin-Token on /api/admin routes (unset = admin routes disabled)
+    
+    # Available LLM models with their per-model dispatch limits
     AVAILABLE_LLM_MODELS: dict = {
-        "anthropic/claude-3.5-sonnet": "Claude 3.5 Sonnet (Best Quality)",
-        "openai/gpt-4-turbo": "GPT-4 Turbo (Fast & Accurate)",
-        "google/gemini-pro-1.5": "Gemini Pro 1.5 (Balanced)",
-        "meta-llama/llama-3.1-70b-instruct": "Llama 3.1 70B (Open Source)"
+        "anthropic/claude-3.5-sonnet": {"label": "Claude 3.5 Sonnet (Best Quality)", "max_concurrency": 8, "tokens_per_minute": 400000},
+        "openai/gpt-4-turbo": {"label": "GPT-4 Turbo (Fast & Accurate)", "max_concurrency": 8, "tokens_per_minute": 300000},
+        "google/gemini-pro-1.5": {"label": "Gemini Pro 1.5 (Balanced)", "max_concurrency": 16, "tokens_per_minute": 1000000},
+        "meta-llama/llama-3.1-70b-instruct": {"label": "Llama 3.1 70B (Open Source)", "max_concurrency": 16, "tokens_per_minute": 0}
     }
     
     # CORS settings - will be updated with actual frontend URL in production
@@ -64,9 +122,15 @@ class Config:
     
     @staticmethod
     def ensure_directories():
-        """Ensure upload and output directories exist."""
+        """Ensure upload, output and shared state directories exist."""
         Config.UPLOAD_FOLDER.mkdir(exist_ok=True)
         Config.OUTPUT_FOLDER.mkdir(exist_ok=True)
+        Config.lock_folder().mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def lock_folder() -> Path:
+        """Directory holding cross-process document lock files."""
+        return Config.STATE_FOLDER / "locks"
 
 # Create a settings instance
 settings = Config()
\ No newline at end of file
@@ -1,8 +1,26 @@
 """Main FastAPI application."""
-from fastapi import FastAPI
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST
 from app.config import settings
-from app.api.routes import translation, document, editor
+from app.api.routes import translation, document, editor, admin
+from app.api.dependencies import (
+    get_document_processor,
+    get_editor_sessions,
+    get_image_render_pool,
+    get_ocr_cache,
+    get_shared_cache,
+    get_storage_manager,
+    get_translation_processor
+)
+from app.utils.compression import CompressionMiddleware
+from app.utils.metrics import mark_worker_exit, render_metrics
+from app.utils.startup import StartupProfile
 import logging
 
 # Configure logging
@@ -11,7 +29,52 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
-app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION)
+def warm_services(profile: StartupProfile):
+    """Build the services and load what their first request would otherwise wait for."""
+    with profile.step("translation", optional=True):
+        # Azure/OpenRouter clients, LLM router (glossary pattern), translation memory database
+        get_translation_processor()
+    with profile.step("caches", optional=True):
+        get_shared_cache()
+        get_ocr_cache()
+    with profile.step("documents", optional=True):
+        get_document_processor()
+    with profile.step("editor", optional=True):
+        get_editor_sessions()
+        from pptx import Presentation  # noqa: F401  (parses every editor deck)
+    with profile.step("images", optional=True):
+        # Pillow, overlay fonts and the render worker processes
+        image_translator = get_document_processor().image_translator
+        if image_translator:
+            image_translator.warm()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background work and warm services before taking traffic; stop them on shutdown."""
+    profile = StartupProfile(_IMPORT_STARTED, _IMPORTED)
+    app.state.startup_profile = profile
+    with profile.step("storage_sweeper"):
+        # Enforce the disk budget for uploads and outputs in the background
+        get_storage_manager().start(settings.STORAGE_SWEEP_INTERVAL)
+    if settings.STARTUP_PREWARM:
+        warm_services(profile)
+    profile.mark_ready()
+
+    yield
+
+    get_storage_manager().stop()
+    # Write edits still held in memory by the editor
+    if get_editor_sessions.cache_info().currsize:
+        get_editor_sessions().close()
+    # Stop image render worker processes if they were started
+    if get_image_render_pool.cache_info().currsize and get_image_render_pool():
+        get_image_render_pool().shutdown()
+    # Stop reporting this worker's live gauges
+    mark_worker_exit()
+
+
+app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION, lifespan=lifespan)
 
 # Configure CORS
 app.add_middleware(
@@ -22,14 +85,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses (br when available, else gzip) for clients that accept it
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
+
 # Include routers
 app.include_router(translation.router, prefix="/api/translation", tags=["translation"])
 app.include_router(document.router, prefix="/api/document", tags=["document"])
 app.include_router(editor.router, prefix="/api/editor", tags=["editor"])
+app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
 
 # Ensure directories exist
 settings.ensure_directories()
 
+_IMPORTED = time.perf_counter()
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -42,4 +111,9 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics endpoint."""
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -9,15 +9,18 @@ class DocumentUploadResponse(BaseModel):
     filename: str = Field(..., description="Uploaded filename")
     file_path: str = Field(..., description="Path where file is stored")
     file_size: int = Field(..., description="File size in bytes")
+    document_id: Optional[str] = Field(None, description="Content id for translating the upload by reference")
     error: Optional[str] = Field(None, description="Error message if upload failed")
 
 
 class DocumentTranslationRequest(BaseModel):
-    """Request model for document translation."""
-    filename: str = Field(..., description="Filename of uploaded document")
+    """Request model for translating a previously uploaded document."""
+    document_id: str = Field(..., description="Content id returned by the upload")
+    filename: Optional[str] = Field(None, description="Name for the translated file (defaults to the uploaded filename)")
     target_language: str = Field(..., description="Target language code")
     source_language: Optional[str] = Field(None, description="Source language code")
     use_llm: bool = Field(False, description="Use LLM enhancement for translation")
+    llm_model: Optional[str] = Field(None, description="LLM model to use")
     preserve_formatting: bool = Field(True, description="Preserve document formatting")
 
 
@@ -28,12 +31,34 @@ class DocumentTranslationResponse(BaseModel):
     output_filename: str = Field(..., description="Translated document filename")
     slides_translated: int = Field(..., description="Number of slides translated")
     text_frames_translated: int = Field(..., description="Number of text frames translated")
+    notes_translated: int = Field(0, description="Number of speaker notes text frames translated")
+    shared_frames_translated: int = Field(0, description="Master/layout text frames translated once")
+    shared_frames_inherited: int = Field(0, description="Per-slide copies of master/layout text covered by those frames")
+    segments_total: int = Field(0, description="Text segments found in the document")
+    segments_unique: int = Field(0, description="Unique text segments sent for translation")
+    llm_segments: int = Field(0, description="Unique segments the router sent to the LLM")
+    azure_segments: int = Field(0, description="Unique segments the router kept on the Azure translation")
+    llm_seconds_saved: float = Field(0.0, description="Estimated LLM latency avoided by keeping segments on Azure")
+    llm_cost_saved: float = Field(0.0, description="Estimated LLM cost (USD) avoided by keeping segments on Azure")
+    llm_prompt_tokens: int = Field(0, description="Prompt tokens used by LLM calls of this job")
+    llm_completion_tokens: int = Field(0, description="Completion tokens used by LLM calls of this job")
+    llm_cached_tokens: int = Field(0, description="Prompt tokens served from the provider's prompt cache")
+    llm_cache_savings: float = Field(0.0, description="Estimated cost (USD) saved by prompt cache reads")
     target_language: str = Field(..., description="Target language used")
     use_llm: bool = Field(..., description="Whether LLM enhancement was used")
     llm_model: Optional[str] = Field(None, description="LLM model used")
     error: Optional[str] = Field(None, description="Error message if translation failed")
 
 
+class MultiDocumentTranslationResponse(BaseModel):
+    """Response model for translating one document into several languages."""
+    success: bool = Field(..., description="Whether every translation was successful")
+    filename: str = Field(..., description="Original filename")
+    target_languages: List[str] = Field(..., description="Target languages requested")
+    translations: List[DocumentTranslationResponse] = Field(..., description="Per-language translation results")
+    error: Optional[str] = Field(None, description="Error message if translation failed")
+
+
 class DocumentInfo(BaseModel):
     """Information about a document."""
     filename: str = Field(..., description="Document filename")
@@ -1,13 +1,34 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 import requests
 import logging
+import time
+
+from app.utils.chunking import pack_chunks, split_text
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.utils.hedging import HedgedCaller
+from app.utils.metrics import AZURE_CHARACTERS, track_upstream
 
 logger = logging.getLogger(__name__)
 
 class AzureTranslator:
     """Class to interact with Azure Translator service for document translation."""
 
-    def __init__(self, subscription_key: str, endpoint: str, region: str = "eastus"):
+    def __init__(
+        self,
+        subscription_key: str,
+        endpoint: str,
+        region: str = "eastus",
+        max_elements_per_request: int = 1000,
+        max_chars_per_request: int = 50000,
+        max_concurrent_requests: int = 4,
+        retry_attempts: int = 3,
+        retry_delay: float = 1.0,
+        hedge_budget: float = 0.05,
+        request_timeout: float = 30.0,
+        hedge_max_chars: int = 5000,
+        breaker: Optional[CircuitBreaker] = None
+    ):
         """
         Initialize the Azure Translator service.
 
@@ -15,10 +36,39 @@ class AzureTranslator:
             subscription_key: Azure Translator subscription key.
             endpoint: Azure Translator endpoint URL.
             region: Azure region for the translator service.
+            max_elements_per_request: Maximum array elements per /translate request.
+            max_chars_per_request: Maximum characters per request, counted
+                once per target language.
+            max_concurrent_requests: Maximum chunks dispatched in parallel.
+            retry_attempts: Attempts per chunk for throttled or failed requests.
+            retry_delay: Initial retry delay in seconds (doubled per attempt).
+            hedge_budget: Fraction of requests that may be duplicated when
+                slower than the observed p95 (0 disables hedging).
+            request_timeout: Per-request deadline in seconds until enough
+                latencies are observed to derive one from the p99; requests
+                with several texts never get less.
+            hedge_max_chars: Requests billing more characters are not hedged
+                and are timed separately from small ones.
+            breaker: Circuit breaker refusing requests while Azure is failing.
         """
         self.subscription_key = subscription_key
         self.endpoint = endpoint.rstrip('/')
         self.region = region
+        self.max_elements_per_request = max(1, max_elements_per_request)
+        self.max_chars_per_request = max(1, max_chars_per_request)
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        self.retry_attempts = max(1, retry_attempts)
+        self.retry_delay = retry_delay
+        self.hedger = HedgedCaller(
+            'azure_translator',
+            hedge_budget=hedge_budget,
+            default_timeout=request_timeout,
+            max_timeout=max(request_timeout, 2.0),
+            max_workers=max(16, 4 * self.max_concurrent_requests),
+            max_hedge_size=hedge_max_chars,
+            timeout_errors=(requests.exceptions.Timeout,)
+        )
+        self.breaker = breaker
         logger.info(f"Azure Translator initialized for region: {region}")
 
     def translate_text(self, text: str, target_language: str, source_language: Optional[str] = None) -> Dict[str, Any]:
@@ -33,35 +83,16 @@ class AzureTranslator:
         Returns:
             Dictionary containing translated text and detected language.
         """
-        path = '/translate'
-        params = {
-            'api-version': '3.0',
-            'to': target_language
-        }
-        
-        if source_language:
-            params['from'] = source_language
-            
-        headers = {
-            'Ocp-Apim-Subscription-Key': self.subscription_key,
-            'Ocp-Apim-Subscription-Region': self.region,
-            'Content-type': 'application/json'
-        }
-        body = [{
-            'text': text
-        }]
-
-        response = requests.post(self.endpoint + path, params=params, headers=headers, json=body)
-        response.raise_for_status()
-        translations = response.json()
+        translations = self._translate_items([text], [target_language], source_language)
 
         if translations and 'translations' in translations[0]:
             translated_text = translations[0]['translations'][0]['text']
             detected_language = translations[0].get('detectedLanguage', {}).get('language', 'unknown')
-            
+
             return {
                 'translated_text': translated_text,
-                'detected_language': detected_language
+                'detected_language': detected_language,
+                'detection_score': translations[0].get('detectedLanguage', {}).get('score')
             }
         else:
             logger.error("No translations found in response")
@@ -71,6 +102,9 @@ class AzureTranslator:
         """
         Translate a batch of texts using Azure Translator.
 
+        The batch is split into requests that respect Azure's per-request
+        element and character limits; results keep the input order.
+
         Args:
             texts: List of texts to be translated.
             target_language: Target language code.
@@ -79,31 +113,13 @@ class AzureTranslator:
         Returns:
             List of dictionaries containing translated texts and detected languages.
         """
-        path = '/translate'
-        params = {
-            'api-version': '3.0',
-            'to': target_language
-        }
-        
-        if source_language:
-            params['from'] = source_language
-            
-        headers = {
-            'Ocp-Apim-Subscription-Key': self.subscription_key,
-            'Ocp-Apim-Subscription-Region': self.region,
-            'Content-type': 'application/json'
-        }
-        body = [{'text': text} for text in texts]
-
-        response = requests.post(self.endpoint + path, params=params, headers=headers, json=body)
-        response.raise_for_status()
-        translations = response.json()
+        translations = self._translate_items(texts, [target_language], source_language)
 
         results = []
         for translation in translations:
             if 'translations' in translation:
                 translated_text = translation['translations'][0]['text']
-                detected_language = translation['detectedLanguage']['language']
+                detected_language = translation.get('detectedLanguage', {}).get('language', source_language)
                 results.append({
                     'translated_text': translated_text,
                     'detected_language': detected_language
@@ -113,3 +129,210 @@ class AzureTranslator:
                 results.append({})
 
         return results
+
+    def batch_translate_multi(
+        self,
+        texts: List[str],
+        target_languages: List[str],
+        source_language: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Translate a batch of texts into several target languages in one request.
+
+        Azure accepts repeated ``to`` parameters, so every text is sent upstream
+        once no matter how many target languages are requested.
+
+        Args:
+            texts: List of texts to be translated.
+            target_languages: Target language codes.
+            source_language: Source language code (optional, auto-detect if None).
+
+        Returns:
+            List of dictionaries (one per input text) containing the detected
+            language (and its detection score when auto-detected) and a
+            ``translations`` mapping of target language to text.
+        """
+        translations = self._translate_items(texts, target_languages, source_language)
+
+        results = []
+        for translation in translations:
+            if 'translations' in translation:
+                # Azure returns translations in the same order as the requested targets
+                by_language = {
+                    language: item.get('text', '')
+                    for language, item in zip(target_languages, translation['translations'])
+                }
+                results.append({
+                    'translations': by_language,
+                    'detected_language': translation.get('detectedLanguage', {}).get('language', source_language),
+                    'detection_score': translation.get('detectedLanguage', {}).get('score')
+                })
+            else:
+                logger.error("No translations found in response for one of the texts")
+                results.append({})
+
+        return results
+
+    def _translate_items(
+        self,
+        texts: List[str],
+        target_languages: List[str],
+        source_language: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Translate any number of texts of any size within request limits.
+
+        Oversized texts are split at sentence boundaries, pieces are packed
+        into requests under the element and character caps, requests are
+        dispatched concurrently, and the pieces are joined back together.
+
+        Returns:
+            Raw Azure response items, one per input text, in input order.
+        """
+        if not texts:
+            return []
+
+        # The character limit applies to the text times the number of targets
+        factor = max(1, len(target_languages))
+        piece_limit = max(1, self.max_chars_per_request // factor)
+
+        pieces = []  # (text index, text sent upstream, trailing whitespace)
+        for text_index, text in enumerate(texts):
+            for piece in split_text(text, piece_limit):
+                core = piece.rstrip()
+                pieces.append((text_index, core, piece[len(core):]))
+
+        chunks = pack_chunks(
+            [len(core) * factor for _, core, _ in pieces],
+            self.max_elements_per_request,
+            self.max_chars_per_request
+        )
+        if len(chunks) > 1 or len(pieces) > len(texts):
+            logger.info(f"Split {len(texts)} texts into {len(pieces)} pieces across {len(chunks)} requests")
+
+        def send(chunk: List[int]) -> List[Dict[str, Any]]:
+            return self._post_translate_with_retry(
+                [pieces[index][1] for index in chunk],
+                target_languages,
+                source_language
+            )
+
+        if len(chunks) == 1:
+            chunk_results = [send(chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrent_requests, len(chunks))) as executor:
+                chunk_results = list(executor.map(send, chunks))
+
+        piece_items = [item for chunk_result in chunk_results for item in chunk_result]
+
+        # Reassemble pieces belonging to the same text
+        grouped: List[List[tuple]] = [[] for _ in texts]
+        for (text_index, _, trailing), item in zip(pieces, piece_items):
+            grouped[text_index].append((item, trailing))
+
+        results = []
+        for parts in grouped:
+            if len(parts) == 1 and not parts[0][1]:
+                results.append(parts[0][0])
+            elif all('translations' in item for item, _ in parts):
+                merged = {
+                    'translations': [
+                        {
+                            'text': ''.join(item['translations'][position].get('text', '') + trailing for item, trailing in parts),
+                            'to': translation.get('to')
+                        }
+                        for position, translation in enumerate(parts[0][0]['translations'])
+                    ]
+                }
+                if 'detectedLanguage' in parts[0][0]:
+                    merged['detectedLanguage'] = parts[0][0]['detectedLanguage']
+                results.append(merged)
+            else:
+                results.append({})
+
+        return results
+
+    def _post_translate_with_retry(
+        self,
+        texts: List[str],
+        target_languages: List[str],
+        source_language: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Send one /translate request, retrying throttled and transient failures.
+
+        Client errors other than 429 are raised immediately. Retry-After is
+        honoured when Azure sends it. Each attempt has an adaptive deadline
+        and small requests may be hedged (see ``HedgedCaller``); timeouts
+        are retried.
+        
+        Raises:
+            CircuitOpenError: Without sending anything while the breaker is open.
+        """
+        billed_chars = sum(len(text) for text in texts) * max(1, len(target_languages))
+        for attempt in range(self.retry_attempts):
+            if self.breaker is not None:
+                self.breaker.check()
+            try:
+                items = self.hedger.call(
+                    lambda timeout: self._post_translate(texts, target_languages, source_language, timeout),
+                    size=billed_chars,
+                    batch=len(texts) > 1
+                )
+            except CircuitOpenError:
+                raise
+            except requests.exceptions.RequestException as e:
+                response = getattr(e, 'response', None)
+                status = response.status_code if response is not None else None
+                retryable = status is None or status == 429 or status >= 500
+                if self.breaker is not None:
+                    # Only outages count; client errors and throttling mean Azure is up
+                    if status is None or status >= 500:
+                        self.breaker.record_failure(e)
+                    else:
+                        self.breaker.record_success()
+                if not retryable or attempt == self.retry_attempts - 1:
+                    raise
+
+                delay = self.retry_delay * (2 ** attempt)
+                retry_after = response.headers.get('Retry-After') if response is not None else None
+                if retry_after and retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+                logger.warning(f"Azure translate attempt {attempt + 1}/{self.retry_attempts} failed ({e}), retrying in {delay}s")
+                time.sleep(delay)
+            else:
+                if self.breaker is not None:
+                    self.breaker.record_success()
+                return items
+
+    def _post_translate(
+        self,
+        texts: List[str],
+        target_languages: List[str],
+        source_language: Optional[str],
+        timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Send a single /translate request and return the raw response items."""
+        path = '/translate'
+        params = {
+            'api-version': '3.0',
+            'to': list(target_languages)
+        }
+
+        if source_language:
+            params['from'] = source_language
+
+        headers = {
+            'Ocp-Apim-Subscription-Key': self.subscription_key,
+            'Ocp-Apim-Subscription-Region': self.region,
+            'Content-type': 'application/json'
+        }
+        body = [{'text': text} for text in texts]
+
+        with track_upstream('azure_translator', 'translate') as call:
+            response = requests.post(self.endpoint + path, params=params, headers=headers, json=body, timeout=timeout)
+            call.status = response.status_code
+        response.raise_for_status()
+        # Azure bills every character once per target language
+        AZURE_CHARACTERS.inc(sum(len(text) for text in texts) * len(target_languages))
+        return response.json()
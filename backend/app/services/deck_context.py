@@ -0,0 +1,93 @@
+"""
+Deck-level context shared by every LLM call of one document.
+
+Translating a segment in isolation loses what the deck is about and lets
+terminology drift between slides. The context block built here (title,
+glossary, style notes and a summary of slide headings) is computed once per
+document from the extraction. It forms a prompt prefix that is identical
+for every segment of the job, so the provider can serve it from its prompt
+cache after the first call.
+"""
+
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+_FRAME_ID = re.compile(r'^slide_(\d+)_shape_\d+$')
+# Acronyms (KPI, EBITDA, Q3) and CamelCase names (PowerPoint, SharePoint)
+_TERM = re.compile(r'\b(?:[A-Z][A-Z0-9&]{1,}|[A-Z][a-z]+[A-Z][A-Za-z0-9]*)\b')
+
+
+def build_deck_context(
+    extraction: Dict[str, Any],
+    glossary_terms: Iterable[str] = (),
+    style_notes: Optional[str] = None,
+    max_glossary_terms: int = 30,
+    max_summary_chars: int = 1500
+) -> str:
+    """
+    Build the shared context block of a document.
+
+    Args:
+        extraction: ``DocumentProcessor.extract_pptx`` output.
+        glossary_terms: Configured terms to keep consistent.
+        style_notes: House style instructions, if any.
+        max_glossary_terms: Maximum terms listed (configured terms first,
+            then terms recurring in the deck).
+        max_summary_chars: Maximum length of the slide heading summary.
+
+    Returns:
+        Context text, or an empty string if the deck has no slide text.
+    """
+    headings = _slide_headings(extraction['text_frames'])
+    if not headings:
+        return ''
+
+    sections = [f"Presentation title: {headings[0]}"]
+
+    glossary = _glossary(extraction, glossary_terms, max_glossary_terms)
+    if glossary:
+        sections.append(
+            "Glossary (translate these terms consistently; keep acronyms and product names unchanged "
+            "unless they have an established translation):\n" + "\n".join(f"- {term}" for term in glossary)
+        )
+
+    if style_notes:
+        sections.append(f"Style notes:\n{style_notes.strip()}")
+
+    summary_lines: List[str] = []
+    length = 0
+    for heading in headings[1:]:
+        line = f"- {heading}"
+        if length + len(line) > max_summary_chars:
+            break
+        summary_lines.append(line)
+        length += len(line) + 1
+    if summary_lines:
+        sections.append("Slide headings:\n" + "\n".join(summary_lines))
+
+    return "\n\n".join(sections)
+
+
+def _slide_headings(text_frames: Dict[str, str]) -> List[str]:
+    """First line of the first text frame on every slide, in slide order."""
+    headings: Dict[int, str] = {}
+    for frame_id, text in text_frames.items():
+        match = _FRAME_ID.match(frame_id)
+        if not match or not text.strip():
+            continue
+        slide = int(match.group(1))
+        if slide not in headings:
+            headings[slide] = text.strip().splitlines()[0][:120]
+    return [headings[slide] for slide in sorted(headings)]
+
+
+def _glossary(extraction: Dict[str, Any], glossary_terms: Iterable[str], limit: int) -> List[str]:
+    """Configured terms, then acronyms/names that recur in the deck."""
+    terms = list(dict.fromkeys(term.strip() for term in glossary_terms if term.strip()))
+    counts: Counter = Counter()
+    for text in list(extraction['text_frames'].values()) + list(extraction['table_cells'].values()):
+        counts.update(set(_TERM.findall(text)))
+    known = {term.lower() for term in terms}
+    terms.extend(term for term, count in counts.most_common() if count >= 2 and term.lower() not in known)
+    return terms[:limit]
@@ -8,39 +8,83 @@ This service handles:
 4. OCR-based translation of text embedded in images.
 
 Algorithm:
-- Extracts text from PPTX slides and shapes
-- Extracts and translates text from images using OCR
-- Translates text while preserving formatting
-- Creates new translated PPTX file
+- Extracts text from PPTX slides and shapes (once per document), plus slide
+  masters, layouts and speaker notes; text on a shared master or layout is
+  translated once however many slides inherit it
+- Extracts text from images using OCR (once per document)
+- Translates all unique segments into every target language in shared batches
+- Creates one translated PPTX file per target language, preserving formatting
+
+Two engines are available: 'pptx' works on the python-pptx object graph,
+'xml' (PptxXmlEngine) works directly on the zip/XML parts and copies
+untouched entries such as media without recompressing them. python-pptx is
+only imported when the 'pptx' engine is used.
 """
 
 import logging
-import hashlib
+import threading
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, Optional
-from pptx import Presentation
-from pptx.util import Pt, Inches
-from pptx.enum.shapes import MSO_SHAPE_TYPE
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import json
 import io
 
+from app.services.deck_context import build_deck_context
+from app.services.pptx_xml_engine import PptxXmlEngine
+from app.utils.image_identity import ImageIndex
+from app.utils.metrics import JOBS_IN_FLIGHT, QUEUE_DEPTH, record_cache
+from app.utils.stages import pipeline_stage
+
 logger = logging.getLogger(__name__)
 
+DOCUMENT_ENGINES = ('xml', 'pptx')
+
 class DocumentProcessor:
     """Processes PPTX documents for translation with formatting preservation."""
 
-    def __init__(self, translation_processor, image_translator=None):
+    def __init__(
+        self,
+        translation_processor,
+        image_translator=None,
+        max_output_workers: int = 4,
+        engine: str = 'xml',
+        include_masters_and_notes: bool = True,
+        deck_context: bool = True,
+        llm_style_notes: Optional[str] = None,
+        extraction_cache_size: int = 4
+    ):
         """
         Initialize the DocumentProcessor.
 
         Args:
             translation_processor: An instance of the translation processor to handle translation logic.
             image_translator: An instance of the image translator for OCR-based image translation (optional).
+            max_output_workers: Maximum number of translated files written concurrently.
+            engine: Document engine, 'xml' (zip/XML fast path) or 'pptx' (python-pptx).
+            include_masters_and_notes: Whether to translate slide masters, layouts and notes.
+            deck_context: Whether LLM calls get a shared per-document context
+                (title, glossary, style notes, slide headings).
+            llm_style_notes: House style instructions for the deck context.
+            extraction_cache_size: Extractions (including OCR results) kept for
+                documents identified by a content id, so translating the same
+                upload again skips parsing and OCR (0 disables).
         """
+        if engine not in DOCUMENT_ENGINES:
+            raise ValueError(f"Unknown document engine '{engine}', expected one of {DOCUMENT_ENGINES}")
         self.translation_processor = translation_processor
         self.image_translator = image_translator
-        self.original_texts = {}  # Store original texts for before/after comparison
-        logger.info("DocumentProcessor initialized")
+        self.max_output_workers = max(1, max_output_workers)
+        self.engine = engine
+        self.include_masters_and_notes = include_masters_and_notes
+        self.deck_context = deck_context
+        self.llm_style_notes = llm_style_notes
+        self.xml_engine = PptxXmlEngine(include_masters_and_notes=include_masters_and_notes) if engine == 'xml' else None
+        self.extraction_cache_size = max(0, extraction_cache_size)
+        self._extractions: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._extractions_lock = threading.Lock()
+        logger.info(f"DocumentProcessor initialized ({engine} engine)")
         if image_translator:
             logger.info("Image translation enabled")
 
@@ -52,7 +96,8 @@ class DocumentProcessor:
         source_language: Optional[str] = None,
         use_llm: bool = False,
         llm_model: Optional[str] = None,
-        preserve_formatting: bool = True
+        preserve_formatting: bool = True,
+        document_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Process PPTX file and create translated version.
@@ -65,12 +110,378 @@ class DocumentProcessor:
             use_llm: Whether to use LLM enhancement
             llm_model: LLM model to use (optional)
             preserve_formatting: Whether to preserve original formatting
+            document_id: Content id of the input file; its extraction is
+                cached and reused by later jobs on the same content
+
+        Returns:
+            Dictionary with processing statistics
+        """
+        results = self.process_pptx_multi(
+            input_path=input_path,
+            output_paths={target_language: output_path},
+            source_language=source_language,
+            use_llm=use_llm,
+            llm_model=llm_model,
+            preserve_formatting=preserve_formatting,
+            document_id=document_id
+        )
+        return results[target_language]
+
+    def process_pptx_multi(
+        self,
+        input_path: Path,
+        output_paths: Dict[str, Path],
+        source_language: Optional[str] = None,
+        use_llm: bool = False,
+        llm_model: Optional[str] = None,
+        preserve_formatting: bool = True,
+        document_id: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Process PPTX file into several target languages in one pass.
+
+        Text and image OCR are extracted once, all unique segments are
+        translated into every target language in shared batched requests,
+        and one output file per language is written (concurrently).
+
+        Args:
+            input_path: Path to input PPTX file
+            output_paths: Mapping of target language code to output path
+            source_language: Source language code (optional)
+            use_llm: Whether to use LLM enhancement
+            llm_model: LLM model to use (optional)
+            preserve_formatting: Whether to preserve original formatting
+            document_id: Content id of the input file; its extraction is
+                cached and reused by later jobs on the same content
+
+        Returns:
+            Mapping of target language code to processing statistics
+        """
+        target_languages = list(output_paths)
+        logger.info(f"Processing PPTX: {input_path.name} -> {', '.join(target_languages)}")
+
+        try:
+            with JOBS_IN_FLIGHT.track_inprogress():
+                return self._process_pptx_multi(
+                    input_path,
+                    output_paths,
+                    source_language,
+                    use_llm,
+                    llm_model,
+                    preserve_formatting,
+                    document_id
+                )
+        except Exception as e:
+            logger.error(f"Error processing PPTX: {e}")
+            raise
+
+    def _process_pptx_multi(
+        self,
+        input_path: Path,
+        output_paths: Dict[str, Path],
+        source_language: Optional[str],
+        use_llm: bool,
+        llm_model: Optional[str],
+        preserve_formatting: bool,
+        document_id: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run the extract, translate and write phases for process_pptx_multi."""
+        target_languages = list(output_paths)
+        output_queue = QUEUE_DEPTH.labels('document_output')
+
+        extraction = self._load_extraction(input_path, document_id)
+        segments = self._segment_texts(extraction)
+        # Built once; every LLM call of the job sends it as the same cacheable prefix
+        shared_context = self._shared_context(extraction, use_llm)
+        with pipeline_stage("translate"):
+            translations = self.translation_processor.translate_segments(
+                texts=segments,
+                target_languages=target_languages,
+                source_language=source_language,
+                force_llm=use_llm,
+                llm_model=llm_model,
+                shared_context=shared_context
+            )
+
+        def write(target_language: str) -> Dict[str, Any]:
+            try:
+                return self.write_translated_pptx(
+                    input_path=input_path,
+                    output_path=output_paths[target_language],
+                    extraction=extraction,
+                    translations=translations[target_language],
+                    target_language=target_language,
+                    source_language=source_language,
+                    use_llm=use_llm,
+                    preserve_formatting=preserve_formatting
+                )
+            finally:
+                written.append(target_language)
+                output_queue.dec()
+
+        written: List[str] = []
+        output_queue.inc(len(target_languages))
+        try:
+            workers = min(self.max_output_workers, len(target_languages))
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = dict(zip(target_languages, executor.map(write, target_languages)))
+            else:
+                results = {language: write(language) for language in target_languages}
+        finally:
+            # Languages never written (after a failure) are no longer queued
+            output_queue.dec(len(target_languages) - len(written))
+
+        for language, result in results.items():
+            result['segments_total'] = len(segments)
+            result['segments_unique'] = len(set(segments))
+            result.update(self.translation_processor.llm_router.report(translations[language]))
+
+        return results
+
+    def process_pptx_bulk(
+        self,
+        documents: List[Dict[str, Any]],
+        target_languages: List[str],
+        source_language: Optional[str] = None,
+        use_llm: bool = False,
+        llm_model: Optional[str] = None,
+        preserve_formatting: bool = True
+    ) -> Iterator[Tuple[int, Dict[str, Dict[str, Any]]]]:
+        """
+        Translate a set of documents, translating each distinct segment once.
+
+        Documents are taken in order: each one's segments not already
+        translated for an earlier document of the set are translated (in
+        batched requests, with that document's deck context), then its
+        outputs are written in the background while the next document is
+        translated. Decks sharing boilerplate thus only send their new text
+        upstream, and early documents complete before the last one starts.
+        The next document is extracted while the current one translates.
+
+        Args:
+            documents: Dicts with ``input_path``, ``output_paths`` (target
+                language -> output path) and optionally ``document_id``
+            target_languages: Target language codes
+            source_language: Source language code (optional)
+            use_llm: Whether to use LLM enhancement
+            llm_model: LLM model to use (optional)
+            preserve_formatting: Whether to preserve original formatting
+
+        Yields:
+            (document index, target language -> processing statistics) as
+            each document completes. Statistics add ``segments_reused``
+            (unique segments translated for an earlier document) and
+            ``segments_new``; routing and token figures cover the new ones,
+            so they add up over the set. A failed document yields results
+            with ``success`` False and the error.
+        """
+        logger.info(f"Processing {len(documents)} PPTX files -> {', '.join(target_languages)}")
+        output_queue = QUEUE_DEPTH.labels('document_output')
+        translated: Dict[str, Dict[str, Dict[str, Any]]] = {language: {} for language in target_languages}
+        seen: set = set()
+
+        def load(document: Dict[str, Any]) -> Dict[str, Any]:
+            return self._load_extraction(document['input_path'], document.get('document_id'))
+
+        def write(document: Dict[str, Any], extraction: Dict[str, Any], translations, stats) -> Dict[str, Dict[str, Any]]:
+            try:
+                results = {}
+                for language in target_languages:
+                    results[language] = self.write_translated_pptx(
+                        input_path=document['input_path'],
+                        output_path=document['output_paths'][language],
+                        extraction=extraction,
+                        translations=translations[language],
+                        target_language=language,
+                        source_language=source_language,
+                        use_llm=use_llm,
+                        preserve_formatting=preserve_formatting
+                    )
+                    results[language].update(stats[language])
+                return results
+            finally:
+                output_queue.dec()
+
+        def failed(error: Exception) -> Dict[str, Dict[str, Any]]:
+            return {language: {'success': False, 'error': str(error)} for language in target_languages}
+
+        with JOBS_IN_FLIGHT.track_inprogress(), \
+                ThreadPoolExecutor(max_workers=1) as extractor, \
+                ThreadPoolExecutor(max_workers=max(1, self.max_output_workers)) as writer:
+            pending: Dict[Any, int] = {}
+            upcoming = extractor.submit(load, documents[0]) if documents else None
+
+            for index, document in enumerate(documents):
+                current = upcoming
+                upcoming = extractor.submit(load, documents[index + 1]) if index + 1 < len(documents) else None
+                try:
+                    extraction = current.result()
+                    segments = self._segment_texts(extraction)
+                    unique = [text for text in dict.fromkeys(segments) if text and text.strip()]
+                    new = [text for text in unique if text not in seen]
+
+                    with pipeline_stage("translate"):
+                        results = self.translation_processor.translate_segments(
+                            texts=new,
+                            target_languages=target_languages,
+                            source_language=source_language,
+                            force_llm=use_llm,
+                            llm_model=llm_model,
+                            shared_context=self._shared_context(extraction, use_llm)
+                        )
+                    seen.update(new)
+
+                    translations, stats = {}, {}
+                    for language in target_languages:
+                        translated[language].update(results[language])
+                        # Writers get their own view; the shared map keeps growing
+                        translations[language] = {
+                            text: translated[language][text] for text in unique if text in translated[language]
+                        }
+                        stats[language] = {
+                            'segments_total': len(segments),
+                            'segments_unique': len(set(segments)),
+                            'segments_new': len(new),
+                            'segments_reused': len(unique) - len(new),
+                            **self.translation_processor.llm_router.report(results[language])
+                        }
+
+                    output_queue.inc()
+                    pending[writer.submit(write, document, extraction, translations, stats)] = index
+                except Exception as e:
+                    logger.error(f"Error processing {document['input_path'].name}: {e}")
+                    yield index, failed(e)
+
+                for future in [future for future in pending if future.done()]:
+                    yield pending.pop(future), self._bulk_result(future, failed)
+
+            for future in as_completed(list(pending)):
+                yield pending.pop(future), self._bulk_result(future, failed)
+
+    @staticmethod
+    def _bulk_result(future, failed) -> Dict[str, Dict[str, Any]]:
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"Error writing translated document: {e}")
+            return failed(e)
+
+    def _load_extraction(self, input_path: Path, document_id: Optional[str]) -> Dict[str, Any]:
+        """Extraction of a document with OCR results, from the cache when kept."""
+        extraction = self._cached_extraction(document_id)
+        if extraction is None:
+            extraction = self.extract_pptx(input_path)
+
+            if self.image_translator:
+                self._ocr_images(extraction)
+
+            self._cache_extraction(document_id, extraction)
+        return extraction
+
+    def _shared_context(self, extraction: Dict[str, Any], use_llm: bool) -> Optional[str]:
+        """Deck context for the LLM calls of a document, if LLM translation may be used."""
+        if not (self.deck_context and (use_llm or self.translation_processor.use_llm_enhancement)):
+            return None
+        return build_deck_context(
+            extraction,
+            glossary_terms=self.translation_processor.llm_router.glossary_terms,
+            style_notes=self.llm_style_notes
+        ) or None
+
+    def extract_pptx(self, input_path: Path) -> Dict[str, Any]:
+        """
+        Extract every translatable element of a PPTX file.
+
+        Args:
+            input_path: Path to input PPTX file
+
+        Returns:
+            Dictionary with text frames, table cells and pictures keyed by
+            frame id, plus the unique images referenced by the pictures
+        """
+        if self.xml_engine:
+            return self.xml_engine.extract(input_path, include_images=bool(self.image_translator))
+
+        from pptx import Presentation
+        from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+        with pipeline_stage("load"):
+            prs = Presentation(input_path)
+
+        extraction = {
+            'filename': input_path.name,
+            'slide_count': len(prs.slides),
+            'text_frames': {},
+            'table_cells': {},
+            'pictures': {},
+            'images': {},
+            'inheritance': self._inheritance(prs) if self.include_masters_and_notes else {}
+        }
+        image_index = ImageIndex(extraction['images'])
+        part_crcs = self._part_crcs(input_path) if self.image_translator else {}
+
+        with pipeline_stage("extract"):
+            for slide_idx, slide, frame_id, shape in self._iter_shapes(prs, self.include_masters_and_notes):
+                try:
+                    if slide_idx is None and not self._is_shared_content(frame_id, shape):
+                        continue
+
+                    if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+                        if self.image_translator and slide_idx is not None:
+                            image_key = self._register_image(shape, image_index, part_crcs)
+                            if image_key:
+                                extraction['pictures'][frame_id] = image_key
+                        continue
+
+                    if shape.has_text_frame:
+                        original_text = shape.text_frame.text.strip()
+                        if original_text:
+                            extraction['text_frames'][frame_id] = original_text
+
+                    if shape.has_table:
+                        for row_idx, row in enumerate(shape.table.rows):
+                            for col_idx, cell in enumerate(row.cells):
+                                cell_text = cell.text.strip()
+                                if cell_text:
+                                    extraction['table_cells'][f"{frame_id}_cell_{row_idx}_{col_idx}"] = cell_text
+                except Exception as e:
+                    logger.error(f"Error extracting {frame_id}: {e}")
+
+        logger.info(
+            f"Extracted {len(extraction['text_frames'])} text frames, "
+            f"{len(extraction['table_cells'])} table cells and "
+            f"{len(extraction['images'])} unique images from {input_path.name}"
+        )
+        return extraction
+
+    def write_translated_pptx(
+        self,
+        input_path: Path,
+        output_path: Path,
+        extraction: Dict[str, Any],
+        translations: Dict[str, Dict[str, Any]],
+        target_language: str,
+        source_language: Optional[str] = None,
+        use_llm: bool = False,
+        preserve_formatting: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Apply translations to a fresh copy of the presentation and save it.
+
+        Args:
+            input_path: Path to input PPTX file
+            output_path: Path to save translated PPTX
+            extraction: Result of extract_pptx for the same input file
+            translations: Translation results keyed by segment text
+            target_language: Target language code
+            source_language: Source language code (optional)
+            use_llm: Whether LLM enhancement was used
+            preserve_formatting: Whether to preserve original formatting
 
         Returns:
             Dictionary with processing statistics
         """
-        logger.info(f"Processing PPTX: {input_path.name}")
-        
         stats = {
             'filename': input_path.name,
             'slides_processed': 0,
@@ -82,382 +493,415 @@ class DocumentProcessor:
             'method': 'llm' if use_llm else 'azure'
         }
 
-        try:
-            # Reset original texts storage
-            self.original_texts = {}
-            
-            # Load presentation
-            prs = Presentation(input_path)
-            
-            # Process each slide
-            for slide_idx, slide in enumerate(prs.slides):
-                logger.info(f"Processing slide {slide_idx + 1}/{len(prs.slides)}")
-                
-                # Create a fixed list of shapes to avoid modifying collection during iteration
-                # (image replacement adds new shapes which would cause infinite loop)
-                shapes_to_process = list(slide.shapes)
-                
-                # Track processed images by their binary content to avoid duplicates
-                processed_image_hashes = set()
-                
-                for shape_idx, shape in enumerate(shapes_to_process):
-                    # Process GROUP shapes recursively (they contain nested shapes)
-                    if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
-                        self._process_group_shape(
-                            shape,
-                            slide,
-                            target_language,
-                            source_language,
-                            use_llm,
-                            llm_model,
-                            preserve_formatting,
-                            slide_idx,
-                            shape_idx,
-                            stats,
-                            processed_image_hashes
-                        )
-                        continue
-                    
-                    # Process images with text (OCR translation) FIRST
-                    # This must come before text frame processing to avoid conflicts
-                    if shape.shape_type == MSO_SHAPE_TYPE.PICTURE and self.image_translator:
-                        # Get image hash to check for duplicates
-                        try:
-                            image_hash = hashlib.md5(shape.image.blob).hexdigest()
-                            
-                            # Skip if we've already processed this exact image
-                            if image_hash in processed_image_hashes:
-                                continue
-                            
-                            processed_image_hashes.add(image_hash)
-                        except:
-                            pass  # If hashing fails, continue anyway
-                        
-                        if self._process_image(
-                            shape,
-                            slide,
-                            target_language,
-                            source_language,
-                            use_llm,
-                            llm_model
-                        ):
-                            stats['images_translated'] += 1
-                        
-                        # After processing image, skip to next shape
-                        # (don't process as text frame even if it has one)
-                        continue
-                    
-                    # Process text frames (text boxes, titles, etc.)
-                    if shape.has_text_frame:
-                        self._process_text_frame(
-                            shape.text_frame,
-                            target_language,
-                            source_language,
-                            use_llm,
-                            llm_model,
-                            preserve_formatting,
-                            slide_idx,
-                            shape_idx
-                        )
-                        stats['text_frames_translated'] += 1
-                    
-                    # Process tables
-                    if shape.has_table:
-                        self._process_table(
-                            shape.table,
-                            target_language,
-                            source_language,
-                            use_llm,
-                            llm_model
-                        )
-                        stats['tables_translated'] += 1
-                
-                stats['slides_processed'] += 1
-            
-            # Save translated presentation
-            prs.save(output_path)
-            logger.info(f"Translated PPTX saved to: {output_path}")
-            
-            # Save original texts mapping to a JSON file
-            original_texts_path = output_path.with_suffix('.original.json')
-            with open(original_texts_path, 'w', encoding='utf-8') as f:
-                json.dump(self.original_texts, f, ensure_ascii=False, indent=2)
-            logger.info(f"Original texts saved to: {original_texts_path}")
-            
-            return {
-                'success': True,
-                **stats
-            }
-        except Exception as e:
-            logger.error(f"Error processing PPTX: {e}")
-            raise
+        translated_images = self._render_images(extraction, translations) if self.image_translator else {}
 
-    def _process_group_shape(
+        if self.xml_engine:
+            stats.update(self.xml_engine.write(
+                input_path,
+                output_path,
+                extraction,
+                translations,
+                translated_images,
+                preserve_formatting
+            ))
+        else:
+            self._write_with_pptx(
+                input_path,
+                output_path,
+                extraction,
+                translations,
+                translated_images,
+                preserve_formatting,
+                stats
+            )
+
+        stats.update(self._shared_stats(extraction))
+
+        # Save original texts mapping to a JSON file
+        original_texts_path = output_path.with_suffix('.original.json')
+        with open(original_texts_path, 'w', encoding='utf-8') as f:
+            json.dump(extraction['text_frames'], f, ensure_ascii=False, indent=2)
+        logger.info(f"Original texts saved to: {original_texts_path}")
+
+        return {
+            'success': True,
+            **stats
+        }
+
+    def _write_with_pptx(
         self,
-        group_shape,
-        slide,
-        target_language: str,
-        source_language: Optional[str],
-        use_llm: bool,
-        llm_model: Optional[str],
+        input_path: Path,
+        output_path: Path,
+        extraction: Dict[str, Any],
+        translations: Dict[str, Dict[str, Any]],
+        translated_images: Dict[str, Optional[bytes]],
         preserve_formatting: bool,
-        slide_idx: int,
-        parent_shape_idx: int,
-        stats: Dict,
-        processed_image_hashes: set
+        stats: Dict[str, Any]
     ):
-        """
-        Recursively process shapes within a group.
-        Groups can contain text boxes, images, and even nested groups.
-        """
-        try:
-            for nested_idx, nested_shape in enumerate(group_shape.shapes):
-                # Recursively process nested groups
-                if nested_shape.shape_type == MSO_SHAPE_TYPE.GROUP:
-                    self._process_group_shape(
-                        nested_shape,
-                        slide,
-                        target_language,
-                        source_language,
-                        use_llm,
-                        llm_model,
-                        preserve_formatting,
-                        slide_idx,
-                        parent_shape_idx,
-                        stats,
-                        processed_image_hashes
-                    )
-                    continue
-                
-                # Process images in group
-                if nested_shape.shape_type == MSO_SHAPE_TYPE.PICTURE and self.image_translator:
-                    try:
-                        image_hash = hashlib.md5(nested_shape.image.blob).hexdigest()
-                        if image_hash in processed_image_hashes:
-                            continue
-                        processed_image_hashes.add(image_hash)
-                    except:
-                        pass
-                    
-                    if self._process_image(
-                        nested_shape,
-                        slide,
-                        target_language,
-                        source_language,
-                        use_llm,
-                        llm_model
-                    ):
-                        stats['images_translated'] += 1
+        """Apply translations through the python-pptx object graph and save."""
+        from pptx import Presentation
+        from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+        with pipeline_stage("load"):
+            prs = Presentation(input_path)
+
+        # Materialize the walk first: image replacement adds new shapes, which
+        # would otherwise be visited (and translated) again
+        shapes_to_process = list(self._iter_shapes(prs, self.include_masters_and_notes))
+
+        for slide_idx, slide, frame_id, shape in shapes_to_process:
+            is_slide = slide_idx is not None
+            if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+                if not is_slide:
                     continue
-                
-                # Process text frames in group
-                if nested_shape.has_text_frame:
-                    self._process_text_frame(
-                        nested_shape.text_frame,
-                        target_language,
-                        source_language,
-                        use_llm,
-                        llm_model,
+                image_key = extraction['pictures'].get(frame_id)
+                if translated_images.get(image_key) and self._replace_image(shape, slide, translated_images[image_key]):
+                    stats['images_translated'] += 1
+                continue
+
+            if shape.has_text_frame:
+                original_text = extraction['text_frames'].get(frame_id)
+                if original_text:
+                    self._apply_text_frame(
+                        shape.text_frame,
+                        translations.get(original_text, {}),
                         preserve_formatting,
-                        slide_idx,
-                        f"{parent_shape_idx}_group_{nested_idx}"
+                        frame_id
                     )
+                if is_slide:
                     stats['text_frames_translated'] += 1
-                
-                # Process tables in group
-                if nested_shape.has_table:
-                    self._process_table(
-                        nested_shape.table,
-                        target_language,
-                        source_language,
-                        use_llm,
-                        llm_model
-                    )
+
+            if shape.has_table:
+                self._apply_table(shape.table, frame_id, extraction, translations)
+                if is_slide:
                     stats['tables_translated'] += 1
-        except Exception as e:
-            logger.error(f"Error processing group shape: {e}")
 
+        stats['slides_processed'] = len(prs.slides)
+
+        # Save translated presentation
+        with pipeline_stage("save"):
+            prs.save(output_path)
+        logger.info(f"Translated PPTX saved to: {output_path}")
+
+    def _iter_shapes(self, prs, include_shared: bool = False) -> Iterator[Tuple[Optional[int], Any, str, Any]]:
+        """
+        Walk every non-group shape of a presentation in a stable order.
+
+        Args:
+            prs: Presentation to walk
+            include_shared: Also walk slide masters, layouts and notes slides
+
+        Yields:
+            Tuples of (slide index, slide, frame id, shape). Shapes nested in
+            groups get ids of the form ``slide_0_shape_3_group_1``. Shapes on
+            masters, layouts and notes have a slide index of None and ids
+            prefixed ``master_N``, ``layout_N`` and ``notes_N``.
+        """
+        for slide_idx, slide in enumerate(prs.slides):
+            logger.debug(f"Walking slide {slide_idx + 1}/{len(prs.slides)}")
+            for shape_idx, shape in enumerate(slide.shapes):
+                yield from self._iter_shape(slide_idx, slide, f'slide_{slide_idx}_shape_{shape_idx}', shape)
+
+        if include_shared:
+            for prefix, part in self._shared_parts(prs):
+                for shape_idx, shape in enumerate(part.shapes):
+                    yield from self._iter_shape(None, part, f'{prefix}_shape_{shape_idx}', shape)
+
+    @staticmethod
+    def _shared_parts(prs) -> List[Tuple[str, Any]]:
+        """List (frame id prefix, part) for slide masters, layouts and existing notes slides."""
+        parts = [(f'master_{master_idx}', master) for master_idx, master in enumerate(prs.slide_masters)]
+        layouts = [layout for master in prs.slide_masters for layout in master.slide_layouts]
+        parts.extend((f'layout_{layout_idx}', layout) for layout_idx, layout in enumerate(layouts))
+        parts.extend(
+            (f'notes_{slide_idx}', slide.notes_slide)
+            for slide_idx, slide in enumerate(prs.slides)
+            if slide.has_notes_slide
+        )
+        return parts
+
+    @staticmethod
+    def _is_shared_content(frame_id: str, shape) -> bool:
+        """
+        Whether a master, layout or notes shape holds text to translate.
+
+        Master/layout placeholders only carry prompt text ("Click to edit
+        Master title style") that slides never display, and fields (slide
+        numbers, dates) must stay live, so both are skipped.
+        """
+        if frame_id.startswith(('master_', 'layout_')) and shape.is_placeholder:
+            return False
+        return not shape.element.xpath('.//a:fld')
+
+    @staticmethod
+    def _inheritance(prs) -> Dict[str, int]:
+        """Count the slides inheriting each master and layout, keyed by frame id prefix."""
+        inheritance = {}
+        owners = {}  # layout part name -> (layout prefix, master prefix)
+        layout_idx = 0
+        for master_idx, master in enumerate(prs.slide_masters):
+            inheritance[f'master_{master_idx}'] = 0
+            for layout in master.slide_layouts:
+                owners[layout.part.partname] = (f'layout_{layout_idx}', f'master_{master_idx}')
+                inheritance[f'layout_{layout_idx}'] = 0
+                layout_idx += 1
+
+        for slide in prs.slides:
+            for prefix in owners.get(slide.slide_layout.part.partname, ()):
+                inheritance[prefix] += 1
+        return inheritance
+
+    @staticmethod
+    def _shared_stats(extraction: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Summarize master, layout and notes text in an extraction.
+
+        ``shared_frames_inherited`` is how many per-slide copies of the
+        shared master/layout text were covered by translating it once.
+        """
+        frame_ids = list(extraction['text_frames']) + list(extraction['table_cells'])
+        shared = [frame_id for frame_id in frame_ids if frame_id.startswith(('master_', 'layout_'))]
+        inheritance = extraction.get('inheritance', {})
+        return {
+            'shared_frames_translated': len(shared),
+            'shared_frames_inherited': sum(inheritance.get(frame_id.split('_shape_')[0], 0) for frame_id in shared),
+            'notes_translated': sum(1 for frame_id in frame_ids if frame_id.startswith('notes_'))
+        }
+
+    def _iter_shape(
+        self,
+        slide_idx: Optional[int],
+        slide,
+        frame_id: str,
+        shape
+    ) -> Iterator[Tuple[Optional[int], Any, str, Any]]:
+        """
+        Recursively yield a shape, descending into groups.
+        Groups can contain text boxes, images, and even nested groups.
+        """
+        from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            try:
+                for nested_idx, nested_shape in enumerate(shape.shapes):
+                    yield from self._iter_shape(slide_idx, slide, f"{frame_id}_group_{nested_idx}", nested_shape)
+            except Exception as e:
+                logger.error(f"Error processing group shape: {e}")
+            return
+        yield slide_idx, slide, frame_id, shape
 
+    @staticmethod
+    def _part_crcs(input_path: Path) -> Dict[str, int]:
+        """Map part names to their zip CRC-32 (reads only the zip directory)."""
+        try:
+            with zipfile.ZipFile(input_path) as package:
+                return {info.filename: info.CRC for info in package.infolist()}
+        except (OSError, zipfile.BadZipFile) as e:
+            logger.debug(f"Could not read zip directory of {input_path}: {e}")
+            return {}
+
+    def _register_image(self, shape, image_index: ImageIndex, part_crcs: Dict[str, int]) -> Optional[str]:
+        """
+        Record a picture's image for OCR and return its identity key.
+
+        The image is identified by its package part, so a part shared by
+        many pictures is read once. Images below 5KB are treated as
+        decorative icons and skipped.
+        """
+        try:
+            image_part = shape.part.related_part(shape._element.blip_rId)
         except Exception as e:
-            logger.error(f"Error processing PPTX: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                **stats
-            }
+            logger.debug(f"Could not resolve picture image part: {e}")
+            return None
+
+        size = len(image_part.blob)
+        # Skip very small images (likely decorative icons)
+        if size < 5000:  # Less than 5KB
+            logger.debug(f"Skipping small image ({size} bytes), likely decorative")
+            return None
+
+        part_name = image_part.partname.lstrip('/')
+        return image_index.register(
+            part_name,
+            lambda: image_part.blob,
+            image_part.content_type,
+            crc=part_crcs.get(part_name),
+            size=size
+        )
 
-    def _process_text_frame(
+    def _cached_extraction(self, document_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Extraction (with OCR results) of a previous job on the same content, if kept."""
+        if not document_id or not self.extraction_cache_size:
+            return None
+        with self._extractions_lock:
+            extraction = self._extractions.get(document_id)
+            if extraction is not None:
+                self._extractions.move_to_end(document_id)
+        record_cache('extraction', extraction is not None)
+        if extraction is not None:
+            logger.info(f"Reusing extraction of document {document_id[:12]}")
+        return extraction
+
+    def _cache_extraction(self, document_id: Optional[str], extraction: Dict[str, Any]):
+        """Keep an extraction for later jobs; it is only read from then on."""
+        if not document_id or not self.extraction_cache_size:
+            return
+        with self._extractions_lock:
+            self._extractions[document_id] = extraction
+            self._extractions.move_to_end(document_id)
+            while len(self._extractions) > self.extraction_cache_size:
+                self._extractions.popitem(last=False)
+
+    def _ocr_images(self, extraction: Dict[str, Any]):
+        """Run OCR once for every unique image in the extraction."""
+        ocr_queue = QUEUE_DEPTH.labels('ocr')
+        ocr_queue.inc(len(extraction['images']))
+        for image_key, image in extraction['images'].items():
+            logger.info(f"Running OCR on image: {image['content_type']}, size: {len(image['blob'])} bytes")
+            try:
+                image['text_blocks'] = self.image_translator.extract_text_from_image(
+                    image['blob'],
+                    image['content_type']
+                )
+            finally:
+                ocr_queue.dec()
+
+    def _segment_texts(self, extraction: Dict[str, Any]) -> List[str]:
+        """Collect every text segment (frames, cells and OCR lines) to translate."""
+        texts = list(extraction['text_frames'].values())
+        texts.extend(extraction['table_cells'].values())
+        for image in extraction['images'].values():
+            texts.extend(block['text'] for block in image['text_blocks'])
+        return texts
+
+    def _apply_text_frame(
         self,
         text_frame,
-        target_language: str,
-        source_language: Optional[str],
-        use_llm: bool,
-        llm_model: Optional[str],
+        result: Dict[str, Any],
         preserve_formatting: bool,
-        slide_idx: int = 0,
-        shape_idx: int = 0
+        frame_id: str = ''
     ):
-        """Process a text frame and translate its content."""
+        """Write a translation result into a text frame."""
         try:
-            original_text = text_frame.text.strip()
-            if not original_text:
-                return
-            
-            logger.info(f"Translating text frame on slide {slide_idx + 1}: '{original_text[:50]}...'")
-            
-            # Create unique ID for this text frame
-            frame_id = f'slide_{slide_idx}_shape_{shape_idx}'
-            
-            # Store original text
-            self.original_texts[frame_id] = original_text
-            
-            # Translate text
-            result = self.translation_processor.translate_text(
-                text=original_text,
-                target_language=target_language,
-                source_language=source_language,
-                force_llm=use_llm,
-                llm_model=llm_model
-            )
-            
             if result.get('success') and result.get('translation'):
                 translated_text = result['translation']
-                logger.info(f"Translated text frame: '{original_text[:30]}' -> '{translated_text[:30]}'")
-                
+                logger.debug(f"Translated text frame {frame_id}: '{translated_text[:30]}'")
+
                 if preserve_formatting:
                     self._replace_text_preserve_format(text_frame, translated_text)
                 else:
                     text_frame.text = translated_text
             else:
                 logger.warning(f"Translation failed for text frame: {result.get('error', 'Unknown error')}")
-                    
+
         except Exception as e:
             logger.error(f"Error processing text frame: {e}")
 
-    def _process_table(
+    def _apply_table(
         self,
         table,
-        target_language: str,
-        source_language: Optional[str],
-        use_llm: bool,
-        llm_model: Optional[str]
+        frame_id: str,
+        extraction: Dict[str, Any],
+        translations: Dict[str, Dict[str, Any]]
     ):
-        """Process a table and translate its cells."""
+        """Write translation results into a table's cells."""
         try:
-            for row in table.rows:
-                for cell in row.cells:
-                    if cell.text.strip():
-                        result = self.translation_processor.translate_text(
-                            text=cell.text.strip(),
-                            target_language=target_language,
-                            source_language=source_language,
-                            force_llm=use_llm,
-                            llm_model=llm_model
-                        )
-                        
-                        if result.get('success') and result.get('translation'):
-                            cell.text = result['translation']
-                            
+            for row_idx, row in enumerate(table.rows):
+                for col_idx, cell in enumerate(row.cells):
+                    cell_text = extraction['table_cells'].get(f"{frame_id}_cell_{row_idx}_{col_idx}")
+                    if not cell_text:
+                        continue
+
+                    result = translations.get(cell_text, {})
+                    if result.get('success') and result.get('translation'):
+                        cell.text = result['translation']
+
         except Exception as e:
             logger.error(f"Error processing table: {e}")
 
-    def _process_image(
+    def _render_images(
         self,
-        shape,
-        slide,
-        target_language: str,
-        source_language: Optional[str],
-        use_llm: bool,
-        llm_model: Optional[str]
-    ) -> bool:
+        extraction: Dict[str, Any],
+        translations: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Optional[bytes]]:
         """
-        Process an image shape and translate embedded text using OCR.
-        
+        Render every image with OCR text in the target language.
+
+        All images are handed to the image translator together so they can
+        be rendered in parallel by its render pool.
+        """
+        keys = [key for key, image in extraction['images'].items() if image['text_blocks']]
+        if not keys:
+            return {}
+
+        items = []
+        for key in keys:
+            image = extraction['images'][key]
+            blocks_to_translate = self.image_translator.select_translated_blocks(image['text_blocks'], translations)
+            items.append((image['blob'], image['content_type'], blocks_to_translate))
+
+        with pipeline_stage("image_redraw"):
+            rendered = self.image_translator.render_translated_images(items)
+        return dict(zip(keys, rendered))
+
+    def _replace_image(self, shape, slide, translated_image_bytes: bytes) -> bool:
+        """
+        Replace a picture shape with a translated image.
+
         Args:
             shape: Picture shape from slide
             slide: Parent slide object
-            target_language: Target language code
-            source_language: Source language code (optional)
-            use_llm: Whether to use LLM enhancement
-            llm_model: LLM model to use
-            
+            translated_image_bytes: Translated image as bytes
+
         Returns:
-            True if image was successfully translated, False otherwise
+            True if image was successfully replaced, False otherwise
         """
         try:
-            # Get image from shape
-            image = shape.image
-            image_bytes = image.blob
-            content_type = image.content_type
-            
-            # Skip very small images (likely decorative icons)
-            if len(image_bytes) < 5000:  # Less than 5KB
-                logger.debug(f"Skipping small image ({len(image_bytes)} bytes), likely decorative")
-                return False
-            
-            logger.info(f"Processing image: {content_type}, size: {len(image_bytes)} bytes, dimensions: {shape.width} x {shape.height}")
-            
-            # Translate the image
-            translated_image_bytes = self.image_translator.translate_image(
-                image_bytes=image_bytes,
-                content_type=content_type,
-                translation_processor=self.translation_processor,
-                target_language=target_language,
-                source_language=source_language,
-                use_llm=use_llm,
-                llm_model=llm_model
+            # Preserve ALL shape properties for accurate positioning
+            left = shape.left
+            top = shape.top
+            width = shape.width
+            height = shape.height
+
+            # Also preserve rotation if it exists
+            rotation = 0
+            try:
+                rotation = shape.rotation
+            except:
+                pass
+
+            # Get the shape's position in the z-order (layer ordering)
+            shape_element = shape.element
+            parent = shape_element.getparent()
+            shape_index = list(parent).index(shape_element)
+
+            # Remove old shape
+            parent.remove(shape_element)
+
+            # Add new image with translated text AT THE EXACT SAME POSITION
+            pic = slide.shapes.add_picture(
+                io.BytesIO(translated_image_bytes),
+                left, top, width, height
             )
-            
-            if translated_image_bytes:
-                # Replace the image in the slide
-                # Preserve ALL shape properties for accurate positioning
-                left = shape.left
-                top = shape.top
-                width = shape.width
-                height = shape.height
-                
-                # Also preserve rotation if it exists
-                rotation = 0
+
+            # Restore rotation if it existed
+            if rotation != 0:
                 try:
-                    rotation = shape.rotation
+                    pic.rotation = rotation
                 except:
                     pass
-                
-                # Get the shape's position in the z-order (layer ordering)
-                shape_element = shape.element
-                parent = shape_element.getparent()
-                shape_index = list(parent).index(shape_element)
-                
-                # Remove old shape
-                parent.remove(shape_element)
-                
-                # Add new image with translated text AT THE EXACT SAME POSITION
-                pic = slide.shapes.add_picture(
-                    io.BytesIO(translated_image_bytes),
-                    left, top, width, height
-                )
-                
-                # Restore rotation if it existed
-                if rotation != 0:
-                    try:
-                        pic.rotation = rotation
-                    except:
-                        pass
-                
-                # Try to restore the z-order position
-                try:
-                    pic_element = pic.element
-                    parent.remove(pic_element)
-                    parent.insert(shape_index, pic_element)
-                except:
-                    pass  # If z-order restoration fails, at least we have the image
-                
-                logger.info(f"Image successfully translated and replaced (position: {left}, {top}, size: {width}x{height}, rotation: {rotation})")
-                return True
-            else:
-                logger.info("No text found in image or translation skipped")
-                return False
-                
+
+            # Try to restore the z-order position
+            try:
+                pic_element = pic.element
+                pic_element.getparent().remove(pic_element)
+                parent.insert(shape_index, pic_element)
+            except:
+                pass  # If z-order restoration fails, at least we have the image
+
+            logger.info(f"Image successfully translated and replaced (position: {left}, {top}, size: {width}x{height}, rotation: {rotation})")
+            return True
+
         except Exception as e:
             logger.error(f"Error processing image: {e}")
             return False
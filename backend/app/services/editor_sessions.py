@@ -0,0 +1,383 @@
+"""
+In-memory editing sessions for translated decks.
+
+Every editor request used to parse the output deck from disk, and every
+save wrote the whole deck back. The session manager keeps recently edited
+decks parsed in memory instead:
+
+- decks are kept in an LRU bounded by a memory budget (estimated from the
+  uncompressed size of each package) and dropped after an idle timeout
+- edits are applied to the parsed deck in memory; saves are debounced (a
+  burst of edits is written once, ``save_delay`` after the last one, and
+  at most ``max_save_delay`` after the first) under the document lock
+- a session is checked against the file's size and mtime on every use and
+  before every save: when the file was changed by someone else (a new
+  translation job, or an editor in another worker), the deck is reloaded
+  and the edits not yet saved are applied on top of it again
+- decks with a session are leased in the storage manager, so sweeps never
+  delete them; the lease is dropped when the session is evicted
+
+Sessions live in one worker process; other workers see edits once they are
+saved.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from app.utils.file_lock import document_lock
+from app.utils.storage_manager import StorageManager
+
+logger = logging.getLogger(__name__)
+
+_FRAME_ID = re.compile(r'^slide_(\d+)_shape_(\d+)$')
+
+
+def _signature(path: Path) -> Tuple[int, int]:
+    """(mtime in ns, size) of a file; raises FileNotFoundError if it is gone."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _parsed_size(path: Path) -> int:
+    """Estimate the memory a parsed deck needs from its uncompressed parts."""
+    try:
+        with zipfile.ZipFile(path) as package:
+            return sum(info.file_size for info in package.infolist())
+    except (OSError, zipfile.BadZipFile):
+        return path.stat().st_size
+
+
+def parse_frame_id(frame_id: str) -> Optional[Tuple[int, int]]:
+    """(slide index, shape index) of a ``slide_<i>_shape_<j>`` frame id, or None."""
+    match = _FRAME_ID.match(frame_id)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def set_frame_text(presentation, frame_id: str, text: str) -> bool:
+    """
+    Replace the text of a frame identified as ``slide_<i>_shape_<j>``.
+
+    Returns:
+        Whether the frame exists (and was changed).
+    """
+    indices = parse_frame_id(frame_id)
+    if indices is None or indices[0] >= len(presentation.slides):
+        return False
+    return set_shape_text(presentation.slides[indices[0]].shapes, indices[1], text)
+
+
+def set_shape_text(shapes, shape_idx: int, text: str) -> bool:
+    """Replace the text of the shape_idx-th shape of a shape tree if it has a text frame."""
+    if shape_idx >= len(shapes) or not shapes[shape_idx].has_text_frame:
+        return False
+    text_frame = shapes[shape_idx].text_frame
+    # Clear all existing paragraphs and write the new text into the first one
+    text_frame.clear()
+    paragraph = text_frame.paragraphs[0] if text_frame.paragraphs else text_frame.add_paragraph()
+    paragraph.text = text
+    return True
+
+
+class EditorSession:
+    """A parsed deck, its unsaved edits and when it must be saved."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.presentation = None
+        self.signature: Optional[Tuple[int, int]] = None
+        self.size = 0
+        # Edits applied in memory but not saved yet (frame id -> text)
+        self.pending: Dict[str, str] = {}
+        self.first_edit = 0.0
+        self.save_due: Optional[float] = None
+        self.last_used = time.monotonic()
+        self.lock = threading.RLock()
+        self._version: Optional[str] = None
+
+    @property
+    def version(self) -> str:
+        """Identifies the deck's content: the file on disk plus the unsaved edits."""
+        if self._version is None:
+            digest = hashlib.sha256(repr((self.signature, sorted(self.pending.items()))).encode('utf-8'))
+            self._version = digest.hexdigest()[:16]
+        return self._version
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.pending)
+
+
+class EditorSessionManager:
+    """LRU of parsed decks with in-memory edits and debounced saves."""
+
+    def __init__(
+        self,
+        lock_folder: Path,
+        storage: Optional[StorageManager] = None,
+        memory_budget: int = 512 * 1024 * 1024,
+        idle_seconds: float = 600.0,
+        save_delay: float = 2.0,
+        max_save_delay: float = 10.0,
+        lock_timeout: Optional[float] = 1.0,
+        pin_seconds: float = 3600.0
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            lock_folder: Folder of the cross-process document locks.
+            storage: Storage manager whose lease keeps open decks from being swept.
+            memory_budget: Estimated bytes of parsed decks kept in memory.
+            idle_seconds: Sessions unused this long are saved and dropped.
+            save_delay: Seconds after the last edit before a deck is saved.
+            max_save_delay: Seconds after the first unsaved edit by which a deck is saved.
+            lock_timeout: Seconds to wait for the document lock before retrying a save later.
+            pin_seconds: Length of the storage lease, renewed on every use.
+        """
+        self.lock_folder = Path(lock_folder)
+        self.storage = storage
+        self.memory_budget = memory_budget
+        self.idle_seconds = idle_seconds
+        self.save_delay = save_delay
+        self.max_save_delay = max(save_delay, max_save_delay)
+        self.lock_timeout = lock_timeout
+        self.pin_seconds = pin_seconds
+        self._sessions: 'OrderedDict[Path, EditorSession]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.loads = 0
+        self.saves = 0
+
+    @contextmanager
+    def open(self, path: Path) -> Iterator[EditorSession]:
+        """
+        Use the session of a deck, loading it if needed, while holding its lock.
+
+        Raises:
+            FileNotFoundError: If the deck does not exist.
+        """
+        path = Path(path)
+        while True:
+            with self._lock:
+                session = self._sessions.get(path)
+                if session is None:
+                    session = self._sessions[path] = EditorSession(path)
+                self._sessions.move_to_end(path)
+            session.lock.acquire()
+            with self._lock:
+                current = self._sessions.get(path) is session
+            if current:
+                break
+            # Evicted while waiting for its lock: use a fresh session
+            session.lock.release()
+        try:
+            try:
+                self._refresh(session)
+            except FileNotFoundError:
+                self._discard(session)
+                raise
+            session.last_used = time.monotonic()
+            if self.storage is not None:
+                self.storage.lease(path, self.pin_seconds)
+            # The saver also drops idle sessions
+            self._schedule()
+            self._enforce_budget(keep=session)
+            yield session
+        finally:
+            session.lock.release()
+
+    def apply_edits(self, path: Path, edits: Dict[str, str]) -> int:
+        """
+        Apply edits (frame id -> text) to a deck in memory and schedule its save.
+
+        Returns:
+            The number of frames found and changed.
+
+        Raises:
+            FileNotFoundError: If the deck does not exist.
+        """
+        with self.open(path) as session:
+            applied = 0
+            for frame_id, text in edits.items():
+                if set_frame_text(session.presentation, frame_id, text):
+                    session.pending[frame_id] = text
+                    applied += 1
+            if applied:
+                now = time.monotonic()
+                if not session.first_edit:
+                    session.first_edit = now
+                session.save_due = min(now + self.save_delay, session.first_edit + self.max_save_delay)
+                session._version = None
+                self._schedule()
+        return applied
+
+    def flush(self, path: Optional[Path] = None):
+        """Save unsaved edits now (of one deck, or of every deck)."""
+        with self._lock:
+            sessions = list(self._sessions.values()) if path is None else [self._sessions.get(Path(path))]
+        for session in sessions:
+            if session is not None:
+                with session.lock:
+                    self._save(session)
+
+    def close(self):
+        """Save every deck and stop the background saver."""
+        with self._lock:
+            self._closed = True
+            self._wake.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+        with self._lock:
+            sessions = list(self._sessions.values())
+            # Later use starts a new saver
+            self._closed = False
+        for session in sessions:
+            self._discard(session)
+
+    def stats(self) -> Dict[str, Any]:
+        """Sessions, their estimated memory and unsaved edits."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+        return {
+            'sessions': len(sessions),
+            'bytes': sum(session.size for session in sessions),
+            'memory_budget': self.memory_budget,
+            'unsaved_edits': sum(len(session.pending) for session in sessions),
+            'loads': self.loads,
+            'saves': self.saves
+        }
+
+    def _refresh(self, session: EditorSession):
+        """(Re)load a session's deck if the file changed, keeping its unsaved edits."""
+        from pptx import Presentation
+
+        signature = _signature(session.path)
+        if session.presentation is not None and signature == session.signature:
+            return
+        if session.presentation is not None:
+            logger.info(f"{session.path.name} changed on disk, reloading its editor session")
+        session.presentation = Presentation(session.path)
+        session.signature = signature
+        session.size = _parsed_size(session.path)
+        session._version = None
+        self.loads += 1
+        for frame_id, text in session.pending.items():
+            set_frame_text(session.presentation, frame_id, text)
+
+    def _save(self, session: EditorSession, lock_timeout: Any = 'default'):
+        """Write a session's deck if it has unsaved edits (caller holds the session lock)."""
+        if not session.dirty:
+            return
+        timeout = self.lock_timeout if lock_timeout == 'default' else lock_timeout
+        try:
+            with document_lock(self.lock_folder, session.path.name, timeout=timeout):
+                # Someone else wrote the file since it was loaded: start from their version
+                self._refresh(session)
+                fd, temp = tempfile.mkstemp(dir=session.path.parent, prefix='.editor-', suffix='.pptx')
+                os.close(fd)
+                try:
+                    session.presentation.save(temp)
+                    os.replace(temp, session.path)
+                except BaseException:
+                    Path(temp).unlink(missing_ok=True)
+                    raise
+                session.signature = _signature(session.path)
+        except TimeoutError:
+            # A translation job holds the document; try again shortly
+            session.save_due = time.monotonic() + self.save_delay
+            logger.info(f"{session.path.name} is locked, saving its edits later")
+            return
+        except FileNotFoundError:
+            logger.warning(f"{session.path.name} was deleted, dropping {len(session.pending)} unsaved edits")
+            self._discard(session)
+            return
+        logger.info(f"Saved {len(session.pending)} edits to {session.path.name}")
+        session.pending.clear()
+        session.first_edit = 0.0
+        session.save_due = None
+        session._version = None
+        self.saves += 1
+
+    def _discard(self, session: EditorSession):
+        """Drop a session from the LRU and release its storage lease."""
+        with self._lock:
+            if self._sessions.get(session.path) is session:
+                del self._sessions[session.path]
+        session.presentation = None
+        if self.storage is not None:
+            try:
+                self.storage.release(session.path)
+            except Exception as e:
+                logger.warning(f"Could not release {session.path.name}: {e}")
+
+    def _evict(self, session: EditorSession) -> bool:
+        """Save and drop a session unless another request or a job is using it."""
+        if not session.lock.acquire(blocking=False):
+            return False
+        try:
+            self._save(session, lock_timeout=0)
+            if session.dirty:
+                return False
+            self._discard(session)
+            return True
+        finally:
+            session.lock.release()
+
+    def _enforce_budget(self, keep: EditorSession):
+        """Evict the least recently used sessions while over the memory budget."""
+        with self._lock:
+            candidates = [s for s in self._sessions.values() if s is not keep]
+            total = sum(s.size for s in self._sessions.values())
+        for session in candidates:
+            if total <= self.memory_budget:
+                break
+            if self._evict(session):
+                total -= session.size
+
+    def _schedule(self):
+        """Wake the background saver, starting it on first use."""
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name='editor-saver', daemon=True)
+                self._thread.start()
+            self._wake.notify_all()
+
+    def _run(self):
+        """Save decks when their edits are due and drop idle sessions."""
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                now = time.monotonic()
+                sessions = list(self._sessions.values())
+                deadlines = [s.save_due for s in sessions if s.save_due is not None]
+                deadlines += [s.last_used + self.idle_seconds for s in sessions]
+                wait = min(deadlines) - now if deadlines else None
+                if wait is None or wait > 0:
+                    self._wake.wait(timeout=wait)
+                    continue
+            for session in sessions:
+                try:
+                    if session.save_due is not None and session.save_due <= now:
+                        with session.lock:
+                            self._save(session)
+                    if session.last_used + self.idle_seconds <= now and not self._evict(session):
+                        # In use: look again once a save would be due
+                        session.last_used = time.monotonic() - self.idle_seconds + self.save_delay
+                except Exception as e:
+                    logger.warning(f"Editor session {session.path.name} could not be saved: {e}")
+                    session.save_due = time.monotonic() + self.save_delay
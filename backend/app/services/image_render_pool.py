@@ -0,0 +1,157 @@
+"""
+Process pool for CPU-bound image redraw and encoding.
+
+Decoding, drawing and re-encoding translated images holds the GIL for a long
+time on large screenshots, stalling every other request thread. This pool
+moves that work into worker processes:
+
+- image bytes are handed to workers through shared memory, so only a small
+  descriptor is pickled per task
+- submissions are bounded; callers block once ``max_pending`` renders are
+  queued instead of piling up unbounded work and memory
+- workers are started with the 'spawn' method, which is safe to use from a
+  threaded server; ``warm`` starts them (imports, fonts) before the first
+  render instead of during it
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.utils.metrics import QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+# Per-process renderer, created lazily in each worker
+_worker_translator = None
+
+
+def _render_worker(
+    shm_name: str,
+    size: int,
+    content_type: str,
+    blocks: List[Dict[str, Any]],
+    encode_profile: str
+) -> Optional[bytes]:
+    """Render one image inside a worker process, reading its bytes from shared memory."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        image_bytes = bytes(shm.buf[:size])
+    finally:
+        shm.close()
+
+    return _translator(encode_profile).render_image_blocks(image_bytes, content_type, blocks)
+
+
+def _warm_worker(encode_profile: str) -> None:
+    """Create the worker's renderer and load its fonts."""
+    _translator(encode_profile).warm()
+
+
+def _translator(encode_profile: str):
+    global _worker_translator
+    from app.services.image_translator import ImageTranslator
+
+    if _worker_translator is None or _worker_translator.encode_profile != encode_profile:
+        _worker_translator = ImageTranslator('', '', encode_profile=encode_profile)
+    return _worker_translator
+
+
+class ImageRenderPool:
+    """Bounded process pool that renders translated images."""
+
+    def __init__(self, max_workers: int, max_pending: Optional[int] = None):
+        """
+        Initialize the render pool.
+
+        Args:
+            max_workers: Number of worker processes.
+            max_pending: Maximum renders queued or running at once
+                (defaults to twice the worker count).
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending or self.max_workers * 2)
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+        self._queue_depth = QUEUE_DEPTH.labels('image_render')
+        logger.info(f"Image render pool started with {self.max_workers} workers (max pending: {self.max_pending})")
+
+    def submit(self, image_bytes: bytes, content_type: str, blocks: List[Dict[str, Any]], encode_profile: str) -> Future:
+        """
+        Queue one render, blocking while the pool is at capacity.
+
+        Returns:
+            Future resolving to the translated image bytes (or None).
+        """
+        self._slots.acquire()
+        self._queue_depth.inc()
+        shm = None
+        try:
+            shm = shared_memory.SharedMemory(create=True, size=max(1, len(image_bytes)))
+            shm.buf[:len(image_bytes)] = image_bytes
+            future = self._executor.submit(
+                _render_worker, shm.name, len(image_bytes), content_type, blocks, encode_profile
+            )
+        except Exception:
+            self._release(shm)
+            raise
+
+        future.add_done_callback(lambda _: self._release(shm))
+        return future
+
+    def render_many(
+        self,
+        items: List[Tuple[bytes, str, List[Dict[str, Any]]]],
+        encode_profile: str
+    ) -> List[Optional[bytes]]:
+        """
+        Render several images in parallel.
+
+        Args:
+            items: Tuples of (image bytes, content type, blocks to draw).
+            encode_profile: Encoder speed profile.
+
+        Returns:
+            Translated image bytes (or None on failure) per item, in input order.
+        """
+        futures = [self.submit(image_bytes, content_type, blocks, encode_profile)
+                   for image_bytes, content_type, blocks in items]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"Error rendering image in worker process: {e}")
+                results.append(None)
+        return results
+
+    def warm(self, encode_profile: str, timeout: float = 60.0) -> bool:
+        """
+        Start the worker processes and load their renderers.
+
+        Returns:
+            Whether every worker was ready within the timeout.
+        """
+        futures = [self._executor.submit(_warm_worker, encode_profile) for _ in range(self.max_workers)]
+        done, _ = wait(futures, timeout=timeout)
+        for future in done:
+            future.result()
+        return len(done) == len(futures)
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        logger.info("Image render pool stopped")
+
+    def _release(self, shm: Optional[shared_memory.SharedMemory]):
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+        self._queue_depth.dec()
+        self._slots.release()
@@ -9,34 +9,128 @@ This service handles:
 
 import logging
 import io
+import threading
 import time
-from typing import Dict, Any, Optional, List, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
 import requests
 
+from app.utils.metrics import track_upstream
+from app.utils.ocr_cache import OCRCache
+from app.utils.stages import pipeline_stage
+
+# Pillow is imported where images are decoded, so importing the service stays cheap
+if TYPE_CHECKING:
+    from PIL import Image
+
 logger = logging.getLogger(__name__)
 
+# Encoder settings per speed profile. 'fast' favours throughput, 'quality'
+# reproduces the original behaviour (PNG optimize, JPEG quality 95).
+ENCODER_PROFILES = {
+    'fast': {
+        'png': {'compress_level': 1},
+        'jpeg': {'quality': 85, 'subsampling': '4:2:0'}
+    },
+    'balanced': {
+        'png': {'compress_level': 6},
+        'jpeg': {'quality': 90, 'subsampling': '4:2:0'}
+    },
+    'quality': {
+        'png': {'optimize': True},
+        'jpeg': {'quality': 95, 'subsampling': '4:4:4'}
+    }
+}
+
+# Overlay fonts, in order of preference (PIL's built-in font is the last resort)
+FONT_CANDIDATES = ("arial.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf")
+
+# Sizes chosen by _calculate_font_size
+FONT_SIZES = range(10, 51)
+
+# Loaded fonts per thread, by size: FreeType faces are not shared across threads
+_fonts = threading.local()
+
+
+@lru_cache(maxsize=1)
+def _font_source() -> Optional[str]:
+    """The first overlay font that loads, or None to use PIL's default font."""
+    from PIL import ImageFont
+
+    for candidate in FONT_CANDIDATES:
+        try:
+            ImageFont.truetype(candidate, 20)
+            return candidate
+        except OSError:
+            continue
+    logger.warning("No TrueType overlay font found, using PIL's default font")
+    return None
+
+
+def load_font(size: int):
+    """The overlay font at a size, loaded once per thread."""
+    from PIL import ImageFont
+
+    cache = _fonts.__dict__.setdefault('by_size', {})
+    font = cache.get(size)
+    if font is None:
+        source = _font_source()
+        font = ImageFont.truetype(source, size) if source else ImageFont.load_default()
+        cache[size] = font
+    return font
+
 
 class ImageTranslator:
     """Handles OCR-based image translation using Azure Computer Vision."""
     
-    def __init__(self, vision_endpoint: str, vision_key: str):
+    def __init__(
+        self,
+        vision_endpoint: str,
+        vision_key: str,
+        poll_interval: float = 1.0,
+        encode_profile: str = 'balanced',
+        render_pool=None,
+        ocr_cache: Optional[OCRCache] = None,
+        ocr_model_version: str = 'latest'
+    ):
         """
         Initialize the ImageTranslator.
         
         Args:
             vision_endpoint: Azure Computer Vision endpoint
             vision_key: Azure Computer Vision API key
+            poll_interval: Seconds to wait between OCR result polls
+            encode_profile: Encoder speed profile ('fast', 'balanced' or 'quality')
+            render_pool: ImageRenderPool for rendering off the request thread (optional)
+            ocr_cache: Cache of OCR results by image content (optional)
+            ocr_model_version: Azure Read model version; part of the cache key
         """
+        if encode_profile not in ENCODER_PROFILES:
+            raise ValueError(f"Unknown encode profile '{encode_profile}', expected one of {sorted(ENCODER_PROFILES)}")
         self.vision_endpoint = vision_endpoint.rstrip('/')
         self.vision_key = vision_key
+        self.poll_interval = poll_interval
+        self.encode_profile = encode_profile
+        self.render_pool = render_pool
+        self.ocr_cache = ocr_cache
+        self.ocr_model_version = ocr_model_version
         logger.info("ImageTranslator initialized")
     
+    def warm(self):
+        """Import Pillow and load the overlay fonts ahead of the first render."""
+        for size in FONT_SIZES:
+            load_font(size)
+        if self.render_pool is not None:
+            self.render_pool.warm(self.encode_profile)
+    
     def extract_text_from_image(self, image_bytes: bytes, content_type: str = "image/png") -> List[Dict[str, Any]]:
         """
         Extract text from image using Azure Computer Vision OCR.
         
+        Results of successful OCR runs are cached by image content, so the
+        same image is only sent to Azure once whatever the target language.
+        
         Args:
             image_bytes: Image data as bytes
             content_type: MIME type of the image
@@ -48,6 +142,23 @@ class ImageTranslator:
             logger.warning("Azure Vision credentials not configured, skipping OCR")
             return []
         
+        if self.ocr_cache is not None:
+            cached = self.ocr_cache.get(image_bytes, self.ocr_model_version)
+            if cached is not None:
+                logger.info(f"OCR cache hit ({len(cached)} text blocks)")
+                return cached
+        
+        text_blocks = self._read_text(image_bytes, content_type)
+        if text_blocks is None:
+            return []
+        if self.ocr_cache is not None:
+            self.ocr_cache.set(image_bytes, self.ocr_model_version, text_blocks)
+        return text_blocks
+    
+    def _read_text(self, image_bytes: bytes, content_type: str) -> Optional[List[Dict[str, Any]]]:
+        """Run the Azure Read submit/poll flow; None if OCR did not succeed."""
+        from PIL import Image
+
         try:
             # Convert unsupported formats (WMF, EMF) to PNG
             if content_type in ['image/x-wmf', 'image/x-emf', 'image/wmf', 'image/emf']:
@@ -62,7 +173,7 @@ class ImageTranslator:
                     content_type = 'image/png'
                 except Exception as e:
                     logger.error(f"Failed to convert {content_type} to PNG: {e}")
-                    return []
+                    return None
             
             # Use Azure Computer Vision Read API
             ocr_url = f"{self.vision_endpoint}/vision/v3.2/read/analyze"
@@ -74,55 +185,59 @@ class ImageTranslator:
             
             # Don't specify language - let Azure auto-detect (supports Japanese, English, etc.)
             params = {
-                'model-version': 'latest'
+                'model-version': self.ocr_model_version
             }
             
             # Submit image for OCR
-            response = requests.post(
-                ocr_url,
-                headers=headers,
-                params=params,
-                data=image_bytes,
-                timeout=30
-            )
-            response.raise_for_status()
+            with pipeline_stage("ocr_submit"), track_upstream('azure_vision', 'read_submit') as call:
+                response = requests.post(
+                    ocr_url,
+                    headers=headers,
+                    params=params,
+                    data=image_bytes,
+                    timeout=30
+                )
+                call.status = response.status_code
+                response.raise_for_status()
             
             # Get operation location
             operation_url = response.headers.get('Operation-Location')
             if not operation_url:
                 logger.error("No Operation-Location in response")
-                return []
+                return None
             
             # Poll for results
-            import time
             max_attempts = 10
             attempt = 0
             
-            while attempt < max_attempts:
-                time.sleep(1)
-                result_response = requests.get(
-                    operation_url,
-                    headers={'Ocp-Apim-Subscription-Key': self.vision_key},
-                    timeout=10
-                )
-                result_response.raise_for_status()
-                result = result_response.json()
-                
-                status = result.get('status')
-                if status == 'succeeded':
-                    return self._parse_ocr_result(result)
-                elif status == 'failed':
-                    logger.error(f"OCR failed: {result}")
-                    return []
-                
-                attempt += 1
+            with pipeline_stage("ocr_poll"):
+                while attempt < max_attempts:
+                    time.sleep(self.poll_interval)
+                    with track_upstream('azure_vision', 'read_poll') as call:
+                        result_response = requests.get(
+                            operation_url,
+                            headers={'Ocp-Apim-Subscription-Key': self.vision_key},
+                            timeout=10
+                        )
+                        call.status = result_response.status_code
+                    result_response.raise_for_status()
+                    result = result_response.json()
+                    
+                    status = result.get('status')
+                    if status == 'succeeded':
+                        return self._parse_ocr_result(result)
+                    elif status == 'failed':
+                        logger.error(f"OCR failed: {result}")
+                        return None
+                    
+                    attempt += 1
             
             logger.warning("OCR polling timed out")
-            return []
+            return None
             
         except Exception as e:
             logger.error(f"Error extracting text from image: {e}")
-            return []
+            return None
     
     def _parse_ocr_result(self, result: Dict) -> List[Dict[str, Any]]:
         """
@@ -224,6 +339,157 @@ class ImageTranslator:
             for i, block in enumerate(text_blocks):
                 logger.debug(f"Block {i+1}: '{block['text']}' at {block['bbox']}")
             
+            # Translate all blocks in one batched call
+            translations = translation_processor.translate_segments(
+                texts=[block['text'] for block in text_blocks],
+                target_languages=[target_language],
+                source_language=source_language,
+                force_llm=use_llm,
+                llm_model=llm_model
+            )[target_language]
+            
+            blocks_to_translate = self.select_translated_blocks(text_blocks, translations)
+            return self.render_translated_image(image_bytes, content_type, blocks_to_translate)
+            
+        except Exception as e:
+            logger.error(f"Error translating image: {e}")
+            return None
+    
+    def select_translated_blocks(
+        self,
+        text_blocks: List[Dict[str, Any]],
+        translations: Dict[str, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Pair OCR text blocks with their translations, dropping unusable ones.
+        
+        Blocks already in the target language, failed translations and
+        translations that look like LLM error messages are skipped.
+        
+        Args:
+            text_blocks: OCR text blocks from extract_text_from_image
+            translations: Translation results keyed by block text
+            
+        Returns:
+            List of blocks to draw, each with original, translated and bbox
+        """
+        # OCR sometimes detects garbage that produces LLM error messages
+        error_indicators = [
+            "I don't see any",
+            "I don't see",
+            "Please share",
+            "Please provide",
+            "provided to translate",
+            "following your instructions",
+            "following your specified"
+        ]
+        
+        blocks_to_translate = []
+        
+        for block in text_blocks:
+            original_text = block['text']
+            translation_result = translations.get(original_text, {})
+            
+            if translation_result.get('success'):
+                translated_text = translation_result.get('translation', original_text)
+                
+                # Check if translation was skipped (already in target language)
+                if translation_result.get('skipped'):
+                    logger.debug(f"Text already in target language: '{original_text[:50]}'")
+                    continue
+                
+                if any(indicator in translated_text for indicator in error_indicators):
+                    logger.warning(f"Skipping translation that looks like an error message: '{translated_text[:100]}'")
+                    continue
+                
+                # Skip if translation is way longer than original (likely error)
+                if len(translated_text) > len(original_text) * 5:
+                    logger.warning(f"Skipping translation that's too long compared to original: {len(original_text)} -> {len(translated_text)}")
+                    continue
+                
+                blocks_to_translate.append({
+                    'original': original_text,
+                    'translated': translated_text,
+                    'bbox': block['bbox']
+                })
+                
+                logger.info(f"Translated in image: '{original_text}' -> '{translated_text}'")
+            elif translation_result.get('error'):
+                logger.warning(f"Translation failed for '{original_text[:50]}': {translation_result.get('error')}")
+        
+        return blocks_to_translate
+    
+    def render_translated_image(
+        self,
+        image_bytes: bytes,
+        content_type: str,
+        blocks_to_translate: List[Dict[str, Any]]
+    ) -> Optional[bytes]:
+        """
+        Draw translated text blocks over the original image.
+        
+        Rendering runs in the render pool when one is configured.
+        
+        Args:
+            image_bytes: Original image as bytes
+            content_type: MIME type of the image
+            blocks_to_translate: Blocks from select_translated_blocks
+            
+        Returns:
+            Translated image as bytes, or None if there is nothing to draw
+        """
+        return self.render_translated_images([(image_bytes, content_type, blocks_to_translate)])[0]
+    
+    def render_translated_images(
+        self,
+        items: List[Tuple[bytes, str, List[Dict[str, Any]]]]
+    ) -> List[Optional[bytes]]:
+        """
+        Render several images, in parallel when a render pool is configured.
+        
+        Args:
+            items: Tuples of (image bytes, content type, blocks to draw)
+            
+        Returns:
+            Translated image bytes (or None) per item, in input order
+        """
+        # If no blocks need translation, skip image processing entirely
+        work = [index for index, (_, _, blocks) in enumerate(items) if blocks]
+        results: List[Optional[bytes]] = [None] * len(items)
+        if len(work) < len(items):
+            logger.info("All text already in target language for some images, no modification needed")
+        
+        if self.render_pool:
+            rendered = self.render_pool.render_many([items[index] for index in work], self.encode_profile)
+        else:
+            rendered = [self.render_image_blocks(*items[index]) for index in work]
+        
+        for index, image_bytes in zip(work, rendered):
+            results[index] = image_bytes
+        return results
+    
+    def render_image_blocks(
+        self,
+        image_bytes: bytes,
+        content_type: str,
+        blocks_to_translate: List[Dict[str, Any]]
+    ) -> Optional[bytes]:
+        """
+        Decode, draw and re-encode one image on the calling thread.
+        
+        Args:
+            image_bytes: Original image as bytes
+            content_type: MIME type of the image
+            blocks_to_translate: Blocks from select_translated_blocks
+            
+        Returns:
+            Translated image as bytes, or None on failure
+        """
+        from PIL import Image, ImageDraw
+
+        encoder = ENCODER_PROFILES[self.encode_profile]
+        
+        try:
             # Open image (convert WMF/EMF if needed)
             try:
                 image = Image.open(io.BytesIO(image_bytes))
@@ -249,83 +515,8 @@ class ImageTranslator:
             translated_image = image.copy()
             draw = ImageDraw.Draw(translated_image)
             
-            # Try to load a better font
-            try:
-                # Try common font paths
-                font_size = 20
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except:
-                try:
-                    font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-                except:
-                    font = ImageFont.load_default()
-            
-            # Track which text blocks actually need translation
-            blocks_to_translate = []
-            
-            # Translate each text block with small delays to avoid rate limiting
-            for i, block in enumerate(text_blocks):
-                original_text = block['text']
-                bbox = block['bbox']  # [x, y, width, height]
-                
-                # Small delay between translations to avoid overwhelming the API
-                if i > 0:
-                    time.sleep(0.1)  # 100ms delay between translations
-                
-                # Translate the text
-                translation_result = translation_processor.translate_text(
-                    text=original_text,
-                    target_language=target_language,
-                    source_language=source_language,
-                    force_llm=use_llm,
-                    llm_model=llm_model
-                )
-                
-                if translation_result.get('success'):
-                    translated_text = translation_result.get('translation', original_text)
-                    
-                    # Check if translation was skipped (already in target language)
-                    if translation_result.get('skipped'):
-                        logger.debug(f"Text already in target language: '{original_text[:50]}'")
-                        continue  # Skip this block
-                    
-                    # Validate translation - skip if it looks like an error message or is too long
-                    # (OCR sometimes detects garbage that produces LLM error messages)
-                    error_indicators = [
-                        "I don't see any",
-                        "I don't see",
-                        "Please share",
-                        "Please provide",
-                        "provided to translate",
-                        "following your instructions",
-                        "following your specified"
-                    ]
-                    
-                    if any(indicator in translated_text for indicator in error_indicators):
-                        logger.warning(f"Skipping translation that looks like an error message: '{translated_text[:100]}'")
-                        continue
-                    
-                    # Skip if translation is way longer than original (likely error)
-                    if len(translated_text) > len(original_text) * 5:
-                        logger.warning(f"Skipping translation that's too long compared to original: {len(original_text)} -> {len(translated_text)}")
-                        continue
-                    
-                    # Add to blocks that need translation
-                    blocks_to_translate.append({
-                        'original': original_text,
-                        'translated': translated_text,
-                        'bbox': bbox
-                    })
-                    
-                    logger.info(f"Translated in image: '{original_text}' -> '{translated_text}'")
-                elif translation_result.get('error'):
-                    # Translation failed, log warning and skip this block
-                    logger.warning(f"Translation failed for '{original_text[:50]}': {translation_result.get('error')}")
-            
-            # If no blocks need translation, return None (skip image processing)
-            if not blocks_to_translate:
-                logger.info("All text already in target language, no image modification needed")
-                return None
+            font_size = 20
+            font = load_font(font_size)
             
             # Now draw the translations on the image
             for block_data in blocks_to_translate:
@@ -350,13 +541,7 @@ class ImageTranslator:
                 # Calculate font size to fit the bounding box
                 adjusted_font_size = self._calculate_font_size(translated_text, w, h, font)
                 if adjusted_font_size != font_size:
-                    try:
-                        font = ImageFont.truetype("arial.ttf", adjusted_font_size)
-                    except:
-                        try:
-                            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", adjusted_font_size)
-                        except:
-                            font = ImageFont.load_default()
+                    font = load_font(adjusted_font_size)
                 
                 # Draw the translated text with the detected text color
                 draw.text(
@@ -385,21 +570,21 @@ class ImageTranslator:
                     # Create white background
                     rgb_image = Image.new('RGB', translated_image.size, (255, 255, 255))
                     rgb_image.paste(translated_image, mask=translated_image.split()[3] if len(translated_image.split()) == 4 else None)
-                    rgb_image.save(output_buffer, format='JPEG', quality=95)
+                    rgb_image.save(output_buffer, format='JPEG', **encoder['jpeg'])
                 else:
-                    translated_image.save(output_buffer, format='JPEG', quality=95)
+                    translated_image.save(output_buffer, format='JPEG', **encoder['jpeg'])
             else:
                 # PNG format (supports transparency)
-                translated_image.save(output_buffer, format='PNG', optimize=True)
+                translated_image.save(output_buffer, format='PNG', **encoder['png'])
             
-            logger.info(f"Saved translated image as {save_format}")
+            logger.info(f"Saved translated image as {save_format} ({self.encode_profile} profile)")
             return output_buffer.getvalue()
             
         except Exception as e:
-            logger.error(f"Error translating image: {e}")
+            logger.error(f"Error rendering translated image: {e}")
             return None
     
-    def _sample_text_colors(self, image: Image.Image, bbox: list) -> tuple:
+    def _sample_text_colors(self, image: 'Image.Image', bbox: list) -> tuple:
         """
         Sample text and background colors from a bounding box region.
         
@@ -0,0 +1,162 @@
+"""
+Bounded-concurrency dispatcher for LLM calls.
+
+LLM-mode documents make one chat completion per routed segment and target
+language. Sending them one after another makes a deck take the sum of all
+call latencies; sending them all at once trips provider rate limits. The
+dispatcher runs calls concurrently under per-model limits shared by every
+job in the process:
+
+- max_concurrency: calls in flight per model (a semaphore)
+- tokens_per_minute: a token bucket charged with each call's estimated
+  tokens up front and corrected with the actual usage afterwards
+
+Results of ``map`` keep the input order.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+from app.utils.metrics import QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class _TokenBucket:
+    """Tokens-per-minute budget refilled continuously."""
+
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+        self._condition = threading.Condition()
+
+    def acquire(self, tokens: float):
+        """Block until ``tokens`` are available, then take them."""
+        # A single request larger than the whole budget still has to go through
+        tokens = min(tokens, self.capacity)
+        with self._condition:
+            while True:
+                self._refill()
+                if self.available >= tokens:
+                    self.available -= tokens
+                    return
+                self._condition.wait((tokens - self.available) / self.rate)
+
+    def adjust(self, tokens: float):
+        """Charge (positive) or refund (negative) tokens after the fact."""
+        with self._condition:
+            self._refill()
+            self.available = min(self.capacity, self.available - tokens)
+            self._condition.notify_all()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class _ModelLimiter:
+    def __init__(self, max_concurrency: int, tokens_per_minute: int):
+        self.max_concurrency = max(1, max_concurrency)
+        self.semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self.bucket = _TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+
+
+class LLMSlot:
+    """A reserved LLM call; report the actual token usage when known."""
+
+    def __init__(self, bucket: Optional[_TokenBucket], reserved: float):
+        self._bucket = bucket
+        self._reserved = reserved
+
+    def used(self, tokens: int):
+        """Correct the reservation with the call's actual token usage."""
+        if self._bucket is not None and tokens:
+            self._bucket.adjust(tokens - self._reserved)
+            self._reserved = tokens
+
+
+class LLMDispatcher:
+    """Runs LLM calls concurrently under per-model concurrency and TPM limits."""
+
+    def __init__(
+        self,
+        model_limits: Optional[Dict[str, Dict[str, Any]]] = None,
+        default_max_concurrency: int = 4,
+        default_tokens_per_minute: int = 0
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            model_limits: Model name -> dict with optional 'max_concurrency'
+                and 'tokens_per_minute' (e.g. ``Config.AVAILABLE_LLM_MODELS``).
+            default_max_concurrency: Concurrency for models without limits.
+            default_tokens_per_minute: TPM for models without limits (0 = unlimited).
+        """
+        self.model_limits = model_limits or {}
+        self.default_max_concurrency = default_max_concurrency
+        self.default_tokens_per_minute = default_tokens_per_minute
+        self._limiters: Dict[str, _ModelLimiter] = {}
+        self._lock = threading.Lock()
+        self._waiting = QUEUE_DEPTH.labels('llm')
+
+    def limiter(self, model: str) -> _ModelLimiter:
+        with self._lock:
+            if model not in self._limiters:
+                limits = self.model_limits.get(model) or {}
+                self._limiters[model] = _ModelLimiter(
+                    limits.get('max_concurrency', self.default_max_concurrency),
+                    limits.get('tokens_per_minute', self.default_tokens_per_minute)
+                )
+            return self._limiters[model]
+
+    @contextmanager
+    def slot(self, model: str, estimated_tokens: float = 0) -> Iterator[LLMSlot]:
+        """
+        Hold one of the model's concurrency slots for the duration of a call.
+
+        Args:
+            model: Model the call goes to.
+            estimated_tokens: Prompt plus completion tokens expected, charged
+                to the model's TPM budget before the call starts.
+        """
+        limiter = self.limiter(model)
+        self._waiting.inc()
+        try:
+            if limiter.bucket is not None:
+                limiter.bucket.acquire(estimated_tokens)
+            limiter.semaphore.acquire()
+        finally:
+            self._waiting.dec()
+        try:
+            yield LLMSlot(limiter.bucket, estimated_tokens)
+        finally:
+            limiter.semaphore.release()
+
+    def map(self, model: str, fn: Callable[[T], R], items: Sequence[T]) -> List[R]:
+        """
+        Apply ``fn`` (which takes a ``slot`` itself) to every item concurrently.
+
+        The thread pool is sized to the model's concurrency limit; the slot
+        inside ``fn`` enforces the limit across concurrent jobs as well.
+
+        Returns:
+            Results in the order of ``items``.
+        """
+        if not items:
+            return []
+        workers = min(self.limiter(model).max_concurrency, len(items))
+        if workers == 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='llm') as executor:
+            return list(executor.map(fn, items))
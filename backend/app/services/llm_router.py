@@ -0,0 +1,187 @@
+"""
+Per-segment routing between Azure Translator and LLM translation.
+
+With LLM enhancement on, every segment used to cost one chat completion per
+target language on top of the Azure request, including text like "Agenda"
+or "Thank you" that Azure already translates well. The router scores each
+segment from cheap signals and only sends segments scoring at or above a
+threshold to the LLM; the rest keep their Azure translation.
+
+Signals (each in [0, 1]):
+
+- length: longer segments carry more context for the LLM to get right
+- complexity: several sentences or clauses, long sentences
+- uncertainty: Azure's language-detection score was low, Azure returned the
+  input unchanged, or the translation length is far off the source length
+- glossary: the segment contains a glossary term whose rendering must follow
+  house usage (a hit alone is enough to route to the LLM)
+
+A threshold of 0 routes every segment to the LLM, as before.
+"""
+
+import logging
+import re
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r'\w+')
+_SENTENCE_END = re.compile(r'[.!?。！？](?:\s|$)')
+_CLAUSE = re.compile(r'[,;:、，；：]')
+
+# Tokens spent on the system prompt and instructions of one translation call
+_PROMPT_OVERHEAD_TOKENS = 150
+_CHARS_PER_TOKEN = 4
+# Cached prompt tokens are billed at roughly a tenth of the normal input price
+CACHE_READ_PRICE_RATIO = 0.1
+
+
+class LLMRouter:
+    """Decides per segment whether LLM translation is worth its cost."""
+
+    def __init__(
+        self,
+        threshold: float = 0.3,
+        glossary_terms: Iterable[str] = (),
+        llm_seconds_per_call: float = 2.0,
+        llm_cost_per_million_tokens: float = 6.0
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            threshold: Minimum score sent to the LLM (0 sends everything).
+            glossary_terms: Terms that always warrant LLM translation.
+            llm_seconds_per_call: Initial estimate of one LLM call's latency;
+                refined from observed calls.
+            llm_cost_per_million_tokens: Blended prompt/completion price used
+                for cost estimates.
+        """
+        self.threshold = max(0.0, threshold)
+        self.glossary_terms = [term.strip().lower() for term in glossary_terms if term.strip()]
+        self._glossary = re.compile(
+            r'(?<!\w)(?:' + '|'.join(re.escape(term) for term in self.glossary_terms) + r')(?!\w)',
+            re.IGNORECASE
+        ) if self.glossary_terms else None
+        self.llm_cost_per_million_tokens = llm_cost_per_million_tokens
+        self._llm_seconds = llm_seconds_per_call
+        self._lock = threading.Lock()
+
+    def score(
+        self,
+        text: str,
+        azure_translation: Optional[str] = None,
+        detection_score: Optional[float] = None
+    ) -> float:
+        """
+        Score how much a segment would benefit from LLM translation.
+
+        Args:
+            text: Source segment.
+            azure_translation: Azure's translation of the segment, if known.
+            detection_score: Azure's language-detection confidence, if known.
+
+        Returns:
+            Score in [0, 1].
+        """
+        text = text.strip()
+        # Word count, with CJK text (no spaces) counted by characters
+        units = max(len(_WORD.findall(text)), len(text) / 6)
+
+        length = min(units / 30, 1.0)
+
+        sentences = max(1, len(_SENTENCE_END.findall(text)))
+        clauses = len(_CLAUSE.findall(text))
+        complexity = min(
+            (sentences - 1) / 3 + clauses / 6 + max(0.0, units / sentences - 12) / 24,
+            1.0
+        )
+
+        uncertainty = 0.0
+        if detection_score is not None:
+            uncertainty = max(0.0, 1.0 - detection_score)
+        if azure_translation is not None and units >= 3:
+            if azure_translation.strip() == text:
+                uncertainty = 1.0
+            elif len(text) >= 20:
+                ratio = len(azure_translation.strip()) / len(text)
+                if ratio < 0.25 or ratio > 4.0:
+                    uncertainty = 1.0
+
+        score = 0.4 * length + 0.3 * complexity + 0.3 * uncertainty
+        if self._glossary and self._glossary.search(text):
+            score += 0.5
+        return min(score, 1.0)
+
+    def use_llm(
+        self,
+        text: str,
+        azure_translation: Optional[str] = None,
+        detection_score: Optional[float] = None
+    ) -> Tuple[bool, float]:
+        """Return (whether to send the segment to the LLM, its score)."""
+        if self.threshold <= 0:
+            return True, 1.0
+        score = self.score(text, azure_translation, detection_score)
+        return score >= self.threshold, score
+
+    def record_llm_call(self, seconds: float):
+        """Fold an observed LLM call latency into the per-call estimate."""
+        with self._lock:
+            self._llm_seconds = 0.8 * self._llm_seconds + 0.2 * seconds
+
+    def estimate_llm_call(self, text: str) -> Dict[str, float]:
+        """Estimated latency (seconds) and cost of one LLM translation call."""
+        tokens = len(text) / _CHARS_PER_TOKEN
+        total_tokens = _PROMPT_OVERHEAD_TOKENS + tokens + 1.3 * tokens
+        return {
+            'seconds': self._llm_seconds,
+            'cost': total_tokens * self.llm_cost_per_million_tokens / 1_000_000
+        }
+
+    def report(self, results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Summarize routing and LLM usage over one language's segment results.
+
+        Args:
+            results: ``translate_segments`` results for one target language
+                (segment text -> result).
+
+        Returns:
+            Dictionary with llm_segments, azure_segments, the estimated LLM
+            latency (seconds) and cost saved by keeping segments on Azure,
+            the LLM token usage (prompt, completion, and prompt tokens read
+            from the provider's prompt cache) and the estimated cost saved
+            by those cache reads.
+        """
+        report = {
+            'llm_segments': 0,
+            'azure_segments': 0,
+            'llm_seconds_saved': 0.0,
+            'llm_cost_saved': 0.0,
+            'llm_prompt_tokens': 0,
+            'llm_completion_tokens': 0,
+            'llm_cached_tokens': 0,
+            'llm_cache_savings': 0.0
+        }
+        for text, result in results.items():
+            route = result.get('route')
+            if route == 'llm':
+                report['llm_segments'] += 1
+                usage = result.get('usage') or {}
+                report['llm_prompt_tokens'] += usage.get('prompt_tokens', 0)
+                report['llm_completion_tokens'] += usage.get('completion_tokens', 0)
+                report['llm_cached_tokens'] += usage.get('cached_tokens', 0)
+            elif route == 'azure':
+                report['azure_segments'] += 1
+                estimate = self.estimate_llm_call(text)
+                report['llm_seconds_saved'] += estimate['seconds']
+                report['llm_cost_saved'] += estimate['cost']
+        report['llm_seconds_saved'] = round(report['llm_seconds_saved'], 2)
+        report['llm_cost_saved'] = round(report['llm_cost_saved'], 6)
+        report['llm_cache_savings'] = round(
+            report['llm_cached_tokens'] * (1 - CACHE_READ_PRICE_RATIO) * self.llm_cost_per_million_tokens / 1_000_000,
+            6
+        )
+        return report
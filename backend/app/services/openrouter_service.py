@@ -1,22 +1,111 @@
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import json
+import math
 import requests
 import logging
 
+from app.utils.metrics import record_openrouter_usage, track_upstream
+from app.utils.sse import iter_sse_data
+
 logger = logging.getLogger(__name__)
 
+LANGUAGE_NAMES = {
+    'en': 'English',
+    'id': 'Indonesian',
+    'ja': 'Japanese',
+    'fr': 'French',
+    'de': 'German',
+    'es': 'Spanish',
+    'zh': 'Chinese',
+    'ko': 'Korean'
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count of a text.
+
+    CJK characters are counted as one token each, everything else as four
+    characters per token.
+    """
+    wide = sum(1 for char in text if ord(char) >= 0x2E80)
+    return wide + math.ceil((len(text) - wide) / 4)
+
+
+def max_tokens_for(text: str, cap: int = 4096) -> int:
+    """
+    Completion budget for translating or rewriting a text.
+
+    Output gets three times the input's estimated tokens (translations into
+    CJK or German can grow that much) plus a floor for very short strings,
+    so a one-word label cannot run on while long passages are not truncated.
+
+    Args:
+        text: Text the completion will render.
+        cap: Upper bound on the budget.
+    """
+    return max(1, min(cap, 64 + 3 * estimate_tokens(text)))
+
+
+def usage_summary(usage: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Normalize an OpenRouter ``usage`` block.
+
+    Returns:
+        prompt_tokens, completion_tokens and cached_tokens (prompt tokens
+        served from the provider's prompt cache).
+    """
+    usage = usage or {}
+    details = usage.get('prompt_tokens_details') or {}
+    return {
+        'prompt_tokens': usage.get('prompt_tokens') or 0,
+        'completion_tokens': usage.get('completion_tokens') or 0,
+        'cached_tokens': details.get('cached_tokens') or usage.get('cache_read_input_tokens') or 0
+    }
+
+
+@lru_cache(maxsize=64)
+def _shared_prefix(target_language: str, shared_context: str) -> str:
+    """Instructions plus deck context: identical for every segment of a job and language."""
+    target_lang_name = LANGUAGE_NAMES.get(target_language, target_language)
+    return f"""You translate presentation text to {target_lang_name}.
+
+Instructions:
+- Preserve proper nouns, brand names, and company names
+- Keep technical terms accurate
+- Maintain the original formatting and structure
+- Preserve URLs, emails, and numbers
+- Use natural, fluent language in the target language
+- Follow the glossary and style notes below so every slide uses the same terminology
+
+Deck context:
+{shared_context}"""
+
+
 class OpenRouterService:
     """Service to interact with OpenRouter for LLM-enhanced translation capabilities."""
-    
-    def __init__(self, api_key: str, api_url: str = "https://openrouter.ai/api/v1/chat/completions"):
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str = "https://openrouter.ai/api/v1/chat/completions",
+        max_tokens_cap: int = 4096,
+        timeout: float = 60.0
+    ):
         """
         Initialize the OpenRouter service.
-        
+
         Args:
             api_key: API key for authenticating with OpenRouter.
             api_url: API URL for the OpenRouter chat completions endpoint.
+            max_tokens_cap: Upper bound on the completion budget of one request.
+            timeout: Seconds to wait for a response (or the next streamed chunk).
         """
         self.api_key = api_key
         self.api_url = api_url
+        self.max_tokens_cap = max_tokens_cap
+        self.timeout = timeout
         logger.info("OpenRouter service initialized")
 
     def translate_with_context(
@@ -25,98 +114,44 @@ class OpenRouterService:
         target_language: str,
         source_language: Optional[str] = None,
         context: Optional[str] = None,
-        model: str = "anthropic/claude-3.5-sonnet"
+        model: str = "anthropic/claude-3.5-sonnet",
+        shared_context: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Translate text using LLM with context awareness for better quality.
-        
+
         Args:
             text: Text to be translated.
             target_language: Target language code (e.g., 'en', 'id', 'ja').
             source_language: Source language code (optional).
             context: Additional context for better translation.
             model: LLM model to use for translation.
-        
+            shared_context: Deck-level context sent as a cacheable prompt
+                prefix shared by every segment of a job.
+
         Returns:
-            Dictionary with translation result.
+            Dictionary with translation result (including normalized ``usage``).
         """
-        # Build prompt
-        lang_names = {
-            'en': 'English',
-            'id': 'Indonesian',
-            'ja': 'Japanese',
-            'fr': 'French',
-            'de': 'German',
-            'es': 'Spanish',
-            'zh': 'Chinese',
-            'ko': 'Korean'
-        }
-        
-        target_lang_name = lang_names.get(target_language, target_language)
-        source_info = f" from {lang_names.get(source_language, source_language)}" if source_language else ""
-        
-        prompt = f"""Translate the following text{source_info} to {target_lang_name}.
+        messages = self._translate_messages(text, target_language, source_language, context, shared_context)
 
-Instructions:
-- Preserve proper nouns, brand names, and company names
-- Keep technical terms accurate
-- Maintain the original formatting and structure
-- Preserve URLs, emails, and numbers
-- Use natural, fluent language in the target language
-"""
-        
-        if context:
-            prompt += f"\nContext: {context}\n"
-        
-        prompt += f"\nText to translate:\n{text}\n\nProvide only the translated text without explanations."
-        
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json',
-            'HTTP-Referer': 'https://document-translation-app.com',
-            'X-Title': 'Document Translation App'
-        }
-        
-        payload = {
-            'model': model,
-            'messages': [
-                {
-                    'role': 'user',
-                    'content': prompt
-                }
-            ],
-            'temperature': 0.3,
-            'max_tokens': 2000
-        }
-        
         try:
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=60
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            # Extract translation
-            if 'choices' in result and len(result['choices']) > 0:
-                translation = result['choices'][0]['message']['content'].strip()
-                
+            translation, usage = self._complete('translate', model, messages, max_tokens_for(text, self.max_tokens_cap))
+
+            if translation is not None:
                 return {
                     'success': True,
                     'translation': translation,
                     'model': model,
-                    'target_language': target_language
+                    'target_language': target_language,
+                    'usage': usage
                 }
-            
+
             return {
                 'success': False,
                 'error': 'No translation returned',
                 'translation': None
             }
-            
+
         except requests.exceptions.RequestException as e:
             logger.error(f"OpenRouter API error: {e}")
             return {
@@ -125,6 +160,35 @@ Instructions:
                 'translation': None
             }
 
+    def stream_translate_with_context(
+        self,
+        text: str,
+        target_language: str,
+        source_language: Optional[str] = None,
+        context: Optional[str] = None,
+        model: str = "anthropic/claude-3.5-sonnet",
+        shared_context: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Translate text using LLM, yielding the translation as it is generated.
+
+        Args:
+            text: Text to be translated.
+            target_language: Target language code (e.g., 'en', 'id', 'ja').
+            source_language: Source language code (optional).
+            context: Additional context for better translation.
+            model: LLM model to use for translation.
+            shared_context: Deck-level context sent as a cacheable prompt prefix.
+
+        Yields:
+            Text deltas of the translation.
+
+        Raises:
+            requests.exceptions.RequestException: If the request or stream fails.
+        """
+        messages = self._translate_messages(text, target_language, source_language, context, shared_context)
+        yield from self._stream('translate', model, messages, max_tokens_for(text, self.max_tokens_cap))
+
     def improve_translation(
         self,
         original_text: str,
@@ -135,30 +199,159 @@ Instructions:
     ) -> Dict[str, Any]:
         """
         Improve or refine an existing translation based on feedback.
-        
+
         Args:
             original_text: Original source text.
             translated_text: Current translation to improve.
             target_language: Target language code.
             feedback: Specific feedback or instructions for improvement.
             model: LLM model to use.
-        
+
         Returns:
             Dictionary with improved translation.
         """
-        lang_names = {
-            'en': 'English',
-            'id': 'Indonesian',
-            'ja': 'Japanese',
-            'fr': 'French',
-            'de': 'German',
-            'es': 'Spanish',
-            'zh': 'Chinese',
-            'ko': 'Korean'
-        }
-        
-        target_lang_name = lang_names.get(target_language, target_language)
-        
+        messages = self._user_message(self._improve_prompt(original_text, translated_text, target_language, feedback))
+        max_tokens = max_tokens_for(max(original_text, translated_text, key=len), self.max_tokens_cap)
+
+        try:
+            improved_translation, usage = self._complete('improve', model, messages, max_tokens)
+
+            if improved_translation is not None:
+                return {
+                    'success': True,
+                    'translation': improved_translation,
+                    'model': model,
+                    'usage': usage
+                }
+
+            return {
+                'success': False,
+                'error': 'No improved translation returned',
+                'translation': None
+            }
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"OpenRouter API error: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+                'translation': None
+            }
+
+    def stream_improve_translation(
+        self,
+        original_text: str,
+        translated_text: str,
+        target_language: str,
+        feedback: Optional[str] = None,
+        model: str = "anthropic/claude-3.5-sonnet"
+    ) -> Iterator[str]:
+        """
+        Improve an existing translation, yielding the result as it is generated.
+
+        Args:
+            original_text: Original source text.
+            translated_text: Current translation to improve.
+            target_language: Target language code.
+            feedback: Specific feedback or instructions for improvement.
+            model: LLM model to use.
+
+        Yields:
+            Text deltas of the improved translation.
+
+        Raises:
+            requests.exceptions.RequestException: If the request or stream fails.
+        """
+        messages = self._user_message(self._improve_prompt(original_text, translated_text, target_language, feedback))
+        max_tokens = max_tokens_for(max(original_text, translated_text, key=len), self.max_tokens_cap)
+        yield from self._stream('improve', model, messages, max_tokens)
+
+    def _translate_messages(
+        self,
+        text: str,
+        target_language: str,
+        source_language: Optional[str],
+        context: Optional[str],
+        shared_context: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Chat messages for one translation.
+
+        With a shared context, the instructions and deck context go into a
+        system message marked for provider prompt caching (``cache_control``;
+        providers with automatic prefix caching ignore the marker), and only
+        the segment varies between calls.
+        """
+        if not shared_context:
+            return self._user_message(self._translate_prompt(text, target_language, source_language, context))
+
+        suffix = ""
+        if source_language:
+            suffix += f"Source language: {LANGUAGE_NAMES.get(source_language, source_language)}\n"
+        if context:
+            suffix += f"Context: {context}\n"
+        suffix += f"\nText to translate:\n{text}\n\nProvide only the translated text without explanations."
+        return [
+            {
+                'role': 'system',
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': _shared_prefix(target_language, shared_context),
+                        'cache_control': {'type': 'ephemeral'}
+                    }
+                ]
+            },
+            {
+                'role': 'user',
+                'content': suffix
+            }
+        ]
+
+    @staticmethod
+    def _user_message(prompt: str) -> List[Dict[str, Any]]:
+        return [
+            {
+                'role': 'user',
+                'content': prompt
+            }
+        ]
+
+    @staticmethod
+    def _translate_prompt(
+        text: str,
+        target_language: str,
+        source_language: Optional[str],
+        context: Optional[str]
+    ) -> str:
+        target_lang_name = LANGUAGE_NAMES.get(target_language, target_language)
+        source_info = f" from {LANGUAGE_NAMES.get(source_language, source_language)}" if source_language else ""
+
+        prompt = f"""Translate the following text{source_info} to {target_lang_name}.
+
+Instructions:
+- Preserve proper nouns, brand names, and company names
+- Keep technical terms accurate
+- Maintain the original formatting and structure
+- Preserve URLs, emails, and numbers
+- Use natural, fluent language in the target language
+"""
+
+        if context:
+            prompt += f"\nContext: {context}\n"
+
+        prompt += f"\nText to translate:\n{text}\n\nProvide only the translated text without explanations."
+        return prompt
+
+    @staticmethod
+    def _improve_prompt(
+        original_text: str,
+        translated_text: str,
+        target_language: str,
+        feedback: Optional[str]
+    ) -> str:
+        target_lang_name = LANGUAGE_NAMES.get(target_language, target_language)
+
         prompt = f"""Review and improve the following {target_lang_name} translation.
 
 Original text:
@@ -167,61 +360,96 @@ Original text:
 Current translation:
 {translated_text}
 """
-        
+
         if feedback:
             prompt += f"\nFeedback/Instructions:\n{feedback}\n"
-        
+
         prompt += "\nProvide only the improved translation without explanations."
-        
-        headers = {
+        return prompt
+
+    def _headers(self) -> Dict[str, str]:
+        return {
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json',
             'HTTP-Referer': 'https://document-translation-app.com',
             'X-Title': 'Document Translation App'
         }
-        
+
+    @staticmethod
+    def _payload(model: str, messages: List[Dict[str, Any]], max_tokens: int, stream: bool = False) -> Dict[str, Any]:
         payload = {
             'model': model,
-            'messages': [
-                {
-                    'role': 'user',
-                    'content': prompt
-                }
-            ],
+            'messages': messages,
             'temperature': 0.3,
-            'max_tokens': 2000
+            'max_tokens': max_tokens,
+            # Ask for detailed usage, including prompt tokens read from the cache
+            'usage': {'include': True}
         }
-        
-        try:
+        if stream:
+            payload['stream'] = True
+        return payload
+
+    def _complete(
+        self,
+        operation: str,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_tokens: int
+    ) -> Tuple[Optional[str], Dict[str, int]]:
+        """Send one chat completion and return its stripped content (None if empty) and usage."""
+        with track_upstream('openrouter', operation) as call:
             response = requests.post(
                 self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=60
+                headers=self._headers(),
+                json=self._payload(model, messages, max_tokens),
+                timeout=self.timeout
             )
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            if 'choices' in result and len(result['choices']) > 0:
-                improved_translation = result['choices'][0]['message']['content'].strip()
-                
-                return {
-                    'success': True,
-                    'translation': improved_translation,
-                    'model': model
-                }
-            
-            return {
-                'success': False,
-                'error': 'No improved translation returned',
-                'translation': None
-            }
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"OpenRouter API error: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'translation': None
-            }
\ No newline at end of file
+            call.status = response.status_code
+        response.raise_for_status()
+
+        result = response.json()
+        record_openrouter_usage(model, result.get('usage'))
+
+        usage = usage_summary(result.get('usage'))
+        if 'choices' in result and len(result['choices']) > 0:
+            return result['choices'][0]['message']['content'].strip(), usage
+        return None, usage
+
+    def _stream(self, operation: str, model: str, messages: List[Dict[str, Any]], max_tokens: int) -> Iterator[str]:
+        """
+        Send one streaming chat completion and yield its content deltas.
+
+        Leading whitespace of the completion is dropped, matching the
+        stripped output of the non-streaming calls.
+        """
+        with track_upstream('openrouter', f'{operation}_stream') as call:
+            response = requests.post(
+                self.api_url,
+                headers=self._headers(),
+                json=self._payload(model, messages, max_tokens, stream=True),
+                timeout=self.timeout,
+                stream=True
+            )
+            call.status = response.status_code
+            with response:
+                response.raise_for_status()
+                started = False
+                for data in iter_sse_data(response.iter_lines(decode_unicode=True)):
+                    if data == '[DONE]':
+                        break
+                    chunk = json.loads(data)
+                    if 'error' in chunk:
+                        # Errors after the stream started arrive as an event, not a status code
+                        message = chunk['error'].get('message', 'stream error') if isinstance(chunk['error'], dict) else str(chunk['error'])
+                        raise requests.exceptions.RequestException(f"OpenRouter stream error: {message}")
+                    record_openrouter_usage(model, chunk.get('usage'))
+                    for choice in chunk.get('choices', []):
+                        delta = (choice.get('delta') or {}).get('content')
+                        if not delta:
+                            continue
+                        if not started:
+                            delta = delta.lstrip()
+                            if not delta:
+                                continue
+                            started = True
+                        yield delta
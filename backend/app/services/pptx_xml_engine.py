@@ -0,0 +1,631 @@
+"""
+Zip/XML-level PPTX engine.
+
+Extracts and writes back slide text without building the python-pptx object
+graph:
+
+- slide XML is streamed with lxml ``iterparse``; shapes are addressed exactly
+  like ``DocumentProcessor._iter_shapes`` (``slide_0_shape_3_group_1``), so
+  frame ids, table cell ids and ``.original.json`` sidecars are identical for
+  both engines
+- slide masters, layouts and notes slides are included with ids prefixed
+  ``master_``, ``layout_`` and ``notes_``; shared master/layout text is
+  extracted once however many slides inherit it
+- only parts whose text changed (and media parts that were re-rendered)
+  are re-serialized into the output zip
+- every other entry, including all media, is copied as raw compressed bytes
+  without being decompressed or recompressed
+"""
+
+import copy
+import logging
+import posixpath
+import re
+import struct
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from lxml import etree
+
+from app.utils.image_identity import ImageIndex
+from app.utils.stages import pipeline_stage
+
+logger = logging.getLogger(__name__)
+
+_NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+    'ct': 'http://schemas.openxmlformats.org/package/2006/content-types'
+}
+_RELATIONSHIP_TYPES = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+_OFFICE_DOCUMENT = _RELATIONSHIP_TYPES + 'officeDocument'
+_SLIDE_LAYOUT = _RELATIONSHIP_TYPES + 'slideLayout'
+_NOTES_SLIDE = _RELATIONSHIP_TYPES + 'notesSlide'
+
+
+def _qn(tag: str) -> str:
+    prefix, name = tag.split(':')
+    return f"{{{_NS[prefix]}}}{name}"
+
+
+# Child elements of p:spTree / p:grpSp that python-pptx exposes as shapes
+_SHAPE_TAGS = {_qn(tag) for tag in ('p:sp', 'p:grpSp', 'p:graphicFrame', 'p:cxnSp', 'p:pic', 'p:contentPart')}
+_TEXT_CHILDREN = {_qn('a:r'), _qn('a:br'), _qn('a:fld')}
+# Run properties that describe the original text rather than its formatting
+_SOURCE_RUN_ATTRIBUTES = ('lang', 'altLang', 'err', 'dirty')
+_CONTROL_CHARS = re.compile(r'([\x00-\x08\x0B-\x1F])')
+_ZIP_ENCRYPTED = 0x1
+_ZIP_DATA_DESCRIPTOR = 0x8
+
+
+class PptxXmlEngine:
+    """Reads and rewrites PPTX text at the zip/XML level."""
+
+    def __init__(self, min_image_bytes: int = 5000, include_masters_and_notes: bool = True):
+        """
+        Initialize the engine.
+
+        Args:
+            min_image_bytes: Pictures smaller than this are treated as
+                decorative icons and not registered for OCR.
+            include_masters_and_notes: Whether to translate slide masters,
+                layouts and notes slides as well as slides.
+        """
+        self.min_image_bytes = min_image_bytes
+        self.include_masters_and_notes = include_masters_and_notes
+
+    def extract(self, input_path: Path, include_images: bool = False) -> Dict[str, Any]:
+        """
+        Extract every translatable element of a PPTX file.
+
+        Args:
+            input_path: Path to input PPTX file
+            include_images: Whether to register pictures for OCR
+
+        Returns:
+            Extraction dictionary in the same shape as
+            ``DocumentProcessor.extract_pptx``; images additionally list the
+            media ``parts`` holding them
+        """
+        with zipfile.ZipFile(input_path) as package:
+            with pipeline_stage("load"):
+                parts, inheritance = self._document_parts(package)
+                content_types = self._content_types(package) if include_images else None
+
+            extraction = {
+                'filename': input_path.name,
+                'slide_count': sum(1 for prefix, _ in parts if prefix.startswith('slide_')),
+                'text_frames': {},
+                'table_cells': {},
+                'pictures': {},
+                'images': {},
+                'inheritance': inheritance
+            }
+            image_index = ImageIndex(extraction['images'])
+
+            with pipeline_stage("extract"):
+                for prefix, part in parts:
+                    is_slide = prefix.startswith('slide_')
+                    rels = self._relationships(package, part) if include_images and is_slide else {}
+                    with package.open(part) as stream:
+                        for frame_id, element in self._stream_shapes(stream, prefix):
+                            try:
+                                if not is_slide and not _is_shared_content(prefix, element):
+                                    continue
+                                self._extract_shape(frame_id, element, extraction)
+                                if rels and element.tag == _qn('p:pic'):
+                                    picture_part = self._picture_part(element, rels)
+                                    image_key = self._register_image(package, picture_part, content_types, image_index) if picture_part else None
+                                    if image_key:
+                                        extraction['pictures'][frame_id] = image_key
+                            except Exception as e:
+                                logger.error(f"Error extracting {frame_id}: {e}")
+
+        logger.info(
+            f"Extracted {len(extraction['text_frames'])} text frames, "
+            f"{len(extraction['table_cells'])} table cells and "
+            f"{len(extraction['images'])} unique images from {input_path.name} (xml engine)"
+        )
+        return extraction
+
+    def write(
+        self,
+        input_path: Path,
+        output_path: Path,
+        extraction: Dict[str, Any],
+        translations: Dict[str, Dict[str, Any]],
+        translated_images: Optional[Dict[str, Optional[bytes]]] = None,
+        preserve_formatting: bool = True
+    ) -> Dict[str, int]:
+        """
+        Write a translated copy of a PPTX file.
+
+        Args:
+            input_path: Path to input PPTX file
+            output_path: Path to save translated PPTX
+            extraction: Result of extract for the same input file
+            translations: Translation results keyed by segment text
+            translated_images: Rendered image bytes keyed by image key
+            preserve_formatting: Whether to keep the first run's formatting
+
+        Returns:
+            Counts of slides, text frames, tables and pictures processed
+        """
+        stats = {
+            'slides_processed': 0,
+            'text_frames_translated': 0,
+            'tables_translated': 0,
+            'images_translated': 0
+        }
+
+        with zipfile.ZipFile(input_path) as package:
+            with pipeline_stage("load"):
+                parts, _ = self._document_parts(package)
+                replacements: Dict[str, bytes] = {}
+
+                for prefix, part in parts:
+                    root = etree.fromstring(package.read(part))
+                    if self._apply_part(root, prefix, extraction, translations, preserve_formatting, stats):
+                        replacements[part] = etree.tostring(
+                            root, xml_declaration=True, encoding='UTF-8', standalone=True
+                        )
+                stats['slides_processed'] = extraction['slide_count']
+
+                replaced_images = self._image_replacements(package, extraction, translated_images or {}, replacements)
+                stats['images_translated'] = sum(
+                    1 for image_key in extraction['pictures'].values() if image_key in replaced_images
+                )
+
+            with pipeline_stage("save"):
+                copied = self._write_package(package, output_path, replacements)
+
+        logger.info(
+            f"Translated PPTX saved to: {output_path} "
+            f"({len(replacements)} parts rewritten, {copied} copied raw)"
+        )
+        return stats
+
+    def _write_package(self, package: zipfile.ZipFile, output_path: Path, replacements: Dict[str, bytes]) -> int:
+        """Write the output zip, copying unmodified entries raw. Returns the number copied."""
+        copied = 0
+        with zipfile.ZipFile(output_path, 'w') as output:
+            for info in package.infolist():
+                if info.filename in replacements:
+                    entry = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+                    entry.compress_type = zipfile.ZIP_DEFLATED
+                    entry.external_attr = info.external_attr
+                    output.writestr(entry, replacements[info.filename])
+                elif self._copy_entry_raw(package, output, info):
+                    copied += 1
+                else:
+                    output.writestr(copy.copy(info), package.read(info))
+        return copied
+
+    @staticmethod
+    def _copy_entry_raw(source: zipfile.ZipFile, target: zipfile.ZipFile, info: zipfile.ZipInfo) -> bool:
+        """
+        Copy one entry's compressed bytes from source to target unchanged.
+
+        Returns:
+            False if the entry cannot be copied raw (encrypted or zip64), in
+            which case the caller re-encodes it
+        """
+        if (info.flag_bits & _ZIP_ENCRYPTED
+                or info.file_size >= zipfile.ZIP64_LIMIT
+                or info.compress_size >= zipfile.ZIP64_LIMIT):
+            return False
+
+        source.fp.seek(info.header_offset)
+        header = source.fp.read(zipfile.sizeFileHeader)
+        if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile(f"Bad local file header for {info.filename}")
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        source.fp.seek(name_length + extra_length, 1)
+
+        entry = copy.copy(info)
+        # CRC and sizes are known up front, so they go in the local header
+        entry.flag_bits &= ~_ZIP_DATA_DESCRIPTOR
+        entry.header_offset = target.fp.tell()
+        target.fp.write(entry.FileHeader(zip64=False))
+
+        remaining = info.compress_size
+        while remaining:
+            chunk = source.fp.read(min(remaining, 1 << 20))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated entry {info.filename}")
+            target.fp.write(chunk)
+            remaining -= len(chunk)
+
+        target.filelist.append(entry)
+        target.NameToInfo[entry.filename] = entry
+        target.start_dir = target.fp.tell()
+        return True
+
+    def _image_replacements(
+        self,
+        package: zipfile.ZipFile,
+        extraction: Dict[str, Any],
+        translated_images: Dict[str, Optional[bytes]],
+        replacements: Dict[str, bytes]
+    ) -> set:
+        """
+        Queue rendered images as replacements for their media parts.
+
+        When rendering changed the image format (e.g. a GIF redrawn as PNG),
+        a content type override is added for the part.
+
+        Returns:
+            Keys of the images that were replaced
+        """
+        replaced = set()
+        overrides = {}
+        for image_key, image_bytes in translated_images.items():
+            image = extraction['images'].get(image_key)
+            if not image_bytes or not image:
+                continue
+            rendered_type = 'image/jpeg' if image_bytes[:2] == b'\xff\xd8' else 'image/png'
+            for part in image.get('parts', []):
+                replacements[part] = image_bytes
+                if rendered_type != image['content_type']:
+                    overrides['/' + part] = rendered_type
+            replaced.add(image_key)
+
+        if overrides:
+            root = etree.fromstring(package.read('[Content_Types].xml'))
+            for override in root.findall('ct:Override', _NS):
+                if override.get('PartName') in overrides:
+                    root.remove(override)
+            for part_name, content_type in overrides.items():
+                etree.SubElement(root, _qn('ct:Override'), PartName=part_name, ContentType=content_type)
+            replacements['[Content_Types].xml'] = etree.tostring(
+                root, xml_declaration=True, encoding='UTF-8', standalone=True
+            )
+        return replaced
+
+    def _document_parts(self, package: zipfile.ZipFile) -> Tuple[List[Tuple[str, str]], Dict[str, int]]:
+        """
+        List the parts to translate with their frame id prefixes.
+
+        Returns:
+            Tuple of [(prefix, part name)] (slides in presentation order,
+            then masters, layouts and notes slides) and the number of slides
+            inheriting each master/layout prefix
+        """
+        presentation_part = next(
+            (target for target, rel_type in self._relationships(package, '').values() if rel_type == _OFFICE_DOCUMENT),
+            'ppt/presentation.xml'
+        )
+        rels = self._relationships(package, presentation_part)
+        root = etree.fromstring(package.read(presentation_part))
+        slides = _listed_parts(root, 'p:sldIdLst/p:sldId', rels)
+        parts = [(f'slide_{slide_idx}', part) for slide_idx, part in enumerate(slides)]
+        if not self.include_masters_and_notes:
+            return parts, {}
+
+        inheritance: Dict[str, int] = {}
+        layout_owners: Dict[str, Tuple[str, str]] = {}  # layout part -> (layout prefix, master prefix)
+        layout_idx = 0
+        for master_idx, master in enumerate(_listed_parts(root, 'p:sldMasterIdLst/p:sldMasterId', rels)):
+            master_prefix = f'master_{master_idx}'
+            parts.append((master_prefix, master))
+            inheritance[master_prefix] = 0
+            master_root = etree.fromstring(package.read(master))
+            for layout in _listed_parts(master_root, 'p:sldLayoutIdLst/p:sldLayoutId', self._relationships(package, master)):
+                layout_owners[layout] = (f'layout_{layout_idx}', master_prefix)
+                layout_idx += 1
+
+        parts.extend((prefix, layout) for layout, (prefix, _) in layout_owners.items())
+        inheritance.update({prefix: 0 for prefix, _ in layout_owners.values()})
+
+        for slide_idx, slide in enumerate(slides):
+            for target, rel_type in self._relationships(package, slide).values():
+                if rel_type == _NOTES_SLIDE:
+                    parts.append((f'notes_{slide_idx}', target))
+                elif rel_type == _SLIDE_LAYOUT and target in layout_owners:
+                    for prefix in layout_owners[target]:
+                        inheritance[prefix] += 1
+        return parts, inheritance
+
+    @staticmethod
+    def _relationships(package: zipfile.ZipFile, part: str) -> Dict[str, Tuple[str, str]]:
+        """
+        Read the internal relationships of a part.
+
+        Returns:
+            Mapping of relationship id to (target part name, relationship type)
+        """
+        directory, name = posixpath.split(part)
+        rels_part = posixpath.join(directory, '_rels', f"{name}.rels")
+        try:
+            root = etree.fromstring(package.read(rels_part))
+        except KeyError:
+            return {}
+
+        rels = {}
+        for rel in root.iterfind('rel:Relationship', _NS):
+            if rel.get('TargetMode') == 'External':
+                continue
+            target = rel.get('Target', '')
+            if target.startswith('/'):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(directory, target))
+            rels[rel.get('Id')] = (target, rel.get('Type'))
+        return rels
+
+    @staticmethod
+    def _content_types(package: zipfile.ZipFile) -> Dict[str, Dict[str, str]]:
+        """Read [Content_Types].xml into default (by extension) and override (by part) maps."""
+        root = etree.fromstring(package.read('[Content_Types].xml'))
+        return {
+            'defaults': {
+                item.get('Extension', '').lower(): item.get('ContentType')
+                for item in root.iterfind('ct:Default', _NS)
+            },
+            'overrides': {
+                item.get('PartName', '').lstrip('/'): item.get('ContentType')
+                for item in root.iterfind('ct:Override', _NS)
+            }
+        }
+
+    def _stream_shapes(self, stream, prefix: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream a part's shapes with iterparse, yielding (frame id, element).
+
+        Each top-level shape is yielded (with nested group members) once it
+        is fully parsed, then discarded to keep memory flat.
+        """
+        depth = 0
+        shape_idx = 0
+        for event, element in etree.iterparse(stream, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            # p:sld / p:sldMaster / p:sldLayout / p:notes (0) > p:cSld (1) > p:spTree (2) > shape (3)
+            if depth != 3 or element.tag not in _SHAPE_TAGS:
+                continue
+            if element.getparent().tag == _qn('p:spTree'):
+                yield from self._walk_shape(element, f'{prefix}_shape_{shape_idx}')
+                shape_idx += 1
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    def _walk_shapes(self, sp_tree, prefix: str) -> Iterator[Tuple[str, Any]]:
+        """Walk the shapes of a fully parsed part, yielding (frame id, element)."""
+        shapes = [child for child in sp_tree if child.tag in _SHAPE_TAGS]
+        for shape_idx, element in enumerate(shapes):
+            yield from self._walk_shape(element, f'{prefix}_shape_{shape_idx}')
+
+    def _walk_shape(self, element, frame_id: str) -> Iterator[Tuple[str, Any]]:
+        """Yield a shape element, descending into groups."""
+        if element.tag == _qn('p:grpSp'):
+            nested = [child for child in element if child.tag in _SHAPE_TAGS]
+            for nested_idx, child in enumerate(nested):
+                yield from self._walk_shape(child, f"{frame_id}_group_{nested_idx}")
+            return
+        yield frame_id, element
+
+    def _extract_shape(self, frame_id: str, element, extraction: Dict[str, Any]):
+        """Record the text of one shape element."""
+        if element.tag == _qn('p:sp'):
+            tx_body = element.find('p:txBody', _NS)
+            if tx_body is not None:
+                text = _text_body_text(tx_body).strip()
+                if text:
+                    extraction['text_frames'][frame_id] = text
+        elif element.tag == _qn('p:graphicFrame'):
+            for row_idx, col_idx, cell in _table_cells(element):
+                tx_body = cell.find('a:txBody', _NS)
+                text = _text_body_text(tx_body).strip() if tx_body is not None else ''
+                if text:
+                    extraction['table_cells'][f"{frame_id}_cell_{row_idx}_{col_idx}"] = text
+
+    @staticmethod
+    def _picture_part(element, rels: Dict[str, Tuple[str, str]]) -> Optional[str]:
+        """Return the media part of a plain picture (not a placeholder or movie)."""
+        nv_pr = element.find('p:nvPicPr/p:nvPr', _NS)
+        if nv_pr is not None and (
+            nv_pr.find('p:ph', _NS) is not None
+            or nv_pr.find('a:videoFile', _NS) is not None
+            or nv_pr.find('a:audioFile', _NS) is not None
+        ):
+            return None
+        blip = element.find('p:blipFill/a:blip', _NS)
+        if blip is None:
+            return None
+        target = rels.get(blip.get(_qn('r:embed')))
+        return target[0] if target else None
+
+    def _register_image(
+        self,
+        package: zipfile.ZipFile,
+        part: str,
+        content_types: Dict[str, Dict[str, str]],
+        image_index: ImageIndex
+    ) -> Optional[str]:
+        """Record a media part for OCR and return its identity key (read once per part)."""
+        try:
+            info = package.getinfo(part)
+        except KeyError:
+            logger.debug(f"Picture references missing part {part}")
+            return None
+
+        # Skip very small images (likely decorative icons) without reading them
+        if info.file_size < self.min_image_bytes:
+            logger.debug(f"Skipping small image ({info.file_size} bytes), likely decorative")
+            return None
+
+        extension = posixpath.splitext(part)[1].lstrip('.').lower()
+        return image_index.register(
+            part,
+            lambda: package.read(info),
+            content_types['overrides'].get(part) or content_types['defaults'].get(extension, f"image/{extension}"),
+            crc=info.CRC,
+            size=info.file_size
+        )
+
+    def _apply_part(
+        self,
+        root,
+        prefix: str,
+        extraction: Dict[str, Any],
+        translations: Dict[str, Dict[str, Any]],
+        preserve_formatting: bool,
+        stats: Dict[str, int]
+    ) -> bool:
+        """
+        Apply translations to a parsed slide, master, layout or notes part.
+
+        Only slides count towards the frame and table stats.
+
+        Returns:
+            True if the part changed
+        """
+        sp_tree = root.find('p:cSld/p:spTree', _NS)
+        if sp_tree is None:
+            return False
+
+        is_slide = prefix.startswith('slide_')
+        modified = False
+        for frame_id, element in self._walk_shapes(sp_tree, prefix):
+            try:
+                if element.tag == _qn('p:sp'):
+                    if is_slide:
+                        stats['text_frames_translated'] += 1
+                    original_text = extraction['text_frames'].get(frame_id)
+                    translated = _translated_text(translations, original_text)
+                    if translated is not None:
+                        _set_text(element.find('p:txBody', _NS), translated, preserve_formatting)
+                        modified = True
+
+                elif element.tag == _qn('p:graphicFrame'):
+                    if element.find('a:graphic/a:graphicData/a:tbl', _NS) is not None:
+                        if is_slide:
+                            stats['tables_translated'] += 1
+                    for row_idx, col_idx, cell in _table_cells(element):
+                        cell_text = extraction['table_cells'].get(f"{frame_id}_cell_{row_idx}_{col_idx}")
+                        translated = _translated_text(translations, cell_text)
+                        if translated is not None:
+                            _set_text(cell.find('a:txBody', _NS), translated, preserve_formatting=False)
+                            modified = True
+            except Exception as e:
+                logger.error(f"Error writing {frame_id}: {e}")
+        return modified
+
+
+def _is_shared_content(prefix: str, element) -> bool:
+    """
+    Whether a master, layout or notes shape holds text to translate.
+
+    Master/layout placeholders only carry prompt text that slides never
+    display, and fields (slide numbers, dates) must stay live.
+    """
+    if prefix.startswith(('master_', 'layout_')) and element.find('*/p:nvPr/p:ph', _NS) is not None:
+        return False
+    return element.find('.//a:fld', _NS) is None
+
+
+def _listed_parts(root, path: str, rels: Dict[str, Tuple[str, str]]) -> List[str]:
+    """Resolve the r:id list at path (e.g. p:sldIdLst/p:sldId) to part names, in order."""
+    return [
+        rels[item.get(_qn('r:id'))][0]
+        for item in root.iterfind(path, _NS)
+        if item.get(_qn('r:id')) in rels
+    ]
+
+
+def _translated_text(translations: Dict[str, Dict[str, Any]], original_text: Optional[str]) -> Optional[str]:
+    """Return the successful translation of a segment, if any."""
+    if not original_text:
+        return None
+    result = translations.get(original_text, {})
+    if result.get('success') and result.get('translation'):
+        return result['translation']
+    if result:
+        logger.warning(f"Translation failed for text frame: {result.get('error', 'Unknown error')}")
+    return None
+
+
+def _table_cells(element) -> Iterator[Tuple[int, int, Any]]:
+    """Yield (row, column, a:tc element) for a graphic frame holding a table."""
+    table = element.find('a:graphic/a:graphicData/a:tbl', _NS)
+    if table is None:
+        return
+    for row_idx, row in enumerate(table.iterfind('a:tr', _NS)):
+        for col_idx, cell in enumerate(row.iterfind('a:tc', _NS)):
+            yield row_idx, col_idx, cell
+
+
+def _paragraph_text(paragraph) -> str:
+    """Text of an a:p element, with line breaks as vertical tabs (as python-pptx)."""
+    parts = []
+    for child in paragraph:
+        if child.tag == _qn('a:br'):
+            parts.append('\v')
+        elif child.tag in _TEXT_CHILDREN:
+            t = child.find('a:t', _NS)
+            parts.append((t.text or '') if t is not None else '')
+    return ''.join(parts)
+
+
+def _text_body_text(tx_body) -> str:
+    """Text of a txBody element, one line per paragraph (as python-pptx)."""
+    return '\n'.join(_paragraph_text(paragraph) for paragraph in tx_body.iterfind('a:p', _NS))
+
+
+def _new_run(text: str, run_properties=None):
+    run = etree.Element(_qn('a:r'))
+    if run_properties is not None:
+        run.append(run_properties)
+    etree.SubElement(run, _qn('a:t')).text = _CONTROL_CHARS.sub(lambda m: "_x%04X_" % ord(m.group(1)), text)
+    return run
+
+
+def _set_text(tx_body, text: str, preserve_formatting: bool):
+    """
+    Replace the text of a txBody element.
+
+    With preserve_formatting the first paragraph (and its properties) is kept
+    and the text becomes a single run carrying a copy of the first run's
+    formatting, matching ``DocumentProcessor._replace_text_preserve_format``.
+    Otherwise paragraphs are rebuilt per line like ``TextFrame.text``.
+    """
+    paragraphs = tx_body.findall('a:p', _NS)
+    first_run = paragraphs[0].find('a:r', _NS) if paragraphs else None
+
+    if preserve_formatting and first_run is not None:
+        run_properties = first_run.find('a:rPr', _NS)
+        if run_properties is not None:
+            run_properties = copy.deepcopy(run_properties)
+            for attribute in _SOURCE_RUN_ATTRIBUTES:
+                run_properties.attrib.pop(attribute, None)
+
+        paragraph = paragraphs[0]
+        for extra in paragraphs[1:]:
+            tx_body.remove(extra)
+        for child in list(paragraph):
+            if child.tag in _TEXT_CHILDREN:
+                paragraph.remove(child)
+
+        run = _new_run(text, run_properties)
+        end = paragraph.find('a:endParaRPr', _NS)
+        if end is not None:
+            end.addprevious(run)
+        else:
+            paragraph.append(run)
+        return
+
+    for paragraph in paragraphs:
+        tx_body.remove(paragraph)
+    for line in text.split('\n'):
+        paragraph = etree.SubElement(tx_body, _qn('a:p'))
+        for index, piece in enumerate(re.split('\v', line)):
+            if index > 0:
+                etree.SubElement(paragraph, _qn('a:br'))
+            if piece:
+                paragraph.append(_new_run(piece))
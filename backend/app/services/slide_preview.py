@@ -0,0 +1,192 @@
+"""
+Slide previews built in memory.
+
+Previewing edits used to copy the deck to a temporary file, apply the edits
+to every slide, save the whole deck and reopen it for rendering. Here a
+preview is built from the parsed deck of an editor session instead:
+
+- only the target slide is copied and edited; the deck itself is untouched
+- the package handed to the renderer holds that one slide and the parts it
+  needs (presentation, its master/layout, theme, media), written to memory
+  without compression
+- rendering uses Aspose.Slides when it is installed; otherwise (as for
+  ``/slide-preview``) a placeholder image is returned
+"""
+
+import copy
+import hashlib
+import io
+import logging
+import zipfile
+from typing import Dict, Optional, Set
+
+from lxml import etree
+
+from app.services.editor_sessions import parse_frame_id, set_shape_text
+
+logger = logging.getLogger(__name__)
+
+_RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_CT_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+_R_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+
+
+def slide_edits(edits: Dict[str, str], slide_index: int) -> Dict[int, str]:
+    """Edits (frame id -> text) of one slide, as shape index -> text."""
+    shape_edits = {}
+    for frame_id, text in edits.items():
+        indices = parse_frame_id(frame_id)
+        if indices is not None and indices[0] == slide_index:
+            shape_edits[indices[1]] = text
+    return shape_edits
+
+
+def edits_digest(shape_edits: Dict[int, str]) -> str:
+    """Short stable hash of one slide's edits (for cache keys)."""
+    return hashlib.sha256(repr(sorted(shape_edits.items())).encode('utf-8')).hexdigest()[:16]
+
+
+def build_slide_package(presentation, slide_index: int, shape_edits: Dict[int, str]) -> bytes:
+    """
+    A one-slide PPTX, in memory, showing a slide of a deck with edits applied.
+
+    Args:
+        presentation: Parsed python-pptx presentation (not modified).
+        slide_index: Slide to keep (0-indexed).
+        shape_edits: Shape index -> new text for that slide.
+
+    Returns:
+        The package bytes.
+    """
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    from pptx.opc.oxml import serialize_part_xml
+    from pptx.shapes.shapetree import SlideShapes
+
+    slide = presentation.slides[slide_index]
+    presentation_part = presentation.part
+    target = slide.part
+
+    # Parts left out: the other slides and every notes slide
+    skipped: Set = set()
+    for rel in presentation_part.rels.values():
+        if rel.reltype == RT.SLIDE and rel.target_part is not target:
+            skipped.add(rel.target_part)
+    for rel in target.rels.values():
+        if rel.reltype == RT.NOTES_SLIDE:
+            skipped.add(rel.target_part)
+
+    slide_xml = copy.deepcopy(slide._element)
+    shapes = SlideShapes(slide_xml.cSld.spTree, slide)
+    for shape_idx, text in shape_edits.items():
+        set_shape_text(shapes, shape_idx, text)
+
+    presentation_xml = copy.deepcopy(presentation_part._element)
+    target_rid = next(
+        rId for rId, rel in presentation_part.rels.items()
+        if rel.reltype == RT.SLIDE and rel.target_part is target
+    )
+    for sld_id in list(presentation_xml.sldIdLst):
+        if sld_id.get(_R_ID) != target_rid:
+            presentation_xml.sldIdLst.remove(sld_id)
+
+    blobs = {
+        target: serialize_part_xml(slide_xml),
+        presentation_part: serialize_part_xml(presentation_xml)
+    }
+
+    # Package relationships are not exposed publicly; python-pptx's own writer uses them the same way
+    package_rels = presentation_part.package._rels
+    parts = []
+    seen: Set = set()
+    pending = [rel.target_part for rel in package_rels.values() if not rel.is_external]
+    while pending:
+        part = pending.pop()
+        if part in seen or part in skipped:
+            continue
+        seen.add(part)
+        parts.append(part)
+        pending.extend(
+            rel.target_part for rel in part.rels.values()
+            if not rel.is_external and rel.target_part not in skipped
+        )
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as package:
+        package.writestr('[Content_Types].xml', _content_types(parts))
+        package.writestr('_rels/.rels', _rels_xml(package_rels, skipped))
+        for part in parts:
+            package.writestr(part.partname.membername, blobs.get(part) or part.blob)
+            if part.rels:
+                package.writestr(part.partname.rels_uri.membername, _rels_xml(part.rels, skipped))
+    return buffer.getvalue()
+
+
+def render_slide_png(package: bytes, slide_index: int = 0, scale: float = 2.0) -> Optional[bytes]:
+    """
+    Render a slide of a package to PNG with Aspose.Slides.
+
+    Returns:
+        The image, or None when Aspose.Slides is not installed.
+    """
+    try:
+        import aspose.slides as slides
+    except ImportError:
+        return None
+    with slides.Presentation(io.BytesIO(package)) as deck:
+        with deck.slides[slide_index].get_image(scale, scale) as image:
+            buffer = io.BytesIO()
+            image.save(buffer, slides.ImageFormat.PNG)
+            return buffer.getvalue()
+
+
+def placeholder_png(slide_number: int) -> bytes:
+    """Placeholder image for a slide (0-indexed) when it cannot be rendered."""
+    from PIL import Image, ImageDraw
+
+    img = Image.new('RGB', (960, 720), color='#f8f9fa')
+    draw = ImageDraw.Draw(img)
+
+    # Draw slide number and message
+    text_lines = [
+        f"Slide {slide_number + 1}",
+        "",
+        "Preview not available",
+        "",
+        "(Download file to see presentation)"
+    ]
+
+    y_position = 280
+    for line in text_lines:
+        bbox = draw.textbbox((0, 0), line)
+        text_width = bbox[2] - bbox[0]
+        x_position = (960 - text_width) // 2
+        draw.text((x_position, y_position), line, fill='#666666')
+        y_position += 40
+
+    # Draw border
+    draw.rectangle([(0, 0), (959, 719)], outline='#dee2e6', width=3)
+
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def _rels_xml(rels, skipped: Set) -> bytes:
+    """Serialize relationships, leaving out those to skipped parts."""
+    root = etree.Element(f'{{{_RELS_NS}}}Relationships', nsmap={None: _RELS_NS})
+    for rId, rel in rels.items():
+        if not rel.is_external and rel.target_part in skipped:
+            continue
+        element = etree.SubElement(root, f'{{{_RELS_NS}}}Relationship', Id=rId, Type=rel.reltype, Target=rel.target_ref)
+        if rel.is_external:
+            element.set('TargetMode', 'External')
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def _content_types(parts) -> bytes:
+    root = etree.Element(f'{{{_CT_NS}}}Types', nsmap={None: _CT_NS})
+    etree.SubElement(root, f'{{{_CT_NS}}}Default', Extension='rels', ContentType='application/vnd.openxmlformats-package.relationships+xml')
+    etree.SubElement(root, f'{{{_CT_NS}}}Default', Extension='xml', ContentType='application/xml')
+    for part in parts:
+        etree.SubElement(root, f'{{{_CT_NS}}}Override', PartName=str(part.partname), ContentType=part.content_type)
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
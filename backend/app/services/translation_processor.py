@@ -1,8 +1,21 @@
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, closing
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 import logging
+import queue
+import sqlite3
+import threading
 import time
+
+import requests
+
 from .azure_translator import AzureTranslator
-from .openrouter_service import OpenRouterService
+from .llm_dispatcher import LLMDispatcher
+from .llm_router import LLMRouter
+from .openrouter_service import OpenRouterService, estimate_tokens, max_tokens_for
+from app.utils.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from app.utils.metrics import CACHE_REQUESTS, ROUTED_SEGMENTS
+from app.utils.translation_memory import HUMAN, TranslationMemory
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +31,26 @@ class TranslationProcessor:
         azure_translator: AzureTranslator,
         openrouter_service: Optional[OpenRouterService] = None,
         use_llm_enhancement: bool = False,
-        default_llm_model: Optional[str] = None
+        default_llm_model: Optional[str] = None,
+        llm_router: Optional[LLMRouter] = None,
+        llm_dispatcher: Optional[LLMDispatcher] = None,
+        llm_fallback_models: Optional[List[str]] = None,
+        breakers: Optional[CircuitBreakerRegistry] = None,
+        translation_memory: Optional[TranslationMemory] = None
     ):
         self.azure_translator = azure_translator
         self.openrouter_service = openrouter_service
         self.use_llm_enhancement = use_llm_enhancement and openrouter_service is not None
         self.default_llm_model = default_llm_model or "anthropic/claude-3.5-sonnet"
+        # Without a router every segment goes to the LLM when it is enabled
+        self.llm_router = llm_router or LLMRouter(threshold=0)
+        self.llm_dispatcher = llm_dispatcher or LLMDispatcher()
+        # Models tried in order when the requested one fails or its breaker is
+        # open; after the last one the Azure translation is used
+        self.llm_fallback_models = list(llm_fallback_models or [])
+        self.breakers = breakers or CircuitBreakerRegistry()
+        # Consulted before any upstream call; machine results are recorded in it
+        self.translation_memory = translation_memory
         logger.info(f"Translation processor initialized (LLM enhancement: {self.use_llm_enhancement})")
 
     def translate_text(
@@ -56,76 +83,189 @@ class TranslationProcessor:
                 'translation': ''
             }
         
-        # Try translation with retry logic
-        max_retries = 3
-        retry_delay = 1  # seconds
+        remembered = self._remembered([text], target_language, source_language, force_llm)
+        if text in remembered:
+            return remembered[text]
+        
+        try:
+            # Always try Azure Translator first (also does language detection).
+            # The client retries throttled and transient failures itself.
+            azure_result = self.azure_translator.translate_text(text, target_language, source_language)
+        except (requests.exceptions.RequestException, CircuitOpenError) as e:
+            logger.error(f"Translation failed: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+                'translation': text,  # Return original text as fallback
+                'source_language': source_language,
+                'target_language': target_language,
+                'method': 'failed'
+            }
+        
+        # Check if source and target languages are the same
+        detected_lang = azure_result.get('detected_language', source_language)
+        if detected_lang and self._normalize_language_code(detected_lang) == self._normalize_language_code(target_language):
+            logger.debug(f"Skipping translation: text is already in target language '{target_language}'")
+            return {
+                'success': True,
+                'translation': text,  # Return original text unchanged
+                'source_language': detected_lang,
+                'target_language': target_language,
+                'method': 'skipped',
+                'skipped': True
+            }
+        
+        # If LLM enhancement is enabled or forced, use OpenRouter for segments worth it
+        route = self._route(
+            text,
+            azure_result.get('translated_text'),
+            azure_result.get('detection_score'),
+            force_llm
+        )
+        if route.get('route') == 'llm':
+            llm_result = self._llm_translate(text, target_language, detected_lang, context, llm_model)
+            
+            if llm_result.get('success'):
+                result = {
+                    'success': True,
+                    'translation': llm_result['translation'],
+                    'source_language': detected_lang,
+                    'target_language': target_language,
+                    'method': 'llm',
+                    'azure_translation': azure_result.get('translated_text'),
+                    **route
+                }
+                self._remember({text: result}, target_language)
+                return result
+        
+        # Return Azure translation
+        result = {
+            'success': True,
+            'translation': azure_result.get('translated_text', ''),
+            'source_language': azure_result.get('detected_language'),
+            'target_language': target_language,
+            'method': 'azure',
+            **route
+        }
+        self._remember({text: result}, target_language)
+        return result
+
+    def stream_translate_text(
+        self,
+        text: str,
+        target_language: str,
+        source_language: Optional[str] = None,
+        context: Optional[str] = None,
+        force_llm: bool = False,
+        llm_model: Optional[str] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Translate text like ``translate_text``, streaming LLM output as it arrives.
+        
+        Yields ``('delta', {'text': ...})`` events while the LLM generates,
+        then one ``('done', result)`` event whose result has the same shape as
+        ``translate_text`` output. The done event's translation is
+        authoritative: if the LLM stream fails midway, it carries the Azure
+        translation instead of the partial deltas.
+        
+        Args:
+            text: Text to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+            context: Additional context for LLM translation
+            force_llm: Force use of LLM even if enhancement is disabled
+            llm_model: Specific LLM model to use (optional)
+        """
+        if not text or not text.strip():
+            yield 'done', {
+                'success': False,
+                'error': 'Empty text provided',
+                'translation': ''
+            }
+            return
+        
+        remembered = self._remembered([text], target_language, source_language, force_llm)
+        if text in remembered:
+            yield 'done', remembered[text]
+            return
         
-        for attempt in range(max_retries):
+        try:
+            # The Azure client retries throttled and transient failures itself
+            azure_result = self.azure_translator.translate_text(text, target_language, source_language)
+        except Exception as e:
+            logger.error(f"Translation failed: {e}")
+            yield 'done', {
+                'success': False,
+                'error': str(e),
+                'translation': text,
+                'source_language': source_language,
+                'target_language': target_language,
+                'method': 'failed'
+            }
+            return
+        
+        detected_lang = azure_result.get('detected_language', source_language)
+        if detected_lang and self._normalize_language_code(detected_lang) == self._normalize_language_code(target_language):
+            yield 'done', {
+                'success': True,
+                'translation': text,
+                'source_language': detected_lang,
+                'target_language': target_language,
+                'method': 'skipped',
+                'skipped': True
+            }
+            return
+        
+        route = self._route(text, azure_result.get('translated_text'), azure_result.get('detection_score'), force_llm)
+        model = self._available_llm_model(llm_model) if route.get('route') == 'llm' else None
+        if model:
+            parts = []
+            deltas = self._stream_llm(
+                lambda: self.openrouter_service.stream_translate_with_context(
+                    text=text,
+                    target_language=target_language,
+                    source_language=detected_lang,
+                    context=context,
+                    model=model
+                ),
+                model,
+                estimated_tokens=self._estimated_llm_tokens(text, context),
+                record_latency=True
+            )
             try:
-                # Always try Azure Translator first (also does language detection)
-                azure_result = self.azure_translator.translate_text(text, target_language, source_language)
-                
-                # Check if source and target languages are the same
-                detected_lang = azure_result.get('detected_language', source_language)
-                if detected_lang and self._normalize_language_code(detected_lang) == self._normalize_language_code(target_language):
-                    logger.debug(f"Skipping translation: text is already in target language '{target_language}'")
-                    return {
-                        'success': True,
-                        'translation': text,  # Return original text unchanged
-                        'source_language': detected_lang,
-                        'target_language': target_language,
-                        'method': 'skipped',
-                        'skipped': True
-                    }
-                
-                # If LLM enhancement is enabled or forced, use OpenRouter
-                if (self.use_llm_enhancement or force_llm) and self.openrouter_service:
-                    llm_result = self.openrouter_service.translate_with_context(
-                        text=text,
-                        target_language=target_language,
-                        source_language=detected_lang,
-                        context=context,
-                        model=llm_model or self.default_llm_model
-                    )
-                    
-                    if llm_result.get('success'):
-                        return {
-                            'success': True,
-                            'translation': llm_result['translation'],
-                            'source_language': detected_lang,
-                            'target_language': target_language,
-                            'method': 'llm',
-                            'azure_translation': azure_result.get('translated_text')
-                        }
-                
-                # Return Azure translation
-                return {
+                with closing(deltas):
+                    for delta in deltas:
+                        parts.append(delta)
+                        yield 'delta', {'text': delta}
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.error(f"LLM stream failed, falling back to Azure translation: {e}")
+                parts = []
+            
+            translation = ''.join(parts).strip()
+            if translation:
+                result = {
                     'success': True,
-                    'translation': azure_result.get('translated_text', ''),
-                    'source_language': azure_result.get('detected_language'),
+                    'translation': translation,
+                    'source_language': detected_lang,
                     'target_language': target_language,
-                    'method': 'azure'
+                    'method': 'llm',
+                    'azure_translation': azure_result.get('translated_text'),
+                    **route
                 }
-                
-            except Exception as e:
-                logger.warning(f"Translation attempt {attempt + 1}/{max_retries} failed: {e}")
-                
-                if attempt < max_retries - 1:
-                    # Exponential backoff
-                    sleep_time = retry_delay * (2 ** attempt)
-                    logger.info(f"Retrying in {sleep_time} seconds...")
-                    time.sleep(sleep_time)
-                else:
-                    # Final attempt failed
-                    logger.error(f"Translation failed after {max_retries} attempts: {e}")
-                    return {
-                        'success': False,
-                        'error': str(e),
-                        'translation': text,  # Return original text as fallback
-                        'source_language': source_language,
-                        'target_language': target_language,
-                        'method': 'failed'
-                    }
+                self._remember({text: result}, target_language)
+                yield 'done', result
+                return
+        
+        result = {
+            'success': True,
+            'translation': azure_result.get('translated_text', ''),
+            'source_language': detected_lang,
+            'target_language': target_language,
+            'method': 'azure',
+            **route
+        }
+        self._remember({text: result}, target_language)
+        yield 'done', result
 
     def batch_translate(
         self,
@@ -144,22 +284,442 @@ class TranslationProcessor:
         Returns:
             List of translation results
         """
+        # Texts in the translation memory are not sent upstream
+        remembered = self._remembered(texts, target_language, source_language)
+        pending = [text for text in texts if text not in remembered]
+        
         # Use Azure batch translation for efficiency
-        azure_results = self.azure_translator.batch_translate(texts, target_language, source_language)
+        azure_results = iter(
+            self.azure_translator.batch_translate(pending, target_language, source_language) if pending else []
+        )
         
         translations = []
-        for i, azure_result in enumerate(azure_results):
-            translations.append({
+        fresh = {}
+        for i, text in enumerate(texts):
+            if text in remembered:
+                translations.append({**remembered[text], 'index': i})
+                continue
+            azure_result = next(azure_results)
+            result = {
                 'success': True,
                 'translation': azure_result.get('translated_text', ''),
                 'source_language': azure_result.get('detected_language'),
                 'target_language': target_language,
-                'method': 'azure',
-                'index': i
-            })
+                'method': 'azure'
+            }
+            fresh[text] = result
+            translations.append({**result, 'index': i})
         
+        self._remember(fresh, target_language)
         return translations
 
+    def stream_batch_translate(
+        self,
+        texts: List[str],
+        target_language: str,
+        source_language: Optional[str] = None,
+        chunk_size: int = 100,
+        max_concurrency: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Translate many texts, yielding each result in input order as soon as it is ready.
+        
+        Identical texts are sent upstream once, and texts that need no
+        translation are answered without a request: everything when the
+        source language is the target language, and texts without letters
+        (numbers, symbols, blanks), and texts found in the translation
+        memory. Texts Azure detects as already in the target language come
+        back unchanged, as in ``translate_text``.
+        Unique texts are sent in chunks, several in flight at a time; a
+        result is yielded once every earlier one has been, and translations
+        are kept only until the last duplicate of their text is emitted.
+        
+        Args:
+            texts: Texts to translate
+            target_language: Target language code
+            source_language: Source language code (optional)
+            chunk_size: Unique texts per upstream request
+            max_concurrency: Chunks in flight (default: the Azure client's limit)
+            
+        Yields:
+            ``translate_text``-shaped results (Azure only) with their input ``index``
+        """
+        same_language = bool(source_language) and (
+            self._normalize_language_code(source_language) == self._normalize_language_code(target_language)
+        )
+        
+        def needs_translation(text: str) -> bool:
+            return not same_language and any(char.isalpha() for char in text)
+        
+        # Unique texts to send, in order of first occurrence, and where each one recurs last
+        unique_texts = list(dict.fromkeys(text for text in texts if needs_translation(text)))
+        remembered = self._remembered(unique_texts, target_language, source_language)
+        unique_texts = [text for text in unique_texts if text not in remembered]
+        chunk_of = {text: position // chunk_size for position, text in enumerate(unique_texts)}
+        chunks = [unique_texts[start:start + chunk_size] for start in range(0, len(unique_texts), chunk_size)]
+        last_use = {text: index for index, text in enumerate(texts)}
+        logger.info(
+            f"Streaming batch translation of {len(texts)} texts ({len(unique_texts)} to translate "
+            f"in {len(chunks)} chunks) into {target_language}"
+        )
+        
+        def translate_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+            try:
+                azure_results = self.azure_translator.batch_translate_multi(chunk, [target_language], source_language)
+            except Exception as e:
+                logger.error(f"Batch translation chunk failed: {e}")
+                azure_results = [{'error': str(e)} for _ in chunk]
+            results = {
+                text: self._segment_result(text, target_language, source_language, azure_result, False, routed=False)
+                for text, azure_result in zip(chunk, azure_results)
+            }
+            self._remember(results, target_language)
+            return results
+        
+        window = max(1, max_concurrency or self.azure_translator.max_concurrent_requests)
+        futures = {}
+        ready: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            for index, text in enumerate(texts):
+                if not needs_translation(text):
+                    yield {
+                        'index': index,
+                        'success': True,
+                        'translation': text,
+                        'source_language': source_language,
+                        'target_language': target_language,
+                        'method': 'skipped',
+                        'skipped': True
+                    }
+                    continue
+                
+                if text in remembered:
+                    yield {'index': index, **remembered[text]}
+                    continue
+                
+                if text not in ready:
+                    chunk = chunk_of[text]
+                    # Keep the next few chunks in flight while waiting for this one
+                    for upcoming in range(chunk, min(chunk + window, len(chunks))):
+                        if upcoming not in futures:
+                            futures[upcoming] = executor.submit(translate_chunk, chunks[upcoming])
+                    ready.update(futures.pop(chunk).result())
+                
+                result = ready[text] if last_use[text] > index else ready.pop(text)
+                yield {'index': index, **result}
+
+    def translate_segments(
+        self,
+        texts: List[str],
+        target_languages: List[str],
+        source_language: Optional[str] = None,
+        force_llm: bool = False,
+        llm_model: Optional[str] = None,
+        shared_context: Optional[str] = None
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Translate many segments into several target languages at once.
+        
+        Identical segments are translated once, and each Azure request carries
+        every target language, so a segment goes upstream once rather than
+        once per language. Segments found in the translation memory for
+        every language are not sent at all. The Azure client splits the
+        segments into requests that fit its per-request limits.
+        
+        Args:
+            texts: Segments to translate (duplicates and blanks are allowed)
+            target_languages: Target language codes
+            source_language: Source language code (optional)
+            force_llm: Force use of LLM even if enhancement is disabled
+            llm_model: Specific LLM model to use (optional)
+            shared_context: Document-level context (see ``deck_context``) sent
+                with every LLM call as a cacheable prompt prefix
+            
+        Returns:
+            Mapping of target language -> segment text -> translation result,
+            where each result has the same shape as ``translate_text`` output
+        """
+        unique_texts = list(dict.fromkeys(text for text in texts if text and text.strip()))
+        results: Dict[str, Dict[str, Dict[str, Any]]] = {language: {} for language in target_languages}
+        
+        if not unique_texts or not target_languages:
+            return results
+        
+        logger.info(
+            f"Translating {len(unique_texts)} unique segments into {len(target_languages)} "
+            f"language(s): {', '.join(target_languages)}"
+        )
+        
+        remembered = {
+            language: self._remembered(unique_texts, language, source_language, force_llm)
+            for language in target_languages
+        }
+        for language in target_languages:
+            results[language].update(remembered[language])
+        pending = [
+            text for text in unique_texts
+            if any(text not in remembered[language] for language in target_languages)
+        ]
+        
+        try:
+            azure_results = (
+                self.azure_translator.batch_translate_multi(pending, target_languages, source_language)
+                if pending else []
+            )
+        except Exception as e:
+            # The Azure client already retried throttled and transient failures
+            logger.error(f"Batch translation failed: {e}")
+            azure_results = [{'error': str(e)} for _ in pending]
+        
+        llm_tasks = []  # (language, text) routed to the LLM
+        for text, azure_result in zip(pending, azure_results):
+            for language in target_languages:
+                if text in remembered[language]:
+                    continue
+                result = self._segment_result(text, language, source_language, azure_result, force_llm)
+                results[language][text] = result
+                if result.get('route') == 'llm':
+                    llm_tasks.append((language, text))
+        
+        if llm_tasks:
+            # LLM calls run concurrently under the model's limits; results are
+            # assembled by (language, text), independent of completion order
+            model = llm_model or self.default_llm_model
+            
+            def translate(task):
+                language, text = task
+                return self._llm_translate(
+                    text,
+                    language,
+                    results[language][text]['source_language'],
+                    None,
+                    model,
+                    shared_context
+                )
+            
+            logger.info(f"Dispatching {len(llm_tasks)} LLM translations to {model}")
+            for (language, text), llm_result in zip(llm_tasks, self.llm_dispatcher.map(model, translate, llm_tasks)):
+                if llm_result.get('success'):
+                    azure_shaped = results[language][text]
+                    results[language][text] = {
+                        **azure_shaped,
+                        'translation': llm_result['translation'],
+                        'method': 'llm',
+                        'azure_translation': azure_shaped['translation'],
+                        'usage': llm_result.get('usage')
+                    }
+        
+        for language in target_languages:
+            self._remember(results[language], language)
+            report = self.llm_router.report(results[language])
+            if report['llm_segments'] or report['azure_segments']:
+                logger.info(
+                    f"LLM routing ({language}): {report['llm_segments']} segments to LLM, "
+                    f"{report['azure_segments']} kept on Azure (est. {report['llm_seconds_saved']}s, "
+                    f"${report['llm_cost_saved']:.4f} saved)"
+                )
+        
+        return results
+
+    def _remembered(
+        self,
+        texts: List[str],
+        target_language: str,
+        source_language: Optional[str],
+        force_llm: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        ``translate_text``-shaped results of the texts found in the translation memory.
+        
+        Human entries win over machine ones. When the request would use the
+        LLM, Azure-only entries are not good enough and are ignored.
+        """
+        if self.translation_memory is None or not texts:
+            return {}
+        llm_requested = (self.use_llm_enhancement or force_llm) and self.openrouter_service
+        origins = (HUMAN, 'llm') if llm_requested else (HUMAN, 'llm', 'azure')
+        try:
+            entries = self.translation_memory.lookup(texts, target_language, source_language, origins)
+        except sqlite3.Error as e:
+            logger.warning(f"Translation memory lookup failed: {e}")
+            return {}
+        
+        CACHE_REQUESTS.labels('translation_memory', 'hit').inc(len(entries))
+        CACHE_REQUESTS.labels('translation_memory', 'miss').inc(len(set(texts)) - len(entries))
+        return {
+            text: {
+                'success': True,
+                'translation': entry['translation'],
+                'source_language': entry['source_language'] or source_language,
+                'target_language': target_language,
+                'method': 'memory',
+                'memory_origin': entry['origin']
+            }
+            for text, entry in entries.items()
+        }
+
+    def _remember(self, results: Dict[str, Dict[str, Any]], target_language: str):
+        """Record fresh Azure and LLM translations (text -> result) in the translation memory."""
+        if self.translation_memory is None or not self.translation_memory.records_machine:
+            return
+        groups: Dict[Tuple[str, Optional[str]], List[Tuple[str, str]]] = {}
+        for text, result in results.items():
+            if result.get('success') and result.get('method') in ('azure', 'llm'):
+                key = (result['method'], result.get('source_language'))
+                groups.setdefault(key, []).append((text, result['translation']))
+        try:
+            for (method, source_language), entries in groups.items():
+                self.translation_memory.add(entries, target_language, source_language, origin=method)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not record translations in the translation memory: {e}")
+
+    def _segment_result(
+        self,
+        text: str,
+        target_language: str,
+        source_language: Optional[str],
+        azure_result: Dict[str, Any],
+        force_llm: bool,
+        routed: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Build the Azure-side ``translate_text``-shaped result for one segment and language.
+        
+        Segments routed to the LLM carry ``route == 'llm'``; the caller
+        replaces their translation once the LLM call succeeds. Callers that
+        never use the LLM pass ``routed=False`` to skip routing.
+        """
+        azure_translation = azure_result.get('translations', {}).get(target_language)
+        if azure_translation is None:
+            return {
+                'success': False,
+                'error': azure_result.get('error', 'No translation returned'),
+                'translation': text,
+                'source_language': source_language,
+                'target_language': target_language,
+                'method': 'failed'
+            }
+        
+        detected_lang = azure_result.get('detected_language') or source_language
+        if detected_lang and self._normalize_language_code(detected_lang) == self._normalize_language_code(target_language):
+            return {
+                'success': True,
+                'translation': text,
+                'source_language': detected_lang,
+                'target_language': target_language,
+                'method': 'skipped',
+                'skipped': True
+            }
+        
+        route = self._route(text, azure_translation, azure_result.get('detection_score'), force_llm) if routed else {}
+        return {
+            'success': True,
+            'translation': azure_translation,
+            'source_language': detected_lang,
+            'target_language': target_language,
+            'method': 'azure',
+            **route
+        }
+
+    def _route(
+        self,
+        text: str,
+        azure_translation: Optional[str],
+        detection_score: Optional[float],
+        force_llm: bool
+    ) -> Dict[str, Any]:
+        """
+        Decide whether a segment goes to the LLM.
+        
+        Returns:
+            ``{'route': 'llm' | 'azure', 'route_score': score}`` when LLM
+            translation is enabled for the request, otherwise an empty dict
+        """
+        if not ((self.use_llm_enhancement or force_llm) and self.openrouter_service):
+            return {}
+        use_llm, score = self.llm_router.use_llm(text, azure_translation, detection_score)
+        route = 'llm' if use_llm else 'azure'
+        ROUTED_SEGMENTS.labels(route).inc()
+        return {'route': route, 'route_score': round(score, 3)}
+
+    def _llm_translate(
+        self,
+        text: str,
+        target_language: str,
+        source_language: Optional[str],
+        context: Optional[str],
+        llm_model: Optional[str],
+        shared_context: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Translate one segment with the first working model of the fallback chain.
+        
+        Models whose circuit breaker is open are skipped without a request.
+        A failed result means every model failed or was skipped; callers
+        then keep the Azure translation.
+        """
+        result = {'success': False, 'error': 'All LLM models unavailable (circuit open)', 'translation': None}
+        for model in self._llm_chain(llm_model):
+            breaker = self.breakers.get(f'openrouter:{model}')
+            if not breaker.allow():
+                continue
+            result = self._llm_translate_with(model, text, target_language, source_language, context, shared_context)
+            if result.get('success'):
+                breaker.record_success()
+                return result
+            breaker.record_failure(result.get('error'))
+            logger.warning(f"LLM translation with {model} failed: {result.get('error')}")
+        return result
+
+    def _llm_translate_with(
+        self,
+        model: str,
+        text: str,
+        target_language: str,
+        source_language: Optional[str],
+        context: Optional[str],
+        shared_context: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Translate one segment with one model within its dispatcher limits.
+        
+        The call's latency feeds the router's estimate and its reported usage
+        corrects the token reservation.
+        """
+        with self.llm_dispatcher.slot(model, self._estimated_llm_tokens(text, context, shared_context)) as slot:
+            start = time.perf_counter()
+            try:
+                result = self.openrouter_service.translate_with_context(
+                    text=text,
+                    target_language=target_language,
+                    source_language=source_language,
+                    context=context,
+                    model=model,
+                    shared_context=shared_context
+                )
+            finally:
+                self.llm_router.record_llm_call(time.perf_counter() - start)
+            usage = result.get('usage') or {}
+            slot.used(usage.get('prompt_tokens', 0) + usage.get('completion_tokens', 0))
+            return result
+
+    def _llm_chain(self, llm_model: Optional[str]) -> List[str]:
+        """The requested model followed by the configured fallbacks, without duplicates."""
+        return list(dict.fromkeys([llm_model or self.default_llm_model] + self.llm_fallback_models))
+
+    def _available_llm_model(self, llm_model: Optional[str]) -> Optional[str]:
+        """First model of the chain whose breaker lets a call through, if any."""
+        for model in self._llm_chain(llm_model):
+            if self.breakers.get(f'openrouter:{model}').allow():
+                return model
+        return None
+
+    @staticmethod
+    def _estimated_llm_tokens(text: str, context: Optional[str] = None, shared_context: Optional[str] = None) -> int:
+        """Tokens to reserve for one LLM translation: prompt plus the typical completion."""
+        prompt = 150 + estimate_tokens(text) + estimate_tokens(context or '') + estimate_tokens(shared_context or '')
+        return prompt + min(max_tokens_for(text), 2 * estimate_tokens(text) + 16)
+
     def improve_translation(
         self,
         original_text: str,
@@ -186,15 +746,180 @@ class TranslationProcessor:
                 'translation': current_translation
             }
         
-        result = self.openrouter_service.improve_translation(
-            original_text=original_text,
-            translated_text=current_translation,
-            target_language=target_language,
-            feedback=feedback
-        )
+        result = {
+            'success': False,
+            'error': 'LLM temporarily unavailable (circuit open)',
+            'translation': current_translation
+        }
+        for model in self._llm_chain(None):
+            breaker = self.breakers.get(f'openrouter:{model}')
+            if not breaker.allow():
+                continue
+            result = self.openrouter_service.improve_translation(
+                original_text=original_text,
+                translated_text=current_translation,
+                target_language=target_language,
+                feedback=feedback,
+                model=model
+            )
+            if result.get('success'):
+                breaker.record_success()
+                return result
+            breaker.record_failure(result.get('error'))
         
         return result
     
+    def stream_improve_translation(
+        self,
+        original_text: str,
+        current_translation: str,
+        target_language: str,
+        feedback: Optional[str] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Improve an existing translation using LLM, streaming tokens as they arrive.
+        
+        Yields ``('delta', {'text': ...})`` events, then one ``('done', result)``
+        event shaped like ``improve_translation`` output. On failure the done
+        event keeps the current translation and reports the error.
+        
+        Args:
+            original_text: Original source text
+            current_translation: Current translation to improve
+            target_language: Target language code
+            feedback: Specific improvement feedback
+        """
+        if not self.openrouter_service:
+            yield 'done', {
+                'success': False,
+                'error': 'LLM service not available',
+                'translation': current_translation
+            }
+            return
+        
+        model = self._available_llm_model(None)
+        if not model:
+            yield 'done', {
+                'success': False,
+                'error': 'LLM temporarily unavailable (circuit open)',
+                'translation': current_translation
+            }
+            return
+        
+        parts = []
+        deltas = self._stream_llm(
+            lambda: self.openrouter_service.stream_improve_translation(
+                original_text=original_text,
+                translated_text=current_translation,
+                target_language=target_language,
+                feedback=feedback,
+                model=model
+            ),
+            model
+        )
+        try:
+            with closing(deltas):
+                for delta in deltas:
+                    parts.append(delta)
+                    yield 'delta', {'text': delta}
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"OpenRouter stream error: {e}")
+            yield 'done', {
+                'success': False,
+                'error': str(e),
+                'translation': current_translation
+            }
+            return
+        
+        improved = ''.join(parts).strip()
+        if not improved:
+            yield 'done', {
+                'success': False,
+                'error': 'No improved translation returned',
+                'translation': current_translation
+            }
+            return
+        
+        yield 'done', {
+            'success': True,
+            'translation': improved
+        }
+    
+    def _stream_llm(
+        self,
+        open_stream: Callable[[], Iterator[str]],
+        model: str,
+        estimated_tokens: Optional[float] = None,
+        record_latency: bool = False
+    ) -> Iterator[str]:
+        """
+        Yield the deltas of an LLM stream, read upstream on a worker thread.
+        
+        The worker reads the stream as fast as upstream sends it and queues
+        the deltas (at most max_tokens of text), so the model's dispatcher
+        slot and its breaker outcome depend on the upstream call only, not
+        on how fast the client reads. If the consumer stops early (a client
+        disconnect closes the generator), reading stops and a half-open
+        probe is released without counting as a success or a failure.
+        
+        Args:
+            open_stream: Starts the upstream stream (called on the worker).
+            model: Model the stream goes to (its breaker records the outcome).
+            estimated_tokens: Tokens to reserve with the dispatcher; None
+                streams without taking a dispatcher slot.
+            record_latency: Report the call's duration to the LLM router.
+            
+        Raises:
+            The upstream error, after the breaker recorded it.
+        """
+        breaker = self.breakers.get(f'openrouter:{model}')
+        events: queue.Queue = queue.Queue()
+        cancelled = threading.Event()
+        
+        def read():
+            start = time.perf_counter()
+            try:
+                with ExitStack() as held:
+                    if estimated_tokens is not None:
+                        held.enter_context(self.llm_dispatcher.slot(model, estimated_tokens))
+                    with closing(open_stream()) as stream:
+                        for delta in stream:
+                            if cancelled.is_set():
+                                break
+                            events.put(('delta', delta))
+            except (requests.exceptions.RequestException, ValueError) as e:
+                if cancelled.is_set():
+                    breaker.release_probe()
+                else:
+                    breaker.record_failure(e)
+                events.put(('error', e))
+            except Exception as e:
+                breaker.release_probe()
+                events.put(('error', e))
+            else:
+                if cancelled.is_set():
+                    breaker.release_probe()
+                else:
+                    breaker.record_success()
+                events.put(('end', None))
+            finally:
+                if record_latency:
+                    self.llm_router.record_llm_call(time.perf_counter() - start)
+        
+        threading.Thread(target=read, name=f'llm-stream-{model}', daemon=True).start()
+        try:
+            while True:
+                kind, value = events.get()
+                if kind == 'delta':
+                    yield value
+                elif kind == 'error':
+                    raise value
+                else:
+                    return
+        except GeneratorExit:
+            cancelled.set()
+            raise
+    
     def _normalize_language_code(self, lang_code: str) -> str:
         """
         Normalize language code for comparison.
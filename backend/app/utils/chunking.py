@@ -0,0 +1,105 @@
+"""
+Helpers for fitting text into per-request upstream limits.
+
+``split_text`` breaks an oversized text into pieces at sentence boundaries
+(falling back to whitespace, then a hard cut) such that joining the pieces
+gives back the original text. ``pack_chunks`` groups items into requests
+under element and character caps while keeping their order.
+"""
+
+import re
+from typing import List, Sequence
+
+# Sentence end: Western punctuation followed by whitespace, or CJK full-width
+# punctuation (which is not followed by a space)
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+|(?<=[。！？])')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _split_after(text: str, pattern: re.Pattern) -> List[str]:
+    """Split text after each match of pattern, keeping the separators."""
+    parts = []
+    start = 0
+    for match in pattern.finditer(text):
+        if match.end() > start:
+            parts.append(text[start:match.end()])
+            start = match.end()
+    if start < len(text):
+        parts.append(text[start:])
+    return parts
+
+
+def _merge(parts: List[str], max_chars: int) -> List[str]:
+    """Greedily merge consecutive parts into pieces of at most max_chars."""
+    pieces: List[str] = []
+    current = ""
+    for part in parts:
+        if current and len(current) + len(part) > max_chars:
+            pieces.append(current)
+            current = ""
+        current += part
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_text(text: str, max_chars: int) -> List[str]:
+    """
+    Split text into pieces of at most max_chars characters.
+
+    Pieces end at sentence boundaries where possible, otherwise at
+    whitespace, otherwise at max_chars. ``"".join(pieces) == text``.
+
+    Args:
+        text: Text to split.
+        max_chars: Maximum characters per piece.
+
+    Returns:
+        List of pieces (a single piece if the text already fits).
+    """
+    if max_chars <= 0:
+        raise ValueError("max_chars must be positive")
+    if len(text) <= max_chars:
+        return [text]
+
+    parts: List[str] = []
+    for sentence in _split_after(text, _SENTENCE_END):
+        if len(sentence) <= max_chars:
+            parts.append(sentence)
+            continue
+        for word in _split_after(sentence, _WHITESPACE):
+            if len(word) <= max_chars:
+                parts.append(word)
+            else:
+                parts.extend(word[i:i + max_chars] for i in range(0, len(word), max_chars))
+
+    return _merge(parts, max_chars)
+
+
+def pack_chunks(sizes: Sequence[int], max_elements: int, max_chars: int) -> List[List[int]]:
+    """
+    Pack items into ordered chunks under element and character caps.
+
+    Args:
+        sizes: Character size of each item (already multiplied by any
+            per-request factor such as the number of target languages).
+        max_elements: Maximum items per chunk.
+        max_chars: Maximum total characters per chunk. An item larger than
+            this still gets a chunk of its own.
+
+    Returns:
+        List of chunks, each a list of item indices in input order.
+    """
+    chunks: List[List[int]] = []
+    current: List[int] = []
+    current_chars = 0
+    for index, size in enumerate(sizes):
+        if current and (len(current) >= max_elements or current_chars + size > max_chars):
+            chunks.append(current)
+            current = []
+            current_chars = 0
+        current.append(index)
+        current_chars += size
+    if current:
+        chunks.append(current)
+    return chunks
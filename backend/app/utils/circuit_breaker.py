@@ -0,0 +1,156 @@
+"""
+Circuit breakers for upstream translation backends.
+
+When a backend is down, every call otherwise waits out its timeout (and any
+retries) before the caller falls back. A breaker counts consecutive
+failures per backend/model:
+
+- closed: calls go through; ``failure_threshold`` failures in a row open it
+- open: calls are refused immediately for ``recovery_timeout`` seconds
+- half-open: one probe call is let through; success closes the breaker,
+  failure opens it again
+
+Breakers are per worker process; each worker discovers an outage on its own
+after a handful of failed calls.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List
+
+import requests
+
+from app.utils.metrics import CIRCUIT_STATE, CIRCUIT_TRANSITIONS
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of calling a backend whose breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one backend or model."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Initialize the breaker.
+
+        Args:
+            name: Backend name, e.g. 'azure_translator' or 'openrouter:<model>'.
+            failure_threshold: Consecutive failures that open the breaker.
+            recovery_timeout: Seconds to stay open before letting a probe through.
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.last_error = None
+        self._probing = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+        CIRCUIT_STATE.labels(name).set(_STATE_VALUES[CLOSED])
+
+    def allow(self) -> bool:
+        """Whether a call may go through now (reserves the probe when half-open)."""
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.recovery_timeout:
+                    return False
+                self._transition(HALF_OPEN)
+            if self.state == HALF_OPEN:
+                # A probe whose caller never reported back (e.g. an abandoned
+                # stream) is given up on after another recovery timeout
+                if self._probing and time.monotonic() - self._probe_started < self.recovery_timeout:
+                    return False
+                self._probing = True
+                self._probe_started = time.monotonic()
+            return True
+
+    def check(self):
+        """
+        Raise ``CircuitOpenError`` unless a call may go through now.
+
+        Raises:
+            CircuitOpenError: If the breaker is open (or its probe is in flight).
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"Circuit breaker '{self.name}' is open")
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._probing = False
+            if self.state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self, error: Any = None):
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error) if error is not None else None
+            self._probing = False
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                self._transition(OPEN)
+
+    def release_probe(self):
+        """Give up a half-open probe without an outcome (e.g. its caller went away), so the next call can probe."""
+        with self._lock:
+            self._probing = False
+
+    def reset(self):
+        """Close the breaker and forget past failures."""
+        self.record_success()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            retry_in = 0.0
+            if self.state == OPEN:
+                retry_in = max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+            return {
+                'name': self.name,
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'failure_threshold': self.failure_threshold,
+                'retry_in_seconds': round(retry_in, 1),
+                'last_error': self.last_error
+            }
+
+    def _transition(self, state: str):
+        logger.warning(f"Circuit breaker '{self.name}': {self.state} -> {state}")
+        self.state = state
+        CIRCUIT_STATE.labels(self.name).set(_STATE_VALUES[state])
+        CIRCUIT_TRANSITIONS.labels(self.name, state).inc()
+
+
+class CircuitBreakerRegistry:
+    """Breakers by backend name, created on first use with shared settings."""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(name, self.failure_threshold, self.recovery_timeout)
+            return self._breakers[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._breakers
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            breakers = sorted(self._breakers.values(), key=lambda breaker: breaker.name)
+        return [breaker.snapshot() for breaker in breakers]
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import Optional
 
 def save_file(file_path: str, content: str) -> None:
     """
@@ -99,18 +100,23 @@ def ensure_directory_exists(directory: Path) -> None:
     directory.mkdir(parents=True, exist_ok=True)
 
 
-def generate_unique_filename(original_filename: str, target_language: str) -> str:
+def generate_unique_filename(original_filename: str, target_language: str, document_id: Optional[str] = None) -> str:
     """
     Generate a unique filename for translated documents.
     
     Args:
         original_filename: Original filename
         target_language: Target language code
+        document_id: Content id of the source document; when given, its
+            first 12 characters keep outputs of different documents with
+            the same name apart
         
     Returns:
-        Unique filename with language suffix
+        Unique filename ending in the language suffix
     """
     path = Path(original_filename)
     stem = path.stem
     suffix = path.suffix
+    if document_id:
+        stem = f"{stem}_{document_id[:12]}"
     return f"{stem}_{target_language}{suffix}"
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+Cross-process advisory file locks.
+
+With several uvicorn workers, two requests for the same document can land in
+different processes. Document jobs take an exclusive lock on a per-document
+lock file first, so the second job waits for the first one instead of both
+writing the same upload and output files at once. Locks are released
+automatically if the holding process dies.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+class FileLock:
+    """Exclusive lock on a file, usable as a context manager."""
+
+    def __init__(self, path: Path, timeout: Optional[float] = None, poll_interval: float = 0.05):
+        """
+        Initialize the lock.
+
+        Args:
+            path: Lock file (created if missing).
+            timeout: Seconds to wait for the lock (None waits forever).
+            poll_interval: Seconds between acquisition attempts.
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+
+    def acquire(self):
+        """
+        Acquire the lock.
+
+        Raises:
+            TimeoutError: If the lock is still held by someone else after timeout.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        waited = False
+        while True:
+            try:
+                if fcntl:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise TimeoutError(f"Timed out waiting for lock {self.path.name}")
+                if not waited:
+                    logger.info(f"Waiting for lock {self.path.name} held by another job")
+                    waited = True
+                time.sleep(self.poll_interval)
+        self._fd = fd
+
+    def release(self):
+        """Release the lock."""
+        if self._fd is None:
+            return
+        try:
+            if fcntl:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    @property
+    def locked(self) -> bool:
+        return self._fd is not None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def document_lock(lock_dir: Path, name: str, timeout: Optional[float] = None) -> FileLock:
+    """
+    Lock guarding every job that writes files derived from a document name.
+
+    Args:
+        lock_dir: Directory holding lock files.
+        name: Document (file) name.
+        timeout: Seconds to wait for the lock (None waits forever).
+    """
+    digest = hashlib.sha1(name.encode('utf-8')).hexdigest()
+    return FileLock(Path(lock_dir) / f"{digest}.lock", timeout=timeout)
+
+
+@contextmanager
+def document_locks(lock_dir: Path, names: Iterable[str], timeout: Optional[float] = None) -> Iterator[None]:
+    """
+    Hold the document locks of several names at once.
+
+    Locks are taken in sorted order so that jobs locking overlapping sets of
+    names cannot deadlock.
+    """
+    with ExitStack() as stack:
+        for name in sorted(set(names)):
+            stack.enter_context(document_lock(lock_dir, name, timeout))
+        yield
@@ -0,0 +1,233 @@
+"""
+Adaptive timeouts and hedged requests for upstream calls.
+
+A single stalled request (a slow backend node, a dropped connection) can
+hold a whole document job for seconds. HedgedCaller keeps a rolling window
+of recent latencies per upstream and uses it for two things:
+
+- per-call deadline: a multiple of the observed p99, clamped to
+  [min_timeout, max_timeout], instead of waiting forever
+- hedging: if the request has not returned after the observed p95, a
+  duplicate is sent and whichever answers first wins
+
+Small and large requests (by ``size``, e.g. billed characters, against
+``max_hedge_size``) are kept in separate windows, so full batch chunks are
+never judged by the latency of single-segment calls. Large requests are not
+hedged, and batches never get a deadline below ``default_timeout``. An
+attempt that times out is recorded at its deadline, so a deadline that is
+too short raises itself instead of failing every retry.
+
+Hedges are paid for (Azure bills both requests), so they draw from a budget
+that grows by ``hedge_budget`` per request: with the default 0.05 at most
+about one request in twenty is duplicated, however slow upstream gets.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+from app.utils.metrics import HEDGED_CALL_SECONDS, HEDGED_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar('R')
+
+
+class LatencyWindow:
+    """Rolling window of recent latencies with quantile lookups."""
+
+    def __init__(self, size: int = 500):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Latency at quantile ``q`` (0-1), or None without samples."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+class HedgedCaller:
+    """Runs upstream calls with adaptive deadlines and budgeted hedging."""
+
+    def __init__(
+        self,
+        service: str,
+        hedge_budget: float = 0.05,
+        default_timeout: float = 30.0,
+        min_timeout: float = 2.0,
+        max_timeout: float = 60.0,
+        timeout_multiplier: float = 3.0,
+        min_samples: int = 20,
+        window: int = 500,
+        max_workers: int = 16,
+        max_hedge_size: Optional[int] = None,
+        timeout_errors: Tuple[Type[BaseException], ...] = (TimeoutError,)
+    ):
+        """
+        Initialize the caller.
+
+        Args:
+            service: Upstream name used in metrics and logs.
+            hedge_budget: Hedges allowed per request (0 disables hedging).
+            default_timeout: Deadline used until ``min_samples`` latencies are known.
+            min_timeout: Lower bound of the adaptive deadline in seconds.
+            max_timeout: Upper bound of the adaptive deadline in seconds.
+            timeout_multiplier: Deadline as a multiple of the observed p99.
+            min_samples: Latencies needed before deadlines adapt and hedging starts.
+            window: Number of recent latencies kept.
+            max_workers: Threads running attempts (primary and hedge).
+            max_hedge_size: Largest request ``size`` that is hedged and shares
+                the small-request latency window (None: every request).
+            timeout_errors: Exceptions meaning an attempt hit its deadline;
+                such attempts are recorded as taking the whole deadline.
+        """
+        self.service = service
+        self.hedge_budget = max(0.0, hedge_budget)
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.min_samples = min_samples
+        self.max_hedge_size = max_hedge_size
+        self.timeout_errors = timeout_errors
+        self.attempts = LatencyWindow(window)  # Single attempts of small requests: the latency without hedging
+        self.large_attempts = LatencyWindow(window)  # Single attempts of requests above max_hedge_size
+        self.calls = LatencyWindow(window)  # Whole calls: the latency callers see
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f'{service}-hedge')
+        self._lock = threading.Lock()
+        self._tokens = 1.0
+        self._requests = 0
+        self._hedges = 0
+        self._hedges_won = 0
+
+    def is_large(self, size: int) -> bool:
+        """Whether a request of this size is too large to hedge."""
+        return self.max_hedge_size is not None and size > self.max_hedge_size
+
+    def timeout(self, size: int = 0, batch: bool = False) -> float:
+        """
+        Current per-attempt deadline in seconds for a request.
+
+        Args:
+            size: Request size, in the unit of ``max_hedge_size``.
+            batch: Whether the request carries several items; batches never
+                get less than ``default_timeout``.
+        """
+        window = self._window(size)
+        p99 = window.quantile(0.99) if len(window) >= self.min_samples else None
+        if p99 is None:
+            return self.default_timeout
+        timeout = min(self.max_timeout, max(self.min_timeout, p99 * self.timeout_multiplier))
+        return max(timeout, self.default_timeout) if batch else timeout
+
+    def hedge_delay(self, size: int = 0) -> Optional[float]:
+        """Seconds to wait before hedging a request, or None if it is not hedged."""
+        if not self.hedge_budget or self.is_large(size) or len(self.attempts) < self.min_samples:
+            return None
+        return self.attempts.quantile(0.95)
+
+    def call(self, fn: Callable[[float], R], size: int = 0, batch: bool = False) -> R:
+        """
+        Run ``fn(timeout)``, hedging it once if it is slower than the p95.
+
+        Args:
+            fn: The request; receives the per-attempt deadline in seconds and
+                must raise on failure.
+            size: Request size (e.g. billed characters); requests above
+                ``max_hedge_size`` are not hedged.
+            batch: Whether the request carries several items (see ``timeout``).
+
+        Returns:
+            The first successful attempt's result. If every attempt fails,
+            the last error is raised. A losing attempt is left to finish in
+            the background; its result is discarded.
+        """
+        timeout = self.timeout(size, batch)
+        delay = self.hedge_delay(size)
+        window = self._window(size)
+        start = time.perf_counter()
+        with self._lock:
+            self._requests += 1
+            self._tokens = min(10.0, self._tokens + self.hedge_budget)
+
+        primary = self._executor.submit(self._attempt, fn, timeout, window)
+        pending = {primary}
+        if delay is not None:
+            done, _ = wait(pending, timeout=delay)
+            if not done:
+                if self._take_hedge_token():
+                    logger.info(f"{self.service} request still pending after {delay:.3f}s, sending a hedge")
+                    HEDGED_REQUESTS.labels(self.service, "sent").inc()
+                    pending.add(self._executor.submit(self._attempt, fn, timeout, window))
+                else:
+                    HEDGED_REQUESTS.labels(self.service, "over_budget").inc()
+
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is not primary:
+                        HEDGED_REQUESTS.labels(self.service, "won").inc()
+                        with self._lock:
+                            self._hedges_won += 1
+                    elapsed = time.perf_counter() - start
+                    self.calls.add(elapsed)
+                    HEDGED_CALL_SECONDS.labels(self.service).observe(elapsed)
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def stats(self) -> Dict[str, Any]:
+        """Hedge rate and tail latency of single attempts versus whole calls."""
+        with self._lock:
+            requests, hedges, won = self._requests, self._hedges, self._hedges_won
+        return {
+            'requests': requests,
+            'hedges': hedges,
+            'hedges_won': won,
+            'hedge_rate': hedges / requests if requests else 0.0,
+            'attempt_p95_s': self.attempts.quantile(0.95),
+            'attempt_p99_s': self.attempts.quantile(0.99),
+            'attempt_max_s': self.attempts.quantile(1.0),
+            'call_p95_s': self.calls.quantile(0.95),
+            'call_p99_s': self.calls.quantile(0.99),
+            'call_max_s': self.calls.quantile(1.0),
+            'large_attempt_p99_s': self.large_attempts.quantile(0.99),
+            'timeout_s': self.timeout()
+        }
+
+    def _window(self, size: int) -> LatencyWindow:
+        return self.large_attempts if self.is_large(size) else self.attempts
+
+    def _attempt(self, fn: Callable[[float], R], timeout: float, window: LatencyWindow) -> R:
+        start = time.perf_counter()
+        try:
+            result = fn(timeout)
+        except self.timeout_errors:
+            # Censored sample: the attempt took at least its deadline
+            window.add(max(timeout, time.perf_counter() - start))
+            raise
+        window.add(time.perf_counter() - start)
+        return result
+
+    def _take_hedge_token(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            self._hedges += 1
+            return True
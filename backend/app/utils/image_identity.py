@@ -0,0 +1,100 @@
+"""
+Identity keys for images referenced from a PPTX package.
+
+Pictures reference media parts through relationships, and one part is often
+shared by many slides. Images are therefore keyed by part name (plus the zip
+CRC-32 when known, so keys differ across revisions of a file) and each part
+is read once, however many pictures point at it. Content hashing is only used
+for pictures whose part cannot be resolved.
+"""
+
+import hashlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def image_key(part_name: str, crc: Optional[int] = None) -> str:
+    """Identity key of a media part, e.g. ``ppt/media/image1.png#1a2b3c4d``."""
+    part_name = part_name.lstrip('/')
+    return f"{part_name}#{crc:08x}" if crc is not None else part_name
+
+
+class ImageIndex:
+    """Registers the images of one document under part-name identity keys."""
+
+    def __init__(self, images: Dict[str, Dict[str, Any]]):
+        """
+        Initialize the index.
+
+        Args:
+            images: Extraction ``images`` mapping to populate (key -> entry
+                with 'blob', 'content_type', 'text_blocks' and 'parts').
+        """
+        self.images = images
+        self.reads = 0
+        self._by_part: Dict[str, str] = {}
+        self._by_checksum: Dict[Tuple[int, int], List[str]] = {}
+
+    def register(
+        self,
+        part_name: Optional[str],
+        read_blob: Callable[[], bytes],
+        content_type: str,
+        crc: Optional[int] = None,
+        size: Optional[int] = None
+    ) -> str:
+        """
+        Return the identity key for a picture's image, reading it only once.
+
+        Args:
+            part_name: Package part holding the image (None if unresolvable).
+            read_blob: Callable returning the image bytes.
+            content_type: MIME type of the image.
+            crc: Zip CRC-32 of the part, if known.
+            size: Uncompressed size of the part, if known.
+
+        Returns:
+            Image key in ``images``.
+        """
+        if part_name is None:
+            # Fallback: identify by content
+            blob = self._read(read_blob)
+            key = hashlib.md5(blob).hexdigest()
+            if key not in self.images:
+                self.images[key] = self._entry(blob, content_type)
+            return key
+
+        part_name = part_name.lstrip('/')
+        if part_name in self._by_part:
+            return self._by_part[part_name]
+
+        blob = self._read(read_blob)
+
+        # A different part with the same bytes shares its entry (and its OCR)
+        checksum = (crc, size if size is not None else len(blob)) if crc is not None else None
+        if checksum:
+            for candidate in self._by_checksum.get(checksum, []):
+                if self.images[candidate]['blob'] == blob:
+                    self.images[candidate]['parts'].append(part_name)
+                    self._by_part[part_name] = candidate
+                    return candidate
+
+        key = image_key(part_name, crc)
+        self.images[key] = self._entry(blob, content_type)
+        self.images[key]['parts'].append(part_name)
+        self._by_part[part_name] = key
+        if checksum:
+            self._by_checksum.setdefault(checksum, []).append(key)
+        return key
+
+    def _read(self, read_blob: Callable[[], bytes]) -> bytes:
+        self.reads += 1
+        return read_blob()
+
+    @staticmethod
+    def _entry(blob: bytes, content_type: str) -> Dict[str, Any]:
+        return {
+            'blob': blob,
+            'content_type': content_type,
+            'text_blocks': [],
+            'parts': []
+        }
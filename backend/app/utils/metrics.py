@@ -0,0 +1,207 @@
+"""
+Prometheus metrics for the translation pipeline.
+
+Everything here is recorded per stage, per upstream request or per job, never
+per segment, so the cost on the hot path stays at a few counter updates per
+batched request.
+
+With several uvicorn workers, start.sh points PROMETHEUS_MULTIPROC_DIR at a
+shared directory; each worker then writes its samples there and /metrics
+aggregates them, so a scrape sees the whole server rather than one worker.
+"""
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+
+from app.utils.stages import add_stage_listener
+
+logger = logging.getLogger(__name__)
+
+_SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+STAGE_SECONDS = Histogram(
+    "pipeline_stage_seconds",
+    "Time spent in each document pipeline stage",
+    ["stage"],
+    buckets=_SECONDS_BUCKETS
+)
+
+UPSTREAM_REQUESTS = Counter(
+    "upstream_requests_total",
+    "Requests sent to upstream services",
+    ["service", "operation", "status"]
+)
+
+UPSTREAM_SECONDS = Histogram(
+    "upstream_request_seconds",
+    "Latency of upstream service requests",
+    ["service", "operation"],
+    buckets=_SECONDS_BUCKETS
+)
+
+HEDGED_REQUESTS = Counter(
+    "upstream_hedged_requests_total",
+    "Hedge decisions for slow upstream requests (sent, won = the hedge answered first, over_budget = not sent)",
+    ["service", "result"]
+)
+
+HEDGED_CALL_SECONDS = Histogram(
+    "upstream_hedged_call_seconds",
+    "Latency callers see with hedging; compare with upstream_request_seconds for single attempts",
+    ["service"],
+    buckets=_SECONDS_BUCKETS
+)
+
+CIRCUIT_STATE = Gauge(
+    "circuit_breaker_state",
+    "Circuit breaker state per backend (0 closed, 1 half-open, 2 open; worst worker)",
+    ["breaker"],
+    multiprocess_mode="livemax"
+)
+
+CIRCUIT_TRANSITIONS = Counter(
+    "circuit_breaker_transitions_total",
+    "Circuit breaker state changes, by the state entered",
+    ["breaker", "state"]
+)
+
+AZURE_CHARACTERS = Counter(
+    "azure_translator_characters_total",
+    "Characters sent to Azure Translator (billed once per target language)"
+)
+
+OPENROUTER_TOKENS = Counter(
+    "openrouter_tokens_total",
+    "Tokens reported by OpenRouter (kind: prompt, completion, cached = prompt tokens read from the prompt cache)",
+    ["model", "kind"]
+)
+
+ROUTED_SEGMENTS = Counter(
+    "llm_routing_segments_total",
+    "Segments considered for LLM translation, by where the router sent them",
+    ["route"]
+)
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by result; hit ratio = hit / (hit + miss)",
+    ["cache", "result"]
+)
+
+QUEUE_DEPTH = Gauge(
+    "pipeline_queue_depth",
+    "Work items waiting in pipeline queues",
+    ["queue"],
+    multiprocess_mode="livesum"
+)
+
+STORAGE_BYTES = Gauge(
+    "storage_bytes",
+    "Bytes used by managed document folders, as of the last sweep",
+    ["folder"],
+    multiprocess_mode="livemax"
+)
+
+STORAGE_EVICTIONS = Counter(
+    "storage_evictions_total",
+    "Documents deleted by storage sweeps (ttl = not accessed in time, quota = least recently used over budget)",
+    ["reason"]
+)
+
+JOBS_IN_FLIGHT = Gauge(
+    "document_jobs_in_flight",
+    "Document translation jobs currently running",
+    multiprocess_mode="livesum"
+)
+
+STARTUP_SECONDS = Gauge(
+    "startup_seconds",
+    "Time taken by each startup step (imports, warm-ups, total) of the last worker to start",
+    ["step"],
+    multiprocess_mode="mostrecent"
+)
+
+
+class UpstreamCall:
+    """Mutable holder for the outcome of an upstream request."""
+
+    def __init__(self):
+        self.status: Optional[int] = None
+
+
+@contextmanager
+def track_upstream(service: str, operation: str) -> Iterator[UpstreamCall]:
+    """
+    Record latency and status of one upstream request.
+
+    Set ``call.status`` to the HTTP status code inside the block; requests
+    that raise before a status is known are recorded as ``error``.
+
+    Args:
+        service: Upstream service name (e.g. 'azure_translator').
+        operation: Operation name (e.g. 'translate').
+    """
+    call = UpstreamCall()
+    start = time.perf_counter()
+    try:
+        yield call
+    finally:
+        UPSTREAM_SECONDS.labels(service, operation).observe(time.perf_counter() - start)
+        UPSTREAM_REQUESTS.labels(service, operation, str(call.status) if call.status else "error").inc()
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """
+    Count a cache lookup.
+
+    Args:
+        cache: Cache name.
+        hit: Whether the lookup was a hit.
+    """
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def record_openrouter_usage(model: str, usage: Optional[dict]) -> None:
+    """
+    Count tokens from an OpenRouter ``usage`` block.
+
+    Args:
+        model: Model the request was sent to.
+        usage: The response's ``usage`` dictionary (may be missing).
+    """
+    if not usage:
+        return
+    for kind in ("prompt_tokens", "completion_tokens"):
+        if usage.get(kind):
+            OPENROUTER_TOKENS.labels(model, kind.replace("_tokens", "")).inc(usage[kind])
+    cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or usage.get("cache_read_input_tokens")
+    if cached:
+        OPENROUTER_TOKENS.labels(model, "cached").inc(cached)
+
+
+def render_metrics() -> bytes:
+    """Metrics in the Prometheus text format, aggregated across workers when multiprocess."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
+
+
+def mark_worker_exit() -> None:
+    """Drop this worker's live gauge samples from the multiprocess aggregate."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def _stage_listener(event: str, name: str, seconds: Optional[float]) -> None:
+    if event == "end":
+        STAGE_SECONDS.labels(name).observe(seconds)
+
+
+add_stage_listener(_stage_listener)
@@ -0,0 +1,31 @@
+"""
+Newline-delimited JSON (NDJSON) streaming helpers.
+
+Long-running batch endpoints stream one JSON object per line as results
+become ready, so clients can act on early results (and servers keep
+constant memory) instead of waiting for one large response body.
+"""
+
+from typing import Any, Iterable
+
+import orjson
+from fastapi.responses import StreamingResponse
+
+
+def format_ndjson(item: Any) -> bytes:
+    """Encode one NDJSON line."""
+    return orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def ndjson_response(items: Iterable[Any]) -> StreamingResponse:
+    """
+    Stream JSON-serializable items to the client, one per line.
+
+    The iterable may block; Starlette iterates synchronous iterables in its
+    threadpool.
+    """
+    return StreamingResponse(
+        (format_ndjson(item) for item in items),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,88 @@
+"""
+OCR result cache keyed by image content.
+
+OCR output (text lines, bounding boxes, confidence) depends only on the
+image bytes and the OCR model, never on the target language. Caching it
+lets a deck translated again, into another language or by another worker,
+skip the Azure Vision submit/poll round trips entirely.
+
+Entries live in a small in-process LRU backed by a ``SharedCache`` on disk,
+which every worker shares and which evicts least recently used entries
+beyond its limit. Keys combine the OCR model version with the SHA-256 of
+the image, so pinning a new model version never serves stale results.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from app.utils.metrics import record_cache
+from app.utils.shared_cache import SharedCache
+
+logger = logging.getLogger(__name__)
+
+_NAMESPACE = 'ocr'
+
+
+class OCRCache:
+    """Two-level (memory, disk) cache of OCR text blocks by image hash."""
+
+    def __init__(self, disk: Optional[SharedCache] = None, memory_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            disk: Shared on-disk cache (None keeps results in memory only).
+            memory_entries: Results kept in this process's LRU.
+        """
+        self.disk = disk
+        self.memory_entries = max(0, memory_entries)
+        self._memory: 'OrderedDict[str, List[Dict[str, Any]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(image_bytes: bytes, model_version: str) -> str:
+        return f"{model_version}:{hashlib.sha256(image_bytes).hexdigest()}"
+
+    def get(self, image_bytes: bytes, model_version: str) -> Optional[List[Dict[str, Any]]]:
+        """Cached text blocks for an image, or None on a miss."""
+        key = self.key(image_bytes, model_version)
+        with self._lock:
+            blocks = self._memory.get(key)
+            if blocks is not None:
+                self._memory.move_to_end(key)
+        if blocks is None and self.disk is not None:
+            try:
+                value = self.disk.get(_NAMESPACE, key)
+            except Exception as e:
+                logger.warning(f"OCR cache read failed: {e}")
+                value = None
+            if value is not None:
+                blocks = json.loads(value)
+                self._remember(key, blocks)
+        record_cache('ocr', blocks is not None)
+        # Callers may annotate blocks; hand out copies
+        return [dict(block) for block in blocks] if blocks is not None else None
+
+    def set(self, image_bytes: bytes, model_version: str, blocks: List[Dict[str, Any]]):
+        """Store the text blocks of a successful OCR run."""
+        key = self.key(image_bytes, model_version)
+        blocks = [dict(block) for block in blocks]
+        self._remember(key, blocks)
+        if self.disk is not None:
+            try:
+                self.disk.set(_NAMESPACE, key, json.dumps(blocks).encode('utf-8'))
+            except Exception as e:
+                logger.warning(f"OCR cache write failed: {e}")
+
+    def _remember(self, key: str, blocks: List[Dict[str, Any]]):
+        if not self.memory_entries:
+            return
+        with self._lock:
+            self._memory[key] = blocks
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
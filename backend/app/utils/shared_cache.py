@@ -0,0 +1,114 @@
+"""
+Process-shared key/value cache backed by SQLite.
+
+Used for caches that must survive across uvicorn workers (``--workers N``):
+every worker opens the same database file, so an entry written by one worker
+is a hit for all others. SQLite's WAL mode lets readers proceed while one
+writer commits, and each thread gets its own connection.
+
+Entries are grouped in namespaces; each namespace keeps at most
+``max_entries`` entries, evicting the least recently used. A hit records the
+access only when the entry's last recorded access is older than
+``touch_interval``, so hits are plain reads and workers do not queue on the
+write lock to serve them.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+class SharedCache:
+    """SQLite-backed LRU cache shared by every process using the same file."""
+
+    def __init__(self, path: Path, max_entries: int = 256, busy_timeout: float = 30.0, touch_interval: float = 60.0):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (created if missing).
+            max_entries: Maximum entries kept per namespace.
+            busy_timeout: Seconds to wait for another process's write lock.
+            touch_interval: Seconds within which repeated hits of an entry
+                do not update its access time.
+        """
+        self.path = Path(path)
+        self.max_entries = max(1, max_entries)
+        self.busy_timeout = busy_timeout
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(_SCHEMA)
+        logger.info(f"Shared cache at {self.path} (max {self.max_entries} entries per namespace)")
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """Return a cached value, or None on a miss."""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT value, accessed FROM cache WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[1] >= self.touch_interval:
+                conn.execute(
+                    "UPDATE cache SET accessed = ? WHERE namespace = ? AND key = ?", (now, namespace, key)
+                )
+        return bytes(row[0])
+
+    def set(self, namespace: str, key: str, value: bytes):
+        """Store a value, evicting the least recently used entries beyond the limit."""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, accessed) VALUES (?, ?, ?, ?)",
+                (namespace, key, value, time.time())
+            )
+            conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key IN ("
+                " SELECT key FROM cache WHERE namespace = ? ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (namespace, namespace, self.max_entries)
+            )
+
+    def delete_prefix(self, namespace: str, prefix: str) -> int:
+        """Delete every entry whose key starts with prefix. Returns the number deleted."""
+        escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key LIKE ? ESCAPE '\\'",
+                (namespace, escaped + '%')
+            )
+        return cursor.rowcount
+
+    def clear(self, namespace: Optional[str] = None):
+        """Delete every entry (of one namespace, or all)."""
+        with self._connection() as conn:
+            if namespace is None:
+                conn.execute("DELETE FROM cache")
+            else:
+                conn.execute("DELETE FROM cache WHERE namespace = ?", (namespace,))
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-thread connection; used as a context manager it commits or rolls back."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
@@ -0,0 +1,57 @@
+"""
+Server-sent events (SSE) helpers.
+
+OpenRouter streams chat completions as SSE, and the interactive endpoints
+stream their own progress to the browser the same way: one ``event:`` name
+plus a JSON ``data:`` payload per message.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+from fastapi.responses import StreamingResponse
+
+
+def iter_sse_data(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the data payload of each event in an SSE line stream.
+
+    Multi-line ``data:`` fields are joined with newlines, comment lines
+    (``: keep-alive``) and other fields are ignored.
+
+    Args:
+        lines: Decoded lines without line terminators.
+    """
+    data = []
+    for line in lines:
+        if not line:
+            if data:
+                yield "\n".join(data)
+                data = []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if field == "data":
+            data.append(value[1:] if value.startswith(" ") else value)
+    if data:
+        yield "\n".join(data)
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Encode one SSE message with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def sse_response(events: Iterable[Tuple[str, Dict[str, Any]]]) -> StreamingResponse:
+    """
+    Stream (event, data) pairs to the client as SSE.
+
+    The iterable may block (e.g. on an upstream stream); Starlette iterates
+    synchronous iterables in its threadpool.
+    """
+    return StreamingResponse(
+        (format_sse(event, data) for event, data in events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,75 @@
+"""
+Pipeline stage hooks.
+
+Document processing is split into named stages (load, extract, translate,
+OCR submit/poll, image redraw, save). Code wraps each stage in
+``pipeline_stage(name)`` and any registered listener is told when the stage
+starts and ends. With no listeners registered the context manager only costs
+a list check, so it is safe to leave in place in production.
+
+Listeners are callables ``listener(event, name, seconds)`` where ``event`` is
+``"start"`` or ``"end"`` and ``seconds`` is the stage duration (``None`` on
+start). Stages may run concurrently on several threads, so listeners must be
+thread-safe.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+StageListener = Callable[[str, str, Optional[float]], None]
+
+_listeners: List[StageListener] = []
+
+
+def add_stage_listener(listener: StageListener) -> None:
+    """
+    Register a listener for pipeline stage events.
+
+    Args:
+        listener: Callable receiving (event, stage name, seconds).
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_stage_listener(listener: StageListener) -> None:
+    """
+    Unregister a previously added listener.
+
+    Args:
+        listener: Listener passed to add_stage_listener.
+    """
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def _notify(event: str, name: str, seconds: Optional[float]) -> None:
+    for listener in list(_listeners):
+        try:
+            listener(event, name, seconds)
+        except Exception as e:
+            logger.debug(f"Stage listener failed for {event} {name}: {e}")
+
+
+@contextmanager
+def pipeline_stage(name: str) -> Iterator[None]:
+    """
+    Time a pipeline stage and notify registered listeners.
+
+    Args:
+        name: Stage name (e.g. 'load', 'translate', 'save').
+    """
+    if not _listeners:
+        yield
+        return
+
+    _notify("start", name, None)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _notify("end", name, time.perf_counter() - start)
@@ -0,0 +1,82 @@
+"""
+Startup profile of a worker.
+
+Heavy libraries (python-pptx, Pillow) are imported where they are used, and
+services are built and warmed in the application lifespan rather than on the
+first request. The profile records how long importing the application took
+and how long each warm-up step took, so slow boots can be traced to a step.
+"""
+
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.utils.metrics import STARTUP_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfile:
+    """Timings of a worker's startup steps."""
+
+    def __init__(self, started: float, imported: Optional[float] = None):
+        """
+        Initialize the profile.
+
+        Args:
+            started: time.perf_counter() when the application module started importing.
+            imported: time.perf_counter() when it finished (defaults to now).
+        """
+        self.started = started
+        self.imported = imported if imported is not None else time.perf_counter()
+        self.ready: Optional[float] = None
+        self.steps: List[Dict[str, Any]] = []
+        STARTUP_SECONDS.labels('imports').set(self.imported - started)
+
+    @contextmanager
+    def step(self, name: str, optional: bool = False) -> Iterator[None]:
+        """
+        Time a startup step.
+
+        Args:
+            name: Step name, as reported.
+            optional: Log and swallow errors instead of failing startup
+                (warm-ups: the service is then built on first use instead).
+        """
+        start = time.perf_counter()
+        record: Dict[str, Any] = {'name': name, 'ok': True}
+        try:
+            yield
+        except Exception as e:
+            record.update(ok=False, error=str(e))
+            if not optional:
+                raise
+            logger.warning(f"Startup step '{name}' failed: {e}")
+        finally:
+            record['seconds'] = round(time.perf_counter() - start, 4)
+            self.steps.append(record)
+            STARTUP_SECONDS.labels(name).set(record['seconds'])
+
+    def mark_ready(self) -> None:
+        """Record that the worker is ready to take traffic and log the profile."""
+        self.ready = time.perf_counter()
+        STARTUP_SECONDS.labels('total').set(self.ready - self.started)
+        steps = ', '.join(
+            f"{step['name']} {step['seconds']:.2f}s" + ('' if step['ok'] else ' (failed)')
+            for step in self.steps
+        )
+        logger.info(
+            f"Ready in {self.ready - self.started:.2f}s "
+            f"(imports {self.imported - self.started:.2f}s; {steps or 'no warm-up'})"
+        )
+
+    def report(self) -> Dict[str, Any]:
+        """The profile as a JSON-serializable dict."""
+        return {
+            'imports_seconds': round(self.imported - self.started, 4),
+            'steps': list(self.steps),
+            'ready_seconds': round(self.ready - self.started, 4) if self.ready is not None else None,
+            'modules_loaded': len(sys.modules)
+        }
@@ -0,0 +1,404 @@
+"""
+Disk budget for uploaded and translated documents.
+
+Uploads, translated decks and their ``.json`` / ``.original.json`` sidecars
+are grouped into artifacts (a ``.pptx`` plus its sidecars), each with a size
+and a last access time: the later of its files' mtimes and the last
+recorded access (download, editor request, translation job).
+
+A sweep deletes artifacts not accessed within the TTL, then the least
+recently used ones while the folders exceed their byte budget or the disk
+has less free space than required. Pinned artifacts are never deleted:
+translation jobs pin their input and outputs while they run, and editor
+requests lease a pin on the document being edited for a while.
+
+Access times and pins live in a SQLite file shared by all workers, so a pin
+taken in one worker protects the file from a sweep in another. A sweep
+checks the pins and deletes each artifact inside one write transaction,
+so a job either pins a file before it is swept or finds it gone.
+"""
+
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.utils.file_lock import FileLock
+from app.utils.metrics import STORAGE_BYTES, STORAGE_EVICTIONS
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS artifacts (
+        path TEXT PRIMARY KEY,
+        accessed REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS pins (
+        path TEXT NOT NULL,
+        owner TEXT NOT NULL,
+        expires REAL NOT NULL,
+        PRIMARY KEY (path, owner)
+    )
+    """
+)
+
+# Sidecars stored next to a document, longest suffix first
+_SIDECAR_SUFFIXES = ('.original.json', '.json')
+_DOCUMENT_SUFFIX = '.pptx'
+
+
+def _key(path: Path) -> str:
+    return os.path.abspath(path)
+
+
+def _artifact_keys(path: Path) -> List[str]:
+    """Keys of a document and its sidecars (which may be written first)."""
+    path = Path(path)
+    if path.suffix != _DOCUMENT_SUFFIX:
+        return [_key(path)]
+    return [_key(path)] + [_key(path.with_suffix(suffix)) for suffix in _SIDECAR_SUFFIXES]
+
+
+class _Artifact:
+    """A document file and its sidecars."""
+
+    def __init__(self, root: str, path: Path):
+        self.root = root
+        self.path = path
+        self.files: List[Path] = []
+        self.size = 0
+        self.accessed = 0.0
+
+    @property
+    def temporary(self) -> bool:
+        # Partially written files (atomic writes in progress)
+        return self.path.name.startswith('.')
+
+
+class StorageManager:
+    """Enforces a TTL and a byte budget on the upload and output folders."""
+
+    def __init__(
+        self,
+        roots: Dict[str, Path],
+        db_path: Path,
+        max_bytes: int = 0,
+        ttl_seconds: float = 0,
+        min_free_bytes: int = 0,
+        pin_lease_seconds: float = 6 * 3600,
+        busy_timeout: float = 30.0
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            roots: Managed folders by name (e.g. uploads, outputs).
+            db_path: SQLite file with access times and pins (shared by workers).
+            max_bytes: Budget for all folders together (0 = unlimited).
+            ttl_seconds: Artifacts not accessed for this long are deleted (0 = never).
+            min_free_bytes: Free disk space to keep, evicting LRU artifacts if needed.
+            pin_lease_seconds: Expiry of job pins, should the job's process die.
+            busy_timeout: Seconds to wait for another process's write lock.
+        """
+        self.roots = {name: Path(root) for name, root in roots.items()}
+        self.db_path = Path(db_path)
+        self.max_bytes = max(0, max_bytes)
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self.min_free_bytes = max(0, min_free_bytes)
+        self.pin_lease_seconds = pin_lease_seconds
+        self.busy_timeout = busy_timeout
+        self.last_sweep: Optional[Dict[str, Any]] = None
+        self._local = threading.local()
+        self._sweep_lock = FileLock(self.db_path.with_suffix('.sweep.lock'), timeout=0)
+        self._sweep_thread_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        for root in self.roots.values():
+            root.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    def touch(self, *paths: Path):
+        """Record an access to the artifacts of paths."""
+        now = time.time()
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO artifacts (path, accessed) VALUES (?, ?)",
+                [(_key(path), now) for path in paths]
+            )
+
+    @contextmanager
+    def pinned(self, *paths: Path) -> Iterator[None]:
+        """Keep the artifacts of paths (existing or about to be written) while the block runs."""
+        owner = uuid.uuid4().hex
+        keys = [key for path in paths for key in _artifact_keys(path)]
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO pins (path, owner, expires) VALUES (?, ?, ?)",
+                [(key, owner, time.time() + self.pin_lease_seconds) for key in keys]
+            )
+        try:
+            yield
+        finally:
+            with self._connection() as conn:
+                conn.execute("DELETE FROM pins WHERE owner = ?", (owner,))
+            self.touch(*paths)
+
+    def lease(self, path: Path, seconds: float, owner: str = 'editor'):
+        """Pin an artifact for the next seconds (renewed by every call) and record the access."""
+        expires = time.time() + seconds
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO pins (path, owner, expires) VALUES (?, ?, ?)",
+                [(key, owner, expires) for key in _artifact_keys(path)]
+            )
+        self.touch(path)
+
+    def release(self, path: Path, owner: str = 'editor'):
+        """Drop a lease taken with lease()."""
+        with self._connection() as conn:
+            conn.executemany(
+                "DELETE FROM pins WHERE path = ? AND owner = ?",
+                [(key, owner) for key in _artifact_keys(path)]
+            )
+
+    def usage(self) -> Dict[str, Any]:
+        """Bytes and artifacts per folder, plus the budget and the last sweep."""
+        artifacts = self._scan()
+        pins = self._pins()
+        folders = {
+            name: {
+                'bytes': sum(a.size for a in artifacts if a.root == name),
+                'artifacts': sum(1 for a in artifacts if a.root == name)
+            }
+            for name in self.roots
+        }
+        return {
+            'total_bytes': sum(folder['bytes'] for folder in folders.values()),
+            'max_bytes': self.max_bytes,
+            'ttl_seconds': self.ttl_seconds,
+            'min_free_bytes': self.min_free_bytes,
+            'free_bytes': self._free_bytes(),
+            'folders': folders,
+            'pinned': sum(1 for a in artifacts if self._is_pinned(a, pins)),
+            'last_sweep': self.last_sweep
+        }
+
+    def make_room(self, nbytes: int, wait: float = 30.0):
+        """
+        Evict before writing nbytes if that would break the budget or the free space floor.
+
+        Waits up to ``wait`` seconds for a sweep running in another worker,
+        then proceeds either way.
+        """
+        if not self._low_on_space(self._total_bytes(), nbytes):
+            return
+        deadline = time.monotonic() + wait
+        while True:
+            report = self.sweep(reserve=nbytes)
+            if report is not None or time.monotonic() >= deadline:
+                return
+            time.sleep(0.1)
+
+    def sweep(self, reserve: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        Delete expired artifacts, then LRU ones while over budget.
+
+        Args:
+            reserve: Bytes about to be written, counted as already used.
+
+        Returns:
+            What was evicted, or None if another worker is sweeping.
+        """
+        with self._sweep_thread_lock:
+            try:
+                self._sweep_lock.acquire()
+            except TimeoutError:
+                return None
+            try:
+                report = self._sweep(reserve)
+            finally:
+                self._sweep_lock.release()
+        self.last_sweep = report
+        return report
+
+    def start(self, interval: float):
+        """Sweep every interval seconds in a low-priority background thread."""
+        if self._thread is not None or interval <= 0:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name='storage-sweeper', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self, interval: float):
+        try:
+            # Linux applies the nice value to this thread only
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except (AttributeError, OSError):
+            pass
+        while not self._stop.wait(interval):
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.warning(f"Storage sweep failed: {e}")
+
+    def _sweep(self, reserve: int) -> Dict[str, Any]:
+        start = time.perf_counter()
+        now = time.time()
+        artifacts = self._scan()
+        total = sum(a.size for a in artifacts)
+        report = {'scanned': len(artifacts), 'evicted': 0, 'evicted_bytes': 0, 'pinned_skipped': 0}
+        evicted = set()
+
+        def evict(artifact: _Artifact, reason: str) -> bool:
+            nonlocal total
+            if not self._delete(artifact):
+                report['pinned_skipped'] += 1
+                return False
+            evicted.add(id(artifact))
+            total -= artifact.size
+            report['evicted'] += 1
+            report['evicted_bytes'] += artifact.size
+            STORAGE_EVICTIONS.labels(reason).inc()
+            logger.info(f"Evicted {artifact.path.name} ({artifact.size} bytes, {reason})")
+            return True
+
+        remaining = []
+        for artifact in artifacts:
+            expired = self.ttl_seconds and now - artifact.accessed > self.ttl_seconds
+            if not (expired and evict(artifact, 'ttl')):
+                remaining.append(artifact)
+
+        # In-progress temporary files only ever expire
+        candidates = sorted((a for a in remaining if not a.temporary), key=lambda a: a.accessed)
+        for artifact in candidates:
+            if not self._low_on_space(total, reserve):
+                break
+            evict(artifact, 'quota')
+        if self._low_on_space(total, reserve):
+            logger.warning(
+                f"Storage still over budget after sweep ({total} bytes, {self._free_bytes()} free); "
+                f"remaining artifacts are pinned"
+            )
+
+        for name in self.roots:
+            STORAGE_BYTES.labels(name).set(
+                sum(a.size for a in artifacts if a.root == name and id(a) not in evicted)
+            )
+        report['total_bytes'] = total
+        report['seconds'] = round(time.perf_counter() - start, 3)
+        return report
+
+    def _delete(self, artifact: _Artifact) -> bool:
+        """Delete an artifact unless pinned, atomically with respect to new pins."""
+        keys = [_key(path) for path in artifact.files]
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            placeholders = ','.join('?' * len(keys))
+            pinned = conn.execute(
+                f"SELECT 1 FROM pins WHERE expires > ? AND path IN ({placeholders}) LIMIT 1",
+                (time.time(), *keys)
+            ).fetchone()
+            if pinned:
+                return False
+            for path in artifact.files:
+                path.unlink(missing_ok=True)
+            conn.execute(f"DELETE FROM artifacts WHERE path IN ({placeholders})", keys)
+        return True
+
+    def _scan(self) -> List[_Artifact]:
+        """Group the managed files into artifacts with size and last access."""
+        accessed = self._access_times()
+        artifacts: List[_Artifact] = []
+        for name, root in self.roots.items():
+            try:
+                entries = {entry.name: entry for entry in os.scandir(root) if entry.is_file()}
+            except FileNotFoundError:
+                continue
+            groups: Dict[str, _Artifact] = {}
+            for filename in sorted(entries):
+                primary = self._primary_name(filename, entries)
+                artifact = groups.get(primary)
+                if artifact is None:
+                    artifact = groups[primary] = _Artifact(name, root / primary)
+                try:
+                    stat = entries[filename].stat()
+                except FileNotFoundError:
+                    continue
+                path = root / filename
+                artifact.files.append(path)
+                artifact.size += stat.st_size
+                artifact.accessed = max(artifact.accessed, stat.st_mtime, accessed.get(_key(path), 0.0))
+            artifacts.extend(a for a in groups.values() if a.files)
+        return artifacts
+
+    @staticmethod
+    def _primary_name(filename: str, entries: Dict[str, Any]) -> str:
+        """The document a sidecar belongs to (itself for documents and orphans)."""
+        for suffix in _SIDECAR_SUFFIXES:
+            if filename.endswith(suffix):
+                primary = filename[:-len(suffix)] + _DOCUMENT_SUFFIX
+                if primary in entries:
+                    return primary
+        return filename
+
+    def _access_times(self) -> Dict[str, float]:
+        with self._connection() as conn:
+            return dict(conn.execute("SELECT path, accessed FROM artifacts"))
+
+    def _pins(self) -> set:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM pins WHERE expires <= ?", (time.time(),))
+            return {row[0] for row in conn.execute("SELECT path FROM pins")}
+
+    @staticmethod
+    def _is_pinned(artifact: _Artifact, pins: set) -> bool:
+        return any(_key(path) in pins for path in artifact.files)
+
+    def _total_bytes(self) -> int:
+        return sum(a.size for a in self._scan())
+
+    def _free_bytes(self) -> int:
+        free = []
+        for root in self.roots.values():
+            try:
+                free.append(shutil.disk_usage(root).free)
+            except OSError:
+                pass
+        return min(free) if free else 0
+
+    def _low_on_space(self, total: int, reserve: int) -> bool:
+        if self.max_bytes and total + reserve > self.max_bytes:
+            return True
+        return bool(self.min_free_bytes) and self._free_bytes() - reserve < self.min_free_bytes
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-thread connection; used as a context manager it commits or rolls back."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
@@ -0,0 +1,220 @@
+"""
+Durable translation memory shared by all workers.
+
+Stores (source text, language pair) -> translation, indexed for exact
+lookup, so a segment translated or corrected once is never sent upstream
+again. Entries have an origin:
+
+- ``human``: corrections saved from the editor; they always win and are
+  never evicted
+- ``llm`` / ``azure``: machine translations recorded by the translation
+  processor, capped at ``max_machine_entries`` (oldest written first out;
+  trimmed back to the cap each time 1% of it has been written, so a write
+  does not sort the table)
+
+Lookups prefer human over LLM over Azure entries; a caller asking for LLM
+quality can exclude Azure entries. Like ``SharedCache``, the store is one
+SQLite file in WAL mode with a connection per thread.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+HUMAN = 'human'
+MACHINE_ORIGINS = ('llm', 'azure')
+# Lower ranks win when a text has several entries
+_RANK = {HUMAN: 0, 'llm': 1, 'azure': 2}
+
+# SQLite's default limit on bound parameters is 999
+_LOOKUP_BATCH = 500
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS memory (
+        target_language TEXT NOT NULL,
+        source_text TEXT NOT NULL,
+        source_language TEXT NOT NULL,
+        origin TEXT NOT NULL,
+        translation TEXT NOT NULL,
+        updated REAL NOT NULL,
+        PRIMARY KEY (target_language, source_text, source_language, origin)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS memory_origin_updated ON memory (origin, updated)",
+)
+
+
+def _language(code: Optional[str]) -> str:
+    """Stored form of a language code ('' when unknown); variants like zh-Hans stay distinct."""
+    return (code or '').strip().lower()
+
+
+class TranslationMemory:
+    """SQLite-backed translation memory with exact lookup and human-first priority."""
+
+    def __init__(self, path: Path, max_machine_entries: int = 100000, busy_timeout: float = 30.0):
+        """
+        Initialize the memory.
+
+        Args:
+            path: SQLite database file (created if missing).
+            max_machine_entries: Machine translations kept (0 = record human entries only).
+            busy_timeout: Seconds to wait for another process's write lock.
+        """
+        self.path = Path(path)
+        self.max_machine_entries = max(0, max_machine_entries)
+        self.busy_timeout = busy_timeout
+        # Machine rows this process wrote since it last trimmed the memory
+        self._evict_every = max(1, self.max_machine_entries // 100)
+        self._written = 0
+        self._written_lock = threading.Lock()
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+        logger.info(f"Translation memory at {self.path} (max {self.max_machine_entries} machine entries)")
+
+    @property
+    def records_machine(self) -> bool:
+        """Whether machine translations are recorded."""
+        return self.max_machine_entries > 0
+
+    def add(
+        self,
+        entries: Iterable[Tuple[str, str]],
+        target_language: str,
+        source_language: Optional[str] = None,
+        origin: str = HUMAN
+    ) -> int:
+        """
+        Record translations, replacing earlier entries of the same origin.
+
+        Args:
+            entries: (source text, translation) pairs; blank ones are ignored.
+            target_language: Target language code.
+            source_language: Source language code (None when unknown).
+            origin: ``human``, or the machine method (``llm``/``azure``).
+
+        Returns:
+            The number of entries written.
+        """
+        if origin not in _RANK:
+            raise ValueError(f"Unknown translation memory origin: {origin!r}")
+        if origin != HUMAN and not self.records_machine:
+            return 0
+        now = time.time()
+        rows = [
+            (_language(target_language), text, _language(source_language), origin, translation, now)
+            for text, translation in entries
+            if text and text.strip() and translation and translation.strip()
+        ]
+        if not rows:
+            return 0
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO memory "
+                "(target_language, source_text, source_language, origin, translation, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            if origin != HUMAN and self._due_for_eviction(len(rows)):
+                self._evict(conn)
+        return len(rows)
+
+    def lookup(
+        self,
+        texts: Sequence[str],
+        target_language: str,
+        source_language: Optional[str] = None,
+        origins: Sequence[str] = (HUMAN,) + MACHINE_ORIGINS
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Find the best entry of each text.
+
+        Entries recorded without a source language match any source; with
+        ``source_language`` None, entries of every source language match.
+
+        Args:
+            texts: Source texts (exact match).
+            target_language: Target language code.
+            source_language: Source language code (optional).
+            origins: Origins accepted, e.g. ``('human', 'llm')``.
+
+        Returns:
+            Mapping of text -> ``{'translation', 'origin', 'source_language'}``
+            for the texts found; human entries win, then LLM, then Azure.
+        """
+        unique = list(dict.fromkeys(text for text in texts if text))
+        if not unique or not origins:
+            return {}
+        target = _language(target_language)
+        source = _language(source_language)
+        found: Dict[str, Tuple[Tuple[int, float], Dict[str, str]]] = {}
+        with self._connection() as conn:
+            for start in range(0, len(unique), _LOOKUP_BATCH):
+                batch = unique[start:start + _LOOKUP_BATCH]
+                query = (
+                    "SELECT source_text, source_language, origin, translation, updated FROM memory "
+                    f"WHERE target_language = ? AND source_text IN ({','.join('?' * len(batch))}) "
+                    f"AND origin IN ({','.join('?' * len(origins))})"
+                )
+                params: List = [target, *batch, *origins]
+                if source:
+                    query += " AND source_language IN (?, '')"
+                    params.append(source)
+                for text, entry_source, origin, translation, updated in conn.execute(query, params):
+                    rank = (_RANK[origin], -updated)
+                    if text not in found or rank < found[text][0]:
+                        found[text] = (rank, {
+                            'translation': translation,
+                            'origin': origin,
+                            'source_language': entry_source or None
+                        })
+        return {text: entry for text, (_, entry) in found.items()}
+
+    def stats(self) -> Dict[str, int]:
+        """Number of entries per origin."""
+        with self._connection() as conn:
+            rows = conn.execute("SELECT origin, COUNT(*) FROM memory GROUP BY origin").fetchall()
+        return {origin: count for origin, count in rows}
+
+    def _due_for_eviction(self, written: int) -> bool:
+        """Count machine rows written; True once every ``_evict_every`` of them."""
+        with self._written_lock:
+            self._written += written
+            if self._written < self._evict_every:
+                return False
+            self._written = 0
+            return True
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Delete the oldest machine entries over ``max_machine_entries``."""
+        placeholders = ','.join('?' * len(MACHINE_ORIGINS))
+        # origin IN (...) rather than != 'human', so the (origin, updated) index serves both queries
+        count = conn.execute(
+            f"SELECT COUNT(*) FROM memory WHERE origin IN ({placeholders})", MACHINE_ORIGINS
+        ).fetchone()[0]
+        excess = count - self.max_machine_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM memory WHERE rowid IN ("
+                f" SELECT rowid FROM memory WHERE origin IN ({placeholders}) ORDER BY updated, rowid LIMIT ?)",
+                (*MACHINE_ORIGINS, excess)
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-thread connection; used as a context manager it commits or rolls back."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
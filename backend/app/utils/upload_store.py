@@ -0,0 +1,113 @@
+"""
+Content-addressed storage for uploaded documents.
+
+Uploads are stored under the SHA-256 of their bytes, so:
+
+- the document id returned by /upload identifies exactly one file content,
+  and translating by id never needs the file sent again
+- uploading the same deck twice (or two decks with the same name) never
+  overwrites anything; identical bytes share one file
+- stored files are immutable, so jobs reading them need no lock
+
+Each ``<id>.pptx`` has a ``<id>.json`` sidecar with the original filename,
+size and upload time.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_DOCUMENT_ID = re.compile(r'^[0-9a-f]{64}$')
+
+
+def content_id(content: bytes) -> str:
+    """Document id of some file content."""
+    return hashlib.sha256(content).hexdigest()
+
+
+class UploadStore:
+    """Stores uploads by content hash with a metadata sidecar."""
+
+    def __init__(self, root: Path, extension: str = '.pptx'):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding the uploads (created if missing).
+            extension: Extension of the stored files.
+        """
+        self.root = Path(root)
+        self.extension = extension
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def put(self, content: bytes, filename: str) -> str:
+        """
+        Store an upload (a no-op for content already stored).
+
+        Args:
+            content: File bytes.
+            filename: Original filename, kept as metadata.
+
+        Returns:
+            The document id.
+        """
+        document_id = content_id(content)
+        path = self.path(document_id)
+        if not path.exists():
+            self._write_atomic(path, content)
+            logger.info(f"Stored upload {filename} as {document_id} ({len(content)} bytes)")
+        self._write_atomic(self._metadata_path(document_id), json.dumps({
+            'filename': Path(filename).name,
+            'size': len(content),
+            'uploaded_at': time.time()
+        }).encode('utf-8'))
+        return document_id
+
+    def path(self, document_id: str) -> Path:
+        """
+        Path of a stored upload (which may not exist).
+
+        Raises:
+            ValueError: If the id is not a document id.
+        """
+        if not _DOCUMENT_ID.match(document_id or ''):
+            raise ValueError(f"Invalid document id: {document_id!r}")
+        return self.root / f"{document_id}{self.extension}"
+
+    def get(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Metadata and path of a stored upload, or None if it is unknown.
+
+        Raises:
+            ValueError: If the id is not a document id.
+        """
+        path = self.path(document_id)
+        if not path.exists():
+            return None
+        try:
+            metadata = json.loads(self._metadata_path(document_id).read_text())
+        except (OSError, ValueError):
+            metadata = {'filename': path.name, 'size': path.stat().st_size}
+        return {**metadata, 'document_id': document_id, 'path': path}
+
+    def _metadata_path(self, document_id: str) -> Path:
+        return self.root / f"{document_id}.json"
+
+    def _write_atomic(self, path: Path, data: bytes):
+        """Write via a temporary file so readers never see a partial file."""
+        fd, temp = tempfile.mkstemp(dir=self.root, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                handle.write(data)
+            os.replace(temp, path)
+        except BaseException:
+            Path(temp).unlink(missing_ok=True)
+            raise
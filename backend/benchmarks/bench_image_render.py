@@ -0,0 +1,106 @@
+"""
+Image redraw/encode throughput benchmark.
+
+Renders the same set of synthetic images in-thread and through
+``ImageRenderPool`` with increasing worker counts, for each encoder profile,
+and reports images/sec and images/sec per core.
+
+Usage:
+    python -m benchmarks.bench_image_render --images 32 --size 1600 --workers 1,2,4 --json render.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.services.image_render_pool import ImageRenderPool
+from app.services.image_translator import ENCODER_PROFILES, ImageTranslator
+
+from benchmarks.synthetic_deck import DeckSpec, _image_bytes
+
+
+def build_items(count: int, size: int, lines: int, seed: int = 1234) -> List[tuple]:
+    """Create (image bytes, content type, blocks) tuples like the pipeline produces."""
+    rng = random.Random(seed)
+    spec = DeckSpec(image_size=size)
+    blocks = [
+        {'original': f"Figure line {index}", 'translated': f"Ligne de figure {index}", 'bbox': [20, 20 + index * 40, 200, 30]}
+        for index in range(lines)
+    ]
+    return [(_image_bytes(rng, spec, index), 'image/png', blocks) for index in range(count)]
+
+
+def measure(items: List[tuple], profile: str, workers: int) -> Dict[str, Any]:
+    """Render all items once and return throughput numbers (workers=0 means in-thread)."""
+    pool = ImageRenderPool(max_workers=workers) if workers else None
+    translator = ImageTranslator('', '', encode_profile=profile, render_pool=pool)
+    try:
+        if pool:
+            # Warm up the worker processes so spawn cost is not measured
+            translator.render_translated_images(items[:workers])
+        start = time.perf_counter()
+        results = translator.render_translated_images(items)
+        elapsed = time.perf_counter() - start
+    finally:
+        if pool:
+            pool.shutdown()
+
+    cores = max(1, workers)
+    images_per_sec = len(items) / elapsed if elapsed else 0.0
+    return {
+        'profile': profile,
+        'workers': workers,
+        'seconds': elapsed,
+        'images_per_sec': images_per_sec,
+        'images_per_sec_per_core': images_per_sec / cores,
+        'output_bytes': sum(len(result or b'') for result in results),
+        'failures': sum(1 for result in results if result is None)
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark translated image rendering throughput")
+    parser.add_argument("--images", type=int, default=16)
+    parser.add_argument("--size", type=int, default=1200, help="Image width in pixels (height is half)")
+    parser.add_argument("--lines", type=int, default=6, help="Text blocks drawn per image")
+    parser.add_argument("--workers", default=f"1,{os.cpu_count() or 1}", help="Comma-separated pool sizes")
+    parser.add_argument("--profiles", default=",".join(ENCODER_PROFILES))
+    parser.add_argument("--json", type=Path)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    items = build_items(args.images, args.size, args.lines)
+    worker_counts = [0] + sorted({int(value) for value in args.workers.split(",") if int(value) > 0})
+    rows = [
+        measure(items, profile, workers)
+        for profile in args.profiles.split(",")
+        for workers in worker_counts
+    ]
+
+    print(f"{'profile':<10}{'workers':>8}{'img/s':>10}{'img/s/core':>12}{'out MB':>9}")
+    for row in rows:
+        label = row['workers'] or 'thread'
+        print(f"{row['profile']:<10}{label:>8}{row['images_per_sec']:>10.2f}"
+              f"{row['images_per_sec_per_core']:>12.2f}{row['output_bytes'] / 2**20:>9.2f}")
+
+    if args.json:
+        args.json.write_text(json.dumps({
+            'benchmark': 'image_render',
+            'timestamp': time.time(),
+            'images': args.images,
+            'size': args.size,
+            'lines': args.lines,
+            'cpu_count': os.cpu_count(),
+            'results': rows
+        }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
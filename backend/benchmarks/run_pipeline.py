@@ -0,0 +1,351 @@
+"""
+End-to-end pipeline benchmark.
+
+Generates a synthetic deck, starts the local upstream stubs, runs
+``DocumentProcessor.process_pptx_multi`` against them and reports wall time,
+per-stage time and peak RSS, and upstream calls/bytes per route. Results are
+printed as a table and optionally written as JSON; ``--baseline`` compares
+against a previous JSON report and exits non-zero on regressions.
+
+Usage:
+    python -m benchmarks.run_pipeline --slides 50 --images 1 --languages fr,de \\
+        --latency-ms 40 --jitter-ms 20 --json bench.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.services.azure_translator import AzureTranslator
+from app.services.document_processor import DocumentProcessor
+from app.services.image_translator import ImageTranslator
+from app.services.openrouter_service import OpenRouterService
+from app.services.translation_processor import TranslationProcessor
+from app.services.llm_dispatcher import LLMDispatcher
+from app.services.llm_router import LLMRouter
+from app.utils.stages import add_stage_listener, remove_stage_listener
+
+from benchmarks.stub_servers import StubConfig, UpstreamStubServer
+from benchmarks.synthetic_deck import DeckSpec, generate_deck
+
+REPORT_VERSION = 1
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process (Linux /proc, falling back to ru_maxrss)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS and kilobytes elsewhere
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StageRecorder:
+    """
+    Stage listener recording duration and peak RSS per pipeline stage.
+
+    A background thread samples RSS and attributes each sample to every
+    stage active at that moment.
+    """
+
+    def __init__(self, sample_interval: float = 0.005):
+        self.sample_interval = sample_interval
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.peak_rss = 0
+        self._active: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+
+    def __call__(self, event: str, name: str, seconds: Optional[float]):
+        with self._lock:
+            entry = self.stages.setdefault(name, {"count": 0, "total_s": 0.0, "max_s": 0.0, "peak_rss_bytes": 0})
+            if event == "start":
+                self._active[name] = self._active.get(name, 0) + 1
+                entry["peak_rss_bytes"] = max(entry["peak_rss_bytes"], current_rss_bytes())
+            else:
+                self._active[name] = self._active.get(name, 1) - 1
+                entry["count"] += 1
+                entry["total_s"] += seconds or 0.0
+                entry["max_s"] = max(entry["max_s"], seconds or 0.0)
+                entry["peak_rss_bytes"] = max(entry["peak_rss_bytes"], current_rss_bytes())
+
+    def _sample(self):
+        while not self._stop.wait(self.sample_interval):
+            rss = current_rss_bytes()
+            with self._lock:
+                self.peak_rss = max(self.peak_rss, rss)
+                for name, depth in self._active.items():
+                    if depth > 0:
+                        entry = self.stages[name]
+                        entry["peak_rss_bytes"] = max(entry["peak_rss_bytes"], rss)
+
+    def __enter__(self) -> "StageRecorder":
+        add_stage_listener(self)
+        self._sampler.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._sampler.join()
+        remove_stage_listener(self)
+        self.peak_rss = max(self.peak_rss, current_rss_bytes())
+
+
+def build_processor(
+    stub: UpstreamStubServer,
+    use_images: bool,
+    use_llm: bool,
+    engine: str = 'xml',
+    llm_threshold: float = 0.0,
+    llm_concurrency: int = 8,
+    azure_max_elements: int = 1000,
+    hedge_budget: float = 0.05
+) -> DocumentProcessor:
+    """Wire the real services to the local stubs."""
+    openrouter = OpenRouterService(api_key="bench", api_url=stub.openrouter_url) if use_llm else None
+    translation_processor = TranslationProcessor(
+        azure_translator=AzureTranslator(
+            "bench",
+            stub.translator_endpoint,
+            region="bench",
+            max_elements_per_request=azure_max_elements,
+            retry_delay=0.05,
+            hedge_budget=hedge_budget
+        ),
+        openrouter_service=openrouter,
+        use_llm_enhancement=use_llm,
+        llm_router=LLMRouter(threshold=llm_threshold),
+        llm_dispatcher=LLMDispatcher(default_max_concurrency=llm_concurrency)
+    )
+    image_translator = ImageTranslator(stub.vision_endpoint, "bench", poll_interval=0.01) if use_images else None
+    return DocumentProcessor(translation_processor, image_translator, engine=engine)
+
+
+def run_once(
+    deck_path: Path,
+    languages: List[str],
+    stub: UpstreamStubServer,
+    use_images: bool,
+    use_llm: bool,
+    work_dir: Path,
+    engine: str = 'xml',
+    llm_threshold: float = 0.0,
+    llm_concurrency: int = 8,
+    azure_max_elements: int = 1000,
+    hedge_budget: float = 0.05
+) -> Dict[str, Any]:
+    """Run the pipeline once and collect wall time, stage and upstream statistics."""
+    processor = build_processor(
+        stub, use_images, use_llm, engine, llm_threshold, llm_concurrency, azure_max_elements, hedge_budget
+    )
+    output_paths = {language: work_dir / f"{deck_path.stem}_{language}.pptx" for language in languages}
+    stub.reset_stats()
+
+    with StageRecorder() as recorder:
+        start = time.perf_counter()
+        results = processor.process_pptx_multi(deck_path, output_paths, use_llm=use_llm)
+        wall = time.perf_counter() - start
+
+    return {
+        "wall_time_s": wall,
+        "peak_rss_bytes": recorder.peak_rss,
+        "stages": recorder.stages,
+        "upstream": stub.snapshot(),
+        "output_bytes": {language: path.stat().st_size for language, path in output_paths.items()},
+        "images_translated": {language: result.get("images_translated", 0) for language, result in results.items()},
+        "llm_routing": {
+            language: {
+                key: result.get(key, 0)
+                for key in (
+                    "llm_segments", "azure_segments", "llm_seconds_saved", "llm_cost_saved",
+                    "llm_prompt_tokens", "llm_completion_tokens", "llm_cached_tokens", "llm_cache_savings"
+                )
+            }
+            for language, result in results.items()
+        },
+        "azure_hedging": processor.translation_processor.azure_translator.hedger.stats(),
+    }
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Reduce repeated runs to the best wall time plus that run's details."""
+    best = min(runs, key=lambda run: run["wall_time_s"])
+    walls = sorted(run["wall_time_s"] for run in runs)
+    return {**best, "wall_time_runs_s": walls, "wall_time_median_s": walls[len(walls) // 2]}
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Compare a report with a baseline.
+
+    Returns:
+        Human-readable regression messages (empty if within tolerance).
+    """
+    regressions = []
+    current, previous = report["result"], baseline["result"]
+
+    if current["wall_time_s"] > previous["wall_time_s"] * (1 + tolerance):
+        regressions.append(f"wall time {previous['wall_time_s']:.3f}s -> {current['wall_time_s']:.3f}s")
+
+    for route, values in current["upstream"].items():
+        old_calls = previous["upstream"].get(route, {}).get("calls", 0)
+        if values["calls"] > old_calls:
+            regressions.append(f"{route} calls {old_calls} -> {values['calls']}")
+
+    if current["peak_rss_bytes"] > previous["peak_rss_bytes"] * (1 + tolerance):
+        regressions.append(
+            f"peak RSS {previous['peak_rss_bytes'] / 2**20:.1f}MB -> {current['peak_rss_bytes'] / 2**20:.1f}MB"
+        )
+    return regressions
+
+
+def print_report(report: Dict[str, Any]):
+    result = report["result"]
+    print(f"Deck: {report['deck']}")
+    print(f"Wall time: {result['wall_time_s']:.3f}s (median {result['wall_time_median_s']:.3f}s), "
+          f"peak RSS {result['peak_rss_bytes'] / 2**20:.1f}MB")
+    print(f"{'stage':<14}{'count':>7}{'total s':>10}{'max s':>10}{'peak MB':>10}")
+    for name, stage in sorted(result["stages"].items()):
+        print(f"{name:<14}{stage['count']:>7}{stage['total_s']:>10.3f}{stage['max_s']:>10.3f}"
+              f"{stage['peak_rss_bytes'] / 2**20:>10.1f}")
+    print(f"{'route':<22}{'calls':>7}{'bytes in':>12}{'bytes out':>12}{'429s':>6}")
+    for route, values in sorted(result["upstream"].items()):
+        print(f"{route:<22}{values['calls']:>7}{values['bytes_in']:>12}{values['bytes_out']:>12}"
+              f"{values['throttled']:>6}")
+    for language, routing in sorted(result.get("llm_routing", {}).items()):
+        if routing["llm_segments"] or routing["azure_segments"]:
+            print(f"LLM routing {language}: {routing['llm_segments']} to LLM, {routing['azure_segments']} kept on Azure "
+                  f"(est. {routing['llm_seconds_saved']:.1f}s, ${routing['llm_cost_saved']:.4f} saved)")
+            print(f"LLM tokens {language}: {routing['llm_prompt_tokens']} prompt "
+                  f"({routing['llm_cached_tokens']} from cache), {routing['llm_completion_tokens']} completion")
+    hedging = result.get("azure_hedging")
+    if hedging and hedging["requests"]:
+        def ms(seconds):
+            return f"{seconds * 1000:.0f}ms" if seconds is not None else "-"
+        print(f"Azure hedging: {hedging['hedges']}/{hedging['requests']} requests hedged "
+              f"({hedging['hedge_rate']:.1%}, {hedging['hedges_won']} won); "
+              f"p99/max per attempt {ms(hedging['attempt_p99_s'])}/{ms(hedging['attempt_max_s'])}, "
+              f"per call {ms(hedging['call_p99_s'])}/{ms(hedging['call_max_s'])}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the PPTX translation pipeline against local stubs")
+    parser.add_argument("--deck", type=Path, help="Use an existing deck instead of generating one")
+    parser.add_argument("--slides", type=int, default=20)
+    parser.add_argument("--frames", type=int, default=3)
+    parser.add_argument("--tables", type=int, default=1)
+    parser.add_argument("--groups", type=int, default=1)
+    parser.add_argument("--images", type=int, default=0)
+    parser.add_argument("--unique-images", type=int, default=None)
+    parser.add_argument("--image-size", type=int, default=800)
+    parser.add_argument("--repetition", type=float, default=0.3)
+    parser.add_argument("--languages", default="fr", help="Comma-separated target languages")
+    parser.add_argument("--engine", choices=["xml", "pptx"], default="xml", help="Document engine")
+    parser.add_argument("--llm", action="store_true", help="Enable LLM enhancement against the OpenRouter stub")
+    parser.add_argument("--llm-threshold", type=float, default=0.0, help="LLM routing threshold (0 sends every segment)")
+    parser.add_argument("--llm-concurrency", type=int, default=8, help="Concurrent LLM calls (1 = sequential)")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="Share of upstream responses that stall")
+    parser.add_argument("--stall-ms", type=float, default=2000.0)
+    parser.add_argument("--azure-max-elements", type=int, default=1000, help="Texts per Azure /translate request")
+    parser.add_argument("--hedge-budget", type=float, default=0.05, help="Share of Azure requests that may be hedged (0 = off)")
+    parser.add_argument("--ocr-polls", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--json", type=Path, help="Write the machine-readable report here")
+    parser.add_argument("--baseline", type=Path, help="Compare against a previous JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression")
+    return parser
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the benchmark described by parsed CLI arguments and return the report."""
+    languages = [language.strip() for language in args.languages.split(",") if language.strip()]
+    spec = DeckSpec(
+        slides=args.slides,
+        frames_per_slide=args.frames,
+        tables_per_slide=args.tables,
+        groups_per_slide=args.groups,
+        images_per_slide=args.images,
+        unique_images=args.unique_images,
+        image_size=args.image_size,
+        repetition_ratio=args.repetition
+    )
+    stub_config = StubConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        throttle_rate=args.throttle_rate,
+        ocr_polls=args.ocr_polls,
+        stall_rate=args.stall_rate,
+        stall_ms=args.stall_ms
+    )
+
+    with tempfile.TemporaryDirectory() as tmp, UpstreamStubServer(stub_config) as stub:
+        work_dir = Path(tmp)
+        deck_path = args.deck
+        deck_counts = None
+        if deck_path is None:
+            deck_path = work_dir / "synthetic.pptx"
+            deck_counts = generate_deck(spec, deck_path)
+
+        runs = [
+            run_once(
+                deck_path, languages, stub, args.images > 0 or args.deck is not None, args.llm, work_dir, args.engine,
+                args.llm_threshold, args.llm_concurrency, args.azure_max_elements, args.hedge_budget
+            )
+            for _ in range(max(1, args.repeat))
+        ]
+        deck_bytes = deck_path.stat().st_size
+
+    return {
+        "version": REPORT_VERSION,
+        "benchmark": "pipeline",
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "deck": {
+            "path": str(args.deck) if args.deck else None,
+            "bytes": deck_bytes,
+            "spec": None if args.deck else spec.to_dict(),
+            "counts": deck_counts
+        },
+        "languages": languages,
+        "llm": args.llm,
+        "engine": args.engine,
+        "stub": dict(stub_config.__dict__),
+        "result": summarize(runs)
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    logging.basicConfig(level=logging.WARNING)
+    args = build_parser().parse_args(argv)
+    report = run(args)
+    print_report(report)
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text()), args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION: {message}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
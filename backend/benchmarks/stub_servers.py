@@ -0,0 +1,375 @@
+"""
+Local stand-ins for the upstream services used by the pipeline.
+
+One HTTP server emulates:
+- Azure Translator ``/translate`` and ``/detect``
+- Azure Vision Read submit (``/vision/v3.2/read/analyze``) and poll
+  (``/vision/v3.2/read/analyzeResults/<id>``)
+- OpenRouter chat completions (any path ending in ``/chat/completions``)
+
+Latency, jitter, stall and 429 injection are configurable, and every call is
+counted with request/response byte sizes so benchmarks can report upstream
+traffic without instrumenting the application.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+class StubConfig:
+    """Behaviour knobs for the stub server."""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        ocr_polls: int = 1,
+        ocr_lines: int = 4,
+        service_latency_ms: Optional[Dict[str, float]] = None,
+        stall_rate: float = 0.0,
+        stall_ms: float = 2000.0,
+        seed: int = 1234
+    ):
+        """
+        Initialize the stub configuration.
+
+        Args:
+            latency_ms: Base latency added to every response.
+            jitter_ms: Uniform random jitter added on top of the latency.
+            throttle_rate: Probability (0-1) of answering with 429.
+            retry_after: Retry-After header value sent with 429 responses.
+            ocr_polls: Number of 'running' polls before an OCR job succeeds.
+            ocr_lines: Number of text lines each OCR job returns.
+            service_latency_ms: Per-service latency overrides keyed by
+                'translator', 'vision' or 'openrouter'.
+            stall_rate: Probability (0-1) of a response stalling for ``stall_ms``.
+            stall_ms: Extra latency of a stalled response.
+            seed: Random seed for jitter and throttling.
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.ocr_polls = ocr_polls
+        self.ocr_lines = ocr_lines
+        self.service_latency_ms = service_latency_ms or {}
+        self.stall_rate = stall_rate
+        self.stall_ms = stall_ms
+        self.seed = seed
+
+
+class UpstreamStubServer:
+    """Threaded HTTP server emulating Azure Translator, Azure Vision and OpenRouter."""
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StubConfig()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._operations: Dict[str, int] = {}
+        self._cached_prefixes: set = set()
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def translator_endpoint(self) -> str:
+        return self.url
+
+    @property
+    def vision_endpoint(self) -> str:
+        return self.url
+
+    @property
+    def openrouter_url(self) -> str:
+        return f"{self.url}/api/v1/chat/completions"
+
+    def start(self) -> "UpstreamStubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "UpstreamStubServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {}
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Return a copy of the per-route call statistics."""
+        with self._lock:
+            return {route: dict(values) for route, values in self.stats.items()}
+
+    def _record(self, route: str, bytes_in: int, bytes_out: int, throttled: bool, **extra: int):
+        with self._lock:
+            entry = self.stats.setdefault(
+                route, {"calls": 0, "bytes_in": 0, "bytes_out": 0, "throttled": 0}
+            )
+            entry["calls"] += 1
+            entry["bytes_in"] += bytes_in
+            entry["bytes_out"] += bytes_out
+            entry["throttled"] += int(throttled)
+            for key, value in extra.items():
+                entry[key] = entry.get(key, 0) + value
+
+    def _delay(self, service: str):
+        base = self.config.service_latency_ms.get(service, self.config.latency_ms)
+        with self._lock:
+            jitter = self._rng.uniform(0, self.config.jitter_ms) if self.config.jitter_ms else 0.0
+            if self.config.stall_rate and self._rng.random() < self.config.stall_rate:
+                jitter += self.config.stall_ms
+        if base or jitter:
+            time.sleep((base + jitter) / 1000.0)
+
+    def _should_throttle(self) -> bool:
+        if not self.config.throttle_rate:
+            return False
+        with self._lock:
+            return self._rng.random() < self.config.throttle_rate
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _body(self) -> bytes:
+                length = int(self.headers.get("Content-Length") or 0)
+                return self.rfile.read(length) if length else b""
+
+            def _send(
+                self,
+                status: int,
+                payload: Any = None,
+                headers: Optional[Dict[str, str]] = None,
+                record: Optional[Callable[[int], None]] = None
+            ) -> int:
+                """Send a JSON response; ``record`` gets its size before it is written."""
+                data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+                # Count the call before the client can see the response, so a
+                # snapshot taken right after a request always includes it
+                if record:
+                    record(len(data))
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+                return len(data)
+
+            def _send_stream(self, content: str, usage: Dict[str, int], record: Optional[Callable[[int], None]] = None) -> int:
+                """Send a chat completion as OpenRouter-style SSE, one word per chunk."""
+                events = [": OPENROUTER PROCESSING\n\n"]
+                for word in re.findall(r"\S+\s*", content):
+                    chunk = {"choices": [{"index": 0, "delta": {"content": word}}]}
+                    events.append(f"data: {json.dumps(chunk)}\n\n")
+                events.append(f"data: {json.dumps({'choices': [], 'usage': usage})}\n\n")
+                events.append("data: [DONE]\n\n")
+                if record:
+                    record(sum(len(event.encode("utf-8")) for event in events))
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+                sent = 0
+                for event in events:
+                    data = event.encode("utf-8")
+                    self.wfile.write(data)
+                    self.wfile.flush()
+                    sent += len(data)
+                return sent
+
+            def _throttle(self, route: str, bytes_in: int) -> bool:
+                if not stub._should_throttle():
+                    return False
+                self._send(
+                    429,
+                    {"error": {"code": 429, "message": "Too many requests"}},
+                    {"Retry-After": str(stub.config.retry_after)},
+                    record=lambda sent: stub._record(route, bytes_in, sent, True)
+                )
+                return True
+
+            def do_POST(self):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                body = self._body()
+
+                if parsed.path.endswith("/translate"):
+                    self._translate(query, body)
+                elif parsed.path.endswith("/detect"):
+                    self._detect(body)
+                elif parsed.path.endswith("/read/analyze"):
+                    self._ocr_submit(body)
+                elif parsed.path.endswith("/chat/completions"):
+                    self._chat(body)
+                else:
+                    self._send(404, {"error": "not found"})
+
+            def do_GET(self):
+                match = re.search(r"/read/analyzeResults/([\w-]+)$", urlparse(self.path).path)
+                if match:
+                    self._ocr_poll(match.group(1))
+                else:
+                    self._send(404, {"error": "not found"})
+
+            def _translate(self, query, body: bytes):
+                route = "translator.translate"
+                stub._delay("translator")
+                if self._throttle(route, len(body)):
+                    return
+                items = json.loads(body or b"[]")
+                targets = query.get("to", [])
+                source = query.get("from", [None])[0]
+                response = []
+                for item in items:
+                    text = item.get("text", "")
+                    entry = {"translations": [{"text": f"[{to}] {text}", "to": to} for to in targets]}
+                    if not source:
+                        entry["detectedLanguage"] = {"language": _guess_language(text), "score": 1.0}
+                    response.append(entry)
+                characters = sum(len(item.get("text", "")) for item in items) * max(1, len(targets))
+                self._send(200, response, record=lambda sent: stub._record(
+                    route, len(body), sent, False, elements=len(items), characters=characters
+                ))
+
+            def _detect(self, body: bytes):
+                route = "translator.detect"
+                stub._delay("translator")
+                if self._throttle(route, len(body)):
+                    return
+                items = json.loads(body or b"[]")
+                response = [
+                    {"language": _guess_language(item.get("text", "")), "score": 1.0, "isTranslationSupported": True}
+                    for item in items
+                ]
+                self._send(200, response, record=lambda sent: stub._record(
+                    route, len(body), sent, False, elements=len(items)
+                ))
+
+            def _ocr_submit(self, body: bytes):
+                route = "vision.submit"
+                stub._delay("vision")
+                if self._throttle(route, len(body)):
+                    return
+                operation_id = str(uuid.uuid4())
+                with stub._lock:
+                    stub._operations[operation_id] = stub.config.ocr_polls
+                location = f"{stub.url}/vision/v3.2/read/analyzeResults/{operation_id}"
+                self._send(
+                    202,
+                    None,
+                    {"Operation-Location": location},
+                    record=lambda sent: stub._record(route, len(body), sent, False)
+                )
+
+            def _ocr_poll(self, operation_id: str):
+                route = "vision.poll"
+                stub._delay("vision")
+                with stub._lock:
+                    remaining = stub._operations.get(operation_id)
+                    if remaining:
+                        stub._operations[operation_id] = remaining - 1
+                def record(sent):
+                    stub._record(route, 0, sent, False)
+
+                if remaining is None:
+                    self._send(404, {"error": "unknown operation"}, record=record)
+                elif remaining > 0:
+                    self._send(200, {"status": "running"}, record=record)
+                else:
+                    lines = [
+                        {
+                            "text": f"Figure line {index}",
+                            "boundingBox": [20, 20 + index * 40, 220, 20 + index * 40,
+                                            220, 50 + index * 40, 20, 50 + index * 40]
+                        }
+                        for index in range(stub.config.ocr_lines)
+                    ]
+                    self._send(200, {
+                        "status": "succeeded",
+                        "analyzeResult": {"readResults": [{"page": 1, "lines": lines}]}
+                    }, record=record)
+
+            def _chat(self, body: bytes):
+                route = "openrouter.chat"
+                stub._delay("openrouter")
+                if self._throttle(route, len(body)):
+                    return
+                payload = json.loads(body or b"{}")
+                prompt = "\n".join(
+                    part.get("text", "") if isinstance(part, dict) else str(part)
+                    for message in payload.get("messages", [])
+                    for part in (message.get("content") if isinstance(message.get("content"), list)
+                                 else [message.get("content", "")])
+                )
+                match = re.search(r"Text to translate:\n(.*?)\n\n", prompt, re.S)
+                text = match.group(1) if match else prompt[-200:]
+                content = f"[llm] {text}"
+                prompt_tokens = max(1, len(prompt) // 4)
+                completion_tokens = max(1, len(content) // 4)
+                usage = {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens
+                }
+                # Emulate provider prompt caching: a cache_control prefix seen before is a cache read
+                cached_tokens = 0
+                for message in payload.get("messages", []):
+                    for part in message.get("content") if isinstance(message.get("content"), list) else []:
+                        if isinstance(part, dict) and part.get("cache_control"):
+                            with stub._lock:
+                                if part.get("text", "") in stub._cached_prefixes:
+                                    cached_tokens += len(part.get("text", "")) // 4
+                                stub._cached_prefixes.add(part.get("text", ""))
+                if cached_tokens:
+                    usage["prompt_tokens_details"] = {"cached_tokens": cached_tokens}
+                def record(sent):
+                    stub._record(route, len(body), sent, False, tokens=prompt_tokens + completion_tokens)
+
+                if payload.get("stream"):
+                    self._send_stream(content, usage, record=record)
+                    return
+                self._send(200, {
+                    "id": str(uuid.uuid4()),
+                    "model": payload.get("model"),
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": content}}],
+                    "usage": usage
+                }, record=record)
+
+        return Handler
+
+
+def _guess_language(text: str) -> str:
+    """Crude detection: any CJK character means Japanese, otherwise English."""
+    if any('぀' <= c <= 'ヿ' or '一' <= c <= '鿿' for c in text):
+        return "ja"
+    return "en"
@@ -0,0 +1,212 @@
+"""
+Synthetic PPTX generator for pipeline benchmarks.
+
+Builds decks with a controllable mix of text frames, tables, groups and
+pictures so each pipeline stage can be loaded independently. A repetition
+ratio controls how many segments are drawn from a small shared pool
+(boilerplate such as "Agenda" or "Confidential") versus unique sentences,
+which is what dedupe and caching work depends on.
+
+Usage:
+    python -m benchmarks.synthetic_deck --slides 50 --images 2 out.pptx
+"""
+
+import argparse
+import io
+import random
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from PIL import Image, ImageDraw
+from pptx import Presentation
+from pptx.util import Inches
+
+SHARED_SEGMENTS = [
+    "Agenda",
+    "Thank you",
+    "Confidential - internal use only",
+    "Questions?",
+    "Key takeaways",
+    "Next steps",
+    "Quarterly results overview",
+    "Appendix",
+]
+
+WORDS = (
+    "revenue growth market customer product strategy team quarter region "
+    "platform pipeline delivery target forecast launch partner service "
+    "adoption retention margin roadmap milestone budget review"
+).split()
+
+
+class DeckSpec:
+    """Parameters describing a synthetic deck."""
+
+    def __init__(
+        self,
+        slides: int = 20,
+        frames_per_slide: int = 3,
+        tables_per_slide: int = 0,
+        table_rows: int = 3,
+        table_cols: int = 3,
+        groups_per_slide: int = 0,
+        shapes_per_group: int = 2,
+        images_per_slide: int = 0,
+        image_size: int = 800,
+        unique_images: Optional[int] = None,
+        repetition_ratio: float = 0.3,
+        sentence_words: int = 8,
+        seed: int = 1234
+    ):
+        """
+        Initialize the deck spec.
+
+        Args:
+            slides: Number of slides.
+            frames_per_slide: Text boxes per slide (in addition to the title).
+            tables_per_slide: Tables per slide.
+            table_rows: Rows per table.
+            table_cols: Columns per table.
+            groups_per_slide: Group shapes per slide.
+            shapes_per_group: Text boxes inside each group.
+            images_per_slide: Pictures per slide.
+            image_size: Width of generated pictures in pixels (height is half).
+            unique_images: Number of distinct images; pictures beyond that
+                reuse earlier images (None means every picture is unique).
+            repetition_ratio: Fraction of segments taken from the shared pool.
+            sentence_words: Words per unique sentence.
+            seed: Random seed, so the same spec always yields the same deck.
+        """
+        self.slides = slides
+        self.frames_per_slide = frames_per_slide
+        self.tables_per_slide = tables_per_slide
+        self.table_rows = table_rows
+        self.table_cols = table_cols
+        self.groups_per_slide = groups_per_slide
+        self.shapes_per_group = shapes_per_group
+        self.images_per_slide = images_per_slide
+        self.image_size = image_size
+        self.unique_images = unique_images
+        self.repetition_ratio = repetition_ratio
+        self.sentence_words = sentence_words
+        self.seed = seed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the spec as a JSON-serializable dictionary."""
+        return dict(self.__dict__)
+
+
+def _segment(rng: random.Random, spec: DeckSpec) -> str:
+    if rng.random() < spec.repetition_ratio:
+        return rng.choice(SHARED_SEGMENTS)
+    words = [rng.choice(WORDS) for _ in range(spec.sentence_words)]
+    return " ".join(words).capitalize() + "."
+
+
+def _image_bytes(rng: random.Random, spec: DeckSpec, index: int) -> bytes:
+    """Render a noisy picture with a few lines of text (noise defeats PNG compression)."""
+    width, height = spec.image_size, spec.image_size // 2
+    image = Image.new("RGB", (width, height), (255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    for _ in range(width * height // 50):
+        shade = rng.randint(180, 255)
+        draw.point((rng.randrange(width), rng.randrange(height)), fill=(shade, shade, shade))
+    for line in range(4):
+        draw.text((20, 20 + line * 40), f"Figure {index} line {line}", fill=(0, 0, 0))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def generate_deck(spec: DeckSpec, output_path: Path) -> Dict[str, int]:
+    """
+    Generate a synthetic deck.
+
+    Args:
+        spec: Deck parameters.
+        output_path: Where to save the PPTX.
+
+    Returns:
+        Counts of generated elements (segments, pictures, unique images).
+    """
+    rng = random.Random(spec.seed)
+    prs = Presentation()
+    layout = prs.slide_layouts[5]  # Title only
+    images: list = []
+    counts = {"segments": 0, "pictures": 0, "unique_images": 0}
+
+    for slide_idx in range(spec.slides):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = _segment(rng, spec)
+        counts["segments"] += 1
+
+        for frame_idx in range(spec.frames_per_slide):
+            box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5 + frame_idx * 0.6), Inches(4), Inches(0.5))
+            box.text_frame.text = _segment(rng, spec)
+            counts["segments"] += 1
+
+        for table_idx in range(spec.tables_per_slide):
+            table = slide.shapes.add_table(
+                spec.table_rows, spec.table_cols,
+                Inches(5), Inches(1.5 + table_idx * 1.5), Inches(4), Inches(1.2)
+            ).table
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = _segment(rng, spec)
+                    counts["segments"] += 1
+
+        for group_idx in range(spec.groups_per_slide):
+            group = slide.shapes.add_group_shape()
+            for nested_idx in range(spec.shapes_per_group):
+                box = group.shapes.add_textbox(
+                    Inches(0.5 + nested_idx * 2), Inches(5 + group_idx * 0.6), Inches(1.8), Inches(0.5)
+                )
+                box.text_frame.text = _segment(rng, spec)
+                counts["segments"] += 1
+
+        for image_idx in range(spec.images_per_slide):
+            picture_number = slide_idx * spec.images_per_slide + image_idx
+            if spec.unique_images is None or len(images) < spec.unique_images:
+                images.append(_image_bytes(rng, spec, len(images)))
+                blob = images[-1]
+            else:
+                blob = images[picture_number % spec.unique_images]
+            slide.shapes.add_picture(io.BytesIO(blob), Inches(5 + image_idx * 0.5), Inches(4), Inches(3))
+            counts["pictures"] += 1
+
+    counts["unique_images"] = len(images)
+    prs.save(output_path)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic PPTX deck")
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--slides", type=int, default=20)
+    parser.add_argument("--frames", type=int, default=3)
+    parser.add_argument("--tables", type=int, default=0)
+    parser.add_argument("--groups", type=int, default=0)
+    parser.add_argument("--images", type=int, default=0)
+    parser.add_argument("--unique-images", type=int, default=None)
+    parser.add_argument("--image-size", type=int, default=800)
+    parser.add_argument("--repetition", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    spec = DeckSpec(
+        slides=args.slides,
+        frames_per_slide=args.frames,
+        tables_per_slide=args.tables,
+        groups_per_slide=args.groups,
+        images_per_slide=args.images,
+        unique_images=args.unique_images,
+        image_size=args.image_size,
+        repetition_ratio=args.repetition,
+        seed=args.seed
+    )
+    counts = generate_deck(spec, args.output)
+    print(f"Wrote {args.output}: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,22 @@
 #!/bin/bash
-uvicorn app.main:app --host 0.0.0.0 --port $PORT
\ No newline at end of file
+# Usage: ./start.sh [--workers N]
+# Workers default to $WEB_CONCURRENCY (or 1). Every worker shares the caches
+# and document locks under $STATE_FOLDER, so any N is safe.
+WORKERS="${WEB_CONCURRENCY:-1}"
+while [ $# -gt 0 ]; do
+    case "$1" in
+        --workers) WORKERS="$2"; shift 2 ;;
+        --workers=*) WORKERS="${1#*=}"; shift ;;
+        *) echo "Unknown option: $1" >&2; exit 1 ;;
+    esac
+done
+export WEB_CONCURRENCY="$WORKERS"
+
+if [ "$WORKERS" -gt 1 ]; then
+    # Aggregate Prometheus metrics across workers; stale files from a previous run are dropped
+    export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-${STATE_FOLDER:-state}/prometheus}"
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
+exec uvicorn app.main:app --host 0.0.0.0 --port "${PORT:-8000}" --workers "$WORKERS"
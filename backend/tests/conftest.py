@@ -0,0 +1,34 @@
+import pytest
+
+from app.api.dependencies import get_storage_manager, get_upload_store
+from app.config import Config, settings
+from app.main import app
+from app.utils.storage_manager import StorageManager
+from app.utils.upload_store import UploadStore
+
+
+@pytest.fixture
+def upload_store(tmp_path, monkeypatch):
+    """
+    Upload store of a test, with uploads, outputs and shared state under tmp_path.
+
+    Document routes then write their outputs, lock files and storage database
+    there instead of the source tree. Dependency overrides are cleared afterwards.
+    """
+    monkeypatch.setattr(settings, "UPLOAD_FOLDER", tmp_path / "uploads")
+    monkeypatch.setattr(settings, "OUTPUT_FOLDER", tmp_path / "outputs")
+    monkeypatch.setattr(settings, "STATE_FOLDER", tmp_path / "state")
+    # Config.lock_folder() is static and reads the class attribute
+    monkeypatch.setattr(Config, "STATE_FOLDER", tmp_path / "state")
+    settings.OUTPUT_FOLDER.mkdir()
+    store = UploadStore(settings.UPLOAD_FOLDER)
+    storage = StorageManager(
+        {'uploads': settings.UPLOAD_FOLDER, 'outputs': settings.OUTPUT_FOLDER},
+        settings.STATE_FOLDER / "storage.sqlite3"
+    )
+    app.dependency_overrides[get_upload_store] = lambda: store
+    app.dependency_overrides[get_storage_manager] = lambda: storage
+    try:
+        yield store
+    finally:
+        app.dependency_overrides.clear()
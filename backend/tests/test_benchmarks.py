@@ -0,0 +1,36 @@
+from benchmarks.bench_image_render import build_items, measure
+from benchmarks.run_pipeline import build_parser, run
+from benchmarks.stub_servers import StubConfig, UpstreamStubServer
+from app.services.azure_translator import AzureTranslator
+
+
+def test_stub_translator_supports_multiple_targets():
+    with UpstreamStubServer(StubConfig()) as stub:
+        translator = AzureTranslator("key", stub.translator_endpoint)
+        results = translator.batch_translate_multi(["Hello"], ["fr", "de"])
+        assert results[0]['translations'] == {'fr': '[fr] Hello', 'de': '[de] Hello'}
+        assert results[0]['detected_language'] == 'en'
+        assert stub.snapshot()['translator.translate']['calls'] == 1
+
+
+def test_pipeline_benchmark_reports_stages_and_upstream_calls():
+    args = build_parser().parse_args(["--slides", "3", "--images", "1", "--image-size", "300", "--languages", "fr,de"])
+
+    report = run(args)
+
+    result = report['result']
+    assert result['wall_time_s'] > 0
+    assert {'load', 'extract', 'translate', 'ocr_submit', 'ocr_poll', 'save'} <= set(result['stages'])
+    assert result['stages']['save']['count'] == 2
+    assert result['upstream']['translator.translate']['calls'] == 1
+    assert result['upstream']['vision.submit']['calls'] == 3
+
+
+def test_render_pool_matches_in_thread_rendering():
+    items = build_items(count=2, size=300, lines=2)
+
+    in_thread = measure(items, 'fast', workers=0)
+    pooled = measure(items, 'fast', workers=1)
+
+    assert in_thread['failures'] == pooled['failures'] == 0
+    assert pooled['output_bytes'] == in_thread['output_bytes']
@@ -0,0 +1,91 @@
+import io
+import json
+import zipfile
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_document_processor
+from app.config import settings
+from app.main import app
+from app.services.azure_translator import AzureTranslator
+from app.services.document_processor import DocumentProcessor
+from app.services.translation_processor import TranslationProcessor
+from benchmarks.stub_servers import StubConfig, UpstreamStubServer
+from benchmarks.synthetic_deck import DeckSpec, generate_deck
+
+
+class RecordingTranslationProcessor(TranslationProcessor):
+    """Translation processor recording the segments it is asked to translate."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requested = []
+
+    def translate_segments(self, texts, target_languages, **kwargs):
+        self.requested.extend(texts)
+        return super().translate_segments(texts, target_languages, **kwargs)
+
+
+def _decks(tmp_path, count):
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"deck{index}.pptx"
+        # Same department: mostly shared boilerplate, some deck-specific text
+        generate_deck(DeckSpec(slides=4, frames_per_slide=3, repetition_ratio=0.7, seed=index), path)
+        paths.append(path)
+    return paths
+
+
+def test_bulk_translates_shared_segments_once(tmp_path):
+    decks = _decks(tmp_path, 3)
+    with UpstreamStubServer(StubConfig()) as stub:
+        translation = RecordingTranslationProcessor(azure_translator=AzureTranslator("key", stub.translator_endpoint))
+        processor = DocumentProcessor(translation)
+        documents = [
+            {'input_path': deck, 'output_paths': {'fr': tmp_path / f"{deck.stem}_fr.pptx"}}
+            for deck in decks
+        ]
+        results = dict(processor.process_pptx_bulk(documents, ['fr']))
+
+    assert sorted(results) == [0, 1, 2]
+    assert all(result['fr']['success'] for result in results.values())
+    assert all((tmp_path / f"{deck.stem}_fr.pptx").exists() for deck in decks)
+    # Every distinct segment of the set went upstream exactly once
+    assert len(translation.requested) == len(set(translation.requested))
+    assert sum(result['fr']['segments_new'] for result in results.values()) == len(translation.requested)
+    assert results[1]['fr']['segments_reused'] > 0
+
+
+def test_bulk_endpoint_streams_zip_contents(tmp_path, upload_store):
+    decks = _decks(tmp_path, 2)
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        for deck in decks:
+            zf.write(deck, f"team/{deck.name}")
+        # Same name in another folder still gets its own output
+        zf.write(decks[0], f"other/{decks[0].name}")
+        zf.writestr("__MACOSX/team/._deck0.pptx", b"resource fork")
+
+    with UpstreamStubServer(StubConfig()) as stub:
+        processor = DocumentProcessor(TranslationProcessor(azure_translator=AzureTranslator("key", stub.translator_endpoint)))
+        app.dependency_overrides[get_document_processor] = lambda: processor
+        response = TestClient(app).post(
+            "/api/document/translate-bulk",
+            files={"files": ("decks.zip", archive.getvalue(), "application/zip")},
+            data={"target_languages": "fr,de"}
+        )
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert lines[0]["event"] == "accepted"
+    assert [d["filename"] for d in lines[0]["documents"]] == ["deck0.pptx", "deck1.pptx", "deck0 (1).pptx"]
+    documents = [line for line in lines if line["event"] == "document"]
+    assert sorted(d["index"] for d in documents) == [0, 1, 2]
+    for document in documents:
+        assert document["success"]
+        for translation in document["translations"]:
+            assert (settings.OUTPUT_FOLDER / translation["output_filename"]).exists()
+    done = lines[-1]
+    assert done["event"] == "done" and done["succeeded"] == 3
+    # The duplicate deck adds no new segments
+    assert done["segments_unique"] < done["segments_total"]
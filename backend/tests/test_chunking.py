@@ -0,0 +1,59 @@
+import pytest
+
+from app.services.azure_translator import AzureTranslator
+from app.utils.chunking import pack_chunks, split_text
+from benchmarks.stub_servers import StubConfig, UpstreamStubServer
+
+
+def test_split_text_prefers_sentence_boundaries_and_is_lossless():
+    text = "First sentence here. Second one follows! Third? 日本語の文です。次の文。"
+
+    pieces = split_text(text, 25)
+
+    assert "".join(pieces) == text
+    assert all(len(piece) <= 25 for piece in pieces)
+    assert pieces[0] == "First sentence here. "
+
+
+def test_split_text_falls_back_to_words_and_hard_cuts():
+    text = "word " * 10 + "x" * 30
+
+    pieces = split_text(text, 12)
+
+    assert "".join(pieces) == text
+    assert all(len(piece) <= 12 for piece in pieces)
+
+
+def test_pack_chunks_respects_caps_and_order():
+    chunks = pack_chunks([4, 4, 4, 10, 1, 1, 1], max_elements=3, max_chars=10)
+
+    assert chunks == [[0, 1], [2], [3], [4, 5, 6]]
+
+
+def test_batch_translate_chunks_requests_and_preserves_order():
+    with UpstreamStubServer(StubConfig()) as stub:
+        translator = AzureTranslator(
+            "key",
+            stub.translator_endpoint,
+            max_elements_per_request=3,
+            max_chars_per_request=60,
+            max_concurrent_requests=3
+        )
+        texts = [f"Segment {index}." for index in range(10)]
+        long_text = "This is one sentence. " * 6 + "The end."
+
+        results = translator.batch_translate_multi(texts + [long_text], ["fr", "de"])
+
+        stats = stub.snapshot()['translator.translate']
+        assert stats['calls'] > 4
+        assert stats['elements'] > 11
+        assert [r['translations']['fr'] for r in results[:10]] == [f"[fr] {text}" for text in texts]
+        # Pieces of the long text are translated separately and joined back
+        pieces = split_text(long_text, 30)  # 60 chars shared by two target languages
+        assert len(pieces) > 1
+        assert results[10]['translations']['de'] == "".join(f"[de] {piece.rstrip()} " for piece in pieces).rstrip()
+
+
+def test_split_text_rejects_non_positive_limit():
+    with pytest.raises(ValueError):
+        split_text("text", 0)
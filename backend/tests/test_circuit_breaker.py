@@ -0,0 +1,137 @@
+import time
+
+import pytest
+import requests
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_circuit_breakers
+from app.config import settings
+from app.main import app
+from app.services.azure_translator import AzureTranslator
+from app.services.llm_dispatcher import LLMDispatcher
+from app.services.openrouter_service import OpenRouterService
+from app.services.translation_processor import TranslationProcessor
+from app.utils.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+from benchmarks.stub_servers import StubConfig, UpstreamStubServer
+
+
+class FlakyOpenRouter(OpenRouterService):
+    """OpenRouter client whose calls fail for the models in ``down``."""
+
+    def __init__(self, down):
+        super().__init__(api_key="key")
+        self.down = set(down)
+        self.calls = []
+
+    def translate_with_context(self, text, target_language, source_language=None, context=None,
+                               model="anthropic/claude-3.5-sonnet", shared_context=None):
+        self.calls.append(model)
+        if model in self.down:
+            return {'success': False, 'error': '503 Service Unavailable', 'translation': None}
+        return {'success': True, 'translation': f"[{model}] {text}", 'model': model, 'usage': {}}
+
+
+def test_breaker_opens_then_probes_half_open():
+    breaker = CircuitBreaker("backend", failure_threshold=2, recovery_timeout=0.05)
+    breaker.record_failure("boom")
+    assert breaker.allow()
+    breaker.record_failure("boom")
+    assert breaker.state == 'open'
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == 'half_open'
+    # Only one probe at a time
+    assert not breaker.allow()
+    breaker.record_failure("still down")
+    assert breaker.state == 'open'
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.snapshot()['state'] == 'closed'
+    assert breaker.snapshot()['consecutive_failures'] == 0
+
+
+def test_fallback_chain_skips_open_breakers():
+    openrouter = FlakyOpenRouter(down={"model-a"})
+    with UpstreamStubServer(StubConfig()) as stub:
+        processor = TranslationProcessor(
+            azure_translator=AzureTranslator("key", stub.translator_endpoint),
+            openrouter_service=openrouter,
+            default_llm_model="model-a",
+            llm_fallback_models=["model-b"],
+            # One call at a time so the breaker trips after exactly three failures
+            llm_dispatcher=LLMDispatcher(default_max_concurrency=1),
+            breakers=CircuitBreakerRegistry(failure_threshold=3, recovery_timeout=60)
+        )
+        texts = [f"Segment {i}" for i in range(10)]
+        results = processor.translate_segments(texts, ["fr"], force_llm=True)
+
+        assert all(results['fr'][text]['translation'] == f"[model-b] {text}" for text in texts)
+        # model-a was tried until its breaker opened, then skipped
+        assert openrouter.calls.count("model-a") == 3
+        assert processor.breakers.get("openrouter:model-a").state == 'open'
+
+        # With every model down, segments keep the Azure translation
+        openrouter.down.add("model-b")
+        results = processor.translate_segments(["Another segment"], ["fr"], force_llm=True)
+        assert results['fr']["Another segment"]['method'] == 'azure'
+
+
+def test_open_azure_breaker_fails_fast():
+    breaker = CircuitBreaker("azure_translator", failure_threshold=1, recovery_timeout=60)
+    breaker.record_failure("down")
+    with UpstreamStubServer(StubConfig()) as stub:
+        translator = AzureTranslator("key", stub.translator_endpoint, breaker=breaker)
+        processor = TranslationProcessor(azure_translator=translator)
+
+        start = time.perf_counter()
+        result = processor.translate_text("Hello", "fr")
+        assert time.perf_counter() - start < 0.5
+        assert result['method'] == 'failed'
+        assert stub.snapshot().get('translator.translate', {}).get('calls', 0) == 0
+
+
+def test_azure_errors_are_not_retried_again_by_the_processor():
+    calls = []
+
+    class RejectingTranslator(AzureTranslator):
+        def translate_text(self, text, target_language, source_language=None):
+            calls.append(text)
+            raise requests.exceptions.HTTPError("400 Client Error: Bad Request")
+
+    processor = TranslationProcessor(azure_translator=RejectingTranslator("key", "http://127.0.0.1:9"))
+
+    start = time.perf_counter()
+    result = processor.translate_text("Hello", "fr")
+    # The client already retried what was worth retrying: no second loop of backoff sleeps
+    assert time.perf_counter() - start < 0.5
+    assert calls == ["Hello"]
+    assert result['method'] == 'failed'
+    assert result['translation'] == "Hello"
+
+
+def test_admin_endpoint_reports_and_resets_breakers(monkeypatch):
+    breakers = CircuitBreakerRegistry(failure_threshold=1)
+    breakers.get("openrouter:model-a").record_failure("timeout")
+    app.dependency_overrides[get_circuit_breakers] = lambda: breakers
+    try:
+        # Without a configured token the admin API is closed
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", "")
+        assert TestClient(app).post("/api/admin/circuit-breakers/openrouter:model-a/reset").status_code == 403
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+        assert TestClient(app, headers={"X-Admin-Token": "wrong"}).get("/api/admin/circuit-breakers").status_code == 403
+
+        client = TestClient(app, headers={"X-Admin-Token": "secret"})
+        state = client.get("/api/admin/circuit-breakers").json()
+        assert state["breakers"][0]["name"] == "openrouter:model-a"
+        assert state["breakers"][0]["state"] == "open"
+        assert state["breakers"][0]["last_error"] == "timeout"
+
+        assert client.post("/api/admin/circuit-breakers/openrouter:model-a/reset").json()["state"] == "closed"
+        assert client.post("/api/admin/circuit-breakers/unknown/reset").status_code == 404
+    finally:
+        app.dependency_overrides.clear()
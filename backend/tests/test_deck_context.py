@@ -0,0 +1,63 @@
+from app.services.azure_translator import AzureTranslator
+from app.services.deck_context import build_deck_context
+from app.services.openrouter_service import OpenRouterService
+from app.services.translation_processor import TranslationProcessor
+from benchmarks.stub_servers import StubConfig, UpstreamStubServer
+
+EXTRACTION = {
+    'text_frames': {
+        'slide_0_shape_0': "FY24 Strategy Review\nBoard meeting",
+        'slide_0_shape_1': "Prepared by the PMO",
+        'slide_1_shape_0': "Revenue and EBITDA",
+        'slide_1_shape_1': "EBITDA grew in every region",
+        'slide_2_shape_0': "PMO roadmap",
+        'master_0_shape_0': "Confidential",
+    },
+    'table_cells': {},
+}
+
+
+def test_deck_context_has_title_glossary_style_and_headings():
+    context = build_deck_context(EXTRACTION, glossary_terms=["Board"], style_notes="Use formal register.")
+
+    assert context.startswith("Presentation title: FY24 Strategy Review\n")
+    glossary = context.split("Glossary")[1].split("\n\n")[0]
+    # Configured terms first, then acronyms recurring in the deck
+    assert glossary.index("- Board") < glossary.index("- EBITDA")
+    assert "- PMO" in glossary
+    assert "FY24" not in glossary
+    assert "Style notes:\nUse formal register." in context
+    assert "Slide headings:\n- Revenue and EBITDA\n- PMO roadmap" in context
+    assert "Confidential" not in context
+    assert build_deck_context({'text_frames': {}, 'table_cells': {}}) == ''
+
+
+def test_shared_context_is_a_cacheable_prefix_and_usage_is_reported():
+    service = OpenRouterService(api_key="key")
+    first = service._translate_messages("Hello", "fr", "en", None, "Presentation title: Deck")
+    second = service._translate_messages("Goodbye", "fr", "en", None, "Presentation title: Deck")
+
+    assert first[0]['role'] == 'system'
+    assert first[0]['content'][0]['cache_control'] == {'type': 'ephemeral'}
+    assert first[0] == second[0]
+    assert "Goodbye" in second[1]['content'] and "Goodbye" not in str(second[0])
+
+    with UpstreamStubServer(StubConfig()) as stub:
+        processor = TranslationProcessor(
+            azure_translator=AzureTranslator("key", stub.translator_endpoint),
+            openrouter_service=OpenRouterService(api_key="key", api_url=stub.openrouter_url)
+        )
+        results = processor.translate_segments(
+            ["First slide text", "Second slide text", "Third slide text"],
+            ["fr"],
+            force_llm=True,
+            shared_context=build_deck_context(EXTRACTION)
+        )
+
+    assert results['fr']["Second slide text"]['translation'] == "[llm] Second slide text"
+    report = processor.llm_router.report(results['fr'])
+    assert report['llm_segments'] == 3
+    assert report['llm_prompt_tokens'] > 0
+    # Every call after the first reads the shared prefix from the cache
+    assert report['llm_cached_tokens'] > 0
+    assert report['llm_cache_savings'] > 0
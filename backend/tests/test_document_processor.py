@@ -0,0 +1,177 @@
+import json
+import zipfile
+
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+from app.services.document_processor import DocumentProcessor
+from app.services.translation_processor import TranslationProcessor
+from benchmarks.synthetic_deck import DeckSpec, generate_deck
+
+
+class FakeAzureTranslator:
+    """Azure stand-in that tags text with the target language and counts calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def batch_translate_multi(self, texts, target_languages, source_language=None):
+        self.calls.append((list(texts), list(target_languages)))
+        return [
+            {
+                'translations': {language: f"[{language}] {text}" for language in target_languages},
+                'detected_language': 'en'
+            }
+            for text in texts
+        ]
+
+
+@pytest.fixture
+def deck_path(tmp_path):
+    prs = Presentation()
+    for title in ["Agenda", "Results", "Agenda"]:
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = title
+        table = slide.shapes.add_table(2, 2, Inches(1), Inches(2), Inches(4), Inches(1)).table
+        table.cell(0, 0).text = "Revenue"
+        table.cell(1, 1).text = "Thank you"
+    path = tmp_path / "deck.pptx"
+    prs.save(path)
+    return path
+
+
+@pytest.mark.parametrize("engine", ["xml", "pptx"])
+def test_process_pptx_multi_translates_once_for_all_languages(deck_path, tmp_path, engine):
+    azure = FakeAzureTranslator()
+    processor = DocumentProcessor(TranslationProcessor(azure), engine=engine)
+    output_paths = {language: tmp_path / f"deck_{language}.pptx" for language in ["fr", "de", "en"]}
+
+    results = processor.process_pptx_multi(deck_path, output_paths)
+
+    # One upstream request covering every unique segment and every language
+    assert len(azure.calls) == 1
+    texts, languages = azure.calls[0]
+    assert sorted(texts) == ["Agenda", "Results", "Revenue", "Thank you"]
+    assert languages == ["fr", "de", "en"]
+
+    for language, output_path in output_paths.items():
+        assert results[language]['success']
+        assert results[language]['slides_processed'] == 3
+        prs = Presentation(output_path)
+        title = prs.slides[0].shapes.title.text_frame.text
+        # Text already in the target language is left untouched
+        expected = "Agenda" if language == "en" else f"[{language}] Agenda"
+        assert title == expected
+
+        original_texts = json.loads(output_path.with_suffix('.original.json').read_text(encoding='utf-8'))
+        assert original_texts['slide_1_shape_0'] == "Results"
+
+
+@pytest.mark.parametrize("engine", ["xml", "pptx"])
+def test_process_pptx_keeps_single_language_result_shape(deck_path, tmp_path, engine):
+    processor = DocumentProcessor(TranslationProcessor(FakeAzureTranslator()), engine=engine)
+
+    result = processor.process_pptx(deck_path, tmp_path / "deck_fr.pptx", "fr")
+
+    assert result['success']
+    assert result['target_language'] == "fr"
+    assert result['tables_translated'] == 3
+    cell = Presentation(tmp_path / "deck_fr.pptx").slides[0].shapes[1].table.cell(1, 1)
+    assert cell.text == "[fr] Thank you"
+
+
+def test_xml_engine_matches_pptx_engine_and_copies_media_raw(tmp_path):
+    deck = tmp_path / "synthetic.pptx"
+    generate_deck(DeckSpec(slides=3, frames_per_slide=2, tables_per_slide=1, groups_per_slide=1,
+                           images_per_slide=1, image_size=300), deck)
+    xml_processor = DocumentProcessor(TranslationProcessor(FakeAzureTranslator()), engine="xml")
+    pptx_processor = DocumentProcessor(TranslationProcessor(FakeAzureTranslator()), engine="pptx")
+
+    xml_extraction = xml_processor.extract_pptx(deck)
+    pptx_extraction = pptx_processor.extract_pptx(deck)
+    for key in ("slide_count", "text_frames", "table_cells"):
+        assert xml_extraction[key] == pptx_extraction[key]
+
+    xml_result = xml_processor.process_pptx(deck, tmp_path / "xml_fr.pptx", "fr")
+    pptx_result = pptx_processor.process_pptx(deck, tmp_path / "pptx_fr.pptx", "fr")
+    assert xml_result == pptx_result
+
+    # Both outputs read back with the same translated text
+    assert pptx_processor.extract_pptx(tmp_path / "xml_fr.pptx")["text_frames"] == \
+        pptx_processor.extract_pptx(tmp_path / "pptx_fr.pptx")["text_frames"]
+
+    # Media entries are copied byte for byte, compressed data included
+    with zipfile.ZipFile(deck) as source, zipfile.ZipFile(tmp_path / "xml_fr.pptx") as output:
+        assert output.testzip() is None
+        media = [info for info in source.infolist() if info.filename.startswith("ppt/media/")]
+        assert media
+        for info in media:
+            copied = output.getinfo(info.filename)
+            assert (copied.CRC, copied.compress_size, copied.compress_type) == \
+                (info.CRC, info.compress_size, info.compress_type)
+
+
+class NoOcrImageTranslator:
+    """Image translator stand-in; extraction only needs it to be present."""
+
+
+@pytest.mark.parametrize("engine", ["xml", "pptx"])
+def test_shared_image_parts_get_one_identity(tmp_path, engine):
+    deck = tmp_path / "shared.pptx"
+    generate_deck(DeckSpec(slides=6, frames_per_slide=1, images_per_slide=2, unique_images=2, image_size=300), deck)
+    processor = DocumentProcessor(
+        TranslationProcessor(FakeAzureTranslator()), image_translator=NoOcrImageTranslator(), engine=engine
+    )
+
+    extraction = processor.extract_pptx(deck)
+
+    assert len(extraction['pictures']) == 12
+    assert len(extraction['images']) == 2
+    for key, image in extraction['images'].items():
+        assert key.startswith("ppt/media/") and "#" in key
+        assert image['parts'] == [key.split("#")[0]]
+
+
+def _move_textbox(slide, target, text):
+    """python-pptx cannot add shapes to masters/layouts; build on a slide and move it."""
+    textbox = slide.shapes.add_textbox(Inches(1), Inches(6), Inches(4), Inches(0.5))
+    textbox.text_frame.text = text
+    element = textbox.element
+    element.getparent().remove(element)
+    target.shapes._spTree.append(element)
+
+
+@pytest.mark.parametrize("engine", ["xml", "pptx"])
+def test_masters_layouts_and_notes_are_translated_once(tmp_path, engine):
+    prs = Presentation()
+    layout = prs.slide_layouts[5]
+    for title in ["One", "Two", "Three", "Four"]:
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = title
+    prs.slides[0].notes_slide.notes_text_frame.text = "Speaker note"
+    prs.slides[1].notes_slide.notes_text_frame.text = "Speaker note"
+    _move_textbox(prs.slides[0], prs.slide_master, "Confidential")
+    _move_textbox(prs.slides[0], layout, "Draft")
+    deck = tmp_path / "shared.pptx"
+    prs.save(deck)
+
+    azure = FakeAzureTranslator()
+    processor = DocumentProcessor(TranslationProcessor(azure), engine=engine)
+    result = processor.process_pptx(deck, tmp_path / "shared_fr.pptx", "fr")
+
+    texts, _ = azure.calls[0]
+    assert sorted(texts) == ["Confidential", "Draft", "Four", "One", "Speaker note", "Three", "Two"]
+    assert result['text_frames_translated'] == 4
+    assert result['shared_frames_translated'] == 2
+    # Master text is inherited by all 4 slides, layout text by the 4 slides using it
+    assert result['shared_frames_inherited'] == 8
+    assert result['notes_translated'] == 2
+    assert (result['segments_total'], result['segments_unique']) == (8, 7)
+
+    output = Presentation(tmp_path / "shared_fr.pptx")
+    assert output.slide_master.shapes[-1].text_frame.text == "[fr] Confidential"
+    assert output.slide_layouts[5].shapes[-1].text_frame.text == "[fr] Draft"
+    assert output.slides[1].notes_slide.notes_text_frame.text == "[fr] Speaker note"
+    # Placeholder prompt text and slide number fields are left alone
+    assert output.slide_master.shapes[0].text_frame.text == "Click to edit Master title style"
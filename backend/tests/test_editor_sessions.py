@@ -0,0 +1,108 @@
+import time
+
+from fastapi.testclient import TestClient
+from pptx import Presentation
+
+from app.api.dependencies import get_editor_sessions
+from app.config import settings
+from app.main import app
+from app.services.editor_sessions import EditorSessionManager
+from app.utils.storage_manager import StorageManager
+from benchmarks.synthetic_deck import DeckSpec, generate_deck
+
+FRAME = "slide_0_shape_1"
+
+
+def _frame_text(path, frame_id=FRAME):
+    slide_idx, shape_idx = int(frame_id.split('_')[1]), int(frame_id.split('_')[3])
+    return Presentation(path).slides[slide_idx].shapes[shape_idx].text_frame.text
+
+
+def test_a_burst_of_edits_is_parsed_once_and_saved_once(tmp_path):
+    deck = tmp_path / "deck_fr.pptx"
+    generate_deck(DeckSpec(slides=3, frames_per_slide=2), deck)
+    sessions = EditorSessionManager(tmp_path / "locks", save_delay=0.2, max_save_delay=5)
+    try:
+        for i in range(30):
+            assert sessions.apply_edits(deck, {FRAME: f"Edit {i}"}) == 1
+        with sessions.open(deck) as session:
+            assert session.presentation.slides[0].shapes[1].text_frame.text == "Edit 29"
+        assert sessions.stats()['loads'] == 1
+        assert sessions.stats()['saves'] == 0
+
+        time.sleep(0.8)
+        assert sessions.stats()['saves'] == 1
+        assert _frame_text(deck) == "Edit 29"
+        assert sessions.stats()['unsaved_edits'] == 0
+    finally:
+        sessions.close()
+
+
+def test_unsaved_edits_are_reapplied_when_the_file_changes(tmp_path):
+    deck = tmp_path / "deck_fr.pptx"
+    generate_deck(DeckSpec(slides=2, frames_per_slide=2, seed=1), deck)
+    sessions = EditorSessionManager(tmp_path / "locks", save_delay=60)
+    try:
+        sessions.apply_edits(deck, {FRAME: "Relu"})
+
+        # A new translation job replaces the deck meanwhile
+        generate_deck(DeckSpec(slides=2, frames_per_slide=2, seed=2), deck)
+        replaced = _frame_text(deck, "slide_1_shape_1")
+        with sessions.open(deck) as session:
+            assert session.presentation.slides[1].shapes[1].text_frame.text == replaced
+            assert session.presentation.slides[0].shapes[1].text_frame.text == "Relu"
+
+        sessions.flush(deck)
+        assert _frame_text(deck) == "Relu"
+        assert _frame_text(deck, "slide_1_shape_1") == replaced
+        assert sessions.stats()['loads'] == 2
+    finally:
+        sessions.close()
+
+
+def test_memory_budget_saves_and_evicts_the_least_recently_used(tmp_path):
+    first, second = tmp_path / "a_fr.pptx", tmp_path / "b_fr.pptx"
+    generate_deck(DeckSpec(slides=2, frames_per_slide=1), first)
+    generate_deck(DeckSpec(slides=2, frames_per_slide=1), second)
+    storage = StorageManager({'outputs': tmp_path}, tmp_path / "storage.sqlite3")
+    sessions = EditorSessionManager(tmp_path / "locks", storage=storage, memory_budget=1, save_delay=60)
+    try:
+        sessions.apply_edits(first, {FRAME: "Premier"})
+        assert storage.usage()['pinned'] == 1
+
+        with sessions.open(second):
+            pass
+        assert sessions.stats()['sessions'] == 1
+        assert _frame_text(first) == "Premier"
+        # Only the deck still open is pinned
+        assert storage.usage()['pinned'] == 1
+    finally:
+        sessions.close()
+    assert storage.usage()['pinned'] == 0
+
+
+def test_editor_routes_share_the_session_and_downloads_include_edits(tmp_path, monkeypatch):
+    generate_deck(DeckSpec(slides=2, frames_per_slide=1), tmp_path / "deck_fr.pptx")
+    monkeypatch.setattr(settings, "OUTPUT_FOLDER", tmp_path)
+    sessions = EditorSessionManager(tmp_path / "locks", save_delay=60)
+    app.dependency_overrides[get_editor_sessions] = lambda: sessions
+    try:
+        client = TestClient(app)
+        response = client.post("/api/editor/update-content", json={
+            "filename": "deck_fr.pptx",
+            "edits": [{"id": FRAME, "text": "Modifié"}]
+        })
+        assert response.status_code == 200
+
+        content = client.get("/api/editor/document-content/deck_fr.pptx").json()
+        assert content["slides"][0]["text_frames"][1]["text"] == "Modifié"
+        stats = sessions.stats()
+        assert (stats['loads'], stats['saves']) == (1, 0)
+
+        download = client.get("/api/document/download/deck_fr.pptx")
+        assert download.status_code == 200
+        (tmp_path / "downloaded.pptx").write_bytes(download.content)
+        assert _frame_text(tmp_path / "downloaded.pptx") == "Modifié"
+    finally:
+        app.dependency_overrides.clear()
+        sessions.close()
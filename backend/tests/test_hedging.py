@@ -0,0 +1,116 @@
+import itertools
+import threading
+import time
+
+import pytest
+import requests
+
+from app.services.azure_translator import AzureTranslator
+from app.utils.hedging import HedgedCaller
+from benchmarks.stub_servers import StubConfig, UpstreamStubServer
+
+
+def _warm(caller: HedgedCaller, seconds: float = 0.01, count: int = 20):
+    for _ in range(count):
+        caller.call(lambda timeout: time.sleep(seconds))
+
+
+def test_slow_request_is_hedged_and_the_first_answer_wins():
+    caller = HedgedCaller('test', hedge_budget=1.0, min_timeout=0.1)
+    assert caller.hedge_delay() is None
+    assert caller.timeout() == caller.default_timeout
+    _warm(caller)
+
+    counter = itertools.count()
+
+    def request(timeout):
+        attempt = next(counter)
+        time.sleep(1.0 if attempt == 0 else 0.01)
+        return attempt
+
+    start = time.perf_counter()
+    assert caller.call(request) == 1
+    assert time.perf_counter() - start < 0.5
+
+    stats = caller.stats()
+    assert stats['hedges'] == 1 and stats['hedges_won'] == 1
+    # Deadline derived from the observed p99, clamped to the minimum
+    assert caller.timeout() == pytest.approx(0.1)
+
+
+def test_hedge_budget_caps_duplicates():
+    # Warm up with hedging off: scheduling jitter on near-instant calls would
+    # otherwise spend budget. Enough fast samples that the slow calls below
+    # do not move the p95.
+    caller = HedgedCaller('test', hedge_budget=0, window=1000)
+    _warm(caller, 0, 1000)
+    caller.hedge_budget = 0.5
+    lock = threading.Lock()
+    attempts = [0]
+
+    def slow(timeout):
+        with lock:
+            attempts[0] += 1
+        time.sleep(0.02)
+
+    for _ in range(12):
+        caller.call(slow)
+
+    # 1 initial token plus 0.5 per request: every other slow call is hedged
+    assert caller.stats()['hedges'] == 7
+    time.sleep(0.05)
+    assert attempts[0] == 19
+
+
+def test_failed_primary_falls_back_to_hedge():
+    caller = HedgedCaller('test', hedge_budget=1.0)
+    _warm(caller)
+    counter = itertools.count()
+
+    def request(timeout):
+        if next(counter) == 0:
+            time.sleep(0.2)
+            raise requests.exceptions.ConnectionError("reset")
+        time.sleep(0.3)
+        return "ok"
+
+    assert caller.call(request) == "ok"
+
+
+def test_azure_requests_carry_adaptive_deadline():
+    with UpstreamStubServer(StubConfig()) as stub:
+        translator = AzureTranslator("key", stub.translator_endpoint, max_elements_per_request=1, request_timeout=5)
+        translator.batch_translate([f"text {i}" for i in range(25)], "fr")
+
+        # Fast stub responses pull the deadline down to the minimum
+        assert translator.hedger.timeout() == translator.hedger.min_timeout
+        assert translator.hedger.stats()['requests'] == 25
+
+
+def test_large_batches_keep_the_configured_deadline_and_are_not_hedged():
+    caller = HedgedCaller('test', hedge_budget=1.0, default_timeout=30, max_timeout=30, max_hedge_size=100)
+    _warm(caller, 0.001, 25)
+    assert caller.timeout() == caller.min_timeout
+    # Full chunks are neither judged by single-segment latency nor hedged
+    assert caller.timeout(size=50000, batch=True) == 30
+    assert caller.timeout(size=50, batch=True) == 30
+    assert caller.hedge_delay(size=50000) is None
+    assert caller.call(lambda timeout: time.sleep(0.05) or timeout, size=50000, batch=True) == 30
+    assert caller.stats()['hedges'] == 0
+
+
+def test_timed_out_attempts_raise_the_deadline():
+    caller = HedgedCaller('test', hedge_budget=0, min_timeout=0.05, min_samples=5, window=10)
+    _warm(caller, 0.001, 5)
+    assert caller.timeout() == pytest.approx(0.05)
+
+    def stalled(timeout):
+        time.sleep(timeout)
+        raise requests.exceptions.Timeout()
+
+    caller.timeout_errors = (requests.exceptions.Timeout,)
+    for _ in range(3):
+        with pytest.raises(requests.exceptions.Timeout):
+            caller.call(stalled)
+    # Timeouts are recorded at their deadline, so the deadline grows
+    assert caller.timeout() >= 3 * 0.05
@@ -0,0 +1,53 @@
+from app.utils.image_identity import ImageIndex, image_key
+
+
+class CountingReader:
+    def __init__(self, blob):
+        self.blob = blob
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.blob
+
+
+def test_shared_parts_are_read_once():
+    images = {}
+    index = ImageIndex(images)
+    readers = {f"ppt/media/image{n}.png": CountingReader(bytes([n]) * 6000) for n in range(10)}
+
+    keys = [
+        index.register(part, reader, "image/png", crc=n, size=6000)
+        for _ in range(30)
+        for n, (part, reader) in enumerate(readers.items())
+    ]
+
+    assert index.reads == 10
+    assert all(reader.calls == 1 for reader in readers.values())
+    assert len(images) == 10
+    assert keys[0] == image_key("ppt/media/image0.png", 0) == "ppt/media/image0.png#00000000"
+
+
+def test_identical_bytes_in_different_parts_share_an_entry():
+    images = {}
+    index = ImageIndex(images)
+    blob = b"x" * 6000
+
+    first = index.register("/ppt/media/image1.png", lambda: blob, "image/png", crc=7, size=len(blob))
+    second = index.register("/ppt/media/image2.png", lambda: blob, "image/png", crc=7, size=len(blob))
+    other = index.register("/ppt/media/image3.png", lambda: b"y" * 6000, "image/png", crc=7, size=6000)
+
+    assert first == second != other
+    assert images[first]['parts'] == ["ppt/media/image1.png", "ppt/media/image2.png"]
+
+
+def test_unresolved_parts_fall_back_to_content_hash():
+    images = {}
+    index = ImageIndex(images)
+
+    first = index.register(None, lambda: b"z" * 6000, "image/png")
+    second = index.register(None, lambda: b"z" * 6000, "image/png")
+
+    assert first == second
+    assert len(first) == 32
+    assert index.reads == 2
@@ -0,0 +1,69 @@
+import threading
+import time
+
+from app.services.azure_translator import AzureTranslator
+from app.services.llm_dispatcher import LLMDispatcher
+from app.services.openrouter_service import OpenRouterService
+from app.services.translation_processor import TranslationProcessor
+from benchmarks.stub_servers import StubConfig, UpstreamStubServer
+
+
+def test_map_respects_model_concurrency_and_keeps_order():
+    dispatcher = LLMDispatcher(model_limits={"small": {"max_concurrency": 3}})
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+
+    def call(item):
+        with dispatcher.slot("small"):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.01 * (item % 3))
+            with lock:
+                in_flight[0] -= 1
+        return item * 2
+
+    assert dispatcher.map("small", call, list(range(20))) == [item * 2 for item in range(20)]
+    assert peak[0] == 3
+    assert dispatcher.limiter("other").max_concurrency == 4
+
+
+def test_tokens_per_minute_budget_blocks_until_refilled():
+    # 6000 TPM refills 100 tokens per second
+    dispatcher = LLMDispatcher(model_limits={"m": {"max_concurrency": 4, "tokens_per_minute": 6000}})
+    with dispatcher.slot("m", 6000) as slot:
+        slot.used(5980)
+
+    start = time.perf_counter()
+    with dispatcher.slot("m", 10):
+        pass
+    waited = time.perf_counter() - start
+
+    # 20 tokens were refunded, the remaining 10 needed ~0.1s of refill at most
+    assert waited < 0.15
+    start = time.perf_counter()
+    with dispatcher.slot("m", 20):
+        pass
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_translate_segments_dispatches_llm_calls_concurrently():
+    texts = [f"Segment number {i} of the deck" for i in range(24)]
+    with UpstreamStubServer(StubConfig(service_latency_ms={"openrouter": 50})) as stub:
+        processor = TranslationProcessor(
+            azure_translator=AzureTranslator("key", stub.translator_endpoint),
+            openrouter_service=OpenRouterService(api_key="key", api_url=stub.openrouter_url),
+            llm_dispatcher=LLMDispatcher(default_max_concurrency=8)
+        )
+        start = time.perf_counter()
+        results = processor.translate_segments(texts, ["fr", "de"], force_llm=True)
+        elapsed = time.perf_counter() - start
+        calls = stub.snapshot()['openrouter.chat']['calls']
+
+    assert calls == 48
+    # 48 calls at 50ms each would take 2.4s one after another
+    assert elapsed < 1.2
+    for language in ("fr", "de"):
+        assert [results[language][text]['translation'] for text in texts] == [f"[llm] {text}" for text in texts]
+        assert all(results[language][text]['method'] == 'llm' for text in texts)
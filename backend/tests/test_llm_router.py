@@ -0,0 +1,52 @@
+from app.services.azure_translator import AzureTranslator
+from app.services.llm_router import LLMRouter
+from app.services.openrouter_service import OpenRouterService
+from app.services.translation_processor import TranslationProcessor
+from benchmarks.stub_servers import StubConfig, UpstreamStubServer
+
+LONG_SEGMENT = (
+    "Our regional teams consolidated supplier contracts, renegotiated freight terms and moved "
+    "two warehouses closer to customers. Together these changes cut delivery times by a third."
+)
+
+
+def test_short_labels_score_below_long_complex_text():
+    router = LLMRouter(threshold=0.3)
+
+    assert router.use_llm("Agenda", "Ordre du jour", 1.0)[0] is False
+    assert router.use_llm("Thank you", "Merci", 1.0)[0] is False
+    assert router.use_llm(LONG_SEGMENT, "[fr] " + LONG_SEGMENT, 1.0)[0] is True
+    # Low detection confidence raises the score
+    assert router.score("Quarterly results", "Résultats", 0.3) > router.score("Quarterly results", "Résultats", 1.0)
+
+
+def test_glossary_hits_and_zero_threshold_route_to_llm():
+    router = LLMRouter(threshold=0.3, glossary_terms=["Net Promoter Score", "C++"])
+
+    assert router.use_llm("Our net promoter score")[0] is True
+    assert router.use_llm("Written in C++")[0] is True
+    assert router.use_llm("Scores")[0] is False
+    assert LLMRouter(threshold=0).use_llm("Agenda") == (True, 1.0)
+
+
+def test_translate_segments_routes_per_segment_and_reports_savings():
+    with UpstreamStubServer(StubConfig()) as stub:
+        processor = TranslationProcessor(
+            azure_translator=AzureTranslator("key", stub.translator_endpoint),
+            openrouter_service=OpenRouterService(api_key="key", api_url=stub.openrouter_url),
+            llm_router=LLMRouter(threshold=0.3, llm_seconds_per_call=1.5)
+        )
+
+        results = processor.translate_segments(["Agenda", "Thank you", LONG_SEGMENT], ["fr"], force_llm=True)
+
+        assert stub.snapshot()['openrouter.chat']['calls'] == 1
+    fr = results['fr']
+    assert fr[LONG_SEGMENT]['method'] == 'llm'
+    assert fr['Agenda']['method'] == fr['Thank you']['method'] == 'azure'
+    assert fr['Agenda']['translation'] == "[fr] Agenda"
+
+    report = processor.llm_router.report(fr)
+    assert report['llm_segments'] == 1
+    assert report['azure_segments'] == 2
+    assert report['llm_seconds_saved'] > 0
+    assert report['llm_cost_saved'] > 0
@@ -0,0 +1,44 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from app.utils.metrics import record_cache, track_upstream
+from app.utils.stages import pipeline_stage
+
+
+def _sample(name, labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_pipeline_stage_feeds_histogram():
+    before = _sample('pipeline_stage_seconds_count', {'stage': 'test_stage'})
+
+    with pipeline_stage('test_stage'):
+        pass
+
+    assert _sample('pipeline_stage_seconds_count', {'stage': 'test_stage'}) == before + 1
+
+
+def test_track_upstream_records_status_and_errors():
+    labels = {'service': 'test_service', 'operation': 'op'}
+    ok_before = _sample('upstream_requests_total', {**labels, 'status': '200'})
+    error_before = _sample('upstream_requests_total', {**labels, 'status': 'error'})
+
+    with track_upstream('test_service', 'op') as call:
+        call.status = 200
+    with pytest.raises(ConnectionError):
+        with track_upstream('test_service', 'op'):
+            raise ConnectionError("boom")
+
+    assert _sample('upstream_requests_total', {**labels, 'status': '200'}) == ok_before + 1
+    assert _sample('upstream_requests_total', {**labels, 'status': 'error'}) == error_before + 1
+    assert _sample('upstream_request_seconds_count', labels) >= 2
+
+
+def test_record_cache_counts_hits_and_misses():
+    before = _sample('cache_requests_total', {'cache': 'test_cache', 'result': 'hit'})
+
+    record_cache('test_cache', True)
+    record_cache('test_cache', False)
+
+    assert _sample('cache_requests_total', {'cache': 'test_cache', 'result': 'hit'}) == before + 1
+    assert _sample('cache_requests_total', {'cache': 'test_cache', 'result': 'miss'}) >= 1
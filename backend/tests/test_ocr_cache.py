@@ -0,0 +1,56 @@
+from app.services.azure_translator import AzureTranslator
+from app.services.document_processor import DocumentProcessor
+from app.services.image_translator import ImageTranslator
+from app.services.translation_processor import TranslationProcessor
+from app.utils.ocr_cache import OCRCache
+from app.utils.shared_cache import SharedCache
+from benchmarks.stub_servers import StubConfig, UpstreamStubServer
+from benchmarks.synthetic_deck import DeckSpec, generate_deck
+
+
+def _vision_calls(stub):
+    snapshot = stub.snapshot()
+    return sum(snapshot.get(route, {}).get('calls', 0) for route in ('vision.submit', 'vision.poll'))
+
+
+def test_second_language_needs_no_vision_calls(tmp_path):
+    deck = tmp_path / "deck.pptx"
+    generate_deck(DeckSpec(slides=3, frames_per_slide=1, images_per_slide=1, unique_images=2), deck)
+    cache = OCRCache(disk=SharedCache(tmp_path / "ocr.sqlite3"))
+
+    with UpstreamStubServer(StubConfig()) as stub:
+        processor = DocumentProcessor(
+            TranslationProcessor(azure_translator=AzureTranslator("key", stub.translator_endpoint)),
+            ImageTranslator(stub.vision_endpoint, "key", poll_interval=0.01, ocr_cache=cache)
+        )
+        first = processor.process_pptx(deck, tmp_path / "fr.pptx", "fr")
+        assert first['images_translated'] > 0
+        assert _vision_calls(stub) > 0
+
+        stub.reset_stats()
+        second = processor.process_pptx(deck, tmp_path / "de.pptx", "de")
+        assert _vision_calls(stub) == 0
+        assert second['images_translated'] == first['images_translated']
+
+
+def test_disk_entries_survive_the_process_and_key_on_model_version(tmp_path):
+    blocks = [{'text': "Quarterly revenue", 'bbox': [10, 20, 200, 30], 'confidence': 0.98}]
+    OCRCache(disk=SharedCache(tmp_path / "ocr.sqlite3")).set(b"image", "2022-04-30", blocks)
+
+    # A fresh cache (e.g. another worker) starts with an empty memory level
+    other = OCRCache(disk=SharedCache(tmp_path / "ocr.sqlite3"))
+    assert other.get(b"image", "2022-04-30") == blocks
+    assert other.get(b"image", "latest") is None
+    assert other.get(b"other image", "2022-04-30") is None
+
+
+def test_memory_level_evicts_least_recently_used():
+    cache = OCRCache(memory_entries=2)
+    for name in (b"a", b"b", b"c"):
+        cache.set(name, "latest", [{'text': name.decode()}])
+
+    assert cache.get(b"a", "latest") is None
+    assert cache.get(b"c", "latest") == [{'text': "c"}]
+    # Returned blocks are copies; annotating them does not change the cache
+    cache.get(b"b", "latest")[0]['translated'] = "x"
+    assert cache.get(b"b", "latest") == [{'text': "b"}]
@@ -0,0 +1,103 @@
+import asyncio
+import zlib
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+from app.utils.compression import CompressionMiddleware, choose_encoding
+from benchmarks.synthetic_deck import DeckSpec, generate_deck
+
+
+def test_choose_encoding_honours_q_values():
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, deflate") is None
+    assert choose_encoding("identity") is None
+    assert choose_encoding("*") in ("br", "gzip")
+
+
+def test_streamed_bodies_are_flushed_per_chunk():
+    inner = FastAPI()
+    inner.add_middleware(CompressionMiddleware, minimum_size=10)
+
+    @inner.get("/stream")
+    def stream():
+        return StreamingResponse((f'{{"line": {i}}}\n' for i in range(3)), media_type="application/x-ndjson")
+
+    @inner.get("/small")
+    def small():
+        return PlainTextResponse("ok")
+
+    chunks = []
+    requested = []
+
+    async def receive():
+        if requested:
+            # Never disconnect; the response ends the exchange
+            await asyncio.Event().wait()
+        requested.append(True)
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        chunks.append(message)
+
+    scope = {
+        "type": "http", "method": "GET", "path": "/stream", "raw_path": b"/stream", "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")], "http_version": "1.1", "scheme": "http",
+        "server": ("test", 80), "client": ("test", 1), "root_path": ""
+    }
+    asyncio.run(inner(scope, receive, send))
+
+    bodies = [m["body"] for m in chunks if m["type"] == "http.response.body" and m.get("body")]
+    decompressor = zlib.decompressobj(31)
+    # Every chunk decodes on its own, so clients see each line when it is sent
+    assert [decompressor.decompress(body) for body in bodies[:3]] == [f'{{"line": {i}}}\n'.encode() for i in range(3)]
+
+    client = TestClient(inner)
+    assert "content-encoding" not in client.get("/small").headers
+
+
+def test_document_content_pages_and_selects_fields(tmp_path, monkeypatch):
+    generate_deck(DeckSpec(slides=5, frames_per_slide=2), tmp_path / "deck_fr.pptx")
+    monkeypatch.setattr(settings, "OUTPUT_FOLDER", tmp_path)
+    monkeypatch.setattr(settings, "STATE_FOLDER", tmp_path / "state")
+    client = TestClient(app)
+
+    full = client.get("/api/editor/document-content/deck_fr.pptx").json()
+    assert len(full["slides"]) == 5 and full["next_cursor"] is None
+
+    slides, cursor = [], None
+    while True:
+        params = {"limit": 2, "fields": "text"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/editor/document-content/deck_fr.pptx", params=params, headers={"Accept-Encoding": "gzip"})
+        page = response.json()
+        slides.extend(page["slides"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert [slide["slide_number"] for slide in slides] == [1, 2, 3, 4, 5]
+    assert set(slides[0]["text_frames"][0]) == {"id", "text"}
+    assert [frame["text"] for slide in slides for frame in slide["text_frames"]] == \
+        [frame["text"] for slide in full["slides"] for frame in slide["text_frames"]]
+
+    ranged = client.get("/api/editor/document-content/deck_fr.pptx", params={"start": 2, "end": 3}).json()
+    assert [slide["slide_number"] for slide in ranged["slides"]] == [2, 3]
+    assert client.get("/api/editor/document-content/deck_fr.pptx", params={"fields": "secret"}).status_code == 400
+    for cursor in ("-2", "0", "x"):
+        assert client.get("/api/editor/document-content/deck_fr.pptx", params={"cursor": cursor}).status_code == 400
+
+
+def test_large_json_responses_are_gzipped():
+    client = TestClient(app)
+    response = client.post(
+        "/api/translation/batch-translate/stream",
+        json={"texts": ["12345"] * 200, "target_language": "fr"},
+        headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.text.splitlines()) == 200
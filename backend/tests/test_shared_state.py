@@ -0,0 +1,74 @@
+import multiprocessing
+import sqlite3
+import time
+
+import pytest
+
+from app.utils.file_lock import FileLock, document_lock, document_locks
+from app.utils.shared_cache import SharedCache
+
+
+def _hold_lock(lock_dir, name, ready, release):
+    with document_lock(lock_dir, name):
+        ready.set()
+        release.wait(10)
+
+
+def test_shared_cache_is_visible_across_instances(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    writer = SharedCache(path, max_entries=3)
+    reader = SharedCache(path, max_entries=3)
+
+    writer.set("slide_preview", "deck.pptx_0_1.0", b"png-0")
+    assert reader.get("slide_preview", "deck.pptx_0_1.0") == b"png-0"
+    assert reader.get("other", "deck.pptx_0_1.0") is None
+
+    for slide in range(1, 4):
+        writer.set("slide_preview", f"deck.pptx_{slide}_1.0", b"png")
+        time.sleep(0.01)
+    # Least recently used entry is evicted beyond max_entries
+    assert reader.get("slide_preview", "deck.pptx_0_1.0") is None
+
+    writer.set("slide_preview", "deck_pptx_0_1.0", b"other")  # evicts slide 1
+    assert reader.delete_prefix("slide_preview", "deck.pptx_") == 2
+    # "_" in the prefix is matched literally
+    assert writer.get("slide_preview", "deck_pptx_0_1.0") == b"other"
+
+
+def test_cache_hits_do_not_take_the_write_lock(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = SharedCache(path, busy_timeout=0.1)
+    cache.set("slide_preview", "deck.pptx_0", b"png")
+
+    other = sqlite3.connect(path)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        # Another worker is writing: a recently touched entry is still served
+        assert cache.get("slide_preview", "deck.pptx_0") == b"png"
+        cache.touch_interval = 0
+        with pytest.raises(sqlite3.OperationalError):
+            cache.get("slide_preview", "deck.pptx_0")
+    finally:
+        other.rollback()
+        other.close()
+
+
+def test_document_lock_excludes_other_processes(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    ready, release = context.Event(), context.Event()
+    holder = context.Process(target=_hold_lock, args=(tmp_path, "deck.pptx", ready, release))
+    holder.start()
+    try:
+        assert ready.wait(30)
+        with pytest.raises(TimeoutError):
+            document_lock(tmp_path, "deck.pptx", timeout=0.2).acquire()
+        # Other documents are not blocked
+        with document_locks(tmp_path, ["other.pptx", "other_fr.pptx"], timeout=0.2):
+            pass
+    finally:
+        release.set()
+        holder.join(30)
+
+    with document_lock(tmp_path, "deck.pptx", timeout=5) as lock:
+        assert isinstance(lock, FileLock) and lock.locked
+    assert not lock.locked
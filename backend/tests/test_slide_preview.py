@@ -0,0 +1,104 @@
+import io
+import zipfile
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from pptx import Presentation
+
+from app.api.dependencies import get_editor_sessions
+from app.api.routes import editor
+from app.config import settings
+from app.main import app
+from app.services.editor_sessions import EditorSessionManager
+from app.services.slide_preview import build_slide_package
+from app.utils.shared_cache import SharedCache
+from benchmarks.synthetic_deck import DeckSpec, generate_deck
+
+
+def test_package_holds_only_the_edited_slide(tmp_path):
+    deck = tmp_path / "deck.pptx"
+    generate_deck(DeckSpec(slides=4, frames_per_slide=1, images_per_slide=1, unique_images=4), deck)
+    presentation = Presentation(deck)
+    original = presentation.slides[2].shapes[1].text_frame.text
+
+    package = build_slide_package(presentation, 2, {1: "Aperçu"})
+
+    names = zipfile.ZipFile(io.BytesIO(package)).namelist()
+    assert [name for name in names if name.startswith('ppt/slides/slide')] == ['ppt/slides/slide3.xml']
+    assert len([name for name in names if name.startswith('ppt/media/')]) == 1
+    preview = Presentation(io.BytesIO(package))
+    assert len(preview.slides) == 1
+    assert preview.slides[0].shapes[1].text_frame.text == "Aperçu"
+    # The deck itself is left as it was
+    assert presentation.slides[2].shapes[1].text_frame.text == original
+
+
+def test_previews_of_the_same_state_are_cached(tmp_path, monkeypatch):
+    generate_deck(DeckSpec(slides=3, frames_per_slide=1), tmp_path / "deck_fr.pptx")
+    monkeypatch.setattr(settings, "OUTPUT_FOLDER", tmp_path)
+    cache = SharedCache(tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(editor, "get_shared_cache", lambda: cache)
+    builds = []
+    monkeypatch.setattr(editor, "build_slide_package", lambda *args: builds.append(args[1]) or build_slide_package(*args))
+    monkeypatch.setattr(editor, "render_slide_png", lambda package: b"\x89PNG rendered")
+    sessions = EditorSessionManager(tmp_path / "locks", save_delay=60)
+    app.dependency_overrides[get_editor_sessions] = lambda: sessions
+    try:
+        client = TestClient(app)
+
+        def preview(edits, slide_number=1):
+            response = client.post(
+                "/api/editor/preview-with-edits",
+                params={"slide_number": slide_number},
+                json={"filename": "deck_fr.pptx", "edits": edits}
+            )
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "image/png"
+            return response.content
+
+        edit = [{"id": "slide_1_shape_1", "text": "Brouillon"}]
+        first = preview(edit)
+        # Edits of other slides do not change this slide's preview
+        assert preview(edit + [{"id": "slide_0_shape_1", "text": "Autre"}]) == first
+        assert builds == [1]
+
+        preview([{"id": "slide_1_shape_1", "text": "Brouillon 2"}])
+        assert builds == [1, 1]
+
+        # Saving an edit changes the document version
+        client.post("/api/editor/update-content", json={
+            "filename": "deck_fr.pptx", "edits": [{"id": "slide_1_shape_1", "text": "Final"}]
+        })
+        preview(edit)
+        assert builds == [1, 1, 1]
+        assert sessions.stats()['loads'] == 1
+
+        bad = client.post(
+            "/api/editor/preview-with-edits",
+            params={"slide_number": 7},
+            json={"filename": "deck_fr.pptx", "edits": []}
+        )
+        assert bad.status_code == 400
+
+        # Placeholders (no renderer) are not cached
+        monkeypatch.setattr(editor, "render_slide_png", lambda package: None)
+        placeholder = preview(edit, slide_number=2)
+        assert preview(edit, slide_number=2) == placeholder
+        assert builds == [1, 1, 1, 2, 2]
+    finally:
+        app.dependency_overrides.clear()
+        sessions.close()
+
+
+def test_missing_documents_are_not_pinned(tmp_path, monkeypatch):
+    generate_deck(DeckSpec(slides=1, frames_per_slide=1), tmp_path / "deck_fr.pptx")
+    monkeypatch.setattr(settings, "OUTPUT_FOLDER", tmp_path)
+    monkeypatch.setattr(editor, "get_shared_cache", lambda: SharedCache(tmp_path / "cache.sqlite3"))
+    leased = []
+    monkeypatch.setattr(editor, "get_storage_manager", lambda: SimpleNamespace(lease=lambda path, seconds: leased.append(path.name)))
+    client = TestClient(app)
+
+    assert client.get("/api/editor/slide-preview/missing_fr.pptx/0").status_code == 404
+    assert leased == []
+    assert client.get("/api/editor/slide-preview/deck_fr.pptx/0").status_code == 200
+    assert leased == ["deck_fr.pptx"]
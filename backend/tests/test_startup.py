@@ -0,0 +1,63 @@
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from app import main
+from app.api.dependencies import get_storage_manager
+from app.config import settings
+from app.services.image_translator import load_font
+
+
+def test_importing_the_app_does_not_load_heavy_libraries():
+    script = "import sys, app.main; print(sorted({'pptx', 'PIL', 'numpy'} & set(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parents[1], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_lifespan_warms_services_and_reports_the_profile(tmp_path, monkeypatch):
+    warmed = []
+    image_translator = SimpleNamespace(warm=lambda: warmed.append('images'))
+    sessions = SimpleNamespace(close=lambda: warmed.append('saved'))
+
+    def failing():
+        raise RuntimeError("Azure is unreachable")
+
+    monkeypatch.setattr(settings, "STARTUP_PREWARM", True)
+    monkeypatch.setattr(settings, "STORAGE_SWEEP_INTERVAL", 0)
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    # The storage sweeper really starts: keep its database and folders out of the source tree
+    monkeypatch.setattr(settings, "STATE_FOLDER", tmp_path / "state")
+    monkeypatch.setattr(settings, "UPLOAD_FOLDER", tmp_path / "uploads")
+    monkeypatch.setattr(settings, "OUTPUT_FOLDER", tmp_path / "outputs")
+    monkeypatch.setattr(main, "get_storage_manager", lru_cache()(get_storage_manager.__wrapped__))
+    monkeypatch.setattr(main, "get_translation_processor", failing)
+    monkeypatch.setattr(main, "get_document_processor", lambda: SimpleNamespace(image_translator=image_translator))
+    monkeypatch.setattr(main, "get_editor_sessions", lru_cache()(lambda: warmed.append('editor') or sessions))
+    monkeypatch.setattr(main, "get_shared_cache", lambda: None)
+    monkeypatch.setattr(main, "get_ocr_cache", lambda: None)
+
+    with TestClient(main.app) as client:
+        profile = client.get("/api/admin/startup", headers={"X-Admin-Token": "secret"}).json()
+
+    steps = {step['name']: step for step in profile['steps']}
+    assert list(steps) == ['storage_sweeper', 'translation', 'caches', 'documents', 'editor', 'images']
+    # A failed warm-up does not stop the worker from starting
+    assert steps['translation'] == {
+        'name': 'translation', 'ok': False, 'error': "Azure is unreachable", 'seconds': steps['translation']['seconds']
+    }
+    assert all(step['ok'] for name, step in steps.items() if name != 'translation')
+    # Editor sessions are saved on shutdown
+    assert warmed == ['editor', 'images', 'saved']
+    assert 0 < profile['imports_seconds'] <= profile['ready_seconds']
+
+
+def test_fonts_are_loaded_once_per_thread_and_size():
+    assert load_font(24) is load_font(24)
+    assert load_font(24) is not load_font(25)
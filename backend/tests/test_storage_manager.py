@@ -0,0 +1,74 @@
+import os
+import time
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_storage_manager
+from app.config import settings
+from app.main import app
+from app.utils.storage_manager import StorageManager
+
+
+def _write(path, size, age=0):
+    path.write_bytes(b"x" * size)
+    then = time.time() - age
+    os.utime(path, (then, then))
+    return path
+
+
+def _manager(tmp_path, **kwargs):
+    return StorageManager(
+        roots={'uploads': tmp_path / "uploads", 'outputs': tmp_path / "outputs"},
+        db_path=tmp_path / "state" / "storage.sqlite3",
+        **kwargs
+    )
+
+
+def test_ttl_evicts_documents_with_their_sidecars(tmp_path):
+    storage = _manager(tmp_path, ttl_seconds=3600)
+    outputs = tmp_path / "outputs"
+    old = _write(outputs / "old_fr.pptx", 100, age=7200)
+    _write(outputs / "old_fr.original.json", 10, age=7200)
+    fresh = _write(outputs / "fresh_fr.pptx", 100)
+    edited = _write(outputs / "edited_fr.pptx", 100, age=7200)
+    running = _write(outputs / "running_fr.pptx", 100, age=7200)
+
+    storage.lease(edited, seconds=600)
+    with storage.pinned(running):
+        report = storage.sweep()
+
+    assert report['evicted'] == 1
+    assert not old.exists() and not (outputs / "old_fr.original.json").exists()
+    assert fresh.exists() and edited.exists() and running.exists()
+
+
+def test_quota_evicts_least_recently_used_first(tmp_path):
+    storage = _manager(tmp_path, max_bytes=250)
+    uploads = tmp_path / "uploads"
+    a = _write(uploads / "a.pptx", 100, age=300)
+    b = _write(uploads / "b.pptx", 100, age=200)
+    c = _write(uploads / "c.pptx", 100, age=100)
+    # Downloading/editing counts as an access, whatever the file's mtime
+    storage.touch(a)
+
+    storage.sweep()
+    assert a.exists() and not b.exists() and c.exists()
+
+    # Making room for a new upload evicts before it is written
+    storage.make_room(100)
+    assert a.exists() and not c.exists()
+    assert storage.usage()['total_bytes'] == 100
+
+
+def test_admin_storage_endpoints(tmp_path, monkeypatch):
+    storage = _manager(tmp_path, ttl_seconds=60)
+    _write(tmp_path / "outputs" / "stale_fr.pptx", 100, age=120)
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    app.dependency_overrides[get_storage_manager] = lambda: storage
+    try:
+        client = TestClient(app, headers={"X-Admin-Token": "secret"})
+        assert client.get("/api/admin/storage").json()["folders"]["outputs"]["bytes"] == 100
+        assert client.post("/api/admin/storage/sweep").json()["evicted"] == 1
+        assert client.get("/api/admin/storage").json()["total_bytes"] == 0
+    finally:
+        app.dependency_overrides.clear()
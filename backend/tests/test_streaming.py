@@ -0,0 +1,188 @@
+import json
+import time
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_translation_processor
+from app.main import app
+from app.services.azure_translator import AzureTranslator
+from app.services.llm_dispatcher import LLMDispatcher
+from app.services.openrouter_service import OpenRouterService, max_tokens_for
+from app.services.translation_processor import TranslationProcessor
+from app.utils.circuit_breaker import CircuitBreakerRegistry
+from app.utils.sse import iter_sse_data
+from benchmarks.stub_servers import StubConfig, UpstreamStubServer
+
+
+def _events(body: str):
+    events = []
+    for message in body.strip().split("\n\n"):
+        lines = message.split("\n")
+        event = lines[0][len("event: "):]
+        events.append((event, json.loads("\n".join(iter_sse_data(lines[1:])))))
+    return events
+
+
+def test_iter_sse_data_handles_comments_and_multiline_data():
+    lines = [": OPENROUTER PROCESSING", "", "data: {\"a\":", "data: 1}", "", "event: x", "data:[DONE]"]
+
+    assert list(iter_sse_data(lines)) == ["{\"a\":\n1}", "[DONE]"]
+
+
+def test_max_tokens_scales_with_input():
+    assert max_tokens_for("Agenda") < 100
+    assert max_tokens_for("word " * 2000) > 4 * max_tokens_for("word " * 100)
+    assert max_tokens_for("日本語" * 100) > max_tokens_for("abc" * 100)
+    assert max_tokens_for("word " * 100000, cap=4096) == 4096
+
+
+def test_stream_translate_yields_deltas_then_result():
+    with UpstreamStubServer(StubConfig()) as stub:
+        processor = TranslationProcessor(
+            azure_translator=AzureTranslator("key", stub.translator_endpoint),
+            openrouter_service=OpenRouterService(api_key="key", api_url=stub.openrouter_url)
+        )
+
+        events = list(processor.stream_translate_text("Quarterly results overview", "fr", force_llm=True))
+
+    deltas = [data["text"] for event, data in events if event == "delta"]
+    assert len(deltas) > 1
+    assert events[-1][0] == "done"
+    assert events[-1][1]["method"] == "llm"
+    assert events[-1][1]["translation"] == "".join(deltas) == "[llm] Quarterly results overview"
+
+
+class SlowStreamOpenRouter(OpenRouterService):
+    """OpenRouter client streaming ``count`` words, ``delay`` seconds apart."""
+
+    def __init__(self, count, delay=0.0):
+        super().__init__(api_key="key")
+        self.count = count
+        self.delay = delay
+
+    def stream_translate_with_context(self, text, target_language, source_language=None, context=None, model=None):
+        for i in range(self.count):
+            time.sleep(self.delay)
+            yield f"word{i} "
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def test_stream_releases_the_llm_slot_before_the_client_reads_it_all():
+    with UpstreamStubServer(StubConfig()) as stub:
+        processor = TranslationProcessor(
+            azure_translator=AzureTranslator("key", stub.translator_endpoint),
+            openrouter_service=SlowStreamOpenRouter(count=20),
+            default_llm_model="model-a",
+            llm_dispatcher=LLMDispatcher(default_max_concurrency=1)
+        )
+        events = processor.stream_translate_text("Quarterly results overview", "fr", force_llm=True)
+
+        assert next(events)[0] == "delta"
+        # The upstream stream was read to the end while the client is still on its first delta
+        semaphore = processor.llm_dispatcher.limiter("model-a").semaphore
+        assert semaphore.acquire(timeout=2)
+        semaphore.release()
+        rest = list(events)
+
+    assert rest[-1][1]["translation"] == " ".join(f"word{i}" for i in range(20))
+    assert processor.breakers.get("openrouter:model-a").state == 'closed'
+
+
+def test_client_disconnect_releases_the_half_open_probe():
+    breakers = CircuitBreakerRegistry(failure_threshold=1, recovery_timeout=1.0)
+    breaker = breakers.get("openrouter:model-a")
+    breaker.record_failure("timeout")
+    time.sleep(1.05)
+    with UpstreamStubServer(StubConfig()) as stub:
+        processor = TranslationProcessor(
+            azure_translator=AzureTranslator("key", stub.translator_endpoint),
+            openrouter_service=SlowStreamOpenRouter(count=1000, delay=0.01),
+            default_llm_model="model-a",
+            breakers=breakers
+        )
+        events = processor.stream_translate_text("Quarterly results overview", "fr", force_llm=True)
+
+        assert next(events)[0] == "delta"
+        assert breaker.state == 'half_open' and not breaker.allow()
+        events.close()
+
+    # Neither a success nor a failure, but the next call may probe (well before the stale-probe timeout)
+    assert _wait_for(breaker.allow, timeout=0.2)
+    assert breaker.state == 'half_open'
+
+
+def test_suggest_improvement_stream_endpoint():
+    with UpstreamStubServer(StubConfig()) as stub:
+        processor = TranslationProcessor(
+            azure_translator=AzureTranslator("key", stub.translator_endpoint),
+            openrouter_service=OpenRouterService(api_key="key", api_url=stub.openrouter_url)
+        )
+        app.dependency_overrides[get_translation_processor] = lambda: processor
+        try:
+            response = TestClient(app).post("/api/editor/suggest-improvement/stream", json={
+                "original_text": "Hello",
+                "current_translation": "Bonjour",
+                "target_language": "fr"
+            })
+        finally:
+            app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response.text)
+    assert [event for event, _ in events[:-1]] == ["delta"] * (len(events) - 1)
+    assert events[-1][0] == "done"
+    assert events[-1][1]["success"] is True
+    assert events[-1][1]["translation"] == "".join(data["text"] for _, data in events[:-1])
+
+
+def test_batch_translate_stream_dedupes_and_keeps_input_order():
+    texts = ["Hello", "World", "Hello", "42", "", "こんにちは", "World", "Goodbye"]
+    with UpstreamStubServer(StubConfig(jitter_ms=20)) as stub:
+        processor = TranslationProcessor(azure_translator=AzureTranslator("key", stub.translator_endpoint))
+        app.dependency_overrides[get_translation_processor] = lambda: processor
+        try:
+            response = TestClient(app).post(
+                "/api/translation/batch-translate/stream",
+                json={"texts": texts, "target_language": "ja"}
+            )
+        finally:
+            app.dependency_overrides.clear()
+        stats = stub.snapshot()["translator.translate"]
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [result["index"] for result in results] == list(range(len(texts)))
+    assert [result["translation"] for result in results] == [
+        "[ja] Hello", "[ja] World", "[ja] Hello", "42", "", "こんにちは", "[ja] World", "[ja] Goodbye"
+    ]
+    assert results[3]["method"] == results[5]["method"] == "skipped"
+    # Only the unique texts with letters went upstream
+    assert stats["elements"] == 4
+
+
+def test_batch_translate_stream_skips_everything_for_same_language():
+    processor = TranslationProcessor(azure_translator=AzureTranslator("key", "http://127.0.0.1:9"))
+    results = list(processor.stream_batch_translate(["Hello", "World"], "en", source_language="en-US"))
+
+    assert [result["translation"] for result in results] == ["Hello", "World"]
+    assert all(result["method"] == "skipped" for result in results)
+
+
+def test_batch_translate_stream_chunks_concurrently_in_order():
+    texts = [f"Sentence {i % 30}" for i in range(90)]
+    with UpstreamStubServer(StubConfig(latency_ms=5, jitter_ms=30)) as stub:
+        processor = TranslationProcessor(azure_translator=AzureTranslator("key", stub.translator_endpoint))
+        results = list(processor.stream_batch_translate(texts, "fr", chunk_size=4, max_concurrency=4))
+        stats = stub.snapshot()["translator.translate"]
+
+    assert [result["translation"] for result in results] == [f"[fr] {text}" for text in texts]
+    assert stats["calls"] == 8 and stats["elements"] == 30
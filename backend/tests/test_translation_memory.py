@@ -0,0 +1,105 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_translation_memory
+from app.config import settings
+from app.main import app
+from app.services.azure_translator import AzureTranslator
+from app.services.document_processor import DocumentProcessor
+from app.services.translation_processor import TranslationProcessor
+from app.utils.translation_memory import TranslationMemory
+from benchmarks.stub_servers import StubConfig, UpstreamStubServer
+from benchmarks.synthetic_deck import DeckSpec, generate_deck
+
+
+def _translator_calls(stub):
+    return stub.snapshot().get('translator.translate', {}).get('calls', 0)
+
+
+def test_human_entries_win_and_are_never_evicted(tmp_path):
+    memory = TranslationMemory(tmp_path / "tm.sqlite3", max_machine_entries=2)
+    memory.add([("Agenda", "[fr] Agenda")], "fr", "en", origin='azure')
+    memory.add([("Agenda", "Ordre du jour")], "fr")
+
+    assert memory.lookup(["Agenda"], "fr", "en")["Agenda"] == {
+        'translation': "Ordre du jour", 'origin': 'human', 'source_language': None
+    }
+    # Language variants are distinct targets
+    assert memory.lookup(["Agenda"], "fr-CA") == {}
+    assert memory.lookup(["Agenda"], "fr", origins=('llm',)) == {}
+
+    memory.add([("One", "Un"), ("Two", "Deux"), ("Three", "Trois")], "fr", "en", origin='llm')
+    assert memory.stats() == {'human': 1, 'llm': 2}
+    assert set(memory.lookup(["Agenda", "One", "Two", "Three"], "fr")) == {"Agenda", "Two", "Three"}
+
+
+def test_machine_entries_are_trimmed_once_per_margin(tmp_path):
+    memory = TranslationMemory(tmp_path / "tm.sqlite3", max_machine_entries=200)
+    memory.add([(f"Line {i}", f"Ligne {i}") for i in range(250)], "fr", "en", origin='azure')
+    assert memory.stats() == {'azure': 200}
+    # The oldest entries went first
+    assert memory.lookup(["Line 49", "Line 50"], "fr").keys() == {"Line 50"}
+
+    # Trimmed again only once 1% of the cap (2 entries) has been written
+    memory.add([("Extra 1", "Extra 1")], "fr", "en", origin='llm')
+    assert memory.stats() == {'azure': 200, 'llm': 1}
+    memory.add([("Extra 2", "Extra 2")], "fr", "en", origin='llm')
+    assert memory.stats() == {'azure': 198, 'llm': 2}
+
+
+def test_remembered_segments_are_not_sent_upstream(tmp_path):
+    memory = TranslationMemory(tmp_path / "tm.sqlite3")
+    memory.add([("Quarterly results", "Résultats trimestriels")], "fr")
+
+    with UpstreamStubServer(StubConfig()) as stub:
+        processor = TranslationProcessor(
+            azure_translator=AzureTranslator("key", stub.translator_endpoint),
+            translation_memory=memory
+        )
+        first = processor.translate_segments(["Quarterly results", "Next steps"], ["fr"])
+        assert first['fr']["Quarterly results"]['translation'] == "Résultats trimestriels"
+        assert first['fr']["Quarterly results"]['memory_origin'] == 'human'
+        assert first['fr']["Next steps"]['method'] == 'azure'
+        assert stub.snapshot()['translator.translate']['elements'] == 1
+
+        stub.reset_stats()
+        again = processor.translate_segments(["Quarterly results", "Next steps"], ["fr"])
+        assert again['fr']["Next steps"]['translation'] == "[fr] Next steps"
+        assert processor.translate_text("Next steps", "fr")['method'] == 'memory'
+        assert [r['translation'] for r in processor.stream_batch_translate(["Next steps", "Other"], "fr")] == \
+            ["[fr] Next steps", "[fr] Other"]
+        assert stub.snapshot()['translator.translate']['elements'] == 1
+
+
+def test_editor_edits_feed_the_next_translation(tmp_path, monkeypatch):
+    deck = tmp_path / "deck.pptx"
+    generate_deck(DeckSpec(slides=2, frames_per_slide=1), deck)
+    monkeypatch.setattr(settings, "OUTPUT_FOLDER", tmp_path)
+    memory = TranslationMemory(tmp_path / "tm.sqlite3")
+
+    with UpstreamStubServer(StubConfig()) as stub:
+        processor = DocumentProcessor(TranslationProcessor(
+            azure_translator=AzureTranslator("key", stub.translator_endpoint),
+            translation_memory=memory
+        ))
+        processor.process_pptx(deck, tmp_path / "deck_fr.pptx", "fr")
+        originals = json.loads((tmp_path / "deck_fr.original.json").read_text())
+        frame_id, original = next(iter(originals.items()))
+
+        app.dependency_overrides[get_translation_memory] = lambda: memory
+        try:
+            response = TestClient(app).post("/api/editor/update-content", json={
+                "filename": "deck_fr.pptx",
+                "edits": [{"id": frame_id, "text": "Traduction relue"}]
+            })
+        finally:
+            app.dependency_overrides.clear()
+        assert response.json()["remembered"] == 1
+
+        stub.reset_stats()
+        processor.process_pptx(deck, tmp_path / "again_fr.pptx", "fr")
+        assert _translator_calls(stub) == 0
+
+    results = processor.translation_processor.translate_segments([original], ["fr"])
+    assert results['fr'][original]['translation'] == "Traduction relue"
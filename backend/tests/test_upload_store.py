@@ -0,0 +1,126 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_document_processor
+from app.config import settings
+from app.main import app
+from app.services.azure_translator import AzureTranslator
+from app.services.document_processor import DocumentProcessor
+from app.services.translation_processor import TranslationProcessor
+from app.utils.file_handler import generate_unique_filename
+from app.utils.file_lock import document_lock
+from app.utils.upload_store import UploadStore
+from benchmarks.stub_servers import StubConfig, UpstreamStubServer
+from benchmarks.synthetic_deck import DeckSpec, generate_deck
+
+
+class CountingDocumentProcessor(DocumentProcessor):
+    """Document processor counting how often a file is actually parsed."""
+
+    extractions = 0
+
+    def extract_pptx(self, input_path):
+        self.extractions += 1
+        return super().extract_pptx(input_path)
+
+
+def test_same_name_uploads_do_not_overwrite(tmp_path):
+    store = UploadStore(tmp_path)
+    first = store.put(b"first deck", "deck.pptx")
+    second = store.put(b"second deck", "deck.pptx")
+
+    assert first != second
+    assert store.path(first).read_bytes() == b"first deck"
+    assert store.path(second).read_bytes() == b"second deck"
+    # Identical content is stored once under the same id
+    assert store.put(b"first deck", "copy.pptx") == first
+    assert store.get(first)['filename'] == "copy.pptx"
+    assert len(list(tmp_path.glob("*.pptx"))) == 2
+
+
+def test_invalid_ids_never_reach_the_filesystem(tmp_path):
+    store = UploadStore(tmp_path)
+    with pytest.raises(ValueError):
+        store.path("../../etc/passwd")
+    assert store.get("0" * 64) is None
+
+
+def test_translate_by_id_reuses_the_extraction(tmp_path, upload_store):
+    deck = tmp_path / "deck.pptx"
+    generate_deck(DeckSpec(slides=3, frames_per_slide=2), deck)
+
+    with UpstreamStubServer(StubConfig()) as stub:
+        processor = CountingDocumentProcessor(
+            TranslationProcessor(azure_translator=AzureTranslator("key", stub.translator_endpoint))
+        )
+        app.dependency_overrides[get_document_processor] = lambda: processor
+        client = TestClient(app)
+        with open(deck, "rb") as f:
+            upload = client.post("/api/document/upload", files={"file": ("deck.pptx", f)}).json()
+        document_id = upload["document_id"]
+
+        for language in ("fr", "de"):
+            response = client.post("/api/document/translate-by-id", json={
+                "document_id": document_id,
+                "target_language": language
+            })
+            assert response.status_code == 200
+            body = response.json()
+            assert body["filename"] == "deck.pptx"
+            assert body["text_frames_translated"] > 0
+            assert (settings.OUTPUT_FOLDER / body["output_filename"]).exists()
+
+        assert processor.extractions == 1
+
+        missing = client.post("/api/document/translate-by-id", json={
+            "document_id": "0" * 64, "target_language": "fr"
+        })
+        assert missing.status_code == 404
+        invalid = client.post("/api/document/translate-by-id", json={
+            "document_id": "deck.pptx", "target_language": "fr"
+        })
+        assert invalid.status_code == 400
+
+
+def test_a_locked_output_is_refused_at_once(tmp_path, upload_store):
+    deck = tmp_path / "deck.pptx"
+    generate_deck(DeckSpec(slides=1, frames_per_slide=1), deck)
+    client = TestClient(app)
+    document_id = upload_store.put(deck.read_bytes(), "deck.pptx")
+    # Another job (in any worker) is writing this output
+    with document_lock(settings.lock_folder(), generate_unique_filename("deck.pptx", "fr", document_id)):
+        start = time.perf_counter()
+        response = client.post("/api/document/translate-by-id", json={
+            "document_id": document_id, "target_language": "fr"
+        })
+    assert response.status_code == 409
+    assert time.perf_counter() - start < 5
+
+
+def test_same_name_decks_get_distinct_outputs(tmp_path, upload_store):
+    first, second = tmp_path / "first.pptx", tmp_path / "second.pptx"
+    generate_deck(DeckSpec(slides=1, frames_per_slide=1, seed=1), first)
+    generate_deck(DeckSpec(slides=2, frames_per_slide=1, seed=2), second)
+
+    with UpstreamStubServer(StubConfig()) as stub:
+        processor = DocumentProcessor(
+            TranslationProcessor(azure_translator=AzureTranslator("key", stub.translator_endpoint))
+        )
+        app.dependency_overrides[get_document_processor] = lambda: processor
+        client = TestClient(app)
+        outputs = []
+        for deck in (first, second):
+            with open(deck, "rb") as f:
+                response = client.post(
+                    "/api/document/translate",
+                    files={"file": ("deck.pptx", f)},
+                    data={"target_language": "fr"}
+                )
+            assert response.status_code == 200
+            outputs.append(response.json()["output_filename"])
+
+    assert outputs[0] != outputs[1]
+    assert all(name.startswith("deck_") and name.endswith("_fr.pptx") for name in outputs)
+    assert all((settings.OUTPUT_FOLDER / name).exists() for name in outputs)
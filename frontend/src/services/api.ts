@@ -1,5 +1,5 @@
 import axios from 'axios';
-import { DocumentTranslationResponse } from '../types';
+import { DocumentTranslationResponse, DocumentUploadResponse } from '../types';
 
 const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -13,29 +13,57 @@ const api = axios.create({
 
 
 
-export const translateDocument = async (
-  file: File,
-  targetLanguage: string,
-  useLLM: boolean = false
-): Promise<DocumentTranslationResponse> => {
+// Document ids of files already uploaded, so each file is sent only once
+const uploadedDocumentIds = new WeakMap<File, string>();
+
+export const uploadDocument = async (file: File): Promise<string> => {
+  const cached = uploadedDocumentIds.get(file);
+  if (cached) return cached;
+
   const formData = new FormData();
   formData.append('file', file);
-  formData.append('target_language', targetLanguage);
-  formData.append('use_llm', String(useLLM));
-  
-  // Backend will use the default model (Claude 3.5 Sonnet)
 
-  const response = await api.post('/document/translate', formData, {
+  const response = await api.post<DocumentUploadResponse>('/document/upload', formData, {
     headers: {
       'Content-Type': 'multipart/form-data',
     },
   });
 
-  return response.data;
+  const documentId = response.data.document_id!;
+  uploadedDocumentIds.set(file, documentId);
+  return documentId;
 };
 
-export const getDocumentContent = async (filename: string) => {
-  const response = await api.get(`/editor/document-content/${filename}`);
+export const translateDocument = async (
+  file: File,
+  targetLanguage: string,
+  useLLM: boolean = false
+): Promise<DocumentTranslationResponse> => {
+  // Backend will use the default model (Claude 3.5 Sonnet)
+  const request = async () => api.post('/document/translate-by-id', {
+    document_id: await uploadDocument(file),
+    filename: file.name,
+    target_language: targetLanguage,
+    use_llm: useLLM,
+  });
+
+  try {
+    return (await request()).data;
+  } catch (error) {
+    // The stored upload may have been cleaned up since; send it once more
+    if (axios.isAxiosError(error) && error.response?.status === 404) {
+      uploadedDocumentIds.delete(file);
+      return (await request()).data;
+    }
+    throw error;
+  }
+};
+
+export const getDocumentContent = async (
+  filename: string,
+  params?: { start?: number; end?: number; limit?: number; cursor?: string; fields?: string }
+) => {
+  const response = await api.get(`/editor/document-content/${filename}`, { params });
   return response.data;
 };
 
@@ -49,4 +77,54 @@ export const updateDocumentContent = async (filename: string, edits: Array<{ id:
 
 export const downloadDocument = (filename: string) => {
   window.open(`${API_BASE_URL}/api/document/download/${filename}`, '_blank');
-};
\ No newline at end of file
+};
+export interface ImprovementResult {
+  success: boolean;
+  translation: string;
+  model?: string;
+  error?: string;
+}
+
+// Streams an AI suggestion, calling onToken for each chunk as it arrives.
+// Resolves with the final result (its translation is authoritative).
+export const streamSuggestImprovement = async (
+  request: { original_text: string; current_translation: string; target_language: string; feedback?: string },
+  onToken: (text: string) => void
+): Promise<ImprovementResult> => {
+  const response = await fetch(`${API_BASE_URL}/api/editor/suggest-improvement/stream`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(request),
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`Suggestion failed: ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let result: ImprovementResult | null = null;
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const message = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      const event = message.match(/^event: (.*)$/m)?.[1];
+      const data = message.match(/^data: (.*)$/m)?.[1];
+      if (!data) continue;
+      const payload = JSON.parse(data);
+      if (event === 'delta') onToken(payload.text);
+      else if (event === 'done') result = payload;
+    }
+  }
+
+  if (!result) {
+    throw new Error('Suggestion stream ended unexpectedly');
+  }
+  return result;
+};
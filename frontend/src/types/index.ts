@@ -13,6 +13,7 @@ export interface DocumentUploadResponse {
   filename: string;
   file_path: string;
   file_size: number;
+  document_id?: string;
   error?: string;
 }
 